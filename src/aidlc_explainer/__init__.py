@@ -3,6 +3,12 @@
 __version__ = "0.1.0"
 __author__ = "AI-SDLC Explainer Team"
 
-from aidlc_explainer.app import AIDLCExplainerApp
-
 __all__ = ["AIDLCExplainerApp", "__version__"]
+
+
+def __getattr__(name: str):
+    """Import the app lazily so command line tools don't load Textual."""
+    if name == "AIDLCExplainerApp":
+        from aidlc_explainer.app import AIDLCExplainerApp
+        return AIDLCExplainerApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,23 @@
 """Entry point for the AI-SDLC Explainer application."""
 
 import argparse
-import hashlib
+import json
+import os
 import sys
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from aidlc_explainer.bandwidth import LOW_BANDWIDTH_FPS
+from aidlc_explainer.navigation import SCREEN_CACHE_SIZE
+from aidlc_explainer.storage import BACKEND_ENV, BACKENDS, LEARNER_ENV
 
-def parse_args() -> argparse.Namespace:
+if TYPE_CHECKING:
+    from aidlc_explainer.state import StateManager
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
         prog="aidlc-explainer",
@@ -18,6 +28,62 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable screenshot mode (stable output, no animations)",
     )
+    parser.add_argument(
+        "--reduced-motion",
+        action="store_true",
+        help="Skip animations and show their final frame (useful over SSH)",
+    )
+    parser.add_argument(
+        "--low-bandwidth",
+        action="store_true",
+        help="Minimize terminal output for slow links: lower frame rate, no animations "
+             "or cursor blink",
+    )
+    parser.add_argument(
+        "--wire-stats",
+        type=Path,
+        metavar="PATH",
+        help="Count bytes written to the terminal per interaction and save a JSON report",
+    )
+    parser.add_argument(
+        "--telemetry",
+        type=Path,
+        metavar="PATH",
+        help="Append per-screen dwell time, key presses and render latency to a JSON Lines "
+             "file (summarize with telemetry-report)",
+    )
+    parser.add_argument(
+        "--screen-cache",
+        type=int,
+        default=SCREEN_CACHE_SIZE,
+        metavar="N",
+        help=f"Screens kept for reuse after navigating away (default: {SCREEN_CACHE_SIZE})",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Start from Home instead of reopening the screens left open last time",
+    )
+    parser.add_argument(
+        "--dev-content",
+        action="store_true",
+        help="Reload the quiz, gate and simulator packs as they are edited, for content authors",
+    )
+    parser.add_argument(
+        "--locale",
+        help="Language of lessons, glossary, quizzes, gates and the simulator, e.g. es "
+             "(default: $AIDLC_LOCALE or en; F2 switches while running)",
+    )
+    parser.add_argument(
+        "--state-backend",
+        choices=BACKENDS,
+        help="Where progress is stored: json (default) or sqlite, which keeps one row per "
+             "learner for shared hosts",
+    )
+    parser.add_argument(
+        "--learner",
+        help="Learner whose progress to use with the sqlite backend (default: login name)",
+    )
     parser.add_argument(
         "--theme",
         choices=["dark", "light"],
@@ -39,11 +105,370 @@ def parse_args() -> argparse.Namespace:
         action="version",
         version="%(prog)s 0.1.0",
     )
-    return parser.parse_args()
+
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    sweep = commands.add_parser(
+        "sweep",
+        help="Sweep methodology factors and scenario attributes (requires numpy)",
+        description="Evaluate the methodology comparison model over a dense parameter grid "
+                    "and report sensitivities and AI-DLC break-even points.",
+    )
+    sweep.add_argument(
+        "--resolution",
+        type=int,
+        default=6,
+        help="Samples per continuous axis (default: 6, about 10^7 points)",
+    )
+    sweep.add_argument(
+        "--fix",
+        action="append",
+        default=[],
+        metavar="AXIS=VALUE",
+        help="Pin an axis to one value, e.g. complexity=high or agile.cost_factor=0.8",
+    )
+    sweep.add_argument(
+        "--scenario",
+        default="banking-app",
+        help="Project scenario used as the base point (default: banking-app)",
+    )
+    sweep.add_argument(
+        "--output",
+        type=Path,
+        help="Write the compact result archive (.npz) to this path",
+    )
+    sweep.add_argument(
+        "--keep-grid",
+        action="store_true",
+        help="Store the full win grid as packed bits in the output archive",
+    )
+    sweep.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a JSON summary instead of the text report",
+    )
+
+    calibrate = commands.add_parser(
+        "calibrate",
+        help="Fit methodology factors to historical project data (requires numpy)",
+        description="Fit cycle time, cost, volatility and complexity factors to a CSV of past "
+                    "projects and write a methodology profile the app loads on startup.",
+    )
+    calibrate.add_argument("csv", type=Path, help="CSV of historical projects")
+    calibrate.add_argument(
+        "--output",
+        type=Path,
+        help="Profile path (default: .aidlc-explainer/methodology-profile.json)",
+    )
+    calibrate.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the fitted factors without writing the profile",
+    )
+
+    portfolio = commands.add_parser(
+        "portfolio",
+        help="Simulate many AI-DLC projects sharing the same people",
+        description="Run a discrete-event simulation of concurrent projects competing for "
+                    "shared AI-DLC roles at Inception and Construction gates.",
+    )
+    portfolio.add_argument(
+        "--projects",
+        type=int,
+        default=1000,
+        help="Number of projects, cycling through the built-in scenarios (default: 1000)",
+    )
+    portfolio.add_argument(
+        "--capacity",
+        action="append",
+        default=[],
+        metavar="ROLE=N",
+        help='People in a role, e.g. "Human Validator=20" (repeatable)',
+    )
+    portfolio.add_argument(
+        "--arrival-hours",
+        type=float,
+        default=2.0,
+        help="Mean hours between project arrivals; 0 starts all at once (default: 2)",
+    )
+    portfolio.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    portfolio.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a JSON summary instead of the text report",
+    )
+
+    cohort = commands.add_parser(
+        "cohort-report",
+        help="Aggregate progress across many learners' state files (requires numpy)",
+        description="Read every .json state file under a directory in parallel and summarize "
+                    "lesson completion, quiz and gatekeeper scores, achievements and XP.",
+    )
+    cohort.add_argument("directory", type=Path, help="Directory of collected state files")
+    cohort.add_argument(
+        "--format",
+        choices=["markdown", "csv", "json"],
+        default="markdown",
+        help="Output format (default: markdown)",
+    )
+    cohort.add_argument("--output", type=Path, help="Write the report here instead of stdout")
+    cohort.add_argument(
+        "--processes",
+        type=int,
+        help="Worker processes (default: CPU count)",
+    )
+
+    issue = commands.add_parser(
+        "issue-certificates",
+        help="Issue certificates for every eligible learner in a roster",
+        description="Read each learner's progress in parallel, issue certificates to those "
+                    "who qualify and record them in the certificate registry.",
+    )
+    issue.add_argument(
+        "roster",
+        type=Path,
+        help="CSV with name and state columns (state.json, a learner directory or a "
+             "state.db; optional learner column for state.db)",
+    )
+    issue.add_argument(
+        "--registry",
+        type=Path,
+        help="Registry directory (default: .aidlc-explainer)",
+    )
+    issue.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Also write each issued certificate to <ID>.txt in this directory",
+    )
+    issue.add_argument(
+        "--processes",
+        type=int,
+        help="Worker processes for reading progress (default: CPU count)",
+    )
+
+    verify = commands.add_parser(
+        "verify",
+        help="Look up a certificate ID in the registry",
+        description="Check that a certificate ID was issued and show what it certifies.",
+    )
+    verify.add_argument("cert_id", metavar="CERT_ID", help="12-character certificate ID")
+    verify.add_argument(
+        "--registry",
+        type=Path,
+        help="Registry directory (default: .aidlc-explainer)",
+    )
+
+    state_bench = commands.add_parser(
+        "state-bench",
+        help="Benchmark state backends under many concurrent learners",
+        description="Drive simulated learners issuing add_xp and save_quiz_result in parallel "
+                    "against each state backend, in a scratch directory.",
+    )
+    state_bench.add_argument(
+        "--learners",
+        type=int,
+        default=200,
+        help="Concurrent simulated learners (default: 200)",
+    )
+    state_bench.add_argument(
+        "--rounds",
+        type=int,
+        default=10,
+        help="Operations per learner (default: 10)",
+    )
+    state_bench.add_argument(
+        "--processes",
+        type=int,
+        help="Worker processes the learners are spread over (default: CPU count, at most 8)",
+    )
+    state_bench.add_argument(
+        "--backend",
+        action="append",
+        choices=BACKENDS,
+        help="Backend to benchmark (repeatable; default: all)",
+    )
+    state_bench.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a JSON summary instead of the text report",
+    )
+
+    ui_bench = commands.add_parser(
+        "ui-bench",
+        help="Benchmark screen mount and key press latency",
+        description="Open every screen headlessly, drive it with scripted key presses and report "
+                    "mount and key-press-to-refresh latency percentiles. With --baseline, exit "
+                    "with an error if any screen got slower.",
+    )
+    ui_bench.add_argument(
+        "screens",
+        nargs="*",
+        metavar="SCREEN",
+        help="Screen IDs to benchmark (default: all)",
+    )
+    ui_bench.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="Times each screen is opened (default: 5)",
+    )
+    ui_bench.add_argument(
+        "--baseline",
+        type=Path,
+        help="Compare against a baseline saved with --save-baseline",
+    )
+    ui_bench.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="Allowed slowdown against the baseline, as a fraction (default: 0.5)",
+    )
+    ui_bench.add_argument(
+        "--save-baseline",
+        type=Path,
+        metavar="PATH",
+        help="Save the results as a baseline file",
+    )
+    ui_bench.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a JSON summary instead of the text report",
+    )
+
+    check_sources = commands.add_parser(
+        "check-sources",
+        help="Check the local source references in the content packs",
+        description="Check every local source reference in the quiz, gate, stage and request "
+                    "type content against the cited documents. Reports anchors that are out of "
+                    "range or whose text changed, with a suggested relocation.",
+    )
+    check_sources.add_argument(
+        "--update",
+        action="store_true",
+        help="Record the text every anchor cites now, after reviewing the references",
+    )
+    check_sources.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the findings as JSON instead of a report",
+    )
+
+    build_snapshot = commands.add_parser(
+        "build-snapshot",
+        help="Compile the content into a snapshot the app loads at startup",
+        description="Compile lessons, glossary, mappings, artifacts and the practice and "
+                    "simulator content into one binary snapshot. The app uses it while it "
+                    "matches the content sources and loads from source otherwise.",
+    )
+    build_snapshot.add_argument(
+        "--output",
+        type=Path,
+        help="Where to write the snapshot (default: inside the installed package)",
+    )
+
+    startup_bench = commands.add_parser(
+        "startup-bench",
+        help="Compare startup with and without the content snapshot",
+        description="Time importing the app and loading every content section in fresh "
+                    "interpreters, with a freshly built snapshot and with it turned off.",
+    )
+    startup_bench.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="Interpreters started for each mode (default: 5)",
+    )
+    startup_bench.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a JSON summary instead of the table",
+    )
+
+    list_packs = commands.add_parser(
+        "list-packs",
+        help="List the installed content packs",
+        description="List the lessons, quizzes and gates of every content pack installed "
+                    "through the aidlc_explainer.content_packs entry point group.",
+    )
+    list_packs.add_argument(
+        "--check",
+        action="store_true",
+        help="Also load every item's content, to check that it can be opened",
+    )
+    list_packs.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the packs as JSON instead of a list",
+    )
+
+    migrate_state = commands.add_parser(
+        "migrate-state",
+        help="Upgrade every learner state file under a directory to the current schema",
+        description="Migrate the .json state files under a directory in parallel. Each file "
+                    "that changes is replaced atomically; files from a newer version of the "
+                    "app, and files that are not state, are left alone.",
+    )
+    migrate_state.add_argument("directory", type=Path, help="Directory of state files")
+    migrate_state.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Summarize what would change without writing anything",
+    )
+    migrate_state.add_argument(
+        "--processes",
+        type=int,
+        help="Worker processes (default: CPU count)",
+    )
+
+    telemetry_report = commands.add_parser(
+        "telemetry-report",
+        help="Summarize screen telemetry recorded with --telemetry",
+        description="Per-screen percentiles of dwell time, key presses and render latency.",
+    )
+    telemetry_report.add_argument("path", type=Path, help="Telemetry file")
+    telemetry_report.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the summary as JSON instead of a table",
+    )
+    return parser.parse_args(argv)
+
+
+def _activity_lines(state: "StateManager") -> list[str]:
+    """Streak, session and velocity lines for the learning report.
+    
+    The event-log analytics need numpy; without it only the totals kept in
+    the state file are reported.
+    """
+    from aidlc_explainer.state import format_duration
+    
+    activity = state.get_activity_stats()
+    lines = [
+        f"- Current Streak: {activity['streak_days']} days",
+        f"- Sessions: {activity['total_sessions']}",
+        f"- Time Spent: {format_duration(activity['total_time_seconds'])}",
+        f"- XP This Week: {activity['xp_this_week']}",
+    ]
+    try:
+        from aidlc_explainer.analysis.activity import summarize
+    except ImportError:
+        return lines
+    summary = summarize(state.events)
+    lines.append(f"- Longest Streak: {summary['longest_streak']} days")
+    lines.append(f"- Active Days: {summary['active_days']}")
+    lines.append(
+        f"- Velocity (7 days): {summary['xp_per_day']} XP/day,"
+        f" {summary['sections_per_day']} lesson sections/day"
+    )
+    if summary["answer_accuracy"] is not None:
+        lines.append(f"- Answer Accuracy: {summary['answer_accuracy'] * 100:.0f}%")
+    lines.append(f"- Daily XP (14 days): {' '.join(str(xp) for xp in summary['daily_xp'])}")
+    return lines
 
 
 def export_report() -> None:
     """Export learning progress report to markdown file."""
+    from aidlc_explainer.certificates import is_eligible
     from aidlc_explainer.state import StateManager
     
     state = StateManager()
@@ -89,26 +514,22 @@ def export_report() -> None:
     report.append(f"- Total Runs: {s['runs']}")
     report.append("")
     
+    # Activity
+    report.append("## Activity")
+    report.append("")
+    report.extend(_activity_lines(state))
+    report.append("")
+    
     # Achievements
     report.append("## Achievements")
     report.append("")
-    ach_names = {
-        "first-steps": "🎓 First Steps - Completed first lesson",
-        "scholar": "📚 Scholar - Completed all lessons",
-        "quiz-master": "🎯 Quiz Master - Scored 80%+ on quiz",
-        "perfect-score": "⭐ Perfect Score - Scored 100% on quiz",
-        "gatekeeper": "🚧 Gatekeeper - Scored 80%+ on gatekeeper",
-        "simulator-explorer": "🔬 Explorer - Explored all simulator request types",
-        "completionist": "🏆 Completionist - Completed everything",
-    }
-    
     report.append(f"**Unlocked:** {progress['achievements']['unlocked']}/{progress['achievements']['total']}")
     report.append("")
     
     if achievements["unlocked"]:
         for ach_id in achievements["unlocked"]:
-            name = ach_names.get(ach_id, ach_id)
-            report.append(f"- {name}")
+            ach = state.achievements.get(ach_id)
+            report.append(f"- {ach.name} - {ach.description}" if ach else f"- {ach_id}")
     else:
         report.append("- No achievements unlocked yet")
     report.append("")
@@ -116,11 +537,7 @@ def export_report() -> None:
     # Certificate eligibility
     report.append("## Certificate Status")
     report.append("")
-    is_eligible = (
-        l["completed"] >= 6 and
-        q["percent"] >= 80
-    )
-    if is_eligible:
+    if is_eligible(progress):
         report.append("✅ **Eligible for completion certificate!**")
         report.append("")
         report.append("Run the app and complete the certificate flow to generate your certificate.")
@@ -147,60 +564,445 @@ def reset_progress() -> None:
 
 
 def generate_certificate(name: str) -> str:
-    """Generate a completion certificate."""
+    """Generate a completion certificate and record it in the registry."""
+    from aidlc_explainer.certificates import (
+        COLLISION,
+        Certificate,
+        CertificateRegistry,
+        is_eligible,
+        render_certificate,
+    )
     from aidlc_explainer.state import StateManager
     
     state = StateManager()
     progress = state.get_overall_progress()
     
-    # Check eligibility
-    l = progress["lessons"]
-    q = progress["quiz"]
-    
-    if l["completed"] < 6 or q["percent"] < 80:
+    if not is_eligible(progress):
         return "Not eligible for certificate. Complete all lessons and score 80%+ on quiz."
     
-    # Generate certificate
     date_str = datetime.now().strftime("%Y-%m-%d")
-    cert_data = f"{name}-{date_str}-aidlc-explainer"
-    cert_id = hashlib.sha256(cert_data.encode()).hexdigest()[:12].upper()
-    
-    cert = f"""
-╭────────────────────────────────────────────────────────────────────────────────╮
-│                                                                                │
-│                        CERTIFICATE OF COMPLETION                               │
-│                                                                                │
-│                          AI-DLC Methodology Training                           │
-│                                                                                │
-├────────────────────────────────────────────────────────────────────────────────┤
-│                                                                                │
-│                          This certifies that                                   │
-│                                                                                │
-│                              {name.center(40)}                                 │
-│                                                                                │
-│              has successfully completed the AI-DLC Explainer                   │
-│              curriculum and demonstrated proficiency in the                    │
-│              AI-Driven Development Lifecycle methodology.                      │
-│                                                                                │
-│                                                                                │
-│    Lessons Completed: {l['completed']}/6                                                │
-│    Quiz Score: {q['score']}/{q['total']} ({q['percent']:.0f}%)                                               │
-│    Achievements: {progress['achievements']['unlocked']}/{progress['achievements']['total']}                                                  │
-│                                                                                │
-│                                                                                │
-│    Date: {date_str}                                                        │
-│    Certificate ID: {cert_id}                                           │
-│                                                                                │
-╰────────────────────────────────────────────────────────────────────────────────╯
-"""
-    return cert
-
-
-def main() -> int:
+    cert = Certificate.from_progress(name, date_str, progress)
+    result = CertificateRegistry(state.state_dir).issue(cert)
+    if result.status == COLLISION:
+        return f"Certificate not issued: {result.message}."
+    return render_certificate(cert)
+
+
+def run_sweep(args: argparse.Namespace) -> int:
+    """Run a parameter sweep over the methodology comparison model."""
+    try:
+        import numpy as np
+
+        from aidlc_explainer.analysis import sweep
+    except ImportError:
+        print('❌ The sweep command requires numpy: pip install "aidlc-explainer[analysis]"')
+        return 1
+    from aidlc_explainer.content.methodology_comparison import (
+        get_all_methodologies,
+        get_project_scenarios,
+    )
+
+    methodologies = get_all_methodologies()
+    scenario = next((s for s in get_project_scenarios() if s.id == args.scenario), None)
+    if scenario is None:
+        print(f"❌ Unknown scenario: {args.scenario}")
+        return 1
+
+    axes = {axis.name: axis for axis in sweep.default_axes(methodologies, args.resolution)}
+    for item in args.fix:
+        name, _, raw = item.partition("=")
+        axis = axes.get(name)
+        if axis is None or not raw:
+            print(f"❌ Invalid --fix {item!r}; axes: {', '.join(axes)}")
+            return 1
+        try:
+            value = float(axis.labels.index(raw) if axis.labels else raw)
+        except ValueError:
+            print(f"❌ Invalid value for {name}: {raw}")
+            return 1
+        axis.values = np.array([value])
+
+    result = sweep.run_sweep(
+        list(axes.values()), methodologies, scenario, keep_mask=args.keep_grid
+    )
+    if args.json:
+        print(json.dumps(result.to_summary(), indent=2))
+    else:
+        print(sweep.format_report(result))
+    if args.output:
+        result.save(args.output)
+        print(f"✅ Sweep results written to: {args.output}")
+    return 0
+
+
+def run_calibrate(args: argparse.Namespace) -> int:
+    """Calibrate methodology factors from historical project data."""
+    try:
+        from aidlc_explainer.analysis import calibration
+    except ImportError:
+        print('❌ The calibrate command requires numpy: pip install "aidlc-explainer[analysis]"')
+        return 1
+    from aidlc_explainer.content.methodology_comparison import METHODOLOGIES, PROFILE_PATH
+
+    try:
+        history, dropped = calibration.read_history(args.csv)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    result = calibration.calibrate(history, METHODOLOGIES)
+    result.dropped += dropped
+    result.source = str(args.csv)
+    print(calibration.format_report(result, METHODOLOGIES))
+    if not result.factors:
+        print("❌ No rows matched a known methodology; profile not written.")
+        return 1
+    if not args.dry_run:
+        output = args.output or Path.cwd() / PROFILE_PATH
+        result.write_profile(output)
+        print(f"✅ Methodology profile written to: {output}")
+    return 0
+
+
+def run_portfolio(args: argparse.Namespace) -> int:
+    """Run a discrete-event simulation of a project portfolio."""
+    from aidlc_explainer.analysis import portfolio
+
+    capacity = {}
+    for item in args.capacity:
+        role, _, raw = item.partition("=")
+        try:
+            capacity[role.strip()] = int(raw)
+        except ValueError:
+            print(f"❌ Invalid --capacity {item!r}; expected ROLE=N")
+            return 1
+
+    try:
+        simulation = portfolio.PortfolioSimulation(
+            portfolio.build_portfolio(args.projects),
+            capacity=capacity,
+            arrival_hours=args.arrival_hours,
+            seed=args.seed,
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    result = simulation.run()
+    if args.json:
+        print(json.dumps(result.to_summary(), indent=2))
+    else:
+        print(portfolio.format_report(result))
+    return 0
+
+
+def run_cohort_report(args: argparse.Namespace) -> int:
+    """Aggregate a directory of learner state files."""
+    try:
+        from aidlc_explainer.analysis import cohort
+    except ImportError:
+        print('❌ The cohort-report command requires numpy: pip install "aidlc-explainer[analysis]"')
+        return 1
+
+    if not args.directory.is_dir():
+        print(f"❌ Not a directory: {args.directory}")
+        return 1
+    stats, elapsed = cohort.build_report(args.directory, processes=args.processes)
+    if args.format == "csv":
+        report = cohort.format_csv(stats)
+    elif args.format == "json":
+        report = cohort.format_json(stats, elapsed)
+    else:
+        report = cohort.format_markdown(stats, elapsed)
+
+    if args.output:
+        args.output.write_text(report, encoding="utf-8")
+        print(f"✅ Cohort report for {stats.learners:,} learners written to: {args.output}")
+    else:
+        print(report)
+    return 0
+
+
+def run_issue_certificates(args: argparse.Namespace) -> int:
+    """Issue certificates for a roster of learners."""
+    from aidlc_explainer import certificates
+    from aidlc_explainer.state import StateManager
+
+    try:
+        roster = certificates.read_roster(args.roster)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    registry = certificates.CertificateRegistry(
+        args.registry or Path.cwd() / StateManager.STATE_DIR
+    )
+    results = certificates.issue_from_roster(roster, registry, processes=args.processes)
+
+    icons = {
+        certificates.ISSUED: "✅",
+        certificates.DUPLICATE: "♻️ ",
+        certificates.COLLISION: "⚠️ ",
+        certificates.INELIGIBLE: "⏳",
+        certificates.FAILED: "❌",
+    }
+    counts: dict[str, int] = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+        cert_id = result.certificate.id if result.certificate else ""
+        detail = f" ({result.message})" if result.message else ""
+        print(f"{icons[result.status]} {result.name:<30} {cert_id:<12} {result.status}{detail}")
+        if args.output_dir and result.status in (certificates.ISSUED, certificates.DUPLICATE):
+            args.output_dir.mkdir(parents=True, exist_ok=True)
+            (args.output_dir / f"{cert_id}.txt").write_text(
+                certificates.render_certificate(result.certificate), encoding="utf-8"
+            )
+    print("")
+    print(", ".join(f"{count} {status}" for status, count in counts.items()))
+    print(f"✅ Registry: {registry.log_path} ({len(registry):,} certificates)")
+    return 1 if counts.get(certificates.COLLISION) else 0
+
+
+def run_verify(args: argparse.Namespace) -> int:
+    """Verify a certificate ID against the registry."""
+    from aidlc_explainer import certificates
+    from aidlc_explainer.state import StateManager
+
+    cert_id = certificates.normalize_id(args.cert_id)
+    if cert_id is None:
+        print(f"❌ Invalid certificate ID: {args.cert_id!r}")
+        return 1
+    registry = certificates.CertificateRegistry(
+        args.registry or Path.cwd() / StateManager.STATE_DIR
+    )
+    matches = registry.lookup(cert_id)
+    if not matches:
+        print(f"❌ No certificate with ID {cert_id}")
+        return 1
+    if len(matches) > 1:
+        print(f"⚠️  ID collision: {len(matches)} certificates share ID {cert_id}")
+    else:
+        print(f"✅ Valid certificate {cert_id}")
+    for cert in matches:
+        print(f"   {cert.name}, issued {cert.issued}: lessons {cert.lessons}/6, "
+              f"quiz {cert.quiz_score}/{cert.quiz_total} ({cert.quiz_percent:.0f}%), "
+              f"achievements {cert.achievements}/{cert.achievements_total}")
+    return 0 if len(matches) == 1 else 1
+
+
+def run_state_bench(args: argparse.Namespace) -> int:
+    """Benchmark the state backends under concurrent learners."""
+    from aidlc_explainer.benchmarks import state_backends
+
+    if args.learners < 1 or args.rounds < 1:
+        print("❌ --learners and --rounds must be at least 1")
+        return 1
+    results = state_backends.run_benchmark(
+        args.backend, learners=args.learners, rounds=args.rounds, processes=args.processes
+    )
+    if args.json:
+        print(json.dumps([r.to_summary() for r in results], indent=2))
+    else:
+        print(state_backends.format_report(results))
+    return 0
+
+
+def run_ui_bench(args: argparse.Namespace) -> int:
+    """Benchmark screen latency, optionally against a baseline."""
+    from aidlc_explainer.benchmarks import screens
+
+    if args.repeats < 1:
+        print("❌ --repeats must be at least 1")
+        return 1
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = screens.load_baseline(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot read baseline {args.baseline}: {e}")
+            return 1
+    try:
+        results = screens.run_benchmark(args.screens, repeats=args.repeats)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    regressions = screens.compare(results, baseline, args.threshold) if baseline else []
+    if args.save_baseline:
+        screens.save_baseline(args.save_baseline, results)
+    if args.json:
+        summary = screens.to_baseline(results)
+        summary["regressions"] = [str(r) for r in regressions]
+        print(json.dumps(summary, indent=2))
+    else:
+        print(screens.format_report(results, regressions))
+    return 1 if regressions else 0
+
+
+def run_check_sources(args: argparse.Namespace) -> int:
+    """Check the content packs' local source references."""
+    from aidlc_explainer import source_check
+    from aidlc_explainer.sources import SourceResolver
+
+    anchors_path = source_check.CONTENT_DIR / source_check.ANCHORS_FILE
+    resolver = SourceResolver()
+    try:
+        citations = source_check.extract_citations()
+        anchors = source_check.load_anchors(anchors_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot read the content: {e}")
+        return 1
+    if args.update:
+        document = source_check.record_anchors(citations, resolver)
+        source_check.save_anchors(anchors_path, document)
+        print(f"✅ Recorded {len(document['anchors'])} anchors in {anchors_path}")
+        anchors = document["anchors"]
+    findings = source_check.check_citations(citations, anchors, resolver)
+    if args.json:
+        print(json.dumps([
+            {**asdict(finding.citation), "status": finding.status, "suggestion": finding.suggestion}
+            for finding in findings
+        ], indent=2))
+    else:
+        print(source_check.format_report(findings))
+    return 1 if any(finding.status in source_check.PROBLEMS for finding in findings) else 0
+
+
+def run_build_snapshot(args: argparse.Namespace) -> int:
+    """Compile the content snapshot."""
+    from aidlc_explainer.content import snapshot
+
+    path = args.output or snapshot.SNAPSHOT_PATH
+    try:
+        sizes = snapshot.build_snapshot(path)
+    except OSError as e:
+        print(f"❌ Cannot build the snapshot: {e}")
+        return 1
+    print(f"✅ {path}: {len(sizes)} sections, {sum(sizes.values()):,} bytes")
+    return 0
+
+
+def run_startup_bench(args: argparse.Namespace) -> int:
+    """Compare startup with and without the content snapshot."""
+    from aidlc_explainer.benchmarks import startup
+
+    if args.repeats < 1:
+        print("❌ --repeats must be at least 1")
+        return 1
+    results = startup.run_benchmark(args.repeats)
+    if args.json:
+        print(json.dumps([r.summary() for r in results], indent=2))
+    else:
+        print(startup.format_report(results))
+    return 0
+
+
+def run_list_packs(args: argparse.Namespace) -> int:
+    """List the installed content packs."""
+    from aidlc_explainer.content import packs
+
+    registry = packs.REGISTRY
+    manifests = registry.manifests
+    errors = list(registry.errors)
+    if args.check:
+        for kind in packs.KINDS:
+            for entry in registry.listings(kind):
+                try:
+                    registry.load(kind, entry["id"])
+                except ValueError as e:
+                    errors.append(str(e))
+    if args.json:
+        print(json.dumps({
+            "packs": [asdict(manifest) for manifest in manifests],
+            "errors": errors,
+        }, indent=2))
+    else:
+        for manifest in manifests:
+            counts = ", ".join(f"{len(getattr(manifest, kind))} {kind}" for kind in packs.KINDS)
+            origin = f" ({manifest.distribution})" if manifest.distribution else ""
+            print(f"📦 {manifest.name}{origin}: {manifest.title} - {counts}")
+        for error in errors:
+            print(f"❌ {error}")
+        if not manifests and not errors:
+            print(f"No content packs installed in the {packs.ENTRY_POINT_GROUP} group")
+    return 1 if errors else 0
+
+
+def run_migrate_state(args: argparse.Namespace) -> int:
+    """Migrate a directory of learner state files."""
+    from aidlc_explainer import migrations
+
+    if not args.directory.is_dir():
+        print(f"❌ Not a directory: {args.directory}")
+        return 1
+    report, elapsed = migrations.migrate_tree(
+        args.directory, dry_run=args.dry_run, processes=args.processes
+    )
+    print(migrations.format_report(report, elapsed, dry_run=args.dry_run))
+    return 1 if report.failed else 0
+
+
+def run_telemetry_report(args: argparse.Namespace) -> int:
+    """Summarize a screen telemetry file."""
+    from aidlc_explainer import telemetry
+
+    try:
+        summary = telemetry.summarize(args.path)
+    except OSError as e:
+        print(f"❌ Cannot read {args.path}: {e}")
+        return 1
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(telemetry.format_summary(summary))
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
     """Run the AI-SDLC Explainer TUI application."""
-    args = parse_args()
+    args = parse_args(argv)
+    
+    # Every StateManager in the process picks these up
+    if args.state_backend:
+        os.environ[BACKEND_ENV] = args.state_backend
+    if args.learner:
+        os.environ[LEARNER_ENV] = args.learner
+    if args.locale:
+        from aidlc_explainer.content.locale import LOCALIZER, available_locales
+        locales = available_locales()
+        if args.locale not in locales:
+            print(f"❌ Unknown locale: {args.locale} (available: {', '.join(locales)})")
+            return 1
+        LOCALIZER.set_locale(args.locale)
     
     # Handle non-TUI commands
+    if args.command == "sweep":
+        return run_sweep(args)
+    if args.command == "calibrate":
+        return run_calibrate(args)
+    if args.command == "portfolio":
+        return run_portfolio(args)
+    if args.command == "cohort-report":
+        return run_cohort_report(args)
+    if args.command == "issue-certificates":
+        return run_issue_certificates(args)
+    if args.command == "verify":
+        return run_verify(args)
+    if args.command == "state-bench":
+        return run_state_bench(args)
+    if args.command == "ui-bench":
+        return run_ui_bench(args)
+    if args.command == "check-sources":
+        return run_check_sources(args)
+    if args.command == "build-snapshot":
+        return run_build_snapshot(args)
+    if args.command == "startup-bench":
+        return run_startup_bench(args)
+    if args.command == "list-packs":
+        return run_list_packs(args)
+    if args.command == "migrate-state":
+        return run_migrate_state(args)
+    if args.command == "telemetry-report":
+        return run_telemetry_report(args)
+    
     if args.export_report:
         export_report()
         return 0
@@ -210,13 +1012,28 @@ def main() -> int:
         return 0
     
     # Run TUI
+    if args.low_bandwidth:
+        # Textual reads its frame rate at import time
+        os.environ.setdefault("TEXTUAL_FPS", str(LOW_BANDWIDTH_FPS))
     from aidlc_explainer.app import AIDLCExplainerApp
     
     app = AIDLCExplainerApp(
         screenshot_mode=args.screenshot_mode,
         theme=args.theme,
+        reduced_motion=args.reduced_motion,
+        low_bandwidth=args.low_bandwidth,
+        measure_bandwidth=args.wire_stats is not None,
+        telemetry_path=args.telemetry,
+        screen_cache_size=args.screen_cache,
+        resume=not args.no_resume,
+        dev_content=args.dev_content,
     )
     app.run()
+    
+    if app.bandwidth is not None:
+        app.bandwidth.write_report(args.wire_stats, low_bandwidth=args.low_bandwidth)
+        print(app.bandwidth.format_summary())
+        print(f"✅ Wire stats written to: {args.wire_stats}")
     return 0
 
 
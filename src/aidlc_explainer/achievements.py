@@ -0,0 +1,279 @@
+"""Declarative achievement rules.
+
+Achievements are defined in ``content/achievements.json``; an organization
+can add its own (or override built-in ones by ID) in
+``.aidlc-explainer/achievements.json``. Each rule is a condition tree:
+
+    {"count": "lessons.completed", "min": 6}        len(list) >= 6
+    {"value": "gamification.xp", "min": 1000}      number >= 1000
+    {"value": ["quiz.best_score", "quiz.last_score"],
+     "of": "quiz.total_questions", "default_of": 12,
+     "min_ratio": 0.8}                             first present value / total >= 0.8
+    {"is_true": "quiz.completed"}                  truthy field
+    {"unlocked": ["scholar", "quiz-master"]}       other achievements unlocked
+    {"all": [...]}, {"any": [...]}                 combinations
+
+The state fields a rule reads are collected when it is compiled, and the
+engine indexes rules by field. After a change only rules reading a changed
+field (or anything below or above it) are evaluated, and an unlock in turn
+re-evaluates only the rules that depend on that achievement.
+"""
+
+import heapq
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+ACHIEVEMENTS_SCHEMA = "achievements-v1"
+ACHIEVEMENTS_PATH = Path(__file__).parent / "content" / "achievements.json"
+CUSTOM_ACHIEVEMENTS_FILE = "achievements.json"  # In the state directory
+
+# Dependency key for "achievement <id> was unlocked"
+_UNLOCKED = "achievements.unlocked:"
+
+Condition = Callable[[dict[str, Any], set[str]], bool]
+
+
+@dataclass(frozen=True)
+class Achievement:
+    """A compiled achievement definition."""
+    id: str
+    name: str
+    description: str
+    condition: Condition
+    fields: frozenset[str]  # State paths and unlock keys the rule reads
+
+
+def _get(state: dict[str, Any], path: str) -> Any:
+    """Value at a dotted path, or None if any part is missing."""
+    value: Any = state
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _compile(rule: dict[str, Any], fields: set[str]) -> Condition:
+    """Compile a rule into a predicate, adding the fields it reads to `fields`.
+
+    Raises:
+        ValueError: If the rule is malformed
+    """
+    if not isinstance(rule, dict):
+        raise ValueError(f"Rule must be an object: {rule!r}")
+
+    if "all" in rule or "any" in rule:
+        combine = all if "all" in rule else any
+        parts = [_compile(r, fields) for r in rule.get("all", rule.get("any"))]
+        return lambda state, unlocked: combine(p(state, unlocked) for p in parts)
+
+    if "unlocked" in rule:
+        required = list(rule["unlocked"])
+        fields.update(_UNLOCKED + ach_id for ach_id in required)
+        return lambda state, unlocked: all(ach_id in unlocked for ach_id in required)
+
+    if "is_true" in rule:
+        path = rule["is_true"]
+        fields.add(path)
+        return lambda state, unlocked: bool(_get(state, path))
+
+    if "count" in rule:
+        path, minimum = rule["count"], rule.get("min", 1)
+        fields.add(path)
+        return lambda state, unlocked: len(_get(state, path) or ()) >= minimum
+
+    if "value" in rule:
+        paths = rule["value"] if isinstance(rule["value"], list) else [rule["value"]]
+        fields.update(paths)
+
+        def value(state: dict[str, Any]) -> float:
+            for path in paths:
+                found = _get(state, path)
+                if found is not None:
+                    return found
+            return 0
+
+        if "min_ratio" in rule:
+            of, default_of, ratio = rule["of"], rule.get("default_of", 0), rule["min_ratio"]
+            fields.add(of)
+
+            def total(state: dict[str, Any]) -> float:
+                found = _get(state, of)
+                return default_of if found is None else found
+
+            return lambda state, unlocked: value(state) >= total(state) * ratio
+        minimum = rule.get("min", 0)
+        return lambda state, unlocked: value(state) >= minimum
+
+    raise ValueError(f"Unknown rule: {rule!r}")
+
+
+def _ancestors(path: str) -> Iterable[str]:
+    """Strict ancestors of a dotted path, nearest first."""
+    while "." in path:
+        path = path.rsplit(".", 1)[0]
+        yield path
+
+
+class AchievementEngine:
+    """Evaluates achievement rules incrementally."""
+
+    def __init__(self, definitions: list[dict[str, Any]]) -> None:
+        """Compile definitions.
+
+        Args:
+            definitions: Achievement objects as in achievements.json
+
+        Raises:
+            ValueError: On malformed rules, unknown or cyclic ``unlocked`` references
+        """
+        compiled = {}
+        for definition in definitions:
+            fields: set[str] = set()
+            condition = _compile(definition["rule"], fields)
+            compiled[definition["id"]] = Achievement(
+                id=definition["id"],
+                name=definition.get("name", definition["id"]),
+                description=definition.get("description", ""),
+                condition=condition,
+                fields=frozenset(fields),
+            )
+        self.achievements = self._topological(compiled)
+        self._order = {a.id: i for i, a in enumerate(self.achievements)}
+
+        # _at[f]: rules reading exactly f; _under[p]: rules reading p or below p
+        self._at: dict[str, list[Achievement]] = {}
+        self._under: dict[str, list[Achievement]] = {}
+        for achievement in self.achievements:
+            for field in achievement.fields:
+                self._at.setdefault(field, []).append(achievement)
+                for prefix in (field, *_ancestors(field)):
+                    self._under.setdefault(prefix, []).append(achievement)
+
+    @staticmethod
+    def _topological(compiled: dict[str, Achievement]) -> list[Achievement]:
+        """Order achievements so each comes after those it requires."""
+        ordered: list[Achievement] = []
+        state: dict[str, str] = {}  # "visiting" or "done"
+
+        def visit(ach_id: str, chain: tuple[str, ...]) -> None:
+            if state.get(ach_id) == "done":
+                return
+            if state.get(ach_id) == "visiting":
+                raise ValueError(f"Achievement cycle: {' -> '.join((*chain, ach_id))}")
+            if ach_id not in compiled:
+                raise ValueError(f"{chain[-1]} requires unknown achievement {ach_id!r}")
+            state[ach_id] = "visiting"
+            for field in sorted(compiled[ach_id].fields):
+                if field.startswith(_UNLOCKED):
+                    visit(field[len(_UNLOCKED):], (*chain, ach_id))
+            state[ach_id] = "done"
+            ordered.append(compiled[ach_id])
+
+        for ach_id in compiled:
+            visit(ach_id, ())
+        return ordered
+
+    def __len__(self) -> int:
+        return len(self.achievements)
+
+    def get(self, ach_id: str) -> Achievement | None:
+        """Achievement by ID."""
+        index = self._order.get(ach_id)
+        return None if index is None else self.achievements[index]
+
+    def name(self, ach_id: str) -> str:
+        """Display name, falling back to the ID for unknown achievements."""
+        achievement = self.get(ach_id)
+        return achievement.name if achievement else ach_id
+
+    def affected(self, changed: Iterable[str]) -> list[Achievement]:
+        """Rules that read any of the changed paths, in dependency order."""
+        found: dict[str, Achievement] = {}
+        for path in changed:
+            for achievement in self._under.get(path, ()):
+                found[achievement.id] = achievement
+            for ancestor in _ancestors(path):
+                for achievement in self._at.get(ancestor, ()):
+                    found[achievement.id] = achievement
+        return sorted(found.values(), key=lambda a: self._order[a.id])
+
+    def evaluate(
+        self,
+        state: dict[str, Any],
+        unlocked: Iterable[str],
+        changed: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Find newly unlocked achievements.
+
+        Args:
+            state: The state document
+            unlocked: IDs already unlocked (never re-checked)
+            changed: Dotted paths that changed (e.g. "lessons.completed" or
+                "quiz"); None re-evaluates every rule
+
+        Returns:
+            IDs newly unlocked, in dependency order
+        """
+        unlocked = set(unlocked)
+        candidates = self.achievements if changed is None else self.affected(changed)
+        heap = [(self._order[a.id], a.id) for a in candidates if a.id not in unlocked]
+        heapq.heapify(heap)
+        queued = {ach_id for _, ach_id in heap}
+        newly = []
+        while heap:
+            _, ach_id = heapq.heappop(heap)
+            achievement = self.achievements[self._order[ach_id]]
+            if not achievement.condition(state, unlocked):
+                continue
+            unlocked.add(ach_id)
+            newly.append(ach_id)
+            # Dependents always sort after ach_id, so the heap stays in order
+            for dependent in self._at.get(_UNLOCKED + ach_id, ()):
+                if dependent.id not in unlocked and dependent.id not in queued:
+                    queued.add(dependent.id)
+                    heapq.heappush(heap, (self._order[dependent.id], dependent.id))
+        return newly
+
+
+def _read_definitions(path: Path) -> list[dict[str, Any]]:
+    """Achievement definitions from a JSON file.
+
+    Raises:
+        ValueError: If the file has the wrong schema
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("$schema") != ACHIEVEMENTS_SCHEMA:
+        raise ValueError(f"{path} is not an {ACHIEVEMENTS_SCHEMA} file")
+    return data["achievements"]
+
+
+@lru_cache(maxsize=8)
+def _load_engine(custom_path: Path | None, custom_mtime: float) -> AchievementEngine:
+    definitions = {d["id"]: d for d in _read_definitions(ACHIEVEMENTS_PATH)}
+    if custom_path is not None:
+        for definition in _read_definitions(custom_path):
+            definitions[definition["id"]] = definition
+    return AchievementEngine(list(definitions.values()))
+
+
+def load_achievements(state_dir: Path | None = None) -> AchievementEngine:
+    """Built-in achievements plus any defined in ``<state_dir>/achievements.json``.
+
+    Engines are cached until the custom file changes. A custom file that
+    cannot be read or compiled is ignored.
+    """
+    custom = state_dir / CUSTOM_ACHIEVEMENTS_FILE if state_dir else None
+    try:
+        mtime = custom.stat().st_mtime if custom else 0.0
+    except OSError:
+        custom, mtime = None, 0.0
+    try:
+        return _load_engine(custom, mtime)
+    except (OSError, ValueError, KeyError):
+        return _load_engine(None, 0.0)
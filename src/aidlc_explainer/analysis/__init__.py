@@ -0,0 +1,6 @@
+"""Offline analysis tools for the AI-DLC methodology models and learner cohorts.
+
+Some modules in this package depend on NumPy, which is an optional dependency
+(``pip install "aidlc-explainer[analysis]"``). They are only imported by the
+command line entry points, never by the TUI.
+"""
@@ -0,0 +1,129 @@
+"""Time-series queries over a learner's event log.
+
+The log's fixed-size records are read straight into a NumPy structured
+array, so streaks, daily activity and learning velocity are computed with
+whole-array operations rather than by replaying events one at a time.
+Days are calendar days in local time.
+"""
+
+import time
+
+import numpy as np
+
+from aidlc_explainer import events
+from aidlc_explainer.events import EventLog
+
+# Matches events.RECORD ("<dBxHi")
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("kind", "u1"),
+    ("pad", "u1"),
+    ("code", "<u2"),
+    ("value", "<i4"),
+])
+assert RECORD_DTYPE.itemsize == events.RECORD.size
+
+DAY = 86400
+VELOCITY_WINDOW = 7  # Days
+ACTIVITY_WINDOW = 14  # Days
+
+
+def load_events(log: EventLog) -> np.ndarray:
+    """All complete records of a log as a structured array."""
+    count = len(log)
+    if count == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.fromfile(log.log_path, dtype=RECORD_DTYPE, count=count)
+
+
+def local_offset() -> int:
+    """Seconds east of UTC for local time."""
+    return time.localtime().tm_gmtoff
+
+
+def day_numbers(records: np.ndarray, utc_offset: int = 0) -> np.ndarray:
+    """Day number (days since 1970-01-01) of each record."""
+    return np.floor_divide(records["timestamp"] + utc_offset, DAY).astype(np.int64)
+
+
+def streaks(days: np.ndarray, today: int) -> tuple[int, int]:
+    """Current and longest runs of consecutive active days.
+
+    The current streak is still running if the last active day is today or
+    yesterday.
+    """
+    active = np.unique(days)
+    if active.size == 0:
+        return 0, 0
+    breaks = np.flatnonzero(np.diff(active) != 1)
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.concatenate((breaks, [active.size - 1]))
+    lengths = ends - starts + 1
+    current = int(lengths[-1]) if active[-1] >= today - 1 else 0
+    return current, int(lengths.max())
+
+
+def daily_totals(
+    records: np.ndarray, days: np.ndarray, today: int, window: int, kind: int | None = None
+) -> np.ndarray:
+    """Per-day sums of record values over the `window` days ending today.
+
+    Args:
+        records: Records from `load_events`
+        days: Their day numbers from `day_numbers`
+        today: Day number of today
+        window: Number of days
+        kind: Only sum records of this kind; None counts records instead
+
+    Returns:
+        Array of `window` totals, oldest day first
+    """
+    offset = days - (today - window + 1)
+    mask = (offset >= 0) & (offset < window)
+    if kind is None:
+        return np.bincount(offset[mask], minlength=window)
+    mask &= records["kind"] == kind
+    return np.bincount(offset[mask], weights=records["value"][mask], minlength=window).astype(np.int64)
+
+
+def summarize(
+    log: EventLog,
+    now: float | None = None,
+    utc_offset: int | None = None,
+    window: int = VELOCITY_WINDOW,
+) -> dict:
+    """Activity summary for the progress panel and exports.
+
+    Args:
+        log: The learner's event log
+        now: Current Unix time (defaults to now)
+        utc_offset: Seconds east of UTC used to split days (defaults to local time)
+        window: Days over which velocity is averaged
+    """
+    records = load_events(log)
+    offset = local_offset() if utc_offset is None else utc_offset
+    today = int(((time.time() if now is None else now) + offset) // DAY)
+    days = day_numbers(records, offset)
+    current, longest = streaks(days, today)
+
+    def per_day(kind: int) -> float:
+        return round(float(daily_totals(records, days, today, window, kind).sum()) / window, 2)
+
+    counts = daily_totals(records, days, today, window, None)
+    recent = (days > today - window) & (records["kind"] == events.LESSON_SECTION)
+    answers = np.isin(records["kind"], (events.QUIZ_ANSWER, events.GATE_DECISION))
+    return {
+        "events": int(records.size),
+        "active_days": int(np.unique(days).size),
+        "streak_days": current,
+        "longest_streak": longest,
+        "daily_xp": daily_totals(records, days, today, ACTIVITY_WINDOW, events.XP).tolist(),
+        "daily_events": daily_totals(records, days, today, ACTIVITY_WINDOW, None).tolist(),
+        "xp_per_day": per_day(events.XP),
+        "sections_per_day": round(int(recent.sum()) / window, 2),
+        "events_per_day": round(float(counts.sum()) / window, 2),
+        "answer_accuracy": (
+            round(float(records["value"][answers].mean()), 4) if answers.any() else None
+        ),
+        "session_seconds": int(records["value"][records["kind"] == events.SESSION_END].sum()),
+    }
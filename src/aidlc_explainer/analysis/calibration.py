@@ -0,0 +1,275 @@
+"""Calibrate methodology factors from historical project data.
+
+`simulate_project` models a project as::
+
+    weeks = baseline_weeks * cycle_time_factor * (volatility_time_factor if volatile)
+    cost  = baseline_weeks * COST_UNITS_PER_WEEK * cost_factor
+            * (complexity_cost_factor if high complexity)
+
+Taking logs turns both equations into linear models with one intercept and
+one indicator coefficient per methodology, so every methodology is fitted in
+a single block-design least squares solve.
+
+The input CSV has one row per past project with the columns listed in
+`REQUIRED_COLUMNS`. ``baseline_weeks`` is the Waterfall-equivalent estimate the
+project was planned against; ``actual_cost`` is in the same cost units as
+`simulate_project` (``COST_UNITS_PER_WEEK`` per baseline week). ``team_size``
+is summarized but not fitted, because the model does not use it.
+"""
+
+import csv
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from aidlc_explainer.content.methodology_comparison import (
+    COST_UNITS_PER_WEEK,
+    PROFILE_SCHEMA,
+    Methodology,
+)
+
+REQUIRED_COLUMNS = (
+    "methodology",
+    "complexity",
+    "requirements_stability",
+    "team_size",
+    "baseline_weeks",
+    "actual_weeks",
+    "actual_cost",
+)
+
+
+@dataclass
+class ProjectHistory:
+    """Historical project records as column arrays."""
+    methodology: np.ndarray  # str
+    volatile: np.ndarray  # bool
+    high_complexity: np.ndarray  # bool
+    team_size: np.ndarray
+    baseline_weeks: np.ndarray
+    actual_weeks: np.ndarray
+    actual_cost: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.methodology)
+
+
+@dataclass
+class CalibratedFactors:
+    """Fitted factors for one methodology."""
+    methodology_id: str
+    cycle_time_factor: float
+    cost_factor: float
+    volatility_time_factor: float
+    complexity_cost_factor: float
+    samples: int
+    time_r2: float
+    cost_r2: float
+    mean_team_size: float
+
+
+@dataclass
+class CalibrationResult:
+    """Result of fitting all methodologies."""
+    factors: dict[str, CalibratedFactors]
+    samples: int
+    dropped: int  # Rows skipped for missing or non-positive values
+    source: str = ""
+
+    def to_profile(self) -> dict:
+        """Profile document readable by `load_methodology_profile`."""
+        return {
+            "$schema": PROFILE_SCHEMA,
+            "generated": datetime.utcnow().isoformat() + "Z",
+            "source": self.source,
+            "samples": self.samples,
+            "dropped": self.dropped,
+            "methodologies": {
+                method_id: {
+                    "cycle_time_factor": round(f.cycle_time_factor, 6),
+                    "cost_factor": round(f.cost_factor, 6),
+                    "volatility_time_factor": round(f.volatility_time_factor, 6),
+                    "complexity_cost_factor": round(f.complexity_cost_factor, 6),
+                    "samples": f.samples,
+                    "time_r2": round(f.time_r2, 4),
+                    "cost_r2": round(f.cost_r2, 4),
+                    "mean_team_size": round(f.mean_team_size, 2),
+                }
+                for method_id, f in self.factors.items()
+            },
+        }
+
+    def write_profile(self, path: Path) -> None:
+        """Write the calibrated methodology profile."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_profile(), f, indent=2)
+
+
+def read_history(path: Path) -> tuple[ProjectHistory, int]:
+    """Read historical projects from a CSV file.
+
+    Args:
+        path: CSV file with the columns in `REQUIRED_COLUMNS`
+
+    Returns:
+        Parsed history and the number of rows dropped as unusable
+
+    Raises:
+        ValueError: If a required column is missing
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader, [])]
+        missing = [name for name in REQUIRED_COLUMNS if name not in header]
+        if missing:
+            raise ValueError(f"Missing columns in {path}: {', '.join(missing)}")
+        index = [header.index(name) for name in REQUIRED_COLUMNS]
+        rows = [[row[i] for i in index] for row in reader if len(row) >= len(header)]
+
+    columns = np.array(rows, dtype=str).reshape(-1, len(REQUIRED_COLUMNS)).T
+    methodology, complexity, stability = (np.char.lower(np.char.strip(c)) for c in columns[:3])
+    numeric = np.full((4, columns.shape[1]), np.nan)
+    for i, column in enumerate(columns[3:]):
+        try:
+            numeric[i] = column.astype(np.float64)
+        except ValueError:  # Blanks or junk; parse cell by cell
+            numeric[i] = np.array([_to_float(v) for v in column])
+
+    team_size, baseline, weeks, cost = numeric
+    keep = (baseline > 0) & (weeks > 0) & (cost > 0) & (methodology != "")
+    history = ProjectHistory(
+        methodology=methodology[keep],
+        volatile=stability[keep] == "volatile",
+        high_complexity=complexity[keep] == "high",
+        team_size=team_size[keep],
+        baseline_weeks=baseline[keep],
+        actual_weeks=weeks[keep],
+        actual_cost=cost[keep],
+    )
+    return history, int((~keep).sum())
+
+
+def _to_float(value: str) -> float:
+    """Parse a CSV cell, returning NaN for blanks and junk."""
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
+
+
+def _fit_log_linear(
+    groups: np.ndarray, n_groups: int, indicator: np.ndarray, y: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fit ``y = a[group] + b[group] * indicator`` for all groups at once.
+
+    Returns:
+        Intercepts, indicator coefficients, a mask of identifiable indicator
+        coefficients and per-group R².
+    """
+    design = np.zeros((len(y), 2 * n_groups))
+    rows = np.arange(len(y))
+    design[rows, groups] = 1.0
+    design[rows, n_groups + groups] = indicator
+    coef, *_ = np.linalg.lstsq(design, y, rcond=None)
+    intercepts, slopes = coef[:n_groups], coef[n_groups:]
+
+    # An indicator is identifiable only if the group has rows on both sides.
+    with_indicator = np.bincount(groups, weights=indicator, minlength=n_groups)
+    counts = np.bincount(groups, minlength=n_groups)
+    identified = (with_indicator > 0) & (with_indicator < counts)
+
+    residual = y - design @ coef
+    mean = np.bincount(groups, weights=y, minlength=n_groups) / np.maximum(counts, 1)
+    ss_res = np.bincount(groups, weights=residual ** 2, minlength=n_groups)
+    ss_tot = np.bincount(groups, weights=(y - mean[groups]) ** 2, minlength=n_groups)
+    r2 = np.where(ss_tot > 0, 1 - ss_res / np.where(ss_tot > 0, ss_tot, 1), 1.0)
+    return intercepts, slopes, identified, r2
+
+
+def calibrate(history: ProjectHistory, methodologies: list[Methodology]) -> CalibrationResult:
+    """Fit methodology factors to historical projects.
+
+    Methodologies absent from the history are left out of the result.
+    Multipliers that cannot be identified (e.g. no volatile projects for a
+    methodology) keep their current values.
+
+    Args:
+        history: Historical project data
+        methodologies: Methodologies supplying IDs and fallback values
+
+    Returns:
+        Calibration result with one entry per observed methodology
+    """
+    known = {m.id: m for m in methodologies}
+    mask = np.isin(history.methodology, list(known))
+    ids, groups = np.unique(history.methodology[mask], return_inverse=True)
+    n = len(ids)
+
+    time_y = np.log(history.actual_weeks[mask] / history.baseline_weeks[mask])
+    cost_y = np.log(
+        history.actual_cost[mask] / (history.baseline_weeks[mask] * COST_UNITS_PER_WEEK)
+    )
+    t_icpt, t_slope, t_ok, t_r2 = _fit_log_linear(
+        groups, n, history.volatile[mask].astype(float), time_y
+    )
+    c_icpt, c_slope, c_ok, c_r2 = _fit_log_linear(
+        groups, n, history.high_complexity[mask].astype(float), cost_y
+    )
+    counts = np.bincount(groups, minlength=n)
+    team = np.bincount(groups, weights=np.nan_to_num(history.team_size[mask]), minlength=n)
+
+    factors = {}
+    for i, method_id in enumerate(ids.tolist()):
+        m = known[method_id]
+        factors[method_id] = CalibratedFactors(
+            methodology_id=method_id,
+            cycle_time_factor=float(np.exp(t_icpt[i])),
+            cost_factor=float(np.exp(c_icpt[i])),
+            volatility_time_factor=(
+                float(np.exp(t_slope[i])) if t_ok[i] else m.volatility_time_factor
+            ),
+            complexity_cost_factor=(
+                float(np.exp(c_slope[i])) if c_ok[i] else m.complexity_cost_factor
+            ),
+            samples=int(counts[i]),
+            time_r2=float(t_r2[i]),
+            cost_r2=float(c_r2[i]),
+            mean_team_size=float(team[i] / counts[i]),
+        )
+    return CalibrationResult(
+        factors=factors,
+        samples=int(mask.sum()),
+        dropped=int((~mask).sum()),
+    )
+
+
+def format_report(result: CalibrationResult, methodologies: list[Methodology]) -> str:
+    """Render calibrated factors next to the current values."""
+    current = {m.id: m for m in methodologies}
+    lines = [
+        f"Calibrated from {result.samples:,} projects ({result.dropped:,} rows skipped)",
+        "",
+        f"{'Methodology':<12} {'Factor':<24} {'Current':>9} {'Fitted':>9}",
+        "─" * 57,
+    ]
+    for method_id in (m.id for m in methodologies if m.id in result.factors):
+        fitted = result.factors[method_id]
+        for name in (
+            "cycle_time_factor",
+            "cost_factor",
+            "volatility_time_factor",
+            "complexity_cost_factor",
+        ):
+            lines.append(
+                f"{method_id:<12} {name:<24} "
+                f"{getattr(current[method_id], name):>9.3f} {getattr(fitted, name):>9.3f}"
+            )
+        lines.append(
+            f"{'':<12} {'n / R² time / R² cost':<24} "
+            f"{fitted.samples:>9} {fitted.time_r2:>9.2f} {fitted.cost_r2:>6.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,360 @@
+"""Cohort analytics over many learners' state files.
+
+Each state file is scored with the same `StateManager.get_overall_progress`
+the app shows, then reduced to counts and histograms. Worker processes
+reduce whole chunks of files to a `CohortStats` and the parent adds those
+together, so memory stays bounded by the chunk size and the number of
+chunks in flight, not by the number of files.
+"""
+
+import csv
+import io
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+import numpy as np
+
+from aidlc_explainer.migrations import STATE_VERSION, schema_version
+from aidlc_explainer.state import StateManager
+from aidlc_explainer.storage import MemoryBackend
+
+CHUNK_SIZE = 1000
+XP_BIN = 100
+OVERALL_BIN = 10  # Percent
+
+
+# Question and lesson counts; the same for every learner, so not summed
+_MAX_FIELDS = {"lessons_total", "quiz_total", "gate_total"}
+
+
+def _zeros() -> np.ndarray:
+    return np.zeros(0, dtype=np.int64)
+
+
+@dataclass
+class CohortStats:
+    """Aggregated progress of a set of learners.
+
+    Histogram arrays are indexed by value (e.g. ``quiz_scores[18]`` is the
+    number of learners whose last quiz score was 18) and grow as needed.
+    """
+    files: int = 0
+    skipped: int = 0  # Unreadable files, not state documents, or newer than this app
+    lessons_completed: np.ndarray = field(default_factory=_zeros)
+    quiz_scores: np.ndarray = field(default_factory=_zeros)
+    gate_scores: np.ndarray = field(default_factory=_zeros)
+    simulator_types: np.ndarray = field(default_factory=_zeros)
+    levels: np.ndarray = field(default_factory=_zeros)
+    xp: np.ndarray = field(default_factory=_zeros)  # Bins of XP_BIN
+    overall: np.ndarray = field(default_factory=_zeros)  # Bins of OVERALL_BIN percent
+    quiz_attempts: int = 0
+    quiz_takers: int = 0
+    gate_attempts: int = 0
+    gate_takers: int = 0
+    simulator_runs: int = 0
+    xp_total: int = 0
+    achievements: dict[str, int] = field(default_factory=dict)
+    lessons_total: int = 0
+    quiz_total: int = 0
+    gate_total: int = 0
+
+    @property
+    def learners(self) -> int:
+        """Learners successfully read."""
+        return self.files - self.skipped
+
+    def __iadd__(self, other: "CohortStats") -> "CohortStats":
+        for f in fields(self):
+            mine, theirs = getattr(self, f.name), getattr(other, f.name)
+            if isinstance(mine, np.ndarray):
+                setattr(self, f.name, _add_histograms(mine, theirs))
+            elif isinstance(mine, dict):
+                for key, count in theirs.items():
+                    mine[key] = mine.get(key, 0) + count
+            elif f.name in _MAX_FIELDS:
+                setattr(self, f.name, max(mine, theirs))
+            else:
+                setattr(self, f.name, mine + theirs)
+        return self
+
+    def to_summary(self) -> dict:
+        """JSON-serializable summary."""
+        learners = max(self.learners, 1)
+        return {
+            "files": self.files,
+            "learners": self.learners,
+            "skipped": self.skipped,
+            "lessons": {
+                "total": self.lessons_total,
+                "mean_completed": round(_mean(self.lessons_completed), 2),
+                "all_completed_rate": round(
+                    _at_least(self.lessons_completed, self.lessons_total) / learners, 4
+                ),
+                "histogram": self.lessons_completed.tolist(),
+            },
+            "quiz": {
+                "total": self.quiz_total,
+                "takers": self.quiz_takers,
+                "attempts": self.quiz_attempts,
+                "mean_score": round(_mean(self.quiz_scores), 2),
+                "median_score": _percentile(self.quiz_scores, 50),
+                "p90_score": _percentile(self.quiz_scores, 90),
+                "pass_rate": round(
+                    _at_least(self.quiz_scores, 0.8 * self.quiz_total) / learners, 4
+                ),
+                "histogram": self.quiz_scores.tolist(),
+            },
+            "gatekeeper": {
+                "total": self.gate_total,
+                "takers": self.gate_takers,
+                "attempts": self.gate_attempts,
+                "mean_score": round(_mean(self.gate_scores), 2),
+                "median_score": _percentile(self.gate_scores, 50),
+                "p90_score": _percentile(self.gate_scores, 90),
+                "histogram": self.gate_scores.tolist(),
+            },
+            "simulator": {
+                "runs": self.simulator_runs,
+                "types_explored_histogram": self.simulator_types.tolist(),
+            },
+            "achievements": {
+                ach_id: {"learners": count, "rate": round(count / learners, 4)}
+                for ach_id, count in sorted(self.achievements.items())
+            },
+            "xp": {
+                "total": self.xp_total,
+                "mean": round(self.xp_total / learners, 1),
+                "bin_size": XP_BIN,
+                "histogram": self.xp.tolist(),
+            },
+            "levels": self.levels.tolist(),
+            "overall_percent": {
+                "bin_size": OVERALL_BIN,
+                "histogram": self.overall.tolist(),
+            },
+        }
+
+
+def _add_histograms(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Add two histograms of possibly different lengths."""
+    if len(a) < len(b):
+        a, b = b, a
+    result = a.copy()
+    result[: len(b)] += b
+    return result
+
+
+def _mean(histogram: np.ndarray) -> float:
+    total = histogram.sum()
+    return float(histogram @ np.arange(len(histogram)) / total) if total else 0.0
+
+
+def _percentile(histogram: np.ndarray, pct: float) -> int:
+    """Smallest value with at least pct% of the counts at or below it."""
+    total = histogram.sum()
+    if not total:
+        return 0
+    return int(np.searchsorted(np.cumsum(histogram), pct / 100 * total))
+
+
+def _at_least(histogram: np.ndarray, threshold: float) -> int:
+    return int(histogram[int(np.ceil(threshold)):].sum())
+
+
+def iter_state_files(root: Path) -> Iterator[str]:
+    """Yield every .json file under root, depth first, without sorting."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield entry.path
+
+
+def summarize_files(paths: list[str]) -> CohortStats:
+    """Read and aggregate a chunk of state files (runs in a worker)."""
+    n = len(paths)
+    columns = np.zeros((8, n), dtype=np.int64)
+    lessons, quiz, gate, sim_types, level, xp, overall, ok = columns
+    stats = CohortStats(files=n)
+    backend = MemoryBackend()
+
+    for i, path in enumerate(paths):
+        try:
+            with open(path, "rb") as f:
+                document = json.loads(f.read())
+        except (OSError, ValueError):
+            continue
+        version = schema_version(document)
+        if version is None or version > STATE_VERSION:
+            continue
+        backend.documents[path] = document
+        manager = StateManager(backend=backend, learner_id=path)
+        progress = manager.get_overall_progress()
+        del backend.documents[path]
+
+        ok[i] = 1
+        lessons[i] = progress["lessons"]["completed"]
+        quiz[i] = progress["quiz"]["score"]
+        gate[i] = progress["gatekeeper"]["score"]
+        sim_types[i] = progress["simulator"]["types_explored"]
+        level[i] = progress["gamification"]["level"]
+        xp[i] = progress["gamification"]["xp"]
+        overall[i] = progress["overall_percent"]
+        stats.quiz_attempts += progress["quiz"]["attempts"]
+        stats.quiz_takers += progress["quiz"]["attempts"] > 0
+        stats.gate_attempts += progress["gatekeeper"]["attempts"]
+        stats.gate_takers += progress["gatekeeper"]["attempts"] > 0
+        stats.simulator_runs += progress["simulator"]["runs"]
+        stats.lessons_total = max(stats.lessons_total, progress["lessons"]["total"])
+        stats.quiz_total = max(stats.quiz_total, progress["quiz"]["total"])
+        stats.gate_total = max(stats.gate_total, progress["gatekeeper"]["total"])
+        for ach_id in manager.get_achievements()["unlocked"]:
+            stats.achievements[ach_id] = stats.achievements.get(ach_id, 0) + 1
+
+    read = ok.astype(bool)
+    stats.skipped = int(n - read.sum())
+    stats.lessons_completed = np.bincount(lessons[read])
+    stats.quiz_scores = np.bincount(quiz[read])
+    stats.gate_scores = np.bincount(gate[read])
+    stats.simulator_types = np.bincount(sim_types[read])
+    stats.levels = np.bincount(level[read])
+    stats.xp = np.bincount(xp[read] // XP_BIN)
+    stats.overall = np.bincount(overall[read] // OVERALL_BIN)
+    stats.xp_total = int(xp[read].sum())
+    return stats
+
+
+def _chunks(paths: Iterator[str], size: int) -> Iterator[list[str]]:
+    chunk = []
+    for path in paths:
+        chunk.append(path)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def build_report(
+    root: Path,
+    processes: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[CohortStats, float]:
+    """Aggregate every state file under a directory.
+
+    Directory listing, parsing and aggregation overlap: at most two chunks
+    per worker are in flight at any time.
+
+    Args:
+        root: Directory of collected state files (searched recursively)
+        processes: Worker processes (default: CPU count)
+        chunk_size: Files per worker task
+
+    Returns:
+        Aggregated statistics and the elapsed seconds
+    """
+    start = time.perf_counter()
+    processes = processes or os.cpu_count() or 1
+    total = CohortStats()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending: set[Future] = set()
+        for chunk in _chunks(iter_state_files(root), chunk_size):
+            if len(pending) >= 2 * processes:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    total += future.result()
+            pending.add(pool.submit(summarize_files, chunk))
+        for future in pending:
+            total += future.result()
+    return total, time.perf_counter() - start
+
+
+def format_markdown(stats: CohortStats, elapsed: float | None = None) -> str:
+    """Render the cohort summary as a Markdown report."""
+    s = stats.to_summary()
+    learners = max(stats.learners, 1)
+    lines = ["# AI-DLC Cohort Report", ""]
+    lines.append(
+        f"**Learners:** {s['learners']:,} ({s['skipped']:,} of {s['files']:,} files skipped)"
+    )
+    if elapsed is not None:
+        lines.append(f"**Processed in:** {elapsed:.2f}s")
+    lines.append("")
+
+    lines += [
+        "## Summary",
+        "",
+        "| Metric | Value |",
+        "|--------|-------|",
+        f"| Mean lessons completed | {s['lessons']['mean_completed']} / {s['lessons']['total']} |",
+        f"| Completed all lessons | {s['lessons']['all_completed_rate']:.1%} |",
+        f"| Quiz takers | {s['quiz']['takers']:,} ({s['quiz']['takers'] / learners:.1%}) |",
+        f"| Quiz mean / median / p90 | {s['quiz']['mean_score']} / "
+        f"{s['quiz']['median_score']} / {s['quiz']['p90_score']} of {s['quiz']['total']} |",
+        f"| Quiz 80%+ | {s['quiz']['pass_rate']:.1%} |",
+        f"| Gatekeeper mean / median / p90 | {s['gatekeeper']['mean_score']} / "
+        f"{s['gatekeeper']['median_score']} / {s['gatekeeper']['p90_score']} "
+        f"of {s['gatekeeper']['total']} |",
+        f"| Simulator runs | {s['simulator']['runs']:,} |",
+        f"| Mean XP | {s['xp']['mean']:,} |",
+        "",
+        "## Achievements",
+        "",
+        "| Achievement | Learners | Rate |",
+        "|-------------|----------|------|",
+    ]
+    for ach_id, a in s["achievements"].items():
+        lines.append(f"| {ach_id} | {a['learners']:,} | {a['rate']:.1%} |")
+    lines.append("")
+
+    def histogram(title: str, counts: list[int], label) -> None:
+        lines.extend([f"## {title}", "", "| Bin | Learners | |", "|-----|----------|---|"])
+        peak = max(counts, default=0) or 1
+        for value, count in enumerate(counts):
+            if count:
+                lines.append(f"| {label(value)} | {count:,} | {'█' * round(20 * count / peak)} |")
+        lines.append("")
+
+    histogram("Lessons Completed", s["lessons"]["histogram"], str)
+    histogram("Quiz Scores", s["quiz"]["histogram"], str)
+    histogram("Gatekeeper Scores", s["gatekeeper"]["histogram"], str)
+    histogram("XP", s["xp"]["histogram"], lambda b: f"{b * XP_BIN}–{(b + 1) * XP_BIN - 1}")
+    histogram("Levels", s["levels"], str)
+    return "\n".join(lines)
+
+
+def format_csv(stats: CohortStats) -> str:
+    """Render the cohort summary as long-format CSV (section, key, value)."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["section", "key", "value"])
+
+    def walk(section: str, value) -> None:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                walk(f"{section}.{key}" if section else key, item)
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                writer.writerow([section, index, item])
+        else:
+            head, _, key = section.rpartition(".")
+            writer.writerow([head, key, value])
+
+    walk("", stats.to_summary())
+    return out.getvalue()
+
+
+def format_json(stats: CohortStats, elapsed: float | None = None) -> str:
+    """Render the cohort summary as JSON."""
+    summary = stats.to_summary()
+    if elapsed is not None:
+        summary["elapsed_seconds"] = round(elapsed, 3)
+    return json.dumps(summary, indent=2)
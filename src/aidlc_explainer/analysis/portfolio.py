@@ -0,0 +1,412 @@
+"""Discrete-event simulation of a project portfolio on shared AI-DLC roles.
+
+`simulate_project` evaluates one project in isolation. Here many projects run
+through the AI-DLC lifecycle at once and compete for the same people, taken
+from the AI-DLC roles in `ROLE_MAPPINGS`:
+
+    Inception     Mob Elaboration (AI Facilitator) → Inception gate (Intent Owner)
+    Construction  per Bolt: AI generation → review (Human Validator)
+                  → evidence (Validation Specialist)
+                  then the Construction gate (Intent Owner)
+    Operations    deploy with evidence
+
+Gates can send work back (another Mob Elaboration or a remediation Bolt) and
+reviews can send a Bolt back for another iteration. Every change of role is a
+handoff. Events are kept in a single heap ordered by simulated time, in hours.
+"""
+
+import heapq
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from aidlc_explainer.content.methodology_comparison import (
+    Methodology,
+    ProjectScenario,
+    get_methodology,
+    get_project_scenarios,
+)
+from aidlc_explainer.content.transition_mapping import get_role_mappings
+
+HOURS_PER_WEEK = 40
+HOURS_PER_BOLT = 8  # Planned AI-DLC effort covered by one Bolt
+
+INTENT_OWNER = "Intent Owner"
+AI_FACILITATOR = "AI Facilitator"
+HUMAN_VALIDATOR = "Human Validator"
+VALIDATION_SPECIALIST = "Validation Specialist"
+
+DEFAULT_CAPACITY = {
+    INTENT_OWNER: 4,
+    AI_FACILITATOR: 4,
+    HUMAN_VALIDATOR: 16,
+    VALIDATION_SPECIALIST: 8,
+}
+
+# Mean activity durations in hours, before the complexity multiplier
+MOB_ELABORATION_HOURS = 4.0
+GATE_REVIEW_HOURS = 1.0
+AI_GENERATION_HOURS = 2.0
+BOLT_REVIEW_HOURS = 2.0
+EVIDENCE_HOURS = 1.0
+DEPLOY_HOURS = 4.0
+
+COMPLEXITY_MULTIPLIER = {"low": 0.5, "medium": 1.0, "high": 1.5}
+# Chance that a review or gate sends work back, by requirements stability
+REWORK_PROBABILITY = {"stable": 0.1, "evolving": 0.2, "volatile": 0.35}
+
+# Activities (also event kinds)
+_MOB, _INCEPTION_GATE, _GENERATE, _REVIEW, _EVIDENCE, _CONSTRUCTION_GATE, _DEPLOY, _ARRIVE = (
+    range(8)
+)
+
+
+@dataclass
+class PoolStats:
+    """Occupancy statistics for one shared role pool."""
+    role: str
+    capacity: int
+    requests: int = 0
+    busy_hours: float = 0.0
+    wait_hours: float = 0.0
+    max_queue: int = 0
+    queue_area: float = 0.0  # Integral of queue length over time
+
+    def utilization(self, horizon: float) -> float:
+        """Fraction of the pool's capacity that was busy."""
+        return self.busy_hours / (self.capacity * horizon) if horizon > 0 else 0.0
+
+    def mean_queue(self, horizon: float) -> float:
+        """Time-averaged number of requests waiting."""
+        return self.queue_area / horizon if horizon > 0 else 0.0
+
+    def mean_wait(self) -> float:
+        """Mean hours a request waited for someone in the pool."""
+        return self.wait_hours / self.requests if self.requests else 0.0
+
+
+@dataclass
+class PortfolioResult:
+    """Outcome of a portfolio simulation."""
+    projects: int
+    completed: int
+    events: int
+    horizon_hours: float
+    cycle_hours: list[float]
+    gate_wait_hours: float
+    bolts: int
+    bolt_iterations: int
+    handoffs: int
+    pools: dict[str, PoolStats]
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput_per_week(self) -> float:
+        """Projects completed per simulated week."""
+        weeks = self.horizon_hours / HOURS_PER_WEEK
+        return self.completed / weeks if weeks > 0 else 0.0
+
+    def cycle_percentile(self, pct: float) -> float:
+        """Project cycle time percentile in weeks."""
+        if not self.cycle_hours:
+            return 0.0
+        ordered = sorted(self.cycle_hours)
+        index = min(len(ordered) - 1, int(pct / 100 * len(ordered)))
+        return ordered[index] / HOURS_PER_WEEK
+
+    def to_summary(self) -> dict:
+        """JSON-serializable summary."""
+        return {
+            "projects": self.projects,
+            "completed": self.completed,
+            "events": self.events,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "horizon_weeks": round(self.horizon_hours / HOURS_PER_WEEK, 2),
+            "throughput_per_week": round(self.throughput_per_week, 3),
+            "cycle_weeks": {
+                "p50": round(self.cycle_percentile(50), 2),
+                "p95": round(self.cycle_percentile(95), 2),
+                "max": round(self.cycle_percentile(100), 2),
+            },
+            "gate_wait_hours_per_project": round(
+                self.gate_wait_hours / self.completed if self.completed else 0.0, 2
+            ),
+            "bolts": self.bolts,
+            "bolt_iterations": self.bolt_iterations,
+            "handoffs": self.handoffs,
+            "pools": {
+                role: {
+                    "capacity": pool.capacity,
+                    "utilization": round(pool.utilization(self.horizon_hours), 4),
+                    "mean_queue": round(pool.mean_queue(self.horizon_hours), 3),
+                    "max_queue": pool.max_queue,
+                    "mean_wait_hours": round(pool.mean_wait(), 3),
+                }
+                for role, pool in self.pools.items()
+            },
+        }
+
+
+@dataclass
+class _Project:
+    """Mutable per-project simulation state."""
+    scenario: ProjectScenario
+    arrived: float
+    duration_scale: float
+    rework_probability: float
+    bolts_planned: int
+    bolts_done: int = 0
+    gate_requested: float = 0.0
+
+
+@dataclass
+class _Pool:
+    """A shared role pool with a FIFO queue."""
+    stats: PoolStats
+    free: int
+    queue: deque = field(default_factory=deque)
+    last_change: float = 0.0
+
+
+class PortfolioSimulation:
+    """Heap-scheduled discrete-event simulation of concurrent AI-DLC projects."""
+
+    def __init__(
+        self,
+        scenarios: list[ProjectScenario],
+        capacity: dict[str, int] | None = None,
+        methodology: Methodology | None = None,
+        arrival_hours: float = 2.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the simulation.
+
+        Args:
+            scenarios: Projects to run; each arrives once
+            capacity: People per AI-DLC role (defaults to DEFAULT_CAPACITY)
+            methodology: AI-DLC methodology supplying the cycle time factor
+            arrival_hours: Mean hours between project arrivals (0 = all at once)
+            seed: Random seed for durations, arrivals and rework
+
+        Raises:
+            ValueError: If a role is unknown or has no capacity
+        """
+        roles = [mapping.aidlc_role for mapping in get_role_mappings()]
+        capacity = {**DEFAULT_CAPACITY, **(capacity or {})}
+        for role, size in capacity.items():
+            if role not in roles:
+                raise ValueError(f"Unknown AI-DLC role: {role} (expected one of {roles})")
+            if size < 1:
+                raise ValueError(f"Role {role} needs at least one person")
+
+        self.scenarios = scenarios
+        self.capacity = {role: capacity[role] for role in roles if role in capacity}
+        self.methodology = methodology or get_methodology("aidlc")
+        self.arrival_hours = arrival_hours
+        self.seed = seed
+
+    def _plan(self, scenario: ProjectScenario, arrived: float) -> _Project:
+        """Derive Bolt count and duration scale for a scenario."""
+        planned_hours = (
+            scenario.baseline_weeks * self.methodology.cycle_time_factor * HOURS_PER_WEEK
+        )
+        return _Project(
+            scenario=scenario,
+            arrived=arrived,
+            duration_scale=COMPLEXITY_MULTIPLIER.get(scenario.complexity, 1.0),
+            rework_probability=REWORK_PROBABILITY.get(scenario.requirements_stability, 0.2),
+            bolts_planned=max(1, round(planned_hours / HOURS_PER_BOLT)),
+        )
+
+    def run(self) -> PortfolioResult:
+        """Run the simulation until every project is deployed."""
+        started = time.perf_counter()
+        rng = random.Random(self.seed)
+        expo = rng.expovariate
+        rand = rng.random
+        heap: list[tuple[float, int, int, int]] = []
+        push = heapq.heappush
+        pop = heapq.heappop
+        seq = 0
+
+        pools = {
+            role: _Pool(PoolStats(role, size), size) for role, size in self.capacity.items()
+        }
+        activity_pool = {
+            _MOB: pools[AI_FACILITATOR],
+            _INCEPTION_GATE: pools[INTENT_OWNER],
+            _REVIEW: pools[HUMAN_VALIDATOR],
+            _EVIDENCE: pools[VALIDATION_SPECIALIST],
+            _CONSTRUCTION_GATE: pools[INTENT_OWNER],
+        }
+        mean_hours = {
+            _MOB: MOB_ELABORATION_HOURS,
+            _INCEPTION_GATE: GATE_REVIEW_HOURS,
+            _GENERATE: AI_GENERATION_HOURS,
+            _REVIEW: BOLT_REVIEW_HOURS,
+            _EVIDENCE: EVIDENCE_HOURS,
+            _CONSTRUCTION_GATE: GATE_REVIEW_HOURS,
+            _DEPLOY: DEPLOY_HOURS,
+        }
+
+        projects: list[_Project] = []
+        arrival = 0.0
+        for scenario in self.scenarios:
+            projects.append(self._plan(scenario, arrival))
+            push(heap, (arrival, seq, _ARRIVE, len(projects) - 1))
+            seq += 1
+            if self.arrival_hours > 0:
+                arrival += expo(1.0 / self.arrival_hours)
+
+        now = 0.0
+        events = 0
+        cycle_hours: list[float] = []
+        gate_wait = 0.0
+        bolts = 0
+        bolt_iterations = 0
+        handoffs = 0
+
+        def touch(pool: _Pool) -> None:
+            """Accumulate the queue-length integral up to now."""
+            pool.stats.queue_area += len(pool.queue) * (now - pool.last_change)
+            pool.last_change = now
+
+        def begin(activity: int, index: int, requested: float) -> None:
+            """Start an activity now and schedule its completion."""
+            nonlocal seq
+            pool = activity_pool.get(activity)
+            duration = expo(1.0 / (mean_hours[activity] * projects[index].duration_scale))
+            if pool is not None:
+                pool.stats.wait_hours += now - requested
+                pool.stats.busy_hours += duration
+            push(heap, (now + duration, seq, activity, index))
+            seq += 1
+
+        def request(activity: int, index: int) -> None:
+            """Ask for a person from the activity's pool, queueing if none is free."""
+            pool = activity_pool.get(activity)
+            if pool is None:
+                begin(activity, index, now)
+                return
+            pool.stats.requests += 1
+            if pool.free:
+                pool.free -= 1
+                begin(activity, index, now)
+            else:
+                touch(pool)
+                pool.queue.append((activity, index, now))
+                if len(pool.queue) > pool.stats.max_queue:
+                    pool.stats.max_queue = len(pool.queue)
+
+        def release(pool: _Pool) -> None:
+            """Hand a freed person to the next queued request."""
+            if pool.queue:
+                touch(pool)
+                activity, index, requested = pool.queue.popleft()
+                begin(activity, index, requested)
+            else:
+                pool.free += 1
+
+        while heap:
+            now, _, activity, index = pop(heap)
+            events += 1
+            project = projects[index]
+            pool = activity_pool.get(activity)
+            if pool is not None:
+                release(pool)
+
+            if activity == _ARRIVE:
+                request(_MOB, index)
+            elif activity == _MOB:
+                handoffs += 1
+                project.gate_requested = now
+                request(_INCEPTION_GATE, index)
+            elif activity == _INCEPTION_GATE:
+                gate_wait += now - project.gate_requested
+                if rand() < project.rework_probability:
+                    handoffs += 1
+                    request(_MOB, index)
+                else:
+                    bolts += 1
+                    request(_GENERATE, index)
+            elif activity == _GENERATE:
+                request(_REVIEW, index)
+            elif activity == _REVIEW:
+                if rand() < project.rework_probability:
+                    bolt_iterations += 1
+                    request(_GENERATE, index)
+                else:
+                    handoffs += 1
+                    request(_EVIDENCE, index)
+            elif activity == _EVIDENCE:
+                project.bolts_done += 1
+                handoffs += 1
+                if project.bolts_done < project.bolts_planned:
+                    bolts += 1
+                    request(_GENERATE, index)
+                else:
+                    project.gate_requested = now
+                    request(_CONSTRUCTION_GATE, index)
+            elif activity == _CONSTRUCTION_GATE:
+                gate_wait += now - project.gate_requested
+                if rand() < project.rework_probability:
+                    # Remediation Bolt before the gate is requested again
+                    project.bolts_planned += 1
+                    bolts += 1
+                    handoffs += 1
+                    request(_GENERATE, index)
+                else:
+                    request(_DEPLOY, index)
+            elif activity == _DEPLOY:
+                cycle_hours.append(now - project.arrived)
+
+        for pool in pools.values():
+            touch(pool)
+
+        return PortfolioResult(
+            projects=len(projects),
+            completed=len(cycle_hours),
+            events=events,
+            horizon_hours=now,
+            cycle_hours=cycle_hours,
+            gate_wait_hours=gate_wait,
+            bolts=bolts,
+            bolt_iterations=bolt_iterations,
+            handoffs=handoffs,
+            pools={role: pool.stats for role, pool in pools.items()},
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+
+def build_portfolio(count: int) -> list[ProjectScenario]:
+    """Build a portfolio by cycling through the built-in project scenarios."""
+    scenarios = get_project_scenarios()
+    return [scenarios[i % len(scenarios)] for i in range(count)]
+
+
+def format_report(result: PortfolioResult) -> str:
+    """Render a portfolio result as a plain-text report."""
+    summary = result.to_summary()
+    lines = [
+        f"Portfolio: {result.completed:,}/{result.projects:,} projects deployed, "
+        f"{result.events:,} events in {result.elapsed_seconds:.2f}s",
+        f"Horizon: {summary['horizon_weeks']} weeks  │  "
+        f"Throughput: {summary['throughput_per_week']} projects/week",
+        f"Cycle time (weeks): p50 {summary['cycle_weeks']['p50']}  "
+        f"p95 {summary['cycle_weeks']['p95']}  max {summary['cycle_weeks']['max']}",
+        f"Gate wait per project: {summary['gate_wait_hours_per_project']} h  │  "
+        f"Bolts: {result.bolts:,} ({result.bolt_iterations:,} extra iterations)  │  "
+        f"Handoffs: {result.handoffs:,}",
+        "",
+        f"{'Role':<24} {'People':>6} {'Util':>7} {'Avg queue':>10} {'Max queue':>10} "
+        f"{'Avg wait (h)':>13}",
+        "─" * 75,
+    ]
+    for role, pool in summary["pools"].items():
+        lines.append(
+            f"{role:<24} {pool['capacity']:>6} {pool['utilization']:>7.1%} "
+            f"{pool['mean_queue']:>10.2f} {pool['max_queue']:>10} "
+            f"{pool['mean_wait_hours']:>13.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,493 @@
+"""Parameter sweeps and sensitivity analysis over the methodology comparison model.
+
+`simulate_project` evaluates one scenario against one methodology. This module
+re-expresses the same model as broadcast NumPy arithmetic so that a dense grid
+of methodology factors and scenario attributes can be evaluated in one pass,
+then reports where AI-DLC wins, which parameters matter most (tornado chart)
+and the break-even values at which AI-DLC stops winning.
+"""
+
+import functools
+import math
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from aidlc_explainer.content.methodology_comparison import (
+    COST_UNITS_PER_WEEK,
+    Methodology,
+    ProjectScenario,
+)
+
+SWEEP_FORMAT = "sweep-v1"
+
+COMPLEXITY_LEVELS = ("low", "medium", "high")
+STABILITY_LEVELS = ("stable", "evolving", "volatile")
+
+FACTOR_RANGE = (0.05, 1.5)  # Swept range for cycle time and cost factors
+TEAM_SIZE_RANGE = (2, 20)
+BASELINE_WEEKS_RANGE = (4, 52)
+
+BLOCK_SIZE = 1 << 21  # Grid points evaluated per vectorized block
+LINE_SAMPLES = 2001  # Samples per axis for tornado and break-even lines
+
+
+@dataclass
+class SweepAxis:
+    """A swept parameter and the values it takes on the grid."""
+    name: str
+    values: np.ndarray
+    labels: tuple[str, ...] | None = None  # Set for categorical axes
+
+    @property
+    def categorical(self) -> bool:
+        """Whether the axis encodes a categorical attribute."""
+        return self.labels is not None
+
+    def label(self, value: float) -> str:
+        """Format an axis value for display."""
+        if self.labels is not None:
+            return self.labels[int(value)]
+        if float(value).is_integer():
+            return str(int(value))
+        return f"{value:.3f}"
+
+    def line(self) -> np.ndarray:
+        """Dense 1-D samples over the axis range for one-at-a-time analysis."""
+        if self.categorical or len(self.values) < 2:
+            return self.values
+        low, high = float(self.values.min()), float(self.values.max())
+        if np.all(np.mod(self.values, 1) == 0):
+            return np.arange(low, high + 1)
+        return np.linspace(low, high, LINE_SAMPLES)
+
+
+@dataclass
+class TornadoBar:
+    """Range of AI-DLC's advantage when one parameter varies alone."""
+    metric: str  # "weeks_saved" or "cost_saved"
+    axis: str
+    low_value: float
+    high_value: float
+    saved_at_low: float
+    saved_at_high: float
+    min_saved: float
+    max_saved: float
+
+    @property
+    def swing(self) -> float:
+        """Width of the tornado bar."""
+        return self.max_saved - self.min_saved
+
+
+@dataclass
+class BreakEven:
+    """A parameter value at which AI-DLC starts or stops winning."""
+    axis: str
+    value: float
+    stops_winning: bool
+
+
+@dataclass
+class SweepResult:
+    """Aggregated output of a parameter sweep."""
+    axes: list[SweepAxis]
+    base_point: dict[str, float]
+    target: str
+    points: int
+    wins: int
+    marginal_wins: list[np.ndarray]
+    tornado: list[TornadoBar]
+    break_evens: list[BreakEven]
+    elapsed_seconds: float = 0.0
+    win_mask: np.ndarray | None = field(default=None, repr=False)  # Packed bits
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the parameter grid."""
+        return tuple(len(axis.values) for axis in self.axes)
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of grid points where the target methodology wins."""
+        return self.wins / self.points if self.points else 0.0
+
+    def marginal_win_rates(self) -> list[np.ndarray]:
+        """Win rate for each value of each axis, averaged over all other axes."""
+        return [
+            counts / (self.points // len(axis.values))
+            for axis, counts in zip(self.axes, self.marginal_wins, strict=True)
+        ]
+
+    def unpacked_win_mask(self) -> np.ndarray | None:
+        """The full boolean win grid, if it was kept."""
+        if self.win_mask is None:
+            return None
+        bits = np.unpackbits(self.win_mask, count=self.points).astype(bool)
+        return bits.reshape(self.shape)
+
+    def to_summary(self) -> dict:
+        """JSON-serializable summary of the sweep."""
+        return {
+            "$schema": SWEEP_FORMAT,
+            "target": self.target,
+            "points": self.points,
+            "wins": self.wins,
+            "win_rate": round(self.win_rate, 6),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "base_point": self.base_point,
+            "axes": {
+                axis.name: {
+                    "values": [axis.label(v) for v in axis.values],
+                    "win_rate": [round(float(r), 6) for r in rates],
+                }
+                for axis, rates in zip(self.axes, self.marginal_win_rates(), strict=True)
+            },
+            "tornado": [
+                {
+                    "metric": bar.metric,
+                    "axis": bar.axis,
+                    "min_saved": bar.min_saved,
+                    "max_saved": bar.max_saved,
+                    "swing": bar.swing,
+                }
+                for bar in self.tornado
+            ],
+            "break_evens": [
+                {
+                    "axis": be.axis,
+                    "value": be.value,
+                    "stops_winning": be.stops_winning,
+                }
+                for be in self.break_evens
+            ],
+        }
+
+    def save(self, path: Path) -> None:
+        """Save the result as a compressed ``.npz`` archive."""
+        arrays: dict[str, np.ndarray] = {
+            "format": np.array(SWEEP_FORMAT),
+            "target": np.array(self.target),
+            "counts": np.array([self.points, self.wins], dtype=np.int64),
+            "elapsed_seconds": np.array(self.elapsed_seconds),
+            "axis_names": np.array([axis.name for axis in self.axes]),
+            "base_names": np.array(list(self.base_point)),
+            "base_values": np.array(list(self.base_point.values()), dtype=np.float64),
+            "tornado_metrics": np.array([bar.metric for bar in self.tornado]),
+            "tornado_axes": np.array([bar.axis for bar in self.tornado]),
+            "tornado_values": np.array(
+                [
+                    [bar.low_value, bar.high_value, bar.saved_at_low,
+                     bar.saved_at_high, bar.min_saved, bar.max_saved]
+                    for bar in self.tornado
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 6),
+            "break_even_axes": np.array([be.axis for be in self.break_evens]),
+            "break_even_values": np.array(
+                [[be.value, be.stops_winning] for be in self.break_evens], dtype=np.float64
+            ).reshape(-1, 2),
+        }
+        for i, axis in enumerate(self.axes):
+            arrays[f"axis_{i}"] = axis.values
+            arrays[f"marginal_{i}"] = self.marginal_wins[i]
+            if axis.labels is not None:
+                arrays[f"labels_{i}"] = np.array(axis.labels)
+        if self.win_mask is not None:
+            arrays["win_mask"] = self.win_mask
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> "SweepResult":
+        """Load a result written by `save`."""
+        with np.load(path) as data:
+            if str(data["format"]) != SWEEP_FORMAT:
+                raise ValueError(f"Unsupported sweep format: {data['format']}")
+            axes = []
+            marginal = []
+            for i, name in enumerate(data["axis_names"]):
+                labels = data.get(f"labels_{i}")
+                axes.append(SweepAxis(
+                    str(name),
+                    data[f"axis_{i}"],
+                    tuple(str(label) for label in labels) if labels is not None else None,
+                ))
+                marginal.append(data[f"marginal_{i}"])
+            points, wins = (int(v) for v in data["counts"])
+            tornado = [
+                TornadoBar(str(metric), str(name), *(float(v) for v in row))
+                for metric, name, row in zip(
+                    data["tornado_metrics"], data["tornado_axes"], data["tornado_values"],
+                    strict=True,
+                )
+            ]
+            break_evens = [
+                BreakEven(str(name), float(row[0]), bool(row[1]))
+                for name, row in zip(
+                    data["break_even_axes"], data["break_even_values"], strict=True
+                )
+            ]
+            return cls(
+                axes=axes,
+                base_point=dict(zip(
+                    (str(n) for n in data["base_names"]),
+                    (float(v) for v in data["base_values"]),
+                    strict=True,
+                )),
+                target=str(data["target"]),
+                points=points,
+                wins=wins,
+                marginal_wins=marginal,
+                tornado=tornado,
+                break_evens=break_evens,
+                elapsed_seconds=float(data["elapsed_seconds"]),
+                win_mask=data["win_mask"] if "win_mask" in data else None,
+            )
+
+
+def factor_axis_name(methodology_id: str, factor: str) -> str:
+    """Axis name for a methodology factor, e.g. ``aidlc.cycle_time_factor``."""
+    return f"{methodology_id}.{factor}"
+
+
+def default_axes(methodologies: list[Methodology], resolution: int = 6) -> list[SweepAxis]:
+    """Build the default sweep grid.
+
+    Args:
+        methodologies: Methodologies whose cycle time and cost factors are swept
+        resolution: Number of samples per continuous axis
+
+    Returns:
+        Axes for every methodology factor plus the scenario attributes
+    """
+    factor_values = np.linspace(*FACTOR_RANGE, resolution)
+    axes = []
+    for m in methodologies:
+        axes.append(SweepAxis(factor_axis_name(m.id, "cycle_time_factor"), factor_values))
+        axes.append(SweepAxis(factor_axis_name(m.id, "cost_factor"), factor_values))
+    axes.append(SweepAxis(
+        "complexity", np.arange(len(COMPLEXITY_LEVELS), dtype=np.float64), COMPLEXITY_LEVELS
+    ))
+    axes.append(SweepAxis(
+        "requirements_stability", np.arange(len(STABILITY_LEVELS), dtype=np.float64),
+        STABILITY_LEVELS,
+    ))
+    axes.append(SweepAxis(
+        "team_size", np.unique(np.linspace(*TEAM_SIZE_RANGE, resolution).round())
+    ))
+    axes.append(SweepAxis(
+        "baseline_weeks", np.unique(np.linspace(*BASELINE_WEEKS_RANGE, resolution).round())
+    ))
+    return axes
+
+
+def base_point(methodologies: list[Methodology], scenario: ProjectScenario) -> dict[str, float]:
+    """The hard-coded model parameters for a scenario, keyed by axis name."""
+    point = {}
+    for m in methodologies:
+        point[factor_axis_name(m.id, "cycle_time_factor")] = m.cycle_time_factor
+        point[factor_axis_name(m.id, "cost_factor")] = m.cost_factor
+    point["complexity"] = float(COMPLEXITY_LEVELS.index(scenario.complexity))
+    point["requirements_stability"] = float(
+        STABILITY_LEVELS.index(scenario.requirements_stability)
+    )
+    point["team_size"] = float(scenario.team_size)
+    point["baseline_weeks"] = float(scenario.baseline_weeks)
+    return point
+
+
+def evaluate(
+    params: dict[str, np.ndarray | float],
+    methodologies: list[Methodology],
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Vectorized equivalent of `simulate_project` for weeks and cost.
+
+    Every parameter may be a scalar or an array; arrays are broadcast together.
+    Operations are ordered exactly as in `simulate_project`, so integer results
+    match it bit for bit.
+
+    Args:
+        params: Parameter values keyed by axis name
+        methodologies: Methodologies to evaluate
+
+    Returns:
+        Mapping of methodology id to ``(total_weeks, total_cost_units)`` arrays
+    """
+    volatile = np.equal(params["requirements_stability"], STABILITY_LEVELS.index("volatile"))
+    high = np.equal(params["complexity"], COMPLEXITY_LEVELS.index("high"))
+    base_weeks = np.asarray(params["baseline_weeks"], dtype=np.float64)
+
+    results = {}
+    for m in methodologies:
+        cycle = params.get(factor_axis_name(m.id, "cycle_time_factor"), m.cycle_time_factor)
+        cost = params.get(factor_axis_name(m.id, "cost_factor"), m.cost_factor)
+        time_factor = np.where(volatile, np.multiply(cycle, m.volatility_time_factor), cycle)
+        cost_factor = np.where(high, np.multiply(cost, m.complexity_cost_factor), cost)
+        results[m.id] = (
+            np.trunc(base_weeks * time_factor),
+            np.trunc(base_weeks * COST_UNITS_PER_WEEK * cost_factor),
+        )
+    return results
+
+
+def _advantage(
+    results: dict[str, tuple[np.ndarray, np.ndarray]], target: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Weeks and cost saved by the target, and whether it wins on both."""
+    target_weeks, target_cost = results[target]
+    others = [r for m_id, r in results.items() if m_id != target]
+    best_weeks = functools.reduce(np.minimum, (weeks for weeks, _ in others))
+    best_cost = functools.reduce(np.minimum, (cost for _, cost in others))
+    wins = (target_weeks < best_weeks) & (target_cost < best_cost)
+    return best_weeks - target_weeks, best_cost - target_cost, wins
+
+
+def run_sweep(
+    axes: list[SweepAxis],
+    methodologies: list[Methodology],
+    scenario: ProjectScenario,
+    target: str = "aidlc",
+    keep_mask: bool = False,
+) -> SweepResult:
+    """Evaluate the model over the full grid spanned by `axes`.
+
+    A point counts as a win when the target methodology is strictly faster
+    and strictly cheaper than every other methodology.
+
+    Args:
+        axes: Swept parameters; unswept parameters take their base values
+        methodologies: Methodologies to compare (must include the target)
+        scenario: Scenario supplying the base point for one-at-a-time analysis
+        target: Methodology whose wins are counted
+        keep_mask: Keep the full win grid as packed bits in the result
+
+    Returns:
+        Aggregated sweep result
+    """
+    started = time.perf_counter()
+    base = base_point(methodologies, scenario)
+    shape = tuple(len(axis.values) for axis in axes)
+    points = math.prod(shape)
+
+    # Loop over the leading axes and broadcast the rest, keeping each block
+    # under BLOCK_SIZE points so memory stays bounded on very large grids.
+    split = len(shape)
+    while split > 0 and math.prod(shape[split - 1:]) <= BLOCK_SIZE:
+        split -= 1
+    inner_shape = shape[split:]
+    inner_params = {
+        axis.name: axis.values.reshape(
+            [1] * i + [len(axis.values)] + [1] * (len(inner_shape) - i - 1)
+        )
+        for i, axis in enumerate(axes[split:])
+    }
+
+    marginal = [np.zeros(len(axis.values), dtype=np.int64) for axis in axes]
+    mask = np.empty(points, dtype=bool) if keep_mask else None
+    block_points = math.prod(inner_shape)
+    wins_total = 0
+    for block, outer_index in enumerate(np.ndindex(*shape[:split])):
+        params: dict[str, np.ndarray | float] = dict(base)
+        params.update(inner_params)
+        for axis, i in zip(axes[:split], outer_index, strict=True):
+            params[axis.name] = float(axis.values[i])
+        *_, wins = _advantage(evaluate(params, methodologies), target)
+        wins = np.broadcast_to(wins, inner_shape)
+
+        block_wins = int(np.count_nonzero(wins))
+        wins_total += block_wins
+        for j, i in enumerate(outer_index):
+            marginal[j][i] += block_wins
+        for j in range(len(inner_shape)):
+            other = tuple(k for k in range(len(inner_shape)) if k != j)
+            marginal[split + j] += wins.sum(axis=other, dtype=np.int64)
+        if mask is not None:
+            mask[block * block_points:(block + 1) * block_points] = wins.ravel()
+
+    tornado, break_evens = _one_at_a_time(axes, base, methodologies, target)
+    return SweepResult(
+        axes=axes,
+        base_point=base,
+        target=target,
+        points=points,
+        wins=wins_total,
+        marginal_wins=marginal,
+        tornado=tornado,
+        break_evens=break_evens,
+        elapsed_seconds=time.perf_counter() - started,
+        win_mask=np.packbits(mask) if mask is not None else None,
+    )
+
+
+def _one_at_a_time(
+    axes: list[SweepAxis],
+    base: dict[str, float],
+    methodologies: list[Methodology],
+    target: str,
+) -> tuple[list[TornadoBar], list[BreakEven]]:
+    """Vary each axis alone around the base point."""
+    tornado = []
+    break_evens = []
+    for axis in axes:
+        line = axis.line()
+        params: dict[str, np.ndarray | float] = dict(base)
+        params[axis.name] = line
+        weeks_saved, cost_saved, wins = _advantage(evaluate(params, methodologies), target)
+        for metric, saved in (("weeks_saved", weeks_saved), ("cost_saved", cost_saved)):
+            saved = np.broadcast_to(saved, line.shape)
+            tornado.append(TornadoBar(
+                metric=metric,
+                axis=axis.name,
+                low_value=float(line[0]),
+                high_value=float(line[-1]),
+                saved_at_low=float(saved[0]),
+                saved_at_high=float(saved[-1]),
+                min_saved=float(saved.min()),
+                max_saved=float(saved.max()),
+            ))
+        wins = np.broadcast_to(wins, line.shape)
+        for i in np.flatnonzero(wins[1:] != wins[:-1]) + 1:
+            break_evens.append(BreakEven(axis.name, float(line[i]), not bool(wins[i])))
+    tornado.sort(key=lambda bar: bar.swing, reverse=True)
+    return tornado, break_evens
+
+
+def format_report(result: SweepResult, bar_width: int = 40) -> str:
+    """Render a sweep result as a plain-text report with a tornado chart."""
+    axes = {axis.name: axis for axis in result.axes}
+    lines = [
+        f"Sweep: {result.points:,} points in {result.elapsed_seconds:.2f}s "
+        f"({result.points / max(result.elapsed_seconds, 1e-9):,.0f} points/s)",
+        f"{result.target} wins on time and cost at {result.win_rate:.1%} of grid points",
+    ]
+
+    name_width = max((len(bar.axis) for bar in result.tornado), default=0)
+    for metric, title in (("weeks_saved", "weeks"), ("cost_saved", "cost units")):
+        bars = [bar for bar in result.tornado if bar.metric == metric]
+        lines.append("")
+        lines.append(f"Tornado ({title} saved vs. best alternative, one parameter at a time):")
+        low = min((bar.min_saved for bar in bars), default=0.0)
+        high = max((bar.max_saved for bar in bars), default=0.0)
+        span = (high - low) or 1.0
+        for bar in bars:
+            start = min(bar_width - 1, int((bar.min_saved - low) / span * bar_width))
+            end = max(start + 1, int((bar.max_saved - low) / span * bar_width))
+            chart = " " * start + "█" * (end - start)
+            lines.append(
+                f"  {bar.axis:<{name_width}} │{chart:<{bar_width}}│ "
+                f"{bar.min_saved:+.0f} .. {bar.max_saved:+.0f}"
+            )
+
+    lines.append("")
+    lines.append("Break-even points:")
+    if not result.break_evens:
+        lines.append("  None within the swept ranges")
+    for be in result.break_evens:
+        verb = "stops" if be.stops_winning else "starts"
+        lines.append(
+            f"  {be.axis} = {axes[be.axis].label(be.value)}: {result.target} {verb} winning"
+        )
+    return "\n".join(lines)
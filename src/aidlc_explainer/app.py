@@ -2,12 +2,28 @@
 
 from pathlib import Path
 
+from textual import events
 from textual.app import App
 from textual.binding import Binding
+from textual.screen import Screen
 
-from aidlc_explainer.navigation import NavigationStack
+from aidlc_explainer import layout
+from aidlc_explainer.bandwidth import BandwidthMeter
+from aidlc_explainer.content.locale import LOCALIZER, available_locales, changed_items
+from aidlc_explainer.content.watch import POLL_INTERVAL, ContentWatcher
+from aidlc_explainer.navigation import (
+    SCREEN_CACHE_SIZE,
+    NavigationStack,
+    NavItem,
+    ScreenCache,
+    load_navigation,
+    navigation_path,
+    save_navigation,
+    screen_key,
+)
+from aidlc_explainer.screens.base import ExplorerScreen
 from aidlc_explainer.screens.home import HomeScreen
-from aidlc_explainer.screens.lesson import LessonScreen
+from aidlc_explainer.screens.lesson import RENDERER, LessonScreen
 from aidlc_explainer.screens.lessons import LessonsScreen
 from aidlc_explainer.screens.practice import PracticeScreen
 from aidlc_explainer.screens.sources import SourcesScreen
@@ -16,12 +32,19 @@ from aidlc_explainer.screens.simulation_view import SimulationViewScreen
 from aidlc_explainer.screens.glossary import GlossaryScreen
 from aidlc_explainer.screens.quick_reference import QuickReferenceScreen
 from aidlc_explainer.screens.artifact_explorer import ArtifactExplorerScreen
-from aidlc_explainer.screens.search import SearchScreen
+from aidlc_explainer.screens.search import SearchIndex, SearchScreen
 from aidlc_explainer.screens.methodology_comparison import MethodologyComparisonScreen
 from aidlc_explainer.screens.transition_mapping import TransitionMappingScreen
 from aidlc_explainer.screens.interactive_simulator import InteractiveSimulatorScreen
+from aidlc_explainer.state import StateManager
+from aidlc_explainer.telemetry import ScreenTelemetry
 from aidlc_explainer.widgets.help_overlay import HelpOverlay
 
+try:  # Private to Textual, used to release removed screens (see _evict_screens)
+    from textual._styles_cache import StylesCache
+except ImportError:
+    StylesCache = None
+
 
 class AIDLCExplainerApp(App):
     """AI-SDLC Explainer TUI Application.
@@ -41,32 +64,189 @@ class AIDLCExplainerApp(App):
         Binding("escape", "go_back", "Back", show=True),
         Binding("slash", "show_search", "Search", show=True),
         Binding("g", "show_glossary", "Glossary"),
+        Binding("f2", "next_locale", "Language"),
     ]
     
     def __init__(
         self,
         screenshot_mode: bool = False,
         theme: str = "dark",
+        reduced_motion: bool = False,
+        low_bandwidth: bool = False,
+        measure_bandwidth: bool = False,
+        telemetry_path: Path | None = None,
+        screen_cache_size: int = SCREEN_CACHE_SIZE,
+        resume: bool = True,
+        dev_content: bool = False,
     ) -> None:
         """Initialize the application.
         
         Args:
             screenshot_mode: If True, disable animations and use stable output
             theme: Color theme ("dark" or "light")
+            reduced_motion: If True, show animated widgets at their final frame
+            low_bandwidth: If True, minimize terminal output (no animations,
+                no cursor blink)
+            measure_bandwidth: If True, count bytes written per interaction
+            telemetry_path: If set, record per-screen dwell time, key presses
+                and render latency to this file
+            screen_cache_size: How many screens not currently shown are kept
+                for reuse
+            resume: If True, reopen the screens (and their scroll positions,
+                selections and practice progress) left open last time
+            dev_content: If True, reload content packs as they are edited
+                and redraw the screens showing them
         """
         super().__init__()
         self.nav = NavigationStack()
+        self.screen_cache = ScreenCache(screen_cache_size)
         self.screenshot_mode = screenshot_mode
+        self.resume = resume and not screenshot_mode  # Screenshots start from Home
+        self.low_bandwidth = low_bandwidth
+        self.reduced_motion = reduced_motion or screenshot_mode or low_bandwidth
+        self.bandwidth = BandwidthMeter() if measure_bandwidth else None
+        self.telemetry = ScreenTelemetry(telemetry_path) if telemetry_path else None
+        self._last_input_event: events.Event | None = None
+        self.session: StateManager | None = None
+        self.dev_content = dev_content
+        self.content_watcher: ContentWatcher | None = None
+        self._search_index: SearchIndex | None = None
         self._theme_name = theme
         
-        # Disable animations in screenshot mode
-        if screenshot_mode:
+        # Disable animations in screenshot and low-bandwidth modes
+        if screenshot_mode or low_bandwidth:
             self.animation_level = "none"
     
     def on_mount(self) -> None:
         """Handle application mount - push initial screen."""
-        self.nav.push("home", "Home")
-        self.push_screen(HomeScreen())
+        if self.bandwidth is not None and self._driver is not None:
+            self._driver.write = self.bandwidth.wrap(self._driver.write)
+        try:
+            self.session = StateManager()
+            self.session.start_session()
+        except Exception:
+            self.session = None
+        if self.dev_content:
+            self._watch_content()
+        restored = self._load_navigation()
+        if restored is not None:
+            self.nav = restored
+        else:
+            self.nav.push("home", "Home")
+        # Only the top screen is built now; the rest are built on the way back
+        if self.telemetry is not None:
+            self.telemetry.navigate(self.nav.current().screen_id)
+        self._show_current()
+    
+    def _watch_content(self) -> None:
+        """Start polling the content packs for edits."""
+        try:
+            self.content_watcher = ContentWatcher()
+        except (OSError, ValueError) as e:
+            self.notify(str(e), title="Content reload is off", severity="error")
+            return
+        self.set_interval(POLL_INTERVAL, self.reload_content)
+    
+    def reload_content(self) -> None:
+        """Reload edited content packs and redraw the screens showing them.
+        
+        Mounted screens update in place through `ExplorerScreen.content_changed`;
+        cached screens that never mounted are dropped, to be built afresh.
+        """
+        if self.content_watcher is None:
+            return
+        changes = []
+        for change in self.content_watcher.poll():
+            if change.error is not None:
+                self.notify(change.error, title=f"'{change.section}' not reloaded", severity="error")
+            else:
+                changes.append(change)
+        if not changes:
+            return
+        if self._search_index is not None:
+            for change in changes:
+                self._search_index.patch(change)
+        sections = {change.section for change in changes}
+        for key, screen in self.screen_cache.items():
+            if not (isinstance(screen, ExplorerScreen) and sections & set(screen.CONTENT_SECTIONS)):
+                continue
+            if screen.is_mounted:
+                screen.content_changed(changes)
+            elif screen not in self.screen_stack:
+                self.screen_cache.pop(key)
+                self.uninstall_screen(screen)
+        self.notify(", ".join(sorted(sections)), title="Content reloaded", timeout=2)
+    
+    @property
+    def search_index(self) -> SearchIndex:
+        """The search index, built the first time Search is opened."""
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+        return self._search_index
+    
+    def switch_locale(self, locale: str) -> None:
+        """Show content in another locale.
+        
+        The search entries of items translated in either locale are rebuilt;
+        screens are built again, where they were, as they are next shown.
+        
+        Args:
+            locale: Code of the locale (see `available_locales`)
+        """
+        previous = LOCALIZER.set_locale(locale)
+        if previous.locale == locale:
+            return
+        RENDERER.clear()  # Prepared sections are keyed by lesson ID
+        if self._search_index is not None:
+            self._search_index.relocalize(changed_items(previous, LOCALIZER.catalog))
+        self._remember_views()
+        screens = [screen for _, screen in self.screen_cache.items()]
+        for key, _ in self.screen_cache.items():
+            self.screen_cache.pop(key)
+        for item in self.nav:
+            item.screen = None
+        while len(self.screen_stack) > 1:
+            self.pop_screen()
+        for screen in screens:
+            self.uninstall_screen(screen)
+            if screen.is_attached:
+                screen.remove()
+        self._show_current()
+        self.notify(available_locales().get(locale, locale), title="Language", timeout=2)
+    
+    def action_next_locale(self) -> None:
+        """Switch to the next available locale."""
+        locales = list(available_locales())
+        current = locales.index(LOCALIZER.locale) if LOCALIZER.locale in locales else -1
+        self.switch_locale(locales[(current + 1) % len(locales)])
+    
+    def on_resize(self, event: events.Resize) -> None:
+        """Drop text laid out for the old terminal width."""
+        layout.invalidate()
+    
+    def on_unmount(self) -> None:
+        """Save where the learner was and add this session's time to their stats."""
+        if self.session is not None:
+            if self.resume:
+                self._save_navigation()
+            self.session.end_session()
+        if self.telemetry is not None:
+            self.telemetry.close()
+    
+    async def on_event(self, event: events.Event) -> None:
+        """Count key presses and attribute terminal output to the input that caused it."""
+        if (
+            isinstance(event, (events.Key, events.MouseDown))
+            and event is not self._last_input_event  # Keys bubble back up to the app
+        ):
+            self._last_input_event = event
+            if self.telemetry is not None and isinstance(event, events.Key):
+                self.telemetry.key()
+            if self.bandwidth is not None:
+                current = self.nav.current()
+                key = event.key if isinstance(event, events.Key) else "click"
+                self.bandwidth.begin_interaction(current.screen_id if current else "home", key)
+        await super().on_event(event)
     
     def action_show_help(self) -> None:
         """Show the help overlay."""
@@ -82,64 +262,200 @@ class AIDLCExplainerApp(App):
     
     def action_quit(self) -> None:
         """Quit the application."""
+        self._remember_views()  # Screens are gone by the time the app unmounts
         self.exit()
     
     def go_back(self) -> None:
         """Navigate back to the previous screen."""
         if len(self.nav) > 1:
             self.nav.pop()
-            self.pop_screen()
+            self._pop_to_current()
     
     def action_go_back(self) -> None:
         """Action handler for back navigation."""
         self.go_back()
     
     def navigate_to(self, screen_id: str, title: str, context: dict | None = None) -> None:
-        """Navigate to a new screen.
+        """Navigate to a screen.
+        
+        A screen already in the navigation stack is returned to rather than
+        stacked again, and screens left recently are reused from the screen
+        cache instead of being rebuilt.
         
         Args:
             screen_id: Screen identifier
             title: Title for breadcrumb
             context: Optional context data
         """
-        self.nav.push(screen_id, title, context)
+        key = screen_key(screen_id, context)
+        index = self.nav.index(key)
+        if index is not None:
+            # Collapse the cycle: Home > Glossary > Search > Glossary is Home > Glossary
+            self.nav.truncate(index + 1)
+            self._pop_to_current()
+            return
+        
+        item = self.nav.push(screen_id, title, context)
+        reused = key in self.screen_cache
+        try:
+            screen = self._screen_for(item)
+        except ValueError as e:  # Say, a pack whose content cannot be loaded
+            self.notify(str(e), title="Cannot Open", severity="error")
+            self.nav.pop()
+            return
+        if screen is None:
+            self.notify(f"'{title}' coming in future updates!", title="Coming Soon")
+            self.nav.pop()
+            return
+        if self.telemetry is not None:
+            self.telemetry.navigate(screen_id)
+            if reused:  # A new screen's mount reports the render
+                self.call_after_refresh(self.telemetry.rendered)
+        item.screen = screen
+        self.push_screen(screen)
+        self._evict_screens()
+    
+    def _pop_to_current(self) -> None:
+        """Pop Textual's screen stack back to the current navigation item's screen."""
+        current = self.nav.current()
+        if self.telemetry is not None:
+            self.telemetry.navigate(current.screen_id)
+            # A mounted screen reports its next refresh; a new one, its mount
+            self.call_after_refresh(self.telemetry.rendered)
+        shown = [item.screen for item in self.nav if item.screen is not None]
+        while len(self.screen_stack) > 1 and self.screen not in shown:
+            self.pop_screen()
+        if self.screen is not current.screen:
+            self._show_current()  # Restored from the last session, not built yet
+        self._evict_screens()
+    
+    def _show_current(self) -> None:
+        """Push the current navigation item's screen, building it if needed.
+        
+        Items whose screen can no longer be built (say, a lesson removed
+        since the session was saved) are dropped.
+        """
+        while True:
+            current = self.nav.current()
+            if current.screen is None:
+                try:
+                    current.screen = self._screen_for(current)
+                except (ValueError, KeyError):
+                    current.screen = None
+            if current.screen is not None or len(self.nav) == 1:
+                break
+            self.nav.pop()
+        if current.screen is None:  # Not even Home could be restored
+            self.nav.clear()
+            current = self.nav.push("home", "Home", screen=self._screen_for(NavItem("home", "Home")))
+        self.push_screen(current.screen)
+    
+    def _screen_for(self, item: NavItem) -> Screen | None:
+        """The screen for a navigation item: cached if possible, otherwise built.
         
+        Returns:
+            The screen, or None if there is no such screen
+        """
+        key = item.key
+        screen = self.screen_cache.get(key)
+        if screen is not None:
+            return screen
+        screen = self._build_screen(item.screen_id, item.context)
+        if screen is None:
+            return None
+        if item.view and isinstance(screen, ExplorerScreen):
+            screen.restore_view_state(item.view)
+        # Installed screens survive being popped, so they can be pushed again
+        self.install_screen(screen, key)
+        self.screen_cache.put(key, screen)
+        return screen
+    
+    def _remember_views(self) -> None:
+        """Store the view state of every shown screen in its navigation item."""
+        for item in self.nav:
+            if isinstance(item.screen, ExplorerScreen) and item.screen.is_mounted:
+                try:
+                    item.view = item.screen.get_view_state()
+                except Exception:
+                    pass  # Keep the previous view state
+    
+    def _load_navigation(self) -> NavigationStack | None:
+        """The navigation stack saved by the last session, if it can be resumed."""
+        if not self.resume or self.session is None:
+            return None
+        nav = load_navigation(navigation_path(self.session.state_dir, self.session.learner_id))
+        if nav is None or next(iter(nav)).screen_id != "home":
+            return None
+        return nav
+    
+    def _save_navigation(self) -> None:
+        """Save the navigation stack for the next session."""
+        path = navigation_path(self.session.state_dir, self.session.learner_id)
+        try:
+            save_navigation(path, self.nav)
+        except OSError:
+            pass  # Fail silently - resuming is optional
+    
+    def _evict_screens(self) -> None:
+        """Remove screens the screen cache no longer has room for.
+        
+        A screen left before it finished mounting is kept until a later
+        eviction: removing it mid-mount would run its mount handler without
+        its widgets.
+        """
+        def keep(screen: Screen) -> bool:
+            return screen in self.screen_stack or not screen.is_mounted
+        
+        evicted = self.screen_cache.evict(keep)
+        for screen in evicted:
+            self.uninstall_screen(screen)
+            if screen.is_attached:
+                screen.remove()
+        if evicted:
+            # Textual memoizes border colors per widget in a class-wide LRU
+            # cache, which would keep the render caches of up to 1024 removed
+            # widgets alive; the colors are cheap to recompute
+            get_inner_outer = getattr(StylesCache, "get_inner_outer", None)
+            cache_clear = getattr(get_inner_outer, "cache_clear", None)
+            if cache_clear is not None:
+                cache_clear()
+    
+    def _build_screen(self, screen_id: str, context: dict | None) -> Screen | None:
+        """Create the screen for a screen ID, or None if there is no such screen."""
         if screen_id == "lessons":
-            self.push_screen(LessonsScreen())
+            return LessonsScreen()
         elif screen_id == "lesson":
             lesson_id = context.get("lesson_id") if context else "aidlc-overview"
-            self.push_screen(LessonScreen(lesson_id))
+            return LessonScreen(lesson_id, section=context.get("section", 0) if context else 0)
         elif screen_id == "home":
-            self.push_screen(HomeScreen())
+            return HomeScreen()
         elif screen_id == "practice":
-            self.push_screen(PracticeScreen())
+            return PracticeScreen()
         elif screen_id == "sources":
-            self.push_screen(SourcesScreen())
+            return SourcesScreen()
         elif screen_id == "quiz":
             from aidlc_explainer.screens.quiz import QuizScreen
-            self.push_screen(QuizScreen())
+            return QuizScreen(context.get("quiz_id") if context else None)
         elif screen_id == "gatekeeper":
             from aidlc_explainer.screens.gatekeeper import GatekeeperScreen
-            self.push_screen(GatekeeperScreen())
+            return GatekeeperScreen(context.get("gate_id") if context else None)
         elif screen_id == "simulator":
-            self.push_screen(SimulatorScreen())
+            return SimulatorScreen()
         elif screen_id == "simulation-view":
-            self.push_screen(SimulationViewScreen(context or {}))
+            return SimulationViewScreen(context or {})
         elif screen_id == "glossary":
-            self.push_screen(GlossaryScreen())
+            return GlossaryScreen(term_id=context.get("term_id") if context else None)
         elif screen_id == "quick-reference":
-            self.push_screen(QuickReferenceScreen())
+            return QuickReferenceScreen()
         elif screen_id == "artifact-explorer":
-            self.push_screen(ArtifactExplorerScreen())
+            return ArtifactExplorerScreen()
         elif screen_id == "search":
-            self.push_screen(SearchScreen())
+            return SearchScreen(self.search_index)
         elif screen_id == "methodology-comparison":
-            self.push_screen(MethodologyComparisonScreen())
+            return MethodologyComparisonScreen()
         elif screen_id == "transition-mapping":
-            self.push_screen(TransitionMappingScreen())
+            return TransitionMappingScreen()
         elif screen_id == "interactive-simulator":
             request_type = context.get("request_type", "greenfield") if context else "greenfield"
-            self.push_screen(InteractiveSimulatorScreen(request_type))
-        else:
-            self.notify(f"'{title}' coming in future updates!", title="Coming Soon")
-            self.nav.pop()
+            return InteractiveSimulatorScreen(request_type)
+        return None
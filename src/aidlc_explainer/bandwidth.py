@@ -0,0 +1,122 @@
+"""Bytes-on-wire instrumentation for terminal output."""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+WIRE_STATS_SCHEMA = "wire-stats-v1"
+
+# Frame rate used in low-bandwidth mode; Textual coalesces all widget
+# updates into at most one repaint per frame.
+LOW_BANDWIDTH_FPS = 10
+
+
+@dataclass
+class Interaction:
+    """Terminal output caused by one key press or click."""
+    screen_id: str
+    key: str
+    bytes: int = 0
+    writes: int = 0
+
+
+class BandwidthMeter:
+    """Counts bytes written to the terminal, attributed to interactions.
+
+    Output written between one interaction and the next is charged to the
+    first; output before any interaction is charged to "startup".
+    """
+
+    def __init__(self) -> None:
+        """Initialize with an empty startup interaction."""
+        self.interactions: list[Interaction] = [Interaction("startup", "")]
+
+    def wrap(self, write: Callable[[str], None]) -> Callable[[str], None]:
+        """Wrap a driver's write method so every write is counted.
+
+        Args:
+            write: The terminal write function to wrap
+
+        Returns:
+            A write function with the same signature
+        """
+        def counting_write(data: str) -> None:
+            self.record(data)
+            write(data)
+
+        return counting_write
+
+    def record(self, data: str) -> None:
+        """Charge written data to the current interaction."""
+        current = self.interactions[-1]
+        current.bytes += len(data.encode("utf-8", errors="replace"))
+        current.writes += 1
+
+    def begin_interaction(self, screen_id: str, key: str) -> None:
+        """Start attributing output to a new interaction."""
+        self.interactions.append(Interaction(screen_id, key))
+
+    @property
+    def total_bytes(self) -> int:
+        """Total bytes written."""
+        return sum(i.bytes for i in self.interactions)
+
+    def summary(self) -> dict:
+        """Per-screen byte statistics."""
+        by_screen: dict[str, list[int]] = {}
+        for interaction in self.interactions:
+            by_screen.setdefault(interaction.screen_id, []).append(interaction.bytes)
+
+        screens = {}
+        for screen_id, sizes in by_screen.items():
+            ordered = sorted(sizes)
+            screens[screen_id] = {
+                "interactions": len(sizes),
+                "bytes": sum(sizes),
+                "mean_bytes": round(sum(sizes) / len(sizes), 1),
+                "p95_bytes": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+                "max_bytes": ordered[-1],
+            }
+        return {
+            "total_bytes": self.total_bytes,
+            "interactions": len(self.interactions) - 1,
+            "screens": screens,
+        }
+
+    def write_report(self, path: Path, **metadata) -> None:
+        """Write the summary and raw interactions as JSON.
+
+        Args:
+            path: Output file
+            **metadata: Extra top-level fields (e.g. low_bandwidth=True)
+        """
+        report = {
+            "$schema": WIRE_STATS_SCHEMA,
+            "generated": datetime.utcnow().isoformat() + "Z",
+            **metadata,
+            **self.summary(),
+            "log": [
+                [i.screen_id, i.key, i.bytes, i.writes] for i in self.interactions
+            ],
+        }
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    def format_summary(self) -> str:
+        """Render the per-screen summary as a table."""
+        summary = self.summary()
+        lines = [
+            f"Bytes written: {summary['total_bytes']:,} over "
+            f"{summary['interactions']} interactions",
+            f"{'Screen':<24} {'Inputs':>7} {'Bytes':>10} {'Mean':>9} {'p95':>9} {'Max':>9}",
+            "─" * 72,
+        ]
+        for screen_id, s in sorted(
+            summary["screens"].items(), key=lambda item: item[1]["bytes"], reverse=True
+        ):
+            lines.append(
+                f"{screen_id:<24} {s['interactions']:>7} {s['bytes']:>10,} "
+                f"{s['mean_bytes']:>9,.0f} {s['p95_bytes']:>9,} {s['max_bytes']:>9,}"
+            )
+        return "\n".join(lines)
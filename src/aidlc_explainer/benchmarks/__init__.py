@@ -0,0 +1,5 @@
+"""Performance benchmarks run from the command line.
+
+Benchmarks write to a scratch directory and never touch a learner's real
+state. They are only imported by the command line entry points.
+"""
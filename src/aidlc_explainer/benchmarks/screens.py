@@ -0,0 +1,313 @@
+"""Interaction latency benchmark for every screen.
+
+Drives the real app headlessly with Textual's Pilot. Each screen that
+`AIDLCExplainerApp.navigate_to` can open is opened, put through a short
+scripted interaction (typing a query, answering questions, approving
+gates, switching tabs) and closed again, several times over. Two latencies
+are measured:
+
+    mount_ms    from `navigate_to` until the new screen has refreshed
+    key_ms      from a key press until the screen has refreshed after it
+
+"Refreshed" means every widget on the screen has processed its pending
+messages and the next screen update has been drawn. Between measurements
+the app is left to go idle, so one interaction does not spill into the
+next.
+
+Screen caching is turned off so every open builds a new screen. A first,
+unrecorded pass over the screens gets one-off costs (imports, stylesheet
+parsing) out of the way. Results
+can be saved as a baseline and later runs compared against it; a
+percentile is a regression when it is both `threshold` slower (relative)
+and `MIN_REGRESSION_MS` slower (absolute) than the baseline.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from textual import events
+
+from aidlc_explainer.telemetry import percentile
+
+if TYPE_CHECKING:
+    from textual.pilot import Pilot
+
+BASELINE_SCHEMA = "ui-bench-v1"
+PERCENTILES = (50, 90, 99)
+COMPARED_PERCENTILES = (50, 90)  # p99 of a few samples is mostly noise
+THRESHOLD = 0.5
+MIN_REGRESSION_MS = 2.0
+TERMINAL_SIZE = (100, 30)
+SETTLE_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """How a screen is opened and what is done with it."""
+    title: str
+    keys: tuple[str, ...]
+    context: dict | None = None
+
+
+def _simulation_context() -> dict:
+    """The context the simulator passes to the simulation view."""
+    from aidlc_explainer.screens.simulator import load_request_types
+
+    data = load_request_types()
+    return {
+        "type": data["types"][0],
+        "risk": "medium",
+        "constraints": [],
+        "risk_profiles": data["risk_profiles"],
+        "constraint_data": data["constraints"],
+    }
+
+
+# Keys stay on the screen: none of them navigates away. Home is always open
+# underneath, so its "mount" is the time to bring it back to the top.
+SCENARIOS: dict[str, Scenario] = {
+    "home": Scenario("Home", ("down", "down", "up")),
+    "lessons": Scenario("Lessons", ("down", "down", "up")),
+    "lesson": Scenario(
+        "Lesson", ("right", "right", "left", "l", "h"), {"lesson_id": "aidlc-overview"}
+    ),
+    "practice": Scenario("Practice", ("down", "up")),
+    "quiz": Scenario("Quiz", ("a", "enter", "b", "enter", "c", "enter")),
+    "gatekeeper": Scenario("Gatekeeper", ("a", "enter", "right", "r", "space", "enter")),
+    "simulator": Scenario("Stage Simulator", ("1", "2", "down")),
+    "simulation-view": Scenario("Simulation", ("right", "right", "a", "left", "r")),
+    "interactive-simulator": Scenario(
+        "Interactive Simulator", ("a", "enter", "b", "enter"), {"request_type": "greenfield"}
+    ),
+    "glossary": Scenario("Glossary", ("/", "g", "a", "t", "e", "backspace", "down")),
+    "search": Scenario("Search", ("g", "a", "t", "e", "space", "r", "e", "v")),
+    "quick-reference": Scenario("Quick Reference", ("down", "down", "up")),
+    "artifact-explorer": Scenario("Artifact Explorer", ("i", "c", "o", "a", "t", "t")),
+    "sources": Scenario("Sources", ("down", "down", "up")),
+    "methodology-comparison": Scenario("Methodology Comparison", ("1", "2", "3", "4")),
+    "transition-mapping": Scenario("Transition Mapping", ("1", "2", "3", "4", "5")),
+}
+
+
+@dataclass
+class ScreenResult:
+    """Latencies measured for one screen."""
+    screen_id: str
+    mount_ms: list[float] = field(default_factory=list)
+    key_ms: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        """Percentiles of each latency, in milliseconds."""
+        return {
+            "mount_ms": _percentiles(self.mount_ms),
+            "key_ms": _percentiles(self.key_ms),
+        }
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A percentile that got slower than the baseline allows."""
+    screen_id: str
+    metric: str
+    percentile: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.screen_id} {self.metric} {self.percentile}: "
+            f"{self.baseline:.1f} → {self.current:.1f} ms"
+        )
+
+
+def _percentiles(samples: list[float]) -> dict[str, float | None]:
+    ordered = sorted(samples)
+    return {
+        f"p{pct}": round(percentile(ordered, pct), 2) if ordered else None
+        for pct in PERCENTILES
+    }
+
+
+async def _settle(pilot: "Pilot", timeout: float = SETTLE_TIMEOUT) -> float:
+    """Wait for the screen to process its messages and refresh.
+
+    A callback is queued behind the pending messages of the app and of
+    every widget on the screen; once all have run, the next refresh is
+    awaited. (`Pilot.pause` would also wait for the CPU to go idle.)
+
+    Returns:
+        The time it refreshed, from `time.perf_counter`
+
+    Raises:
+        TimeoutError: If the screen is still busy after `timeout` seconds
+    """
+    loop = asyncio.get_running_loop()
+    app = pilot.app
+    processed = []
+    for node in [app, *app.screen.walk_children(with_self=True)]:
+        future = loop.create_future()
+        if node.call_later(future.set_result, None):
+            processed.append(future)
+    async with asyncio.timeout(timeout):
+        await asyncio.gather(*processed)
+        refreshed = loop.create_future()
+        app.call_after_refresh(lambda: refreshed.set_result(time.perf_counter()))
+        return await refreshed
+
+
+def _key_event(key: str) -> events.Key:
+    """The event a terminal sends for a key name."""
+    character = key if len(key) == 1 else {"space": " "}.get(key)
+    return events.Key(key, character)
+
+
+async def _drive(screen_ids: list[str], repeats: int) -> list[ScreenResult]:
+    """Open, exercise and close each screen `repeats` times, after a warm-up."""
+    from aidlc_explainer.app import AIDLCExplainerApp
+
+    results = [ScreenResult(screen_id) for screen_id in screen_ids]
+    app = AIDLCExplainerApp(reduced_motion=True, screen_cache_size=0, resume=False)
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await pilot.pause()
+        contexts = {
+            screen_id: _simulation_context() if screen_id == "simulation-view"
+            else SCENARIOS[screen_id].context
+            for screen_id in screen_ids
+        }
+        for run in range(repeats + 1):
+            for result in results:
+                # The warm-up run records into a throwaway result
+                record = result if run else ScreenResult(result.screen_id)
+                scenario = SCENARIOS[result.screen_id]
+                start = time.perf_counter()
+                app.navigate_to(result.screen_id, scenario.title, contexts[result.screen_id])
+                record.mount_ms.append((await _settle(pilot) - start) * 1000)
+                await pilot.pause()
+                for key in scenario.keys:
+                    start = time.perf_counter()
+                    app.post_message(_key_event(key))
+                    record.key_ms.append((await _settle(pilot) - start) * 1000)
+                    await pilot.pause()
+                if len(app.nav) > 1:
+                    app.go_back()
+                    await pilot.pause()
+    return results
+
+
+def run_benchmark(screen_ids: list[str] | None = None, repeats: int = 5) -> list[ScreenResult]:
+    """Benchmark screens in a scratch working directory.
+
+    Args:
+        screen_ids: Screens to benchmark (default: all of `SCENARIOS`)
+        repeats: How many times each screen is opened
+
+    Returns:
+        Latencies for each screen
+
+    Raises:
+        ValueError: If a screen has no scenario
+    """
+    screen_ids = screen_ids or list(SCENARIOS)
+    unknown = [screen_id for screen_id in screen_ids if screen_id not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"No benchmark scenario for: {', '.join(unknown)}")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="aidlc-ui-bench-") as scratch:
+        os.chdir(scratch)  # The app keeps progress in the working directory
+        try:
+            return asyncio.run(_drive(screen_ids, repeats))
+        finally:
+            os.chdir(cwd)
+
+
+def to_baseline(results: list[ScreenResult]) -> dict:
+    """Results as a baseline document."""
+    return {
+        "$schema": BASELINE_SCHEMA,
+        "terminal": list(TERMINAL_SIZE),
+        "screens": {result.screen_id: result.summary() for result in results},
+    }
+
+
+def save_baseline(path: Path, results: list[ScreenResult]) -> None:
+    """Write results as a baseline file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(to_baseline(results), f, indent=2)
+        f.write("\n")
+
+
+def load_baseline(path: Path) -> dict:
+    """Read a baseline file.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not a baseline file
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if not isinstance(baseline, dict) or baseline.get("$schema") != BASELINE_SCHEMA:
+        raise ValueError(f"Not a {BASELINE_SCHEMA} baseline: {path}")
+    return baseline
+
+
+def compare(
+    results: list[ScreenResult],
+    baseline: dict,
+    threshold: float = THRESHOLD,
+    min_regression_ms: float = MIN_REGRESSION_MS,
+    percentiles: tuple[int, ...] = COMPARED_PERCENTILES,
+) -> list[Regression]:
+    """Percentiles that regressed beyond the threshold.
+
+    Screens or metrics missing from the baseline are not compared.
+
+    Args:
+        results: Current measurements
+        baseline: A document from `to_baseline` or `load_baseline`
+        threshold: Allowed relative slowdown (0.5 = 50%)
+        min_regression_ms: Slowdowns smaller than this are never regressions
+        percentiles: Percentiles compared
+
+    Returns:
+        The regressions, worst first
+    """
+    regressions = []
+    screens = baseline.get("screens", {})
+    for result in results:
+        for metric, current in result.summary().items():
+            previous = screens.get(result.screen_id, {}).get(metric, {})
+            for pct in percentiles:
+                key = f"p{pct}"
+                before, now = previous.get(key), current[key]
+                if before is None or now is None:
+                    continue
+                if now > before * (1 + threshold) and now - before > min_regression_ms:
+                    regressions.append(Regression(result.screen_id, metric, key, before, now))
+    return sorted(regressions, key=lambda r: r.current / max(r.baseline, 1e-9), reverse=True)
+
+
+def format_report(results: list[ScreenResult], regressions: list[Regression] | None = None) -> str:
+    """Render benchmark results as a table, with any regressions below it."""
+    lines = [
+        f"{'Screen':<24} {'Mount p50/p90/p99 (ms)':>24} {'Key p50/p90/p99 (ms)':>24}",
+        "─" * 74,
+    ]
+    for result in results:
+        summary = result.summary()
+        mount, key = (
+            "/".join("-" if v is None else f"{v:.1f}" for v in summary[metric].values())
+            for metric in ("mount_ms", "key_ms")
+        )
+        lines.append(f"{result.screen_id:<24} {mount:>24} {key:>24}")
+    if regressions:
+        lines += ["", f"{len(regressions)} regressions against the baseline:"]
+        lines += [f"  {regression}" for regression in regressions]
+    return "\n".join(lines)
@@ -0,0 +1,107 @@
+"""Startup benchmark: content loaded from the snapshot versus from source.
+
+Each run is a fresh interpreter, so nothing is already imported. It
+times two things:
+
+    import_ms   importing the app (every screen module included)
+    content_ms  then loading every content section once
+
+once with a freshly built snapshot and once with the snapshot turned off,
+alternating so both see the same machine conditions.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aidlc_explainer.content import snapshot
+
+# Run in the child interpreter; prints the two timings as JSON
+_CHILD = """
+import json, time
+start = time.perf_counter()
+import aidlc_explainer.app
+imported = time.perf_counter()
+from aidlc_explainer.content import snapshot
+for name in snapshot.SECTIONS:
+    snapshot.load(name)
+loaded = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "content_ms": (loaded - imported) * 1000,
+    "sources": sorted(set(snapshot.STORE.sources.values())),
+}))
+"""
+MODES = ("snapshot", "source")
+
+
+@dataclass
+class StartupResult:
+    """Timings for one way of loading content."""
+    mode: str
+    import_ms: list[float] = field(default_factory=list)
+    content_ms: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        """Median of each timing, in milliseconds."""
+        return {
+            "mode": self.mode,
+            "import_ms": round(_median(self.import_ms), 2),
+            "content_ms": round(_median(self.content_ms), 2),
+            "total_ms": round(_median([a + b for a, b in zip(self.import_ms, self.content_ms, strict=True)]), 2),
+        }
+
+
+def _median(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[len(ordered) // 2] if ordered else 0.0
+
+
+def _run_child(setting: str) -> dict:
+    """Time one fresh interpreter with the snapshot setting given."""
+    package_root = Path(snapshot.__file__).resolve().parents[2]
+    env = dict(os.environ, **{snapshot.SNAPSHOT_ENV: setting})
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(package_root), env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def run_benchmark(repeats: int = 5) -> list[StartupResult]:
+    """Time startup with and without a snapshot.
+
+    Raises:
+        RuntimeError: If the snapshot was not used, or was used when off
+    """
+    results = {mode: StartupResult(mode) for mode in MODES}
+    with tempfile.TemporaryDirectory(prefix="aidlc-startup-") as scratch:
+        path = Path(scratch) / "content.snapshot"
+        snapshot.build_snapshot(path)
+        settings = {"snapshot": str(path), "source": "off"}
+        for _ in range(repeats):
+            for mode, result in results.items():
+                timing = _run_child(settings[mode])
+                if timing["sources"] != [mode]:
+                    raise RuntimeError(f"Expected content from {mode}, got {timing['sources']}")
+                result.import_ms.append(timing["import_ms"])
+                result.content_ms.append(timing["content_ms"])
+    return list(results.values())
+
+
+def format_report(results: list[StartupResult]) -> str:
+    """Results as a table of medians."""
+    lines = [
+        f"{'Content from':<14} {'Import (ms)':>12} {'Content (ms)':>13} {'Total (ms)':>11}",
+        "─" * 53,
+    ]
+    for result in results:
+        s = result.summary()
+        lines.append(
+            f"{s['mode']:<14} {s['import_ms']:>12.1f} {s['content_ms']:>13.1f} {s['total_ms']:>11.1f}"
+        )
+    return "\n".join(lines)
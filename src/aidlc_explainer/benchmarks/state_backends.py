@@ -0,0 +1,206 @@
+"""Concurrency benchmark for the state storage backends.
+
+Simulates a classroom host: hundreds of learners, each with their own
+`StateManager`, issue `add_xp` and `save_quiz_result` at the same time.
+Learners are spread over several processes (like separate app instances)
+and run as threads within each process. The benchmark reports throughput,
+per-operation latency and how many learners kept a record of their own;
+with the JSON backend every learner shares one document, so their progress
+is merged into a single record.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from aidlc_explainer.state import StateManager
+from aidlc_explainer.storage import BACKENDS, open_backend
+
+QUIZ_TOTAL = 24
+
+
+@dataclass
+class BackendResult:
+    """Measurements for one backend."""
+    backend: str
+    learners: int
+    operations: int
+    seconds: float
+    latencies_ms: list[float]
+    intact: int  # Learners whose stored record kept all the XP they earned
+
+    @property
+    def throughput(self) -> float:
+        """Operations per second."""
+        return self.operations / self.seconds if self.seconds > 0 else 0.0
+
+    def latency_percentile(self, pct: float) -> float:
+        """Operation latency percentile in milliseconds."""
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+    def to_summary(self) -> dict:
+        """JSON-serializable summary."""
+        return {
+            "backend": self.backend,
+            "learners": self.learners,
+            "operations": self.operations,
+            "seconds": round(self.seconds, 3),
+            "ops_per_second": round(self.throughput, 1),
+            "latency_ms": {
+                "p50": round(self.latency_percentile(50), 2),
+                "p95": round(self.latency_percentile(95), 2),
+                "p99": round(self.latency_percentile(99), 2),
+                "max": round(self.latency_percentile(100), 2),
+            },
+            "intact_learners": self.intact,
+        }
+
+
+def _learner_session(
+    kind: str, base_path: Path, learner_id: str, rounds: int, barrier: threading.Barrier
+) -> tuple[list[float], int]:
+    """Run one learner's operations.
+
+    Returns:
+        Per-operation latencies in ms and the XP the learner earned
+    """
+    state = StateManager(
+        base_path=base_path,
+        backend=open_backend(base_path / StateManager.STATE_DIR, kind),
+        learner_id=learner_id,
+    )
+    latencies = []
+    barrier.wait()
+    for i in range(rounds):
+        start = time.perf_counter()
+        if i % 2 == 0:
+            state.add_xp("lesson_section")
+        else:
+            score = QUIZ_TOTAL - i % 5
+            # Tag the attempt so a learner's record can't pass for another's
+            state.save_quiz_result(score, QUIZ_TOTAL, [learner_id])
+        latencies.append((time.perf_counter() - start) * 1000)
+    earned = state.get_gamification_stats()["xp"]
+    state.close()
+    return latencies, earned
+
+
+def _run_worker(
+    kind: str, base_path: Path, learner_ids: list[str], rounds: int
+) -> tuple[list[float], dict[str, int]]:
+    """Run a group of learners as threads in one process."""
+    barrier = threading.Barrier(len(learner_ids))
+    with ThreadPoolExecutor(max_workers=len(learner_ids)) as pool:
+        futures = {
+            learner_id: pool.submit(_learner_session, kind, base_path, learner_id, rounds, barrier)
+            for learner_id in learner_ids
+        }
+    latencies: list[float] = []
+    earned = {}
+    for learner_id, future in futures.items():
+        learner_latencies, earned[learner_id] = future.result()
+        latencies.extend(learner_latencies)
+    return latencies, earned
+
+
+def _count_intact(kind: str, base_path: Path, earned: dict[str, int]) -> int:
+    """Count learners whose stored record is their own, with all XP kept."""
+    backend = open_backend(base_path / StateManager.STATE_DIR, kind)
+    try:
+        intact = 0
+        for learner_id, xp in earned.items():
+            try:
+                stored = backend.load(learner_id) or {}
+            except ValueError:  # A torn JSON write
+                return 0
+            if (
+                stored.get("quiz", {}).get("mistakes") == [learner_id]
+                and stored.get("gamification", {}).get("xp") == xp
+            ):
+                intact += 1
+        return intact
+    finally:
+        backend.close()
+
+
+def run_backend(
+    kind: str, learners: int = 200, rounds: int = 10, processes: int | None = None
+) -> BackendResult:
+    """Benchmark one backend in a fresh scratch directory.
+
+    Args:
+        kind: Backend name ("json" or "sqlite")
+        learners: Number of simulated learners
+        rounds: Operations per learner, alternating add_xp and save_quiz_result
+        processes: Worker processes (default: CPU count, at most 8)
+
+    Returns:
+        Measurements for the backend
+    """
+    processes = max(1, min(processes or min(os.cpu_count() or 1, 8), learners))
+    learner_ids = [f"learner-{i:04d}" for i in range(learners)]
+    groups = [learner_ids[i::processes] for i in range(processes)]
+
+    with tempfile.TemporaryDirectory(prefix="aidlc-state-bench-") as scratch:
+        base_path = Path(scratch)
+        # Create the store up front so workers don't race to initialize it
+        open_backend(base_path / StateManager.STATE_DIR, kind).close()
+
+        latencies: list[float] = []
+        earned: dict[str, int] = {}
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            for group_latencies, group_earned in pool.map(
+                _run_worker, [kind] * processes, [base_path] * processes, groups,
+                [rounds] * processes,
+            ):
+                latencies.extend(group_latencies)
+                earned.update(group_earned)
+        seconds = time.perf_counter() - start
+
+        return BackendResult(
+            backend=kind,
+            learners=learners,
+            operations=len(latencies),
+            seconds=seconds,
+            latencies_ms=latencies,
+            intact=_count_intact(kind, base_path, earned),
+        )
+
+
+def run_benchmark(
+    backends: list[str] | None = None,
+    learners: int = 200,
+    rounds: int = 10,
+    processes: int | None = None,
+) -> list[BackendResult]:
+    """Benchmark several backends with the same workload."""
+    return [run_backend(kind, learners, rounds, processes) for kind in backends or BACKENDS]
+
+
+def format_report(results: list[BackendResult]) -> str:
+    """Render benchmark results as a table."""
+    first = results[0]
+    lines = [
+        f"{first.learners} concurrent learners, {first.operations // first.learners} "
+        f"operations each",
+        "",
+        f"{'Backend':<8} {'Ops/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'Max ms':>8} {'Intact':>11}",
+        "─" * 66,
+    ]
+    for result in results:
+        lines.append(
+            f"{result.backend:<8} {result.throughput:>9,.0f} "
+            f"{result.latency_percentile(50):>8.2f} {result.latency_percentile(95):>8.2f} "
+            f"{result.latency_percentile(99):>8.2f} {result.latency_percentile(100):>8.2f} "
+            f"{result.intact:>5}/{result.learners:<5}"
+        )
+    return "\n".join(lines)
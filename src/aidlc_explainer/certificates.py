@@ -0,0 +1,523 @@
+"""Completion certificates and the local certificate registry.
+
+A certificate ID is the first 12 hex digits of SHA-256 over the learner's
+name and the issue date. Issued certificates are appended to
+``certificates.jsonl`` (one JSON record per line, never rewritten) and
+indexed by ``certificates.idx``, an on-disk open-addressing hash table from
+ID to byte offset in the log. A lookup reads a few slots and one log line
+however large the registry grows. The index is derived data: when it is
+missing or damaged it is rebuilt from the log.
+"""
+
+import csv
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from aidlc_explainer.state import StateManager
+from aidlc_explainer.storage import (
+    JSONFileBackend,
+    SQLiteBackend,
+    StateBackend,
+    file_lock,
+)
+
+REGISTRY_LOG = "certificates.jsonl"
+REGISTRY_INDEX = "certificates.idx"
+ID_LENGTH = 12  # Hex digits
+
+REQUIRED_LESSONS = 6
+REQUIRED_QUIZ_PERCENT = 80
+
+# Issue outcomes
+ISSUED = "issued"
+DUPLICATE = "duplicate"  # Same learner and date already registered
+COLLISION = "collision"  # ID already belongs to a different certificate
+INELIGIBLE = "ineligible"
+FAILED = "failed"  # Progress could not be read
+
+
+def certificate_id(name: str, date_str: str) -> str:
+    """Certificate ID for a learner name and issue date (YYYY-MM-DD)."""
+    cert_data = f"{name}-{date_str}-aidlc-explainer"
+    return hashlib.sha256(cert_data.encode()).hexdigest()[:ID_LENGTH].upper()
+
+
+def normalize_id(cert_id: str) -> str | None:
+    """Canonical form of a user-supplied ID, or None if malformed."""
+    cert_id = cert_id.strip().upper()
+    if len(cert_id) != ID_LENGTH or any(c not in "0123456789ABCDEF" for c in cert_id):
+        return None
+    return cert_id
+
+
+def is_eligible(progress: dict[str, Any]) -> bool:
+    """Whether overall progress qualifies for a certificate."""
+    return (
+        progress["lessons"]["completed"] >= REQUIRED_LESSONS
+        and progress["quiz"]["percent"] >= REQUIRED_QUIZ_PERCENT
+    )
+
+
+@dataclass
+class Certificate:
+    """A registered certificate."""
+    id: str
+    name: str
+    issued: str  # YYYY-MM-DD
+    lessons: int
+    quiz_score: int
+    quiz_total: int
+    quiz_percent: float
+    achievements: int
+    achievements_total: int
+
+    @classmethod
+    def from_progress(cls, name: str, date_str: str, progress: dict[str, Any]) -> "Certificate":
+        """Certificate for a learner's overall progress."""
+        return cls(
+            id=certificate_id(name, date_str),
+            name=name,
+            issued=date_str,
+            lessons=progress["lessons"]["completed"],
+            quiz_score=progress["quiz"]["score"],
+            quiz_total=progress["quiz"]["total"],
+            quiz_percent=progress["quiz"]["percent"],
+            achievements=progress["achievements"]["unlocked"],
+            achievements_total=progress["achievements"]["total"],
+        )
+
+    def same_holder(self, other: "Certificate") -> bool:
+        """Whether two records certify the same learner on the same date."""
+        return (self.name, self.issued) == (other.name, other.issued)
+
+
+@dataclass
+class IssueResult:
+    """Outcome of issuing one certificate."""
+    name: str
+    status: str
+    certificate: Certificate | None = None
+    message: str = ""
+
+
+def render_certificate(cert: Certificate) -> str:
+    """Render a certificate as a text card."""
+    return f"""
+╭────────────────────────────────────────────────────────────────────────────────╮
+│                                                                                │
+│                        CERTIFICATE OF COMPLETION                               │
+│                                                                                │
+│                          AI-DLC Methodology Training                           │
+│                                                                                │
+├────────────────────────────────────────────────────────────────────────────────┤
+│                                                                                │
+│                          This certifies that                                   │
+│                                                                                │
+│                              {cert.name.center(40)}                                 │
+│                                                                                │
+│              has successfully completed the AI-DLC Explainer                   │
+│              curriculum and demonstrated proficiency in the                    │
+│              AI-Driven Development Lifecycle methodology.                      │
+│                                                                                │
+│                                                                                │
+│    Lessons Completed: {cert.lessons}/6                                                │
+│    Quiz Score: {cert.quiz_score}/{cert.quiz_total} ({cert.quiz_percent:.0f}%)                                               │
+│    Achievements: {cert.achievements}/{cert.achievements_total}                                                  │
+│                                                                                │
+│                                                                                │
+│    Date: {cert.issued}                                                        │
+│    Certificate ID: {cert.id}                                           │
+│                                                                                │
+╰────────────────────────────────────────────────────────────────────────────────╯
+"""
+
+
+# Index file layout: a header, then `capacity` fixed-size slots. A slot holds
+# a certificate ID and its record's log offset plus one (0 marks an empty
+# slot). IDs are hash output, so their low bits pick the home slot directly.
+_HEADER = struct.Struct("<8sIQQQ")  # magic, format, capacity, entries, log bytes indexed
+_SLOT = struct.Struct("<6s2xQ")
+_MAGIC = b"AIDLCIDX"
+_FORMAT = 1
+_INITIAL_CAPACITY = 1024
+_MAX_LOAD = 0.5
+
+
+class _HashIndex:
+    """Open-addressing hash table over an mmapped file."""
+
+    def __init__(self, path: Path, writable: bool) -> None:
+        """Map an existing index file.
+
+        Raises:
+            ValueError: If the file is not a valid index
+            OSError: If the file cannot be opened
+        """
+        self.path = path
+        self._file = open(path, "r+b" if writable else "rb")
+        try:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+        except ValueError:  # Empty file
+            self._file.close()
+            raise
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Not a certificate index: {path}")
+        magic, fmt, self.capacity, self.entries, self.log_bytes = _HEADER.unpack_from(self._map)
+        if (
+            magic != _MAGIC
+            or not self.capacity
+            or fmt != _FORMAT
+            or self.capacity & (self.capacity - 1)
+            or len(self._map) != _HEADER.size + self.capacity * _SLOT.size
+        ):
+            self.close()
+            raise ValueError(f"Not a certificate index: {path}")
+
+    @staticmethod
+    def create(path: Path, capacity: int) -> None:
+        """Write an empty index file, atomically replacing any existing one."""
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".certificates-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _FORMAT, capacity, 0, 0))
+                f.truncate(_HEADER.size + capacity * _SLOT.size)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _probe(self, key: bytes) -> Iterator[tuple[int, bytes, int]]:
+        """Yield (position, key, offset) from the key's home slot to the first empty one."""
+        mask = self.capacity - 1
+        slot = int.from_bytes(key, "little") & mask
+        while True:
+            position = _HEADER.size + slot * _SLOT.size
+            stored, offset = _SLOT.unpack_from(self._map, position)
+            yield position, stored, offset
+            if not offset:
+                return
+            slot = (slot + 1) & mask
+
+    def find(self, key: bytes) -> list[int]:
+        """Log offsets of every record with this key."""
+        return [offset - 1 for _, stored, offset in self._probe(key) if offset and stored == key]
+
+    def insert(self, key: bytes, log_offset: int) -> None:
+        """Add a key (duplicates allowed); the caller keeps the load factor down."""
+        for position, _, offset in self._probe(key):
+            if not offset:
+                _SLOT.pack_into(self._map, position, key, log_offset + 1)
+                self.entries += 1
+                return
+
+    def items(self) -> Iterator[tuple[bytes, int]]:
+        """Every (key, log offset) in slot order."""
+        for slot in range(self.capacity):
+            key, offset = _SLOT.unpack_from(self._map, _HEADER.size + slot * _SLOT.size)
+            if offset:
+                yield key, offset - 1
+
+    def write_header(self, log_bytes: int) -> None:
+        """Record the entry count and how much of the log is indexed."""
+        self.log_bytes = log_bytes
+        _HEADER.pack_into(self._map, 0, _MAGIC, _FORMAT, self.capacity, self.entries, log_bytes)
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._map.close()
+        self._file.close()
+
+
+class CertificateRegistry:
+    """Append-only certificate log with a persistent hash index."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the registry.
+
+        Args:
+            directory: Directory holding the log and index (created on first issue)
+        """
+        self.directory = directory
+        self.log_path = directory / REGISTRY_LOG
+        self.index_path = directory / REGISTRY_INDEX
+        self.lock_path = directory / (REGISTRY_LOG + ".lock")
+
+    def __len__(self) -> int:
+        """Number of certificates registered."""
+        index = self._open_index()
+        if index is None:
+            return 0
+        try:
+            return index.entries + sum(1 for _ in self._scan_log(index.log_bytes))
+        finally:
+            index.close()
+
+    def lookup(self, cert_id: str) -> list[Certificate]:
+        """Every registered certificate with this ID (more than one means a collision)."""
+        cert_id = normalize_id(cert_id)
+        index = self._open_index() if cert_id else None
+        if index is None:
+            return []
+        try:
+            offsets = index.find(bytes.fromhex(cert_id))
+            indexed = index.log_bytes
+        finally:
+            index.close()
+        # Records appended since the index header was last written (a batch
+        # still in progress, or one that was interrupted)
+        offsets += [
+            offset for offset, record in self._scan_log(indexed)
+            if record.get("id") == cert_id and offset not in offsets
+        ]
+        return [self._read_record(offset) for offset in offsets]
+
+    def issue(self, cert: Certificate) -> IssueResult:
+        """Register one certificate."""
+        return self.issue_many([cert])[0]
+
+    def issue_many(self, certs: list[Certificate]) -> list[IssueResult]:
+        """Register certificates, holding the registry lock once for the batch.
+
+        A certificate already registered for the same learner and date is
+        reported as a duplicate and not appended again; one whose ID belongs
+        to a different learner or date is a collision and is not registered.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        results = []
+        with file_lock(self.lock_path):
+            index = self._sync_index()
+            try:
+                with open(self.log_path, "ab") as log:
+                    for cert in certs:
+                        key = bytes.fromhex(cert.id)
+                        existing = [self._read_record(o) for o in index.find(key)]
+                        if any(cert.same_holder(e) for e in existing):
+                            results.append(IssueResult(cert.name, DUPLICATE, cert))
+                            continue
+                        if existing:
+                            results.append(IssueResult(
+                                cert.name, COLLISION, cert,
+                                f"ID {cert.id} already belongs to {existing[0].name} "
+                                f"({existing[0].issued})",
+                            ))
+                            continue
+                        if index.entries + 1 > index.capacity * _MAX_LOAD:
+                            index = self._grow(index, log.tell())
+                        offset = log.tell()
+                        log.write(json.dumps(asdict(cert)).encode("utf-8") + b"\n")
+                        log.flush()
+                        index.insert(key, offset)
+                        results.append(IssueResult(cert.name, ISSUED, cert))
+                    os.fsync(log.fileno())
+                    index.write_header(log.tell())
+            finally:
+                index.close()
+        return results
+
+    def rebuild_index(self) -> None:
+        """Recreate the index from the log."""
+        with file_lock(self.lock_path):
+            self._rebuild().close()
+
+    def _open_index(self) -> _HashIndex | None:
+        """Open the index read-only, rebuilding it first if it is missing or damaged."""
+        if not self.log_path.exists():
+            return None
+        try:
+            index = _HashIndex(self.index_path, writable=False)
+            if index.log_bytes <= self.log_path.stat().st_size:
+                return index
+            index.close()  # Indexes more log than exists
+        except (OSError, ValueError):
+            pass
+        self.rebuild_index()
+        return _HashIndex(self.index_path, writable=False)
+
+    def _sync_index(self) -> _HashIndex:
+        """Writable index covering the whole log (caller holds the lock)."""
+        if not self.index_path.exists() and not self.log_path.exists():
+            _HashIndex.create(self.index_path, _INITIAL_CAPACITY)
+        try:
+            index = _HashIndex(self.index_path, writable=True)
+        except (OSError, ValueError):
+            return self._rebuild()
+        log_size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        if index.log_bytes > log_size:
+            index.close()
+            return self._rebuild()
+        if index.log_bytes < log_size:
+            for offset, record in self._scan_log(index.log_bytes):
+                key = bytes.fromhex(record["id"])
+                if offset in index.find(key):
+                    # Inserted by a batch interrupted before its header was
+                    # written, which is also why it is not counted yet
+                    index.entries += 1
+                    continue
+                if index.entries + 1 > index.capacity * _MAX_LOAD:
+                    index = self._grow(index, offset)
+                index.insert(key, offset)
+            index.write_header(log_size)
+        return index
+
+    def _rebuild(self) -> _HashIndex:
+        """Build a fresh index from the whole log (caller holds the lock)."""
+        records = list(self._scan_log(0))
+        capacity = _INITIAL_CAPACITY
+        while len(records) + 1 > capacity * _MAX_LOAD:
+            capacity *= 2
+        _HashIndex.create(self.index_path, capacity)
+        index = _HashIndex(self.index_path, writable=True)
+        for offset, record in records:
+            index.insert(bytes.fromhex(record["id"]), offset)
+        index.write_header(self.log_path.stat().st_size if self.log_path.exists() else 0)
+        return index
+
+    def _grow(self, index: _HashIndex, log_bytes: int) -> _HashIndex:
+        """Rehash into an index with twice the capacity."""
+        tmp_path = self.index_path.with_suffix(".grow")
+        _HashIndex.create(tmp_path, index.capacity * 2)
+        grown = _HashIndex(tmp_path, writable=True)
+        for key, offset in index.items():
+            grown.insert(key, offset)
+        grown.write_header(log_bytes)
+        index.close()
+        grown.close()
+        os.replace(tmp_path, self.index_path)
+        return _HashIndex(self.index_path, writable=True)
+
+    def _scan_log(self, start: int) -> Iterator[tuple[int, dict]]:
+        """Yield (offset, record) for each complete line from `start`."""
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, "rb") as log:
+            log.seek(start)
+            offset = start
+            for line in log:
+                if line.endswith(b"\n"):
+                    try:
+                        yield offset, json.loads(line)
+                    except ValueError:
+                        pass  # Skip a damaged line rather than lose the rest
+                offset += len(line)
+
+    def _read_record(self, offset: int) -> Certificate:
+        """Read the log record at a byte offset."""
+        with open(self.log_path, "rb") as log:
+            log.seek(offset)
+            return Certificate(**json.loads(log.readline()))
+
+
+def read_roster(path: Path) -> list[dict[str, str]]:
+    """Read a roster CSV.
+
+    Columns: ``name`` (as printed on the certificate), ``state`` (a learner's
+    state.json, the directory containing their .aidlc-explainer folder, or a
+    shared state.db) and, for state.db, an optional ``learner`` ID that
+    defaults to the name. Relative paths are resolved against the roster.
+
+    Raises:
+        ValueError: If the name or state column is missing
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = {"name", "state"} - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"Missing columns in {path}: {', '.join(sorted(missing))}")
+        rows = []
+        for row in reader:
+            name = (row.get("name") or "").strip()
+            if not name:
+                continue
+            state = Path((row.get("state") or "").strip())
+            rows.append({
+                "name": name,
+                "state": str(state if state.is_absolute() else path.parent / state),
+                "learner": (row.get("learner") or "").strip() or name,
+            })
+        return rows
+
+
+def _backend_for(state_path: Path) -> StateBackend:
+    """Backend for a roster ``state`` entry."""
+    if state_path.is_dir():
+        return JSONFileBackend(state_path / StateManager.STATE_DIR / StateManager.STATE_FILE)
+    if state_path.suffix == ".db":
+        return SQLiteBackend(state_path)
+    return JSONFileBackend(state_path)
+
+
+def read_progress(row: dict[str, str]) -> tuple[dict[str, Any] | None, str]:
+    """Overall progress for a roster row (runs in a worker process).
+
+    Returns:
+        The progress, or None and the reason it could not be read
+    """
+    state_path = Path(row["state"])
+    if not state_path.exists():
+        return None, f"not found: {state_path}"
+    try:
+        backend = _backend_for(state_path)
+        try:
+            if backend.load(row["learner"]) is None:
+                return None, "no saved progress"
+            manager = StateManager(backend=backend, learner_id=row["learner"])
+            return manager.get_overall_progress(), ""
+        finally:
+            backend.close()
+    except Exception as e:  # Report per learner; one bad file shouldn't stop a cohort
+        return None, str(e)
+
+
+def issue_from_roster(
+    roster: list[dict[str, str]],
+    registry: CertificateRegistry,
+    date_str: str | None = None,
+    processes: int | None = None,
+) -> list[IssueResult]:
+    """Check eligibility for a roster in parallel and register certificates.
+
+    Args:
+        roster: Rows from `read_roster`
+        registry: Registry to record issued certificates in
+        date_str: Issue date (default: today)
+        processes: Worker processes for reading progress (default: CPU count)
+
+    Returns:
+        One result per roster row, in roster order
+    """
+    date_str = date_str or datetime.now().strftime("%Y-%m-%d")
+    processes = processes or os.cpu_count() or 1
+    chunksize = max(1, len(roster) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        progress = list(pool.map(read_progress, roster, chunksize=chunksize))
+
+    results: list[IssueResult | None] = [None] * len(roster)
+    eligible = []
+    for i, (row, (prog, error)) in enumerate(zip(roster, progress, strict=True)):
+        if prog is None:
+            results[i] = IssueResult(row["name"], FAILED, message=error)
+        elif not is_eligible(prog):
+            results[i] = IssueResult(
+                row["name"], INELIGIBLE,
+                message=f"lessons {prog['lessons']['completed']}/{REQUIRED_LESSONS}, "
+                        f"quiz {prog['quiz']['percent']:.0f}%",
+            )
+        else:
+            eligible.append((i, Certificate.from_progress(row["name"], date_str, prog)))
+
+    issued = registry.issue_many([cert for _, cert in eligible])
+    for (i, _), result in zip(eligible, issued, strict=True):
+        results[i] = result
+    return results
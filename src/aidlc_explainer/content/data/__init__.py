@@ -0,0 +1,6 @@
+"""The content as written, which `content.snapshot` compiles.
+
+Screens do not import these modules directly; they load sections through
+`aidlc_explainer.content.snapshot`, which only imports a module here when
+there is no current snapshot.
+"""
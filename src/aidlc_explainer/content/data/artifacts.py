@@ -0,0 +1,460 @@
+"""Artifact definitions for the artifact explorer."""
+
+from aidlc_explainer.content.models import ArtifactDefinition
+
+# Artifact definitions based on AWS AI-DLC methodology
+ARTIFACTS = [
+    # Root artifacts
+    ArtifactDefinition(
+        path="aidlc-docs/aidlc-state.md",
+        name="State Tracker",
+        phase="all",
+        stage="all",
+        mandatory=True,
+        purpose="Tracks current phase, stage, and completion status. Updated after every significant action.",
+        template="""# AI-DLC State
+
+## Current Status
+| Field | Value |
+|-------|-------|
+| Phase | Inception |
+| Stage | Requirements Analysis |
+| Status | IN PROGRESS |
+| Last Updated | YYYY-MM-DD |
+
+## What Changed
+- [Description of recent changes]
+
+## What's Next
+1. [Next steps]
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L156",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/execution-plan.md",
+        name="Execution Plan",
+        phase="inception",
+        stage="workflow-planning",
+        mandatory=True,
+        purpose="Documents the planned stages, their sequence, and rationale for inclusion or exclusion.",
+        template="""# Execution Plan
+
+## Overview
+- **Request Type:** Greenfield/Brownfield/Frontend/Bugfix
+- **Risk Level:** Low/Medium/High
+- **Estimated Stages:** X
+
+## Stage Checklist
+
+### Inception
+- [ ] Workspace Detection
+- [ ] Requirements Analysis
+- [ ] Workflow Planning
+
+### Construction
+- [ ] Functional Design
+- [ ] Code Generation
+- [ ] Build and Test
+
+## Rationale
+[Why these stages were selected]
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L96-97",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/audit.md",
+        name="Audit Log",
+        phase="all",
+        stage="all",
+        mandatory=True,
+        purpose="Append-only log of timestamped decisions, approvals, and evidence. Never edited, only appended.",
+        template="""# Audit Log
+
+Append-only record of decisions, approvals, and evidence.
+
+---
+
+## YYYY-MM-DD | [Action Title]
+
+**Action:** [What was done]
+**Decision:** [What was decided]
+**Evidence:** [Proof/references]
+**Status:** [APPROVED/PENDING/REJECTED]
+
+---
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L157",
+    ),
+    
+    # Inception artifacts
+    ArtifactDefinition(
+        path="aidlc-docs/inception/intent.md",
+        name="Intent Document",
+        phase="inception",
+        stage="requirements-analysis",
+        mandatory=True,
+        purpose="Captures the high-level goal in one paragraph plus success metrics and explicit non-goals.",
+        template="""# Intent
+
+[One paragraph describing the business goal, feature, or technical outcome]
+
+## Success Metrics
+| Metric | Target | Measurement |
+|--------|--------|-------------|
+| [Metric 1] | [Target] | [How measured] |
+
+## Non-Goals
+- [Explicit exclusions]
+""",
+        source="aidlc-method-definition.md#L68-69",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/inception/requirements.md",
+        name="Requirements Document",
+        phase="inception",
+        stage="requirements-analysis",
+        mandatory=True,
+        purpose="Documents functional requirements including user stories, acceptance criteria, and constraints.",
+        template="""# Requirements
+
+## User Stories
+
+### US-01: [Story Title]
+**As a** [role]
+**I want to** [action]
+**So that** [benefit]
+
+**Acceptance Criteria:**
+- [ ] [Criterion 1]
+- [ ] [Criterion 2]
+
+## Constraints
+- [Constraint 1]
+- [Constraint 2]
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L93-94",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/inception/nfr.md",
+        name="NFR Document",
+        phase="inception",
+        stage="requirements-analysis",
+        mandatory=True,
+        purpose="Documents non-functional requirements: availability, latency, security, compliance, scalability.",
+        template="""# Non-Functional Requirements
+
+## Availability
+- Target: 99.9% uptime
+- RTO: [Recovery Time Objective]
+- RPO: [Recovery Point Objective]
+
+## Performance
+- Latency p99: < 200ms
+- Throughput: X req/sec
+
+## Security
+- Authentication: [Method]
+- Authorization: [Method]
+- Encryption: [Requirements]
+
+## Compliance
+- [Applicable standards: GDPR, SOC2, HIPAA, etc.]
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L95-96",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/inception/user-stories.md",
+        name="User Stories",
+        phase="inception",
+        stage="user-stories",
+        mandatory=False,
+        purpose="Detailed user stories with personas, acceptance criteria, and validation approach.",
+        template="""# User Stories
+
+## Personas
+- **[Persona Name]:** [Description]
+
+## Stories
+
+### US-01: [Title]
+**Persona:** [Name]
+**Story:** As a [role], I want to [action] so that [benefit]
+**Acceptance Criteria:**
+1. [Criterion]
+**Validation:** [How to test]
+""",
+        source="aidlc-workflows/inception/user-stories.md",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/inception/application-design.md",
+        name="Application Design",
+        phase="inception",
+        stage="application-design",
+        mandatory=False,
+        purpose="High-level component identification and service layer design (optional for simple projects).",
+        template="""# Application Design
+
+## Components
+- **[Component 1]:** [Responsibility]
+- **[Component 2]:** [Responsibility]
+
+## Component Diagram
+```
+[ASCII or description of component relationships]
+```
+
+## Service Boundaries
+[How components interact]
+""",
+        source="aidlc-workflows/inception/application-design.md",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/inception/units/unit-01.md",
+        name="Unit Definition",
+        phase="inception",
+        stage="units-generation",
+        mandatory=False,
+        purpose="Defines a cohesive unit of work with scope, stories, acceptance criteria, and dependencies.",
+        template="""# Unit 01: [Unit Name]
+
+## Scope
+[What this unit includes and excludes]
+
+## User Stories
+- US-01: [Story]
+- US-02: [Story]
+
+## Acceptance Criteria
+- [ ] [Criterion 1]
+- [ ] [Criterion 2]
+
+## Dependencies
+- Depends on: [Other units or external systems]
+- Depended on by: [Units that need this]
+
+## Estimated Bolts
+[Number of iterations expected]
+""",
+        source="aidlc-method-definition.md#L71-75",
+    ),
+    
+    # Construction artifacts
+    ArtifactDefinition(
+        path="aidlc-docs/construction/<unit>/design.md",
+        name="Unit Design",
+        phase="construction",
+        stage="functional-design",
+        mandatory=True,
+        purpose="Domain model, API design, data model, and key tradeoffs for the unit.",
+        template="""# Unit Design: [Unit Name]
+
+## Domain Model
+- **Entities:** [List]
+- **Value Objects:** [List]
+- **Aggregates:** [List]
+
+## API Design
+| Endpoint | Method | Description |
+|----------|--------|-------------|
+| /api/v1/resource | GET | [Description] |
+
+## Data Model
+[Schema or description]
+
+## Key Tradeoffs
+- [Decision]: [Rationale]
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L116-117",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/construction/<unit>/tasks-plan.md",
+        name="Tasks Plan",
+        phase="construction",
+        stage="code-generation",
+        mandatory=True,
+        purpose="Checkboxed task list for implementing the unit. Must be approved before execution.",
+        template="""# Tasks Plan: [Unit Name]
+
+## Phase 1: Setup
+- [ ] Create project structure
+- [ ] Configure dependencies
+
+## Phase 2: Implementation
+- [ ] Implement [Component 1]
+- [ ] Implement [Component 2]
+
+## Phase 3: Testing
+- [ ] Write unit tests
+- [ ] Write integration tests
+
+## Phase 4: Validation
+- [ ] Run full test suite
+- [ ] Update validation report
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L118",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/construction/<unit>/validation-report.md",
+        name="Validation Report",
+        phase="construction",
+        stage="build-and-test",
+        mandatory=True,
+        purpose="Documents what tests/checks ran, results, fixes applied, and final acceptance criteria status.",
+        template="""# Validation Report: [Unit Name]
+
+## Commands Executed
+```
+pip install -r requirements.txt
+pytest tests/ -v
+ruff check src/
+```
+
+## Results
+- Tests: X passed, Y failed
+- Lint: X errors
+- Security: X issues
+
+## Fixes Applied
+- [Fix 1]
+
+## Acceptance Criteria Status
+- [x] AC1: [Description] ✓
+- [ ] AC2: [Description] ✗
+
+## Final Status
+[PASS/FAIL]
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L119",
+    ),
+    
+    # Operations artifacts
+    ArtifactDefinition(
+        path="aidlc-docs/operations/deployment-plan.md",
+        name="Deployment Plan",
+        phase="operations",
+        stage="deployment",
+        mandatory=True,
+        purpose="Environment topology, infrastructure requirements, deployment sequence, and rollback procedure.",
+        template="""# Deployment Plan
+
+## Environment Topology
+- Dev: [Description]
+- Staging: [Description]
+- Production: [Description]
+
+## Infrastructure
+- Compute: [Requirements]
+- Database: [Requirements]
+- Network: [Requirements]
+
+## Deployment Sequence
+1. [Step 1]
+2. [Step 2]
+
+## Rollback Procedure
+1. [Step 1]
+2. [Step 2]
+""",
+        source="AI-SDLC_best-practice_method_principles.md#L131",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/operations/observability.md",
+        name="Observability Plan",
+        phase="operations",
+        stage="observability",
+        mandatory=True,
+        purpose="Defines SLOs, metrics list, log schema, dashboard templates, and alert definitions.",
+        template="""# Observability Plan
+
+## SLOs
+| SLO | Target | Error Budget |
+|-----|--------|--------------|
+| Availability | 99.9% | 0.1%/month |
+| Latency p99 | < 200ms | - |
+
+## Metrics
+- [Metric 1]: [Description]
+- [Metric 2]: [Description]
+
+## Log Schema
+```json
+{"timestamp": "", "level": "", "message": "", "correlation_id": ""}
+```
+
+## Alerts
+| Alert | Condition | Severity |
+|-------|-----------|----------|
+| High Error Rate | > 1% for 5m | P1 |
+""",
+        source="operations observability best practices",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/operations/runbooks.md",
+        name="Runbooks",
+        phase="operations",
+        stage="incident-response",
+        mandatory=True,
+        purpose="Documents incident types, triage steps, resolution procedures, and escalation paths.",
+        template="""# Runbooks
+
+## Runbook: [Incident Type]
+
+### Trigger
+[What triggers this runbook]
+
+### Severity
+[P1/P2/P3/P4]
+
+### Symptoms
+- [Symptom 1]
+- [Symptom 2]
+
+### Triage Steps
+1. [Step 1]
+2. [Step 2]
+
+### Resolution Steps
+1. [Step 1]
+2. [Step 2]
+
+### Rollback Steps
+1. [Step 1]
+
+### Escalation
+- [Contact info]
+""",
+        source="operations runbook best practices",
+    ),
+    ArtifactDefinition(
+        path="aidlc-docs/operations/cost.md",
+        name="Cost Model",
+        phase="operations",
+        stage="cost-modeling",
+        mandatory=False,
+        purpose="Documents load assumptions, cost drivers, scaling strategy, and cost guardrails.",
+        template="""# Cost Model
+
+## Load Assumptions
+- Baseline: X req/min
+- Peak: Xx baseline
+- Growth: X% month-over-month
+
+## Cost Breakdown
+| Resource | Monthly Cost |
+|----------|--------------|
+| Compute | $X |
+| Database | $X |
+| Network | $X |
+| **Total** | **$X** |
+
+## Scaling Strategy
+- Scale up: [Condition]
+- Scale down: [Condition]
+
+## Guardrails
+- Alert at: 120% of budget
+- Hard cap: 150% of budget
+""",
+        source="cost modeling best practices",
+    ),
+]
@@ -0,0 +1,232 @@
+"""Translated content, laid over the English content it shares structure with.
+
+A locale is a directory under ``content/locales/`` with a ``locale.json``
+naming it and one file per content section it translates:
+
+    locales/es/locale.json      {"$schema": "locale-v1", "name": "Español"}
+    locales/es/quiz.json        {"$schema": "locale-v1", "strings": {...}}
+
+A section's ``strings`` mirror the English section, holding only the
+translated text. Lists of items with an ``id`` (lessons, sections,
+glossary terms, questions, scenarios, stages) are given as objects keyed
+by that ID; other lists are given in full, with ``null`` for an element
+left untranslated:
+
+    {"questions": {"q1": {"prompt": "¿Cuáles son las tres fases de AI-DLC?",
+                          "options": [null, "Inicio, Construcción, Operaciones", null, null]}}}
+
+Only strings are replaced, and never those under `STRUCTURE_KEYS`, so
+IDs, correct answers, stage graphs and every other part of the structure
+always come from the English content, and anything not translated falls
+back to English. A translated item is a
+shallow copy of the English one with its translated fields replaced;
+everything untranslated, items and fields alike, is the English object
+itself, so a locale costs little more than its strings.
+
+A locale's files are read the first time one of its sections is loaded,
+and kept along with the sections localized from them, so switching back
+to a locale reads and copies nothing. Set ``AIDLC_LOCALE`` (or
+pass ``--locale``) to start in another locale.
+"""
+
+import dataclasses
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+LOCALES_DIR = Path(__file__).parent / "locales"
+LOCALE_ENV = "AIDLC_LOCALE"
+DEFAULT_LOCALE = "en"
+LOCALE_SCHEMA = "locale-v1"
+
+# Sections whose items are searched, and the key of their item array
+# (None: the section is itself the list or mapping of items)
+ITEM_KEYS = {
+    "lessons": None,
+    "lesson-index": None,
+    "glossary": None,
+    "quiz": "questions",
+    "gates": "scenarios",
+    "stages": "stages",
+}
+
+# Keys whose strings are structure (IDs and references to them, answers,
+# paths, sources), never translated
+STRUCTURE_KEYS = frozenset({
+    "id", "phase", "type", "correct", "correct_action", "always_execute",
+    "affects_stages", "add_stages", "remove_stages", "stages", "related",
+    "path", "source", "sources", "icon", "color", "default_risk",
+})
+
+
+def _read(path: Path) -> dict:
+    """A locale file.
+
+    Raises:
+        OSError: If it cannot be read
+        ValueError: If it is not a locale file
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    if not isinstance(document, dict) or document.get("$schema") != LOCALE_SCHEMA:
+        raise ValueError(f"Not a {LOCALE_SCHEMA} file: {path}")
+    return document
+
+
+def available_locales(locales_dir: Path = LOCALES_DIR) -> dict[str, str]:
+    """Every locale, by code, with its name; English first."""
+    locales = {DEFAULT_LOCALE: "English"}
+    if locales_dir.is_dir():
+        for path in sorted(locales_dir.glob("*/locale.json")):
+            try:
+                locales[path.parent.name] = str(_read(path).get("name", path.parent.name))
+            except (OSError, ValueError):
+                continue
+    return locales
+
+
+def _item_id(item: Any) -> Any:
+    if isinstance(item, dict):
+        return item.get("id")
+    return getattr(item, "id", None)
+
+
+def overlay(base: Any, strings: Any, keep: frozenset = STRUCTURE_KEYS) -> Any:
+    """English content with translated strings laid over it.
+
+    Args:
+        base: The English content
+        strings: Translated strings, shaped like ``base``
+        keep: Keys whose values are left as they are
+
+    Returns:
+        ``base`` itself where nothing is translated; otherwise a shallow
+        copy with the translated parts replaced
+    """
+    if strings is None:
+        return base
+    if isinstance(base, str):
+        return strings if isinstance(strings, str) else base
+    if isinstance(base, dict) and isinstance(strings, dict):
+        changed = {
+            key: overlay(base[key], value, keep)
+            for key, value in strings.items() if key in base and key not in keep
+        }
+        changed = {key: value for key, value in changed.items() if value is not base[key]}
+        return {**base, **changed} if changed else base
+    if isinstance(base, list):
+        if isinstance(strings, dict):  # Items keyed by ID
+            items = [overlay(item, strings.get(_item_id(item)), keep) for item in base]
+        elif isinstance(strings, list) and len(strings) == len(base):
+            items = [overlay(item, text, keep) for item, text in zip(base, strings, strict=True)]
+        else:
+            return base
+        return items if any(new is not old for new, old in zip(items, base, strict=True)) else base
+    if dataclasses.is_dataclass(base) and isinstance(strings, dict):
+        names = {field.name for field in dataclasses.fields(base)} - keep
+        changed = {
+            key: overlay(getattr(base, key), value, keep)
+            for key, value in strings.items() if key in names
+        }
+        changed = {key: value for key, value in changed.items() if value is not getattr(base, key)}
+        return dataclasses.replace(base, **changed) if changed else base
+    return base
+
+
+class Catalog:
+    """The translated strings of one locale, read a section at a time."""
+
+    def __init__(self, locale: str, locales_dir: Path = LOCALES_DIR):
+        self.locale = locale
+        self.directory = locales_dir / locale
+        self._strings: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def strings(self, section: str) -> dict:
+        """A section's translated strings (empty if it is not translated)."""
+        with self._lock:
+            if section not in self._strings:
+                strings = {}
+                if self.locale != DEFAULT_LOCALE:
+                    try:
+                        strings = _read(self.directory / f"{section}.json").get("strings", {})
+                    except (OSError, ValueError):
+                        strings = {}  # Untranslated, or unusable: English it is
+                self._strings[section] = strings if isinstance(strings, dict) else {}
+            return self._strings[section]
+
+    def item_ids(self, section: str) -> set[str]:
+        """IDs of the items of a section that have translated strings."""
+        strings = self.strings(section)
+        key = ITEM_KEYS.get(section)
+        items = strings.get(key, {}) if key else strings
+        return set(items) if isinstance(items, dict) else set()
+
+
+class Localizer:
+    """The active locale, and content sections localized to it."""
+
+    def __init__(self, locale: str = DEFAULT_LOCALE, locales_dir: Path = LOCALES_DIR):
+        self.locales_dir = locales_dir
+        self._catalogs: dict[str, Catalog] = {}
+        # (locale, section) -> (English, localized)
+        self._localized: dict[tuple[str, str], tuple[Any, Any]] = {}
+        self._lock = threading.RLock()
+        self.catalog = self._catalog(locale)
+
+    @property
+    def locale(self) -> str:
+        """The active locale's code."""
+        return self.catalog.locale
+
+    def _catalog(self, locale: str) -> Catalog:
+        if locale not in self._catalogs:
+            self._catalogs[locale] = Catalog(locale, self.locales_dir)
+        return self._catalogs[locale]
+
+    def set_locale(self, locale: str) -> Catalog:
+        """Make a locale active.
+
+        Returns:
+            The catalog of the locale that was active before
+        """
+        with self._lock:
+            previous = self.catalog
+            self.catalog = self._catalog(locale)
+            return previous
+
+    def localize(self, section: str, value: Any) -> Any:
+        """A section's English content in the active locale.
+
+        A section that is loaded once and shared is localized once; the
+        result is reused for as long as the English content is the same.
+        """
+        catalog = self.catalog
+        if catalog.locale == DEFAULT_LOCALE:
+            return value
+        key = (catalog.locale, section)
+        with self._lock:
+            cached = self._localized.get(key)
+            if cached is not None and cached[0] is value:
+                return cached[1]
+            # A section's own item array is translated; the same key inside
+            # an item (a request type's stages) is structure
+            keep = STRUCTURE_KEYS - {ITEM_KEYS.get(section)}
+            localized = overlay(value, catalog.strings(section), keep)
+            self._localized[key] = (value, localized)
+            return localized
+
+
+def changed_items(old: Catalog, new: Catalog) -> dict[str, set[str]]:
+    """IDs of the items, by section, whose text may differ between two locales."""
+    return {section: old.item_ids(section) | new.item_ids(section) for section in ITEM_KEYS}
+
+
+LOCALIZER = Localizer(os.environ.get(LOCALE_ENV) or DEFAULT_LOCALE)
+
+
+def localize(section: str, value: Any) -> Any:
+    """A section's content in the active locale."""
+    return LOCALIZER.localize(section, value)
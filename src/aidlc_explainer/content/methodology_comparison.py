@@ -1,6 +1,8 @@
 """Methodology comparison data for Waterfall, Agile, and AI-DLC."""
 
-from dataclasses import dataclass, field
+import json
+from dataclasses import dataclass, field, replace
+from pathlib import Path
 
 
 @dataclass
@@ -27,6 +29,8 @@ class Methodology:
     key_characteristics: list[str]
     strengths: list[str]
     weaknesses: list[str]
+    volatility_time_factor: float = 1.0  # Time multiplier for volatile requirements
+    complexity_cost_factor: float = 1.2  # Cost multiplier for high-complexity projects
 
 
 # === METHODOLOGY DEFINITIONS ===
@@ -63,6 +67,7 @@ WATERFALL = Methodology(
         "High risk of building wrong thing",
         "Long time to value",
     ],
+    volatility_time_factor=1.5,  # Waterfall suffers more from volatility
 )
 
 AGILE = Methodology(
@@ -128,22 +133,74 @@ AIDLC = Methodology(
         "Learning curve for teams",
         "New collaboration patterns",
     ],
+    volatility_time_factor=0.9,  # AI-DLC handles change better
 )
 
 METHODOLOGIES = [WATERFALL, AGILE, AIDLC]
 
+# Calibrated factors written by `aidlc-explainer calibrate` (relative to cwd)
+PROFILE_PATH = Path(".aidlc-explainer") / "methodology-profile.json"
+PROFILE_SCHEMA = "methodology-profile-v1"
+CALIBRATED_FIELDS = (
+    "cycle_time_factor",
+    "cost_factor",
+    "volatility_time_factor",
+    "complexity_cost_factor",
+)
+
 
-def get_methodology(method_id: str) -> Methodology | None:
+def load_methodology_profile(path: Path | None = None) -> dict[str, dict[str, float]]:
+    """Load calibrated methodology factors.
+    
+    Args:
+        path: Profile file (defaults to PROFILE_PATH in the current directory)
+        
+    Returns:
+        Mapping of methodology ID to calibrated factor values; empty if the
+        profile is missing or invalid
+    """
+    path = path or Path.cwd() / PROFILE_PATH
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(profile, dict) or profile.get("$schema") != PROFILE_SCHEMA:
+        return {}
+    methodologies = profile.get("methodologies")
+    if not isinstance(methodologies, dict):
+        return {}
+    
+    factors = {}
+    for method_id, values in methodologies.items():
+        if not isinstance(values, dict):
+            continue
+        factors[method_id] = {
+            name: float(values[name])
+            for name in CALIBRATED_FIELDS
+            if isinstance(values.get(name), (int, float))
+            and not isinstance(values[name], bool)
+            and values[name] > 0
+        }
+    return factors
+
+
+def get_methodology(method_id: str, profile_path: Path | None = None) -> Methodology | None:
     """Get a methodology by ID."""
-    for m in METHODOLOGIES:
+    for m in get_all_methodologies(profile_path):
         if m.id == method_id:
             return m
     return None
 
 
-def get_all_methodologies() -> list[Methodology]:
-    """Get all methodologies."""
-    return METHODOLOGIES.copy()
+def get_all_methodologies(profile_path: Path | None = None) -> list[Methodology]:
+    """Get all methodologies, with calibrated factors applied if a profile exists.
+    
+    Args:
+        profile_path: Calibrated profile to apply (defaults to PROFILE_PATH)
+    """
+    factors = load_methodology_profile(profile_path)
+    return [replace(m, **factors[m.id]) if m.id in factors else m for m in METHODOLOGIES]
 
 
 # === COMPARISON METRICS ===
@@ -297,6 +354,9 @@ PROJECT_SCENARIOS = [
 ]
 
 
+COST_UNITS_PER_WEEK = 10  # Cost units per baseline week
+
+
 def simulate_project(scenario: ProjectScenario, methodology: Methodology) -> SimulationResult:
     """Simulate a project scenario with a given methodology."""
     base_weeks = scenario.baseline_weeks
@@ -304,19 +364,15 @@ def simulate_project(scenario: ProjectScenario, methodology: Methodology) -> Sim
     # Calculate time
     time_factor = methodology.cycle_time_factor
     if scenario.requirements_stability == "volatile":
-        # Waterfall suffers more from volatility
-        if methodology.id == "waterfall":
-            time_factor *= 1.5
-        elif methodology.id == "aidlc":
-            time_factor *= 0.9  # AI-DLC handles change better
+        time_factor *= methodology.volatility_time_factor
     
     total_weeks = int(base_weeks * time_factor)
     
     # Calculate cost
     cost_factor = methodology.cost_factor
     if scenario.complexity == "high":
-        cost_factor *= 1.2
-    total_cost = int(base_weeks * 10 * cost_factor)  # 10 units per week baseline
+        cost_factor *= methodology.complexity_cost_factor
+    total_cost = int(base_weeks * COST_UNITS_PER_WEEK * cost_factor)
     
     # Calculate feedback points
     if methodology.id == "waterfall":
@@ -0,0 +1,105 @@
+"""Data classes for the content shown by the screens.
+
+They are kept apart from the content itself, so a compiled content
+snapshot can be loaded without importing the modules it was built from.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Section:
+    """A section within a lesson."""
+    id: str
+    title: str
+    content: str
+    diagram: str | None = None
+
+
+@dataclass
+class Lesson:
+    """A complete lesson with multiple sections."""
+    id: str
+    title: str
+    description: str
+    sections: list[Section]
+
+
+@dataclass
+class GlossaryTerm:
+    """A glossary term definition."""
+    id: str
+    term: str
+    definition: str
+    example: str
+    related: list[str]
+    source: str
+
+
+@dataclass
+class RoleMapping:
+    """Maps an Agile role to its AI-DLC equivalent."""
+    agile_role: str
+    agile_responsibilities: list[str]
+    aidlc_role: str
+    aidlc_responsibilities: list[str]
+    key_changes: list[str]
+    skills_to_develop: list[str]
+
+
+@dataclass
+class ProcessMapping:
+    """Maps an Agile ceremony/process to AI-DLC equivalent."""
+    agile_process: str
+    agile_frequency: str
+    agile_duration: str
+    agile_purpose: str
+    aidlc_process: str
+    aidlc_frequency: str
+    aidlc_duration: str
+    aidlc_purpose: str
+    key_differences: list[str]
+
+
+@dataclass
+class ArtifactMapping:
+    """Maps an Agile artifact to AI-DLC equivalent."""
+    agile_artifact: str
+    agile_purpose: str
+    aidlc_artifact: str
+    aidlc_purpose: str
+    key_differences: list[str]
+
+
+@dataclass
+class TransitionPhase:
+    """A phase in the transition journey."""
+    id: str
+    name: str
+    duration: str
+    focus: str
+    activities: list[str]
+    success_criteria: list[str]
+    risks: list[str]
+
+
+@dataclass
+class ReadinessItem:
+    """An item in the transition readiness checklist."""
+    category: str
+    item: str
+    description: str
+    importance: str  # critical, high, medium
+
+
+@dataclass
+class ArtifactDefinition:
+    """Definition of an AI-DLC artifact."""
+    path: str
+    name: str
+    phase: str
+    stage: str
+    mandatory: bool
+    purpose: str
+    template: str
+    source: str
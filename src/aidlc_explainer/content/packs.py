@@ -0,0 +1,196 @@
+"""Content packs installed as separate Python distributions.
+
+A pack registers a manifest under the ``aidlc_explainer.content_packs``
+entry point group:
+
+    [project.entry-points."aidlc_explainer.content_packs"]
+    acme-security = "acme_security.manifest:MANIFEST"
+
+The manifest is a plain dict listing what the pack offers and where each
+item's content is, without the content itself:
+
+    MANIFEST = {
+        "title": "ACME Security",
+        "lessons": [
+            {"id": "threat-modeling", "title": "Threat Modeling",
+             "description": "...", "source": "acme_security.lessons:THREAT_MODELING"},
+        ],
+        "quizzes": [
+            {"id": "acme-secure-coding", "title": "Secure Coding",
+             "description": "...", "source": "acme_security:quiz.json"},
+        ],
+        "gates": [...],
+    }
+
+A ``source`` is either ``module:attribute`` (a `Lesson` for lessons, a
+dict in the ``quiz-v1``/``gates-v1`` format for quizzes and gates) or
+``package:file.json``, a JSON file shipped in a package. Discovery loads
+only the manifests, so the manifest module should not import the pack's
+content; a source is imported the first time its lesson, quiz or gate
+is opened, and kept for the rest of the session.
+
+A pack that cannot be loaded, or whose manifest is not valid, is skipped
+and reported in `PackRegistry.errors` rather than stopping the app.
+"""
+
+import importlib
+import json
+import threading
+from dataclasses import dataclass, field
+from importlib import metadata, resources
+from typing import Any
+
+from aidlc_explainer.content.models import Lesson
+
+ENTRY_POINT_GROUP = "aidlc_explainer.content_packs"
+KINDS = ("lessons", "quizzes", "gates")
+# The list a quiz or gate set must hold
+ITEM_LISTS = {"quizzes": "questions", "gates": "scenarios"}
+_LISTING_FIELDS = ("id", "title", "description", "source")
+
+
+@dataclass
+class PackManifest:
+    """What a content pack offers, from its entry point."""
+    name: str  # Entry point name
+    title: str
+    distribution: str = ""
+    lessons: list[dict] = field(default_factory=list)
+    quizzes: list[dict] = field(default_factory=list)
+    gates: list[dict] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, name: str, data: Any, distribution: str = "") -> "PackManifest":
+        """Build a manifest from the dict a pack registers.
+
+        Raises:
+            ValueError: If the manifest is not valid
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Pack '{name}': manifest is not a dict")
+        listings = {}
+        for kind in KINDS:
+            entries = data.get(kind, [])
+            if not isinstance(entries, list):
+                raise ValueError(f"Pack '{name}': '{kind}' is not a list")
+            for entry in entries:
+                missing = [f for f in _LISTING_FIELDS if not isinstance(entry, dict) or not entry.get(f)]
+                if missing:
+                    raise ValueError(f"Pack '{name}': a {kind} entry has no {', '.join(missing)}")
+                if ":" not in entry["source"]:
+                    raise ValueError(f"Pack '{name}': source '{entry['source']}' has no ':'")
+            listings[kind] = [{**entry, "pack": name} for entry in entries]
+        return cls(name, str(data.get("title", name)), distribution, **listings)
+
+
+def load_source(source: str) -> Any:
+    """The object or JSON file a manifest source names.
+
+    Raises:
+        ImportError: If the module or package cannot be imported
+        AttributeError: If the module has no such attribute
+        OSError: If the JSON file cannot be read
+        ValueError: If the JSON file is not valid
+    """
+    module, _, name = source.partition(":")
+    if name.endswith(".json"):
+        with resources.files(module).joinpath(name).open("r", encoding="utf-8") as f:
+            return json.load(f)
+    return getattr(importlib.import_module(module), name)
+
+
+class PackRegistry:
+    """Installed content packs, discovered on first use."""
+
+    def __init__(self, entry_points: list[metadata.EntryPoint] | None = None):
+        """Create a registry.
+
+        Args:
+            entry_points: Pack entry points (default: those installed in
+                the ``aidlc_explainer.content_packs`` group)
+        """
+        self._entry_points = entry_points
+        self._manifests: list[PackManifest] | None = None
+        self._content: dict[str, Any] = {}  # Source -> loaded content
+        self.errors: list[str] = []
+        self._lock = threading.RLock()  # Lessons are prefetched in a thread
+
+    @property
+    def manifests(self) -> list[PackManifest]:
+        """Every valid pack manifest, in entry point name order."""
+        with self._lock:
+            if self._manifests is None:
+                self._manifests = self._discover()
+            return self._manifests
+
+    def _discover(self) -> list[PackManifest]:
+        entry_points = self._entry_points
+        if entry_points is None:
+            entry_points = list(metadata.entry_points(group=ENTRY_POINT_GROUP))
+        manifests, seen = [], set()
+        for entry_point in sorted(entry_points, key=lambda e: e.name):
+            distribution = entry_point.dist.name if entry_point.dist else ""
+            try:
+                manifest = PackManifest.from_dict(entry_point.name, entry_point.load(), distribution)
+            except Exception as e:  # A broken pack must not stop the app
+                self.errors.append(f"Pack '{entry_point.name}' not loaded: {e}")
+                continue
+            for kind in KINDS:
+                listings = []
+                for entry in getattr(manifest, kind):
+                    if (kind, entry["id"]) in seen:
+                        self.errors.append(
+                            f"Pack '{manifest.name}': {kind} '{entry['id']}' is already defined"
+                        )
+                        continue
+                    seen.add((kind, entry["id"]))
+                    listings.append(entry)
+                setattr(manifest, kind, listings)
+            manifests.append(manifest)
+        return manifests
+
+    def listings(self, kind: str) -> list[dict]:
+        """The lessons, quizzes or gates every pack lists, without their content."""
+        return [entry for manifest in self.manifests for entry in getattr(manifest, kind)]
+
+    def find(self, kind: str, item_id: str) -> dict | None:
+        """A pack's listing of a lesson, quiz or gate, by ID."""
+        for entry in self.listings(kind):
+            if entry["id"] == item_id:
+                return entry
+        return None
+
+    def load(self, kind: str, item_id: str) -> Any:
+        """A pack lesson, quiz or gate set, importing its content on first use.
+
+        Raises:
+            ValueError: If no pack lists it, or its content cannot be loaded
+        """
+        entry = self.find(kind, item_id)
+        if entry is None:
+            raise ValueError(f"Unknown {kind[:-1]}: {item_id}")
+        source = entry["source"]
+        with self._lock:
+            if source not in self._content:
+                try:
+                    content = load_source(source)
+                except (ImportError, AttributeError, OSError, ValueError) as e:
+                    raise ValueError(f"Pack '{entry['pack']}': cannot load {source}: {e}") from e
+                expected = Lesson if kind == "lessons" else dict
+                if not isinstance(content, expected):
+                    raise ValueError(
+                        f"Pack '{entry['pack']}': {source} is not a {expected.__name__}"
+                    )
+                items = ITEM_LISTS.get(kind)
+                if items and not isinstance(content.get(items), list):
+                    raise ValueError(f"Pack '{entry['pack']}': {source} has no {items} list")
+                self._content[source] = content
+            return self._content[source]
+
+    def is_loaded(self, kind: str, item_id: str) -> bool:
+        """Whether a pack item's content has been imported yet."""
+        entry = self.find(kind, item_id)
+        return entry is not None and entry["source"] in self._content
+
+
+REGISTRY = PackRegistry()
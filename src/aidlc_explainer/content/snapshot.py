@@ -0,0 +1,250 @@
+"""Compiled content snapshot, loaded lazily with a fallback to source.
+
+All of the app's content (lessons, glossary, transition mappings,
+artifact definitions and the practice and simulator JSON files) is
+written as Python literals and JSON, which cost an import or a parse the
+first time a screen needs them. `build_snapshot` compiles every content
+section into one binary file:
+
+    header      magic, format version, SHA-256 of the content sources,
+                size of the section table
+    table       marshalled {section: (offset, length)}
+    sections    one pickle per section
+
+At runtime the file is memory-mapped and a section is unpickled only the
+first time it is asked for. The digest in the header is checked against
+the current sources first; if they have changed since the snapshot was
+built (or there is no snapshot), sections are loaded from source instead,
+so a stale snapshot is never used.
+
+Set ``AIDLC_CONTENT_SNAPSHOT`` to a path to use another snapshot file, or
+to ``off`` to always load from source. Snapshots hold the English content;
+`load` lays the active locale's translations over it.
+"""
+
+import hashlib
+import importlib
+import json
+import marshal
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from aidlc_explainer.content.locale import localize
+
+CONTENT_DIR = Path(__file__).parent
+SNAPSHOT_PATH = CONTENT_DIR / "content.snapshot"
+SNAPSHOT_ENV = "AIDLC_CONTENT_SNAPSHOT"
+SNAPSHOT_FORMAT = 1
+
+# Section name -> source, relative to the content directory: a JSON file,
+# or a module and the attribute holding the section
+SECTIONS = {
+    "lessons": "data/lessons.py:LESSONS",
+    "glossary": "data/glossary.py:GLOSSARY_TERMS",
+    "role-mappings": "data/transitions.py:ROLE_MAPPINGS",
+    "process-mappings": "data/transitions.py:PROCESS_MAPPINGS",
+    "artifact-mappings": "data/transitions.py:ARTIFACT_MAPPINGS",
+    "transition-phases": "data/transitions.py:TRANSITION_PHASES",
+    "readiness-checklist": "data/transitions.py:READINESS_CHECKLIST",
+    "artifacts": "data/artifacts.py:ARTIFACTS",
+    "quiz": "practice/quiz.json",
+    "gates": "practice/gates.json",
+    "stages": "simulator/stages.json",
+    "questions": "simulator/questions.json",
+    "request-types": "simulator/request-types.json",
+}
+MODELS_SOURCE = "models.py"  # The classes the pickles refer to
+
+_HEADER = struct.Struct("<8sI32sI")  # magic, format, source digest, table size
+_MAGIC = b"AIDLCSNP"
+
+
+def _source_file(source: str) -> str:
+    return source.partition(":")[0]
+
+
+def _is_json(source: str) -> bool:
+    return source.endswith(".json")
+
+
+def source_digest(content_dir: Path = CONTENT_DIR) -> bytes:
+    """SHA-256 of every content source file, and of the data classes.
+
+    Raises:
+        OSError: If a source file cannot be read
+    """
+    digest = hashlib.sha256(f"{SNAPSHOT_FORMAT}".encode())
+    for name in sorted({_source_file(s) for s in SECTIONS.values()} | {MODELS_SOURCE}):
+        digest.update(name.encode() + b"\0")
+        digest.update((content_dir / name).read_bytes())
+    return digest.digest()
+
+
+def load_from_source(name: str) -> Any:
+    """A section read from its source.
+
+    Raises:
+        KeyError: If there is no such section
+    """
+    source = SECTIONS[name]
+    if _is_json(source):
+        with open(CONTENT_DIR / source, "r", encoding="utf-8") as f:
+            return json.load(f)
+    path, _, attribute = source.partition(":")
+    module = "aidlc_explainer.content." + path.removesuffix(".py").replace("/", ".")
+    return getattr(importlib.import_module(module), attribute)
+
+
+def build_snapshot(path: Path = SNAPSHOT_PATH) -> dict[str, int]:
+    """Compile every section from source into a snapshot file, atomically.
+
+    Returns:
+        The size in bytes of each compiled section
+
+    Raises:
+        OSError: If a source cannot be read or the snapshot cannot be written
+    """
+    payloads = {
+        name: pickle.dumps(load_from_source(name), protocol=pickle.HIGHEST_PROTOCOL)
+        for name in SECTIONS
+    }
+    table, offset = {}, 0
+    for name, payload in payloads.items():
+        table[name] = (offset, len(payload))
+        offset += len(payload)
+    packed_table = marshal.dumps(table)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".content-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, SNAPSHOT_FORMAT, source_digest(), len(packed_table)))
+            f.write(packed_table)
+            for payload in payloads.values():
+                f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return {name: len(payload) for name, payload in payloads.items()}
+
+
+class _Snapshot:
+    """An open snapshot file: its section table over a memory map."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.digest, table_size = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != SNAPSHOT_FORMAT:
+            raise ValueError(f"Not a format {SNAPSHOT_FORMAT} content snapshot: {path}")
+        start = _HEADER.size
+        self._table = marshal.loads(self._map[start:start + table_size])
+        self._base = start + table_size
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._table
+
+    def section(self, name: str) -> Any:
+        offset, length = self._table[name]
+        start = self._base + offset
+        return pickle.loads(self._map[start:start + length])
+
+
+class ContentStore:
+    """Content sections, from the snapshot when it is current.
+
+    Sections built from Python modules are loaded once and shared. JSON
+    sections are decoded afresh for every caller, as reading the file
+    would, so a screen can change what it is given. Sections given to
+    `override` (the packs reloaded by ``--dev-content``) are shared too.
+    """
+
+    def __init__(self, snapshot_path: Path | None = SNAPSHOT_PATH):
+        """Create a store.
+
+        Args:
+            snapshot_path: Snapshot to load sections from (None: always
+                load from source)
+        """
+        self.snapshot_path = snapshot_path
+        self.sources: dict[str, str] = {}  # Section -> "snapshot" or "source"
+        self._snapshot: _Snapshot | None = None
+        self._opened = False
+        self._shared: dict[str, Any] = {}
+        self._overrides: dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def snapshot(self) -> _Snapshot | None:
+        """The snapshot, if there is one and it matches the sources."""
+        with self._lock:
+            if not self._opened:
+                self._opened = True
+                self._snapshot = self._open()
+            return self._snapshot
+
+    def _open(self) -> _Snapshot | None:
+        if self.snapshot_path is None:
+            return None
+        try:
+            snapshot = _Snapshot(self.snapshot_path)
+            if snapshot.digest == source_digest():
+                return snapshot
+        except (OSError, ValueError, struct.error, EOFError):
+            pass
+        return None
+
+    def load(self, name: str) -> Any:
+        """A content section.
+
+        Raises:
+            KeyError: If there is no such section
+        """
+        if name not in SECTIONS:
+            raise KeyError(name)
+        with self._lock:
+            if name in self._overrides:
+                return self._overrides[name]
+            if name in self._shared:
+                return self._shared[name]
+            snapshot = self.snapshot
+            if snapshot is not None and name in snapshot:
+                value, self.sources[name] = snapshot.section(name), "snapshot"
+            else:
+                value, self.sources[name] = load_from_source(name), "source"
+            if not _is_json(SECTIONS[name]):
+                self._shared[name] = value
+            return value
+
+    def override(self, name: str, value: Any) -> None:
+        """Serve a section from a value instead of from the snapshot or source.
+
+        Raises:
+            KeyError: If there is no such section
+        """
+        if name not in SECTIONS:
+            raise KeyError(name)
+        with self._lock:
+            self._overrides[name] = value
+
+
+def _default_path() -> Path | None:
+    setting = os.environ.get(SNAPSHOT_ENV)
+    if setting is None:
+        return SNAPSHOT_PATH
+    return None if setting.lower() in ("", "0", "off") else Path(setting)
+
+
+STORE = ContentStore(_default_path())
+
+
+def load(name: str) -> Any:
+    """A content section from the shared store, in the active locale."""
+    return localize(name, STORE.load(name))
@@ -0,0 +1,300 @@
+"""Hot reload of the JSON content packs for content authors.
+
+With ``--dev-content`` the app polls the practice and simulator packs and
+reloads the ones that change, so an edit shows up without a restart.
+
+Each pack is a JSON object with one large array of items (quiz questions,
+gate scenarios, stages). `PackDocument` remembers where every item of that
+array starts and ends in the text, so an edit is re-parsed from the item
+before it to the first item after it whose text is untouched; the items
+after that are reused as they are, at their shifted offsets. An edit
+outside the array (the title, metadata) re-parses the whole pack.
+
+Parsed values are never changed in place: an update builds a new top-level
+object and item list around the reused items, so a screen still holding
+the old value keeps a consistent copy until it reloads.
+"""
+
+import json
+import os
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aidlc_explainer.content import snapshot
+
+# Section -> key of the array of items edited most
+WATCHED = {
+    "quiz": "questions",
+    "gates": "scenarios",
+    "stages": "stages",
+    "questions": "questions",
+}
+POLL_INTERVAL = 0.5  # Seconds between checks for changed packs
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_CHUNK = 4096  # Characters compared at a time when diffing texts
+
+
+@dataclass(frozen=True)
+class PackChange:
+    """What changed in a pack: items ``start:start + removed`` became
+    ``start:start + added`` of the new item list."""
+    section: str
+    start: int = 0
+    removed: int = 0
+    added: int = 0
+    full: bool = False  # The whole pack was re-parsed
+    error: str | None = None  # The new text is not valid; the old value stands
+
+
+def _skip(text: str, position: int) -> int:
+    return _WHITESPACE.match(text, position).end()
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the longest common prefix of two strings."""
+    limit = min(len(a), len(b))
+    position = 0
+    while position < limit and a[position:position + _CHUNK] == b[position:position + _CHUNK]:
+        position += _CHUNK
+    end = min(position + _CHUNK, limit)
+    while position < end and a[position] == b[position]:
+        position += 1
+    return min(position, limit)
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the longest common suffix of two strings, at most ``limit``."""
+    length = 0
+    while length < limit:
+        step = min(_CHUNK, limit - length)
+        if a[len(a) - length - step:len(a) - length] != b[len(b) - length - step:len(b) - length]:
+            break
+        length += step
+    else:
+        return length
+    while length < limit and a[-length - 1] == b[-length - 1]:
+        length += 1
+    return length
+
+
+class PackDocument:
+    """A JSON content pack with the offsets of its items, for incremental updates."""
+
+    def __init__(self, section: str, text: str, items_key: str | None = None):
+        """Parse a pack.
+
+        Args:
+            section: Content section the pack is loaded as
+            text: The pack's JSON text
+            items_key: Key of the array to track (default: from `WATCHED`)
+
+        Raises:
+            ValueError: If the text is not a JSON object with that array
+        """
+        self.section = section
+        self.items_key = items_key or WATCHED[section]
+        self._parse(text)
+
+    @property
+    def items(self) -> list:
+        """The items of the tracked array."""
+        return self.value[self.items_key]
+
+    def _parse(self, text: str) -> None:
+        """Parse the whole text, recording where the tracked array's items are."""
+        value: dict[str, Any] = {}
+        starts: list[int] = []
+        ends: list[int] = []
+        opened = closed = -1
+        position = _skip(text, 0)
+        if text[position:position + 1] != "{":
+            raise ValueError(f"{self.section}: expected a JSON object")
+        position = _skip(text, position + 1)
+        while text[position:position + 1] != "}":
+            if value:
+                if text[position:position + 1] != ",":
+                    raise ValueError(f"{self.section}: expected ',' at offset {position}")
+                position = _skip(text, position + 1)
+            key, position = _DECODER.raw_decode(text, position)
+            position = _skip(text, position)
+            if not isinstance(key, str) or text[position:position + 1] != ":":
+                raise ValueError(f"{self.section}: expected a key at offset {position}")
+            position = _skip(text, position + 1)
+            if key == self.items_key and text[position:position + 1] == "[":
+                opened = position + 1
+                items, closed, _ = self._parse_items(text, opened, starts, ends)
+                value[key] = items
+                position = closed + 1
+            else:
+                value[key], position = _DECODER.raw_decode(text, position)
+            position = _skip(text, position)
+        if opened < 0:
+            raise ValueError(f"{self.section}: no '{self.items_key}' array")
+        if _skip(text, position + 1) != len(text):
+            raise ValueError(f"{self.section}: extra data after the JSON object")
+        self.text, self.value = text, value
+        self._starts, self._ends = starts, ends
+        self._open, self._close = opened, closed
+
+    def _parse_items(
+        self,
+        text: str,
+        position: int,
+        starts: list[int],
+        ends: list[int],
+        first: bool = True,
+        after: int | None = None,
+        shift: int = 0,
+    ) -> tuple[list, int, int | None]:
+        """Parse array items from ``position`` up to the closing bracket.
+
+        Args:
+            first: Whether ``position`` is just inside the opening bracket
+                rather than just after an item
+            after: If given, stop at the first item from this offset on
+                that starts where an old item did, ``shift`` characters on
+            shift: How far the old items after the edit have moved
+
+        Returns:
+            The items parsed, the offset parsing stopped at (the closing
+            bracket, or the old item's start) and the index of the old item
+            it stopped at, if it did
+        """
+        items = []
+        position = _skip(text, position)
+        while text[position:position + 1] != "]":
+            if not first:
+                if text[position:position + 1] != ",":
+                    raise ValueError(f"{self.section}: expected ',' at offset {position}")
+                position = _skip(text, position + 1)
+            first = False
+            if after is not None and position >= after:
+                old = bisect_left(self._starts, position - shift)
+                if old < len(self._starts) and self._starts[old] == position - shift:
+                    return items, position, old
+            starts.append(position)
+            item, position = _DECODER.raw_decode(text, position)
+            ends.append(position)
+            items.append(item)
+            position = _skip(text, position)
+        return items, position, None
+
+    def update(self, text: str) -> PackChange:
+        """Move to a new version of the pack, re-parsing as little as possible.
+
+        Raises:
+            ValueError: If the new text is not valid; the document is unchanged
+        """
+        old = self.text
+        prefix = _common_prefix(old, text)
+        suffix = _common_suffix(old, text, min(len(old), len(text)) - prefix)
+        old_end, new_end = len(old) - suffix, len(text) - suffix
+        if prefix == len(old) == len(text):
+            return PackChange(self.section)
+        if prefix < self._open or old_end > self._close:
+            return self._reparse(text)
+
+        delta = len(text) - len(old)
+        first = bisect_left(self._ends, prefix)  # First item the edit may touch
+        resume = self._ends[first - 1] if first else self._open
+        # Items starting after the edit are untouched: stop at the first one
+        starts: list[int] = []
+        ends: list[int] = []
+        try:
+            items, stop, reused = self._parse_items(
+                text, resume, starts, ends, first == 0, new_end, delta
+            )
+        except ValueError:
+            return self._reparse(text)
+        if reused is not None:
+            close = self._close + delta
+        elif stop >= new_end and stop == self._close + delta:
+            reused = len(self._starts)
+            close = stop
+        else:  # The edit closed the array early, or moved its end
+            return self._reparse(text)
+
+        old_items = self.items
+        self.value = {**self.value, self.items_key: old_items[:first] + items + old_items[reused:]}
+        self._starts = self._starts[:first] + starts + [s + delta for s in self._starts[reused:]]
+        self._ends = self._ends[:first] + ends + [e + delta for e in self._ends[reused:]]
+        self._close = close
+        self.text = text
+        return PackChange(self.section, first, reused - first, len(items))
+
+    def _reparse(self, text: str) -> PackChange:
+        removed = len(self._starts)
+        self._parse(text)
+        return PackChange(self.section, 0, removed, len(self._starts), full=True)
+
+
+class ContentWatcher:
+    """Reloads changed content packs into a content store."""
+
+    def __init__(
+        self,
+        store: snapshot.ContentStore | None = None,
+        sections: dict[str, str] | None = None,
+        content_dir: Path = snapshot.CONTENT_DIR,
+    ):
+        """Load every watched pack from source into the store.
+
+        Args:
+            store: Store whose sections are replaced (default: the shared store)
+            sections: Section -> key of its item array (default: `WATCHED`)
+            content_dir: Directory the pack paths are relative to
+
+        Raises:
+            OSError: If a pack cannot be read
+            ValueError: If a pack is not valid
+        """
+        self.store = store or snapshot.STORE
+        self.content_dir = content_dir
+        self.documents: dict[str, PackDocument] = {}
+        self._stats: dict[str, tuple[int, int]] = {}
+        for section, items_key in (sections or WATCHED).items():
+            path = self._path(section)
+            self._stats[section] = self._stat(path)
+            document = PackDocument(section, path.read_text(encoding="utf-8"), items_key)
+            self.documents[section] = document
+            self.store.override(section, document.value)
+
+    def _path(self, section: str) -> Path:
+        return self.content_dir / snapshot.SECTIONS[section]
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return (0, -1)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def poll(self) -> list[PackChange]:
+        """Reload the packs changed since the last poll.
+
+        Returns:
+            What changed in each pack that was rewritten, including packs
+            whose new text is not valid (they keep their last valid value)
+        """
+        changes = []
+        for section, document in self.documents.items():
+            path = self._path(section)
+            stat = self._stat(path)
+            if stat == self._stats[section]:
+                continue
+            self._stats[section] = stat
+            try:
+                change = document.update(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                changes.append(PackChange(section, error=str(e)))
+                continue
+            if change.full or change.removed or change.added:
+                self.store.override(section, document.value)
+                changes.append(change)
+        return changes
@@ -0,0 +1,246 @@
+"""Append-only log of learning events.
+
+Each event is a fixed 16-byte record: a UTC timestamp, an event kind, the
+code of the name it concerns (XP action, lesson, question or scenario) and
+an integer value (XP gained, section index, or 1/0 for a right or wrong
+answer). Names are interned in a sidecar ``.names`` file, one per line, so
+that the record stays fixed-size and the log can be read as columns by
+`aidlc_explainer.analysis.activity`.
+
+Every ``SNAPSHOT_INTERVAL`` records the folded `Replay` of the log is
+written to a ``.snap`` file, so rebuilding it only replays the records
+appended since.
+
+Files for learner ``ada`` live in ``.aidlc-explainer/events/``:
+
+    ada.log     records
+    ada.names   interned names
+    ada.snap    latest replay snapshot (JSON)
+"""
+
+import json
+import os
+import struct
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+
+from aidlc_explainer.storage import file_lock, learner_file_stem
+
+EVENTS_DIR = "events"
+SNAPSHOT_SCHEMA = "events-snapshot-v1"
+SNAPSHOT_INTERVAL = 512
+
+# Event kinds
+XP = 1
+LESSON_SECTION = 2
+QUIZ_ANSWER = 3
+GATE_DECISION = 4
+SESSION_START = 5
+SESSION_END = 6  # Value: session length in seconds
+
+KIND_NAMES = {
+    XP: "xp",
+    LESSON_SECTION: "lesson_section",
+    QUIZ_ANSWER: "quiz_answer",
+    GATE_DECISION: "gate_decision",
+    SESSION_START: "session_start",
+    SESSION_END: "session_end",
+}
+
+# timestamp (float64), kind (uint8), pad, name code (uint16), value (int32)
+RECORD = struct.Struct("<dBxHi")
+
+
+@dataclass
+class Replay:
+    """State folded from the event log."""
+    records: int = 0
+    xp: int = 0
+    xp_by_action: dict[str, int] = field(default_factory=dict)
+    daily_xp: dict[str, int] = field(default_factory=dict)  # Local ISO date -> XP
+    lesson_sections: dict[str, int] = field(default_factory=dict)  # Furthest section
+    quiz_answers: int = 0
+    quiz_correct: int = 0
+    gate_decisions: int = 0
+    gate_correct: int = 0
+    sessions: int = 0
+    session_seconds: int = 0
+    first_event: float | None = None
+    last_event: float | None = None
+
+    def apply(self, timestamp: float, kind: int, name: str, value: int) -> None:
+        """Fold one event into the replay."""
+        self.records += 1
+        if self.first_event is None:
+            self.first_event = timestamp
+        self.last_event = timestamp
+        if kind == XP:
+            self.xp += value
+            self.xp_by_action[name] = self.xp_by_action.get(name, 0) + value
+            day = date.fromtimestamp(timestamp).isoformat()
+            self.daily_xp[day] = self.daily_xp.get(day, 0) + value
+        elif kind == LESSON_SECTION:
+            self.lesson_sections[name] = max(self.lesson_sections.get(name, 0), value)
+        elif kind == QUIZ_ANSWER:
+            self.quiz_answers += 1
+            self.quiz_correct += value
+        elif kind == GATE_DECISION:
+            self.gate_decisions += 1
+            self.gate_correct += value
+        elif kind == SESSION_START:
+            self.sessions += 1
+        elif kind == SESSION_END:
+            self.session_seconds += value
+
+
+class EventLog:
+    """One learner's event log."""
+
+    def __init__(self, directory: Path, learner_id: str) -> None:
+        """Initialize the log; files are created on the first append.
+
+        Args:
+            directory: Directory holding the logs (``.aidlc-explainer/events``)
+            learner_id: Learner whose events to record
+        """
+        stem = learner_file_stem(learner_id)
+        self.directory = directory
+        self.log_path = directory / f"{stem}.log"
+        self.names_path = directory / f"{stem}.names"
+        self.snapshot_path = directory / f"{stem}.snap"
+        self.lock_path = directory / f"{stem}.lock"
+        self._codes: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def __len__(self) -> int:
+        """Number of complete records in the log."""
+        try:
+            return self.log_path.stat().st_size // RECORD.size
+        except OSError:
+            return 0
+
+    # Names
+
+    def _read_names(self) -> None:
+        """Load names interned since the last read."""
+        try:
+            with open(self.names_path, "r", encoding="utf-8") as f:
+                names = f.read().split("\n")[:-1]  # Ignore an unterminated last line
+        except OSError:
+            return
+        for name in names[len(self._names):]:
+            self._codes[name] = len(self._names)
+            self._names.append(name)
+
+    def _intern(self, name: str) -> int:
+        """Code for a name, adding it to the names file if new."""
+        name = name.replace("\n", " ")
+        code = self._codes.get(name)
+        if code is not None:
+            return code
+        with file_lock(self.lock_path):
+            self._read_names()  # Another process may have added it
+            code = self._codes.get(name)
+            if code is None:
+                if len(self._names) > 0xFFFF:
+                    raise OverflowError("Too many distinct event names")
+                with open(self.names_path, "a", encoding="utf-8") as f:
+                    f.write(name + "\n")
+                code = self._codes[name] = len(self._names)
+                self._names.append(name)
+        return code
+
+    def names(self) -> list[str]:
+        """All interned names, indexed by code."""
+        self._read_names()
+        return list(self._names)
+
+    # Writing
+
+    def append(self, kind: int, name: str = "", value: int = 0, timestamp: float | None = None) -> None:
+        """Append an event.
+
+        Args:
+            kind: Event kind (`XP`, `LESSON_SECTION`, ...)
+            name: What the event concerns (XP action, lesson ID, question ID)
+            value: XP gained, section index, or 1/0 for a right or wrong answer
+            timestamp: Unix time (defaults to now)
+
+        Raises:
+            OSError: If the log cannot be written
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record = RECORD.pack(
+            time.time() if timestamp is None else timestamp, kind, self._intern(name), value
+        )
+        # One write to an O_APPEND descriptor: concurrent appends never interleave
+        fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, record)
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+        if size % RECORD.size == 0 and (size // RECORD.size) % SNAPSHOT_INTERVAL == 0:
+            self.write_snapshot()
+
+    # Reading
+
+    def read(self, start: int = 0) -> list[tuple[float, int, int, int]]:
+        """Raw records ``(timestamp, kind, code, value)`` from record `start` on.
+
+        A partially written final record is ignored.
+        """
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(start * RECORD.size)
+                data = f.read()
+        except OSError:
+            return []
+        end = len(data) - len(data) % RECORD.size
+        return list(RECORD.iter_unpack(data[:end]))
+
+    def _load_snapshot(self) -> Replay:
+        """The latest snapshot, or an empty replay if there is none usable."""
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("$schema") == SNAPSHOT_SCHEMA:
+                replay = Replay(**data["replay"])
+                if replay.records <= len(self):
+                    return replay
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+        return Replay()
+
+    def replay(self) -> Replay:
+        """Fold the log, starting from the latest snapshot."""
+        replay = self._load_snapshot()
+        records = self.read(replay.records)
+        if records:
+            names = self.names()
+            for timestamp, kind, code, value in records:
+                name = names[code] if code < len(names) else ""
+                replay.apply(timestamp, kind, name, value)
+        return replay
+
+    def write_snapshot(self) -> Replay:
+        """Write the current replay to the snapshot file atomically."""
+        replay = self.replay()
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".snap-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"$schema": SNAPSHOT_SCHEMA, "replay": asdict(replay)}, f)
+            os.replace(tmp, self.snapshot_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return replay
+
+
+def open_event_log(state_dir: Path, learner_id: str) -> EventLog:
+    """The event log for a learner under a state directory."""
+    return EventLog(state_dir / EVENTS_DIR, learner_id)
+
@@ -0,0 +1,119 @@
+"""Width-aware layout for text the screens draw themselves.
+
+Panels, boxes and rules built as plain text are sized to the widget that
+shows them rather than to fixed column counts, so wide terminals show
+whole lines and narrow ones wrap instead of folding mid-word. Widths are
+measured in terminal cells, so emoji and other wide characters line up.
+
+`wrap` and `truncate` are memoized per ``(text, width)``; a string caches
+its own hash, so a repeated layout costs one dictionary lookup. The app
+calls `invalidate` when the terminal is resized, which keeps the memo to
+the widths currently on screen.
+"""
+
+from functools import lru_cache
+
+from rich.cells import cell_len, chop_cells, set_cell_size
+from textual.widget import Widget
+
+LAYOUT_CACHE_SIZE = 4096
+ELLIPSIS = "…"
+
+
+def content_width(widget: Widget, default: int) -> int:
+    """Width available for text in a widget.
+
+    Args:
+        widget: The widget the text is shown in
+        default: Width to use before the widget has been laid out
+    """
+    return widget.content_size.width or default
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def wrap(text: str, width: int, indent: str = "") -> tuple[str, ...]:
+    """Word-wrap text to a width, keeping its line breaks.
+
+    Args:
+        text: Text to wrap
+        width: Maximum line width in cells, including the indent
+        indent: Prefix for every line
+
+    Returns:
+        The wrapped lines
+    """
+    available = max(1, width - cell_len(indent))
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            if not line:
+                candidate = word
+            else:
+                candidate = f"{line} {word}"
+            if cell_len(candidate) <= available:
+                line = candidate
+                continue
+            if line:
+                lines.append(indent + line)
+            # Words longer than a whole line are split across lines
+            *full, line = chop_cells(word, available) if cell_len(word) > available else [word]
+            lines.extend(indent + part for part in full)
+        lines.append(indent + line)
+    return tuple(lines)
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def truncate(text: str, width: int) -> str:
+    """Shorten a single line to a width, ending it with an ellipsis if cut."""
+    if cell_len(text) <= width:
+        return text
+    if width < 1:
+        return ""
+    return set_cell_size(text, width - 1).rstrip() + ELLIPSIS
+
+
+def rule(width: int, title: str = "") -> str:
+    """A horizontal rule across the width, with an optional title."""
+    if not title:
+        return "─" * width
+    head = truncate(f"── {title} ", width)
+    return head + "─" * (width - cell_len(head))
+
+
+def box(
+    lines: list[str],
+    width: int,
+    title: str = "",
+    center: bool = False,
+    wrap_lines: bool = True,
+) -> list[str]:
+    """Draw lines inside a rounded box that spans the width.
+
+    Args:
+        lines: Text for the inside of the box
+        width: Total width of the box in cells, borders included
+        title: Text set into the top border
+        center: If True, center each line
+        wrap_lines: If True, long lines wrap; otherwise they are truncated
+
+    Returns:
+        The box, one string per row
+    """
+    inner = max(1, width - 4)
+    top = rule(width - 2, title) if title else "─" * (width - 2)
+    rows = [f"╭{top}╮"]
+    for line in lines:
+        for part in wrap(line, inner) if wrap_lines and line.strip() else (truncate(line, inner),):
+            if center:
+                padding = inner - cell_len(part)
+                part = " " * (padding // 2) + part
+            rows.append(f"│ {set_cell_size(part, inner)} │")
+    rows.append(f"╰{'─' * (width - 2)}╯")
+    return rows
+
+
+def invalidate() -> None:
+    """Forget memoized layouts (after the terminal is resized)."""
+    wrap.cache_clear()
+    truncate.cache_clear()
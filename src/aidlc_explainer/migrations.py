@@ -0,0 +1,320 @@
+"""Versioned migrations of stored learner state.
+
+Every state document names its schema version in ``$schema``
+(``state-v1``, ``state-v2``, ...). `MIGRATIONS` holds one function per
+version step, upgrading a document of that version to the next:
+
+    @migration(1)
+    def _v1_to_v2(state):
+        state["quiz"]["history"] = []
+        return state
+
+`StateManager` runs the chain on every document it loads, so a schema
+change upgrades each learner's progress the next time they open the app.
+A document from a newer version of the app, or one a migration fails on,
+is left exactly as stored.
+
+`migrate_tree` upgrades a whole directory of collected state files ahead
+of time: chunks of files are migrated in worker processes, and each file
+that changes is replaced atomically, so an interrupted run leaves every
+file either as it was or fully migrated. With ``dry_run`` nothing is
+written and the report summarizes what would change.
+"""
+
+import json
+import os
+import stat
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+from aidlc_explainer.persistent import thaw
+from aidlc_explainer.storage import file_lock
+
+STATE_VERSION = 1  # The version this app reads and writes
+SCHEMA_PREFIX = "state-v"
+STATE_SCHEMA = f"{SCHEMA_PREFIX}{STATE_VERSION}"
+CHUNK_SIZE = 500
+
+Migration = Callable[[dict[str, Any]], dict[str, Any]]
+
+# Version -> function upgrading a document of that version to the next
+MIGRATIONS: dict[int, Migration] = {}
+
+# File outcomes
+MIGRATED = "migrated"
+CURRENT = "current"
+NEWER = "newer"  # Written by a newer version of the app; left alone
+SKIPPED = "skipped"  # Unreadable, or not a state document
+FAILED = "failed"
+
+
+class NewerStateError(ValueError):
+    """A state document is from a newer version of the app than this one."""
+
+
+def migration(version: int) -> Callable[[Migration], Migration]:
+    """Register the function that upgrades ``state-v{version}`` documents."""
+    def register(function: Migration) -> Migration:
+        MIGRATIONS[version] = function
+        return function
+    return register
+
+
+def schema_version(document: Any) -> int | None:
+    """The schema version a state document names, or None if it is not one."""
+    if not isinstance(document, dict):
+        return None
+    schema = document.get("$schema")
+    if not isinstance(schema, str) or not schema.startswith(SCHEMA_PREFIX):
+        return None
+    number = schema[len(SCHEMA_PREFIX):]
+    return int(number) if number.isdigit() and int(number) > 0 else None
+
+
+def migrate(document: dict[str, Any], target: int | None = None) -> dict[str, Any]:
+    """Upgrade a state document to a schema version.
+
+    The document itself is returned if it is already current; otherwise
+    the migrations run on a copy, so the original is never modified.
+
+    Args:
+        document: A stored state document
+        target: Version to upgrade to (default: `STATE_VERSION`)
+
+    Raises:
+        NewerStateError: If the document is newer than ``target``
+        ValueError: If it is not a state document, a migration is missing,
+            or a migration fails
+    """
+    target = target or STATE_VERSION
+    version = schema_version(document)
+    if version is None:
+        raise ValueError("Not a state document")
+    if version > target:
+        raise NewerStateError(f"{SCHEMA_PREFIX}{version} is newer than {SCHEMA_PREFIX}{target}")
+    if version == target:
+        return document
+    state = thaw(document)
+    for step in range(version, target):
+        if step not in MIGRATIONS:
+            raise ValueError(f"No migration from {SCHEMA_PREFIX}{step}")
+        try:
+            state = MIGRATIONS[step](state)
+        except Exception as e:  # A broken migration must not lose the document
+            raise ValueError(f"Migration from {SCHEMA_PREFIX}{step} failed: {e}") from e
+        state["$schema"] = f"{SCHEMA_PREFIX}{step + 1}"
+    return state
+
+
+def diff(old: Any, new: Any, path: str = "") -> list[str]:
+    """Fields that differ between two documents, as ``+``/``-``/``~ dotted.path``.
+
+    Lists and other values are compared whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in old:
+            child = f"{path}.{key}" if path else key
+            if key not in new:
+                changes.append(f"- {child}")
+            elif old[key] != new[key]:
+                changes.extend(diff(old[key], new[key], child))
+        for key in new:
+            if key not in old:
+                changes.append(f"+ {path}.{key}" if path else f"+ {key}")
+        return changes
+    return [] if old == new else [f"~ {path}"]
+
+
+@dataclass
+class MigrationReport:
+    """Outcome of migrating a set of state files."""
+    files: int = 0
+    migrated: int = 0
+    current: int = 0
+    newer: int = 0
+    skipped: int = 0
+    failed: int = 0
+    changes: dict[str, int] = field(default_factory=dict)  # Change -> files with it
+    errors: list[str] = field(default_factory=list)
+
+    def add(self, path: str, outcome: str, changes: list[str], error: str = "") -> None:
+        """Count one file."""
+        self.files += 1
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        for change in changes:
+            self.changes[change] = self.changes.get(change, 0) + 1
+        if error:
+            self.errors.append(f"{path}: {error}")
+
+    def __iadd__(self, other: "MigrationReport") -> "MigrationReport":
+        for f in fields(self):
+            mine, theirs = getattr(self, f.name), getattr(other, f.name)
+            if isinstance(mine, dict):
+                for key, count in theirs.items():
+                    mine[key] = mine.get(key, 0) + count
+            else:
+                setattr(self, f.name, mine + theirs)
+        return self
+
+
+def _write(path: str, document: dict[str, Any], mode: int) -> None:
+    """Replace a file with a document in one rename."""
+    directory = os.path.dirname(path) or "."
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".state-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def migrate_file(path: str, dry_run: bool = False) -> tuple[str, list[str], str]:
+    """Migrate one state file in place.
+
+    The file is only replaced if migrating changed it, and not if it was
+    modified while being migrated. An app saving to it holds the lock
+    next to it, which is taken while the file is read and replaced.
+
+    Returns:
+        The outcome, the changes made (or that would be made) and an error
+        message for failed files
+    """
+    lock_path = Path(path + ".lock")
+    with file_lock(lock_path) if lock_path.exists() else nullcontext():
+        try:
+            before = os.stat(path)
+            with open(path, "rb") as f:
+                document = json.loads(f.read())
+        except (OSError, ValueError):
+            return SKIPPED, [], ""
+        if schema_version(document) is None:
+            return SKIPPED, [], ""
+        try:
+            migrated = migrate(document)
+        except NewerStateError:
+            return NEWER, [], ""
+        except ValueError as e:
+            return FAILED, [], str(e)
+        if migrated is document:
+            return CURRENT, [], ""
+        changes = diff(document, migrated)
+        if dry_run:
+            return MIGRATED, changes, ""
+        try:
+            after = os.stat(path)
+            if (after.st_mtime_ns, after.st_size) != (before.st_mtime_ns, before.st_size):
+                return FAILED, [], "changed while being migrated; run again"
+            _write(path, migrated, stat.S_IMODE(before.st_mode))
+        except (OSError, TypeError, ValueError) as e:
+            return FAILED, [], str(e)
+    return MIGRATED, changes, ""
+
+
+def migrate_files(paths: list[str], dry_run: bool = False) -> MigrationReport:
+    """Migrate a chunk of state files (runs in a worker)."""
+    report = MigrationReport()
+    for path in paths:
+        outcome, changes, error = migrate_file(path, dry_run)
+        report.add(path, outcome, changes, error)
+    return report
+
+
+def iter_state_files(root: Path) -> Iterator[str]:
+    """Paths of the .json files under a directory, in no particular order."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and not entry.name.startswith("."):
+                    yield entry.path
+
+
+def _chunks(paths: Iterator[str], size: int) -> Iterator[list[str]]:
+    chunk = []
+    for path in paths:
+        chunk.append(path)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def migrate_tree(
+    root: Path,
+    dry_run: bool = False,
+    processes: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[MigrationReport, float]:
+    """Migrate every state file under a directory.
+
+    Directory listing and migration overlap: at most two chunks per worker
+    are in flight at any time. With one process, files are migrated in
+    this process.
+
+    Args:
+        root: Directory of state files (searched recursively)
+        dry_run: If True, report what would change without writing
+        processes: Worker processes (default: CPU count)
+        chunk_size: Files per worker task
+
+    Returns:
+        The report and the elapsed seconds
+    """
+    start = time.perf_counter()
+    processes = processes or os.cpu_count() or 1
+    total = MigrationReport()
+    if processes == 1:
+        for chunk in _chunks(iter_state_files(root), chunk_size):
+            total += migrate_files(chunk, dry_run)
+        return total, time.perf_counter() - start
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending: set[Future] = set()
+        for chunk in _chunks(iter_state_files(root), chunk_size):
+            if len(pending) >= 2 * processes:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    total += future.result()
+            pending.add(pool.submit(migrate_files, chunk, dry_run))
+        for future in pending:
+            total += future.result()
+    return total, time.perf_counter() - start
+
+
+def format_report(
+    report: MigrationReport, elapsed: float, dry_run: bool = False, max_errors: int = 20
+) -> str:
+    """Summarize a migration run for the terminal."""
+    verb = "would be migrated" if dry_run else "migrated"
+    lines = [
+        f"{'🔍 Dry run: ' if dry_run else ''}{report.migrated:,} of {report.files:,} files "
+        f"{verb} to {STATE_SCHEMA} in {elapsed:.2f}s "
+        f"({report.current:,} current, {report.newer:,} newer, {report.skipped:,} not state "
+        f"files, {report.failed:,} failed)"
+    ]
+    if report.changes:
+        lines.append("")
+        lines.append("Changes:")
+        width = max(len(change) for change in report.changes)
+        for change, count in sorted(report.changes.items(), key=lambda c: (-c[1], c[0])):
+            lines.append(f"  {change:<{width}}  {count:,} files")
+    if report.errors:
+        lines.append("")
+        lines.extend(f"❌ {error}" for error in report.errors[:max_errors])
+        if len(report.errors) > max_errors:
+            lines.append(f"   ... and {len(report.errors) - max_errors:,} more")
+    return "\n".join(lines)
@@ -1,6 +1,29 @@
 """Navigation system for tracking screen history and breadcrumbs."""
 
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from pathlib import Path
+
+from aidlc_explainer.storage import learner_file_stem
+
+SCREEN_CACHE_SIZE = 8
+NAVIGATION_SCHEMA = "navigation-v1"
+NAVIGATION_DIR = "navigation"
+
+
+def screen_key(screen_id: str, context: dict | None = None) -> str:
+    """Identify a screen by its ID and context.
+    
+    Two navigations with the same key show the same content, so they can
+    share one screen instance.
+    """
+    if not context:
+        return screen_id
+    return f"{screen_id}:{json.dumps(context, sort_keys=True, default=str)}"
 
 
 @dataclass
@@ -10,6 +33,13 @@ class NavItem:
     screen_id: str
     title: str
     context: dict = field(default_factory=dict)
+    view: dict = field(default_factory=dict, compare=False)  # Saved scroll position etc.
+    screen: object | None = field(default=None, repr=False, compare=False)  # Shown instance
+    
+    @property
+    def key(self) -> str:
+        """The `screen_key` of this item."""
+        return screen_key(self.screen_id, self.context)
 
 
 class NavigationStack:
@@ -19,19 +49,28 @@ class NavigationStack:
         """Initialize with empty navigation stack."""
         self._stack: list[NavItem] = []
     
-    def push(self, screen_id: str, title: str, context: dict | None = None) -> None:
+    def push(
+        self, screen_id: str, title: str, context: dict | None = None, screen: object | None = None
+    ) -> NavItem:
         """Push a new screen onto the navigation stack.
         
         Args:
             screen_id: Unique identifier for the screen
             title: Display title for breadcrumb
             context: Optional context data for the screen
+            screen: The screen instance shown for this item
+        
+        Returns:
+            The pushed item
         """
-        self._stack.append(NavItem(
+        item = NavItem(
             screen_id=screen_id,
             title=title,
             context=context or {},
-        ))
+            screen=screen,
+        )
+        self._stack.append(item)
+        return item
     
     def pop(self) -> NavItem | None:
         """Pop and return the top screen from the stack.
@@ -43,6 +82,24 @@ class NavigationStack:
             return self._stack.pop()
         return None
     
+    def index(self, key: str) -> int | None:
+        """Position of the item with a `screen_key`, or None if not in the stack."""
+        for i, item in enumerate(self._stack):
+            if item.key == key:
+                return i
+        return None
+    
+    def truncate(self, length: int) -> list[NavItem]:
+        """Pop items until at most `length` remain (never fewer than one).
+        
+        Returns:
+            The popped items, top first
+        """
+        popped = []
+        while len(self._stack) > max(length, 1):
+            popped.append(self._stack.pop())
+        return popped
+    
     def current(self) -> NavItem | None:
         """Get the current (top) screen without removing it.
         
@@ -74,6 +131,135 @@ class NavigationStack:
         """Clear the navigation stack."""
         self._stack.clear()
     
+    def to_document(self) -> dict:
+        """The stack as a compact JSON document.
+        
+        Each item is a ``[screen_id, title, context, view]`` list, with
+        trailing empty dicts left out.
+        """
+        items = []
+        for item in self._stack:
+            fields = [item.screen_id, item.title, item.context, item.view]
+            while len(fields) > 2 and not fields[-1]:
+                fields.pop()
+            items.append(fields)
+        return {"$schema": NAVIGATION_SCHEMA, "items": items}
+    
+    @classmethod
+    def from_document(cls, document: dict) -> "NavigationStack":
+        """Rebuild a stack saved with `to_document`.
+        
+        Raises:
+            ValueError: If the document is not a saved navigation stack
+        """
+        if not isinstance(document, dict) or document.get("$schema") != NAVIGATION_SCHEMA:
+            raise ValueError("Not a navigation document")
+        nav = cls()
+        for fields in document.get("items", []):
+            if not isinstance(fields, list) or not 2 <= len(fields) <= 4:
+                raise ValueError(f"Invalid navigation item: {fields!r}")
+            screen_id, title, context, view = [*fields, {}, {}][:4]
+            if not (isinstance(screen_id, str) and isinstance(context, dict) and isinstance(view, dict)):
+                raise ValueError(f"Invalid navigation item: {fields!r}")
+            nav._stack.append(NavItem(screen_id, str(title), context, view))
+        return nav
+    
+    def __iter__(self) -> Iterator[NavItem]:
+        """Iterate over the items from root to current."""
+        return iter(self._stack)
+    
     def __len__(self) -> int:
         """Return the number of items in the stack."""
         return len(self._stack)
+
+
+def navigation_path(state_dir: Path, learner_id: str) -> Path:
+    """Where a learner's navigation stack is saved between sessions."""
+    return state_dir / NAVIGATION_DIR / f"{learner_file_stem(learner_id)}.json"
+
+
+def save_navigation(path: Path, nav: NavigationStack) -> None:
+    """Write a navigation stack to a file atomically.
+    
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".navigation-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(nav.to_document(), f, separators=(",", ":"), default=str)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_navigation(path: Path) -> NavigationStack | None:
+    """Read a navigation stack saved with `save_navigation`.
+    
+    Returns:
+        The stack, or None if the file is missing or unusable
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            nav = NavigationStack.from_document(json.load(f))
+    except (OSError, ValueError):  # Includes json.JSONDecodeError
+        return None
+    return nav if len(nav) else None
+
+
+class ScreenCache:
+    """Least-recently-used cache of screen instances keyed by `screen_key`."""
+    
+    def __init__(self, max_size: int = SCREEN_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+        
+        Args:
+            max_size: Screens kept beyond those currently in use; 0 disables reuse
+        """
+        self.max_size = max_size
+        self._screens: OrderedDict[str, object] = OrderedDict()
+    
+    def get(self, key: str) -> object | None:
+        """Return the cached screen for a key and mark it recently used."""
+        screen = self._screens.get(key)
+        if screen is not None:
+            self._screens.move_to_end(key)
+        return screen
+    
+    def put(self, key: str, screen: object) -> None:
+        """Cache a screen as the most recently used."""
+        self._screens[key] = screen
+        self._screens.move_to_end(key)
+    
+    def pop(self, key: str) -> object | None:
+        """Remove and return the cached screen for a key, if there is one."""
+        return self._screens.pop(key, None)
+    
+    def items(self) -> list[tuple[str, object]]:
+        """Cached keys and screens, least recently used first."""
+        return list(self._screens.items())
+    
+    def evict(self, in_use: Callable[[object], bool]) -> list[object]:
+        """Drop least recently used screens until the cache fits.
+        
+        Args:
+            in_use: Whether a screen must be kept; those are never evicted
+        
+        Returns:
+            The evicted screens
+        """
+        evicted = []
+        for key in list(self._screens):
+            if len(self._screens) <= self.max_size:
+                break
+            if not in_use(self._screens[key]):
+                evicted.append(self._screens.pop(key))
+        return evicted
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._screens
+    
+    def __len__(self) -> int:
+        return len(self._screens)
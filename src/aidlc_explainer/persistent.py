@@ -0,0 +1,152 @@
+"""Immutable JSON documents that share structure between versions.
+
+A frozen document is built from `FrozenDict`s and `FrozenList`s. Nothing
+changes one in place: `assoc` returns a new version that copies only the
+dicts on the path to the change and shares every other branch with the
+old version. So:
+
+- keeping a version around (a snapshot) costs nothing,
+- `diff` compares two versions in time proportional to what changed,
+  skipping shared branches by identity, and
+- a document is unchanged exactly when it is the same object.
+
+Both classes subclass the built-in types, so frozen documents serialize
+with `json`, read like plain dicts and lists, and compare equal to the
+plain documents they were frozen from. Only the methods that would change
+them in place raise TypeError. `thaw` (or `copy.deepcopy`) gives back a
+plain, mutable copy.
+"""
+
+from typing import Any, NoReturn
+
+_MISSING = object()
+
+
+def _immutable(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} cannot be changed in place; use assoc")
+
+
+class FrozenDict(dict):
+    """A dict that cannot be changed in place."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return thaw(self)
+
+    def __reduce__(self) -> tuple:
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(tuple):
+    """A tuple that also compares equal to a list with the same items."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            return tuple.__eq__(self, tuple(other))
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = tuple.__hash__
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """A frozen version of a JSON-compatible value.
+
+    Frozen documents are returned as they are, so freezing a document
+    whose branches are already frozen only copies its top level.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """A plain, mutable deep copy of a (possibly frozen) document."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def get_in(document: Any, path: tuple[str, ...], default: Any = None) -> Any:
+    """The value at a path of keys, or `default` if any part is missing."""
+    value = document
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return value
+
+
+def assoc(document: FrozenDict, path: tuple[str, ...], value: Any) -> FrozenDict:
+    """A new version of a document with the value at a path replaced.
+
+    Missing dicts along the path are created. The new version shares
+    everything off the path with the old one; if the value is already
+    there, the old version itself is returned.
+    """
+    key, rest = path[0], path[1:]
+    if rest:
+        child = document.get(key)
+        value = assoc(child if isinstance(child, FrozenDict) else FrozenDict(), rest, value)
+    else:
+        value = freeze(value)
+    if document.get(key, _MISSING) is value:
+        return document
+    return FrozenDict({**document, key: value})
+
+
+def dissoc(document: FrozenDict, path: tuple[str, ...]) -> FrozenDict:
+    """A new version of a document without the key at a path."""
+    key, rest = path[0], path[1:]
+    if key not in document:
+        return document
+    if rest:
+        child = document[key]
+        if not isinstance(child, FrozenDict):
+            return document
+        return assoc(document, (key,), dissoc(child, rest))
+    return FrozenDict({k: v for k, v in document.items() if k != key})
+
+
+def diff(old: Any, new: Any, path: tuple[str, ...] = ()) -> list[tuple[str, ...]]:
+    """Paths of the values that differ between two versions of a document.
+
+    Branches the versions share are skipped without being looked at, so
+    comparing a version with one derived from it visits only the dicts on
+    the paths to the changes. Lists are compared whole.
+    """
+    if old is new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for key in [*old, *(k for k in new if k not in old)]:
+            before, after = old.get(key, _MISSING), new.get(key, _MISSING)
+            if before is after:
+                continue
+            if isinstance(before, dict) and isinstance(after, dict):
+                changes.extend(diff(before, after, (*path, key)))
+            elif before is _MISSING or after is _MISSING or before != after:
+                changes.append((*path, key))
+        return changes
+    return [] if old == new else [path]
@@ -1,11 +1,55 @@
 """Base screen class for all content screens."""
 
+from textual import events
 from textual.app import ComposeResult
-from textual.containers import Container
+from textual.containers import Container, ScrollableContainer
 from textual.screen import Screen
-from textual.widgets import Footer, Header
+from textual.widgets import Input
 
-from aidlc_explainer.widgets import Breadcrumb
+from aidlc_explainer.content.watch import PackChange
+from aidlc_explainer.widgets import Breadcrumb, ExplorerFooter, ExplorerHeader
+
+
+def saved_progress(view: dict, total: int) -> tuple[int, int, list[str]] | None:
+    """Validated practice progress from a saved view state.
+    
+    Quiz and gatekeeper views save ``{"position", "score", "mistakes"}``:
+    the number of items answered, how many were right and the IDs of those
+    that were not.
+    
+    Args:
+        view: A view state from `ExplorerScreen.get_view_state`
+        total: Number of items in the practice set
+    
+    Returns:
+        (position, score, mistakes), or None if there is no usable progress
+    """
+    position, score, mistakes = view.get("position"), view.get("score"), view.get("mistakes")
+    if not (isinstance(position, int) and isinstance(score, int) and isinstance(mistakes, list)):
+        return None
+    if not 0 < position < total or score + len(mistakes) != position or score < 0:
+        return None
+    return position, score, [str(m) for m in mistakes]
+
+
+def follow_item(old: list[dict], new: list[dict], index: int) -> int:
+    """Where the item at ``index`` of a reloaded list of content items is now.
+    
+    Args:
+        old: Items before the reload
+        new: Items after it (not empty)
+        index: Position in ``old``
+    
+    Returns:
+        The position of the item with the same ID in ``new``, or failing
+        that the same position, kept within the new list
+    """
+    if index < len(old):
+        item_id = old[index].get("id")
+        for position, item in enumerate(new):
+            if item.get("id") == item_id:
+                return position
+    return min(index, len(new) - 1)
 
 
 class ExplorerScreen(Screen):
@@ -34,6 +78,9 @@ class ExplorerScreen(Screen):
         ("question_mark", "show_help", "Help"),
     ]
     
+    # Content sections the screen shows; it is told when they are reloaded
+    CONTENT_SECTIONS: tuple[str, ...] = ()
+    
     def __init__(self, title: str = "Screen", **kwargs) -> None:
         """Initialize the screen.
         
@@ -43,19 +90,92 @@ class ExplorerScreen(Screen):
         """
         super().__init__(**kwargs)
         self._title = title
+        self._restored_scroll: list[int] = []
+        self._reflow_pending = False
     
     def compose(self) -> ComposeResult:
         """Compose the screen layout."""
-        yield Header()
+        yield ExplorerHeader()
         yield Breadcrumb(self._get_breadcrumb())
         with Container(id="content"):
             yield from self.compose_content()
-        yield Footer()
+        yield ExplorerFooter()
+    
+    def on_mount(self) -> None:
+        """Report the first render to telemetry and stop cursor blinking in
+        low-bandwidth mode (it repaints twice a second)."""
+        telemetry = getattr(self.app, "telemetry", None)
+        if telemetry is not None:
+            self.call_after_refresh(telemetry.rendered)
+        if getattr(self.app, "low_bandwidth", False):
+            for field in self.query(Input):
+                field.cursor_blink = False
+        if self._restored_scroll:
+            # Scrolling needs the content laid out, which happens on refresh
+            self.call_after_refresh(self._restore_scroll)
+    
+    def on_screen_resume(self) -> None:
+        """Update the breadcrumb: a reused screen may be reached by a new path."""
+        for breadcrumb in self.query(Breadcrumb):
+            breadcrumb.update_path(self._get_breadcrumb())
+    
+    def on_resize(self, event: events.Resize) -> None:
+        """Lay out text sized to widgets again once they have their new size."""
+        if not self._reflow_pending:  # Resizes often come in pairs
+            self._reflow_pending = True
+            self.call_after_refresh(self._reflow)
+    
+    def _reflow(self) -> None:
+        self._reflow_pending = False
+        self.reflow()
+    
+    def reflow(self) -> None:
+        """Rebuild text laid out for the width of its widgets.
+        
+        Override in screens that size text with `aidlc_explainer.layout`.
+        Also runs after the first layout, when real widths are known.
+        """
+    
+    def content_changed(self, changes: list[PackChange]) -> None:
+        """Show content reloaded by ``--dev-content``.
+        
+        Called on mounted screens whose `CONTENT_SECTIONS` include a
+        changed section. Override to load the section again and redraw,
+        keeping the learner's place where the content allows.
+        """
     
     def compose_content(self) -> ComposeResult:
         """Compose screen-specific content. Override in subclasses."""
         yield from []
     
+    def get_view_state(self) -> dict:
+        """State to bring this screen back to in a later session.
+        
+        The base state is the scroll offset of each scrollable container;
+        subclasses add their own JSON-compatible fields.
+        """
+        offsets = [round(widget.scroll_y) for widget in self.query(ScrollableContainer)]
+        while offsets and not offsets[-1]:
+            offsets.pop()
+        return {"scroll": offsets} if offsets else {}
+    
+    def restore_view_state(self, view: dict) -> None:
+        """Return to a state from `get_view_state`.
+        
+        Called before the screen is mounted. Fields that are missing or no
+        longer valid (the content may have changed) are ignored.
+        """
+        scroll = view.get("scroll")
+        if isinstance(scroll, list):
+            self._restored_scroll = [y if isinstance(y, int) else 0 for y in scroll]
+    
+    def _restore_scroll(self) -> None:
+        containers = list(self.query(ScrollableContainer))
+        if len(containers) != len(self._restored_scroll):
+            return  # Saved for another layout
+        for widget, y in zip(containers, self._restored_scroll, strict=True):
+            widget.scroll_to(y=y, animate=False)
+    
     def _get_breadcrumb(self) -> str:
         """Get breadcrumb string from app navigation stack."""
         try:
@@ -1,7 +1,5 @@
 """Gatekeeper screen for scenario-based approval practice."""
 
-import json
-from pathlib import Path
 from typing import Any
 
 from textual.app import ComposeResult
@@ -9,14 +7,24 @@ from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
 from textual.widgets import Static, Checkbox
 
-from aidlc_explainer.screens.base import ExplorerScreen
+from aidlc_explainer import sources
+from aidlc_explainer.content import packs, snapshot
+from aidlc_explainer.content.watch import PackChange
+from aidlc_explainer.screens.base import ExplorerScreen, follow_item, saved_progress
 
 
-def load_gates() -> dict[str, Any]:
-    """Load gatekeeper scenarios from JSON file."""
-    gates_path = Path(__file__).parent.parent / "content" / "practice" / "gates.json"
-    with open(gates_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def load_gates(gate_id: str | None = None) -> dict[str, Any]:
+    """Load gatekeeper scenarios from the content.
+    
+    Args:
+        gate_id: A content pack's gate scenarios (default: the built-in ones)
+    
+    Raises:
+        ValueError: If no installed pack has the scenarios, or they cannot be loaded
+    """
+    if gate_id is None:
+        return snapshot.load("gates")
+    return packs.REGISTRY.load("gates", gate_id)
 
 
 class GatekeeperScreen(ExplorerScreen):
@@ -86,6 +94,13 @@ class GatekeeperScreen(ExplorerScreen):
         background: $surface;
     }
     
+    GatekeeperScreen .source-excerpt {
+        border-left: outer $success;
+        padding-left: 1;
+        margin: 0 2;
+        color: $text-muted;
+    }
+    
     GatekeeperScreen #progress {
         text-align: center;
         margin-top: 1;
@@ -114,9 +129,18 @@ class GatekeeperScreen(ExplorerScreen):
         Binding("right", "next_scenario", "Next", show=False),
     ]
     
-    def __init__(self) -> None:
+    CONTENT_SECTIONS = ("gates",)
+    
+    def __init__(self, gate_id: str | None = None) -> None:
+        """Initialize gatekeeper practice.
+        
+        Args:
+            gate_id: A content pack's scenarios to practice instead of the
+                built-in ones; only the built-in ones count towards progress
+        """
         super().__init__(title="Gatekeeper")
-        self.gates_data = load_gates()
+        self.gate_id = gate_id
+        self.gates_data = load_gates(gate_id)
         self.scenarios = self.gates_data["scenarios"]
         self.current_index = 0
         self.score = 0
@@ -129,6 +153,43 @@ class GatekeeperScreen(ExplorerScreen):
         self.submitted = False
         self.showing_results = False
     
+    def get_view_state(self) -> dict:
+        """Add the decisions so far, unless all scenarios are done."""
+        view = super().get_view_state()
+        if not self.showing_results:
+            position = self.current_index + (1 if self.submitted else 0)
+            if 0 < position < len(self.scenarios):
+                view.update(position=position, score=self.score, mistakes=list(self.mistakes))
+        return view
+    
+    def restore_view_state(self, view: dict) -> None:
+        """Continue from the saved scenario."""
+        super().restore_view_state(view)
+        progress = saved_progress(view, len(self.scenarios))
+        if progress is not None:
+            self.current_index, self.score, self.mistakes = progress
+    
+    def content_changed(self, changes: list[PackChange]) -> None:
+        """Show the reloaded scenarios, staying on the current one.
+        
+        A decision in progress is started again if its scenario changed,
+        as the reasons offered may have.
+        """
+        gates_data = load_gates(self.gate_id)
+        scenarios = gates_data["scenarios"]
+        if not scenarios:
+            return  # Nothing to show; keep the last scenarios
+        old = self.scenarios
+        self.gates_data, self.scenarios = gates_data, scenarios
+        if not self.showing_results:
+            previous = old[self.current_index] if self.current_index < len(old) else None
+            self.current_index = follow_item(old, scenarios, self.current_index)
+            if not self.submitted and previous != scenarios[self.current_index]:
+                self.decision = None
+                self.showing_reasons = False
+                self.selected_reasons = set()
+        self._refresh_display()
+    
     def compose_content(self) -> ComposeResult:
         if self.showing_results:
             yield from self._compose_results()
@@ -223,7 +284,11 @@ class GatekeeperScreen(ExplorerScreen):
                 for item in s['evidence_checklist']:
                     yield Static(f"  ☐ {item}")
             
-            yield Static(f"\nSource: {s['sources']['local'][0]}")
+            source = s['sources']['local'][0]
+            yield Static(f"\nSource: {source}")
+            cited = sources.excerpt(source)
+            if cited:
+                yield Static(cited, classes="source-excerpt", markup=False)
             
             hint = "[Enter/→] Next scenario" if self.current_index < len(self.scenarios) - 1 else "[Enter] See results"
             yield Static(f"\n{hint}  [Esc] Back", id="progress")
@@ -319,13 +384,26 @@ class GatekeeperScreen(ExplorerScreen):
         wrong_reasons = selected_reason_texts - valid_reasons
         
         # Score: correct decision + more correct reasons than wrong
-        if decision_correct and len(correct_reasons) > len(wrong_reasons):
+        correct = decision_correct and len(correct_reasons) > len(wrong_reasons)
+        if correct:
             self.score += 1
         else:
             self.mistakes.append(s['id'])
+        self._record_decision(s['id'], correct)
+    
+    def _record_decision(self, scenario_id: str, correct: bool) -> None:
+        """Record a decision in the learner's event log."""
+        if self.gate_id is not None:
+            return
+        # The app's session manager; event log errors are ignored there
+        session = getattr(self.app, "session", None)
+        if session is not None:
+            session.record_gate_decision(scenario_id, correct)
     
     def _save_results(self) -> None:
         """Save gatekeeper results to state."""
+        if self.gate_id is not None:
+            return
         try:
             from aidlc_explainer.state import StateManager
             state = StateManager()
@@ -349,6 +427,5 @@ class GatekeeperScreen(ExplorerScreen):
         """Refresh the screen content."""
         content = self.query_one("#content")
         content.remove_children()
-        
-        for widget in self.compose_content():
-            content.mount(widget)
+        # Nested containers only work inside a compose context
+        content.mount_compose(self.compose_content())
@@ -114,11 +114,12 @@ class GlossaryScreen(ExplorerScreen):
     }
     """
     
-    def __init__(self) -> None:
+    def __init__(self, term_id: str | None = None) -> None:
         super().__init__(title="Glossary")
         self.all_terms = sorted(get_all_terms(), key=lambda t: t.term.lower())
         self.filtered_terms = self.all_terms.copy()
         self.selected_term: GlossaryTerm | None = None
+        self.initial_term_id = term_id
     
     def compose_content(self) -> ComposeResult:
         with Horizontal(id="glossary-container"):
@@ -137,12 +138,26 @@ class GlossaryScreen(ExplorerScreen):
                 yield Static("Select a term to view details", id="term-detail")
     
     def on_mount(self) -> None:
-        """Select first term on mount."""
+        """Select the initial term (or the first one) on mount."""
         if self.filtered_terms:
-            self.selected_term = self.filtered_terms[0]
+            ids = [term.id for term in self.filtered_terms]
+            index = ids.index(self.initial_term_id) if self.initial_term_id in ids else 0
+            self.selected_term = self.filtered_terms[index]
             self._update_detail()
             term_list = self.query_one("#term-list", ListView)
-            term_list.index = 0
+            term_list.index = index
+    
+    def get_view_state(self) -> dict:
+        """Add the selected term to the scroll offsets."""
+        view = super().get_view_state()
+        if self.selected_term is not None:
+            view["term"] = self.selected_term.id
+        return view
+    
+    def restore_view_state(self, view: dict) -> None:
+        """Select the saved term once mounted."""
+        super().restore_view_state(view)
+        self.initial_term_id = view.get("term", self.initial_term_id)
     
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
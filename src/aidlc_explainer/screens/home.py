@@ -5,7 +5,7 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import Static, ListItem, ListView, ProgressBar
 
 from aidlc_explainer.screens.base import ExplorerScreen
-from aidlc_explainer.state import StateManager
+from aidlc_explainer.state import StateManager, format_duration
 
 
 WELCOME_BANNER = """\
@@ -156,16 +156,6 @@ class HomeScreen(ExplorerScreen):
         (9, "🔗 Sources", "View official reference sources", "sources", True),
     ]
     
-    ACHIEVEMENT_NAMES = {
-        "first-steps": "🎓 First Steps",
-        "scholar": "📚 Scholar",
-        "quiz-master": "🎯 Quiz Master",
-        "perfect-score": "⭐ Perfect Score",
-        "gatekeeper": "🚧 Gatekeeper",
-        "simulator-explorer": "🔬 Explorer",
-        "completionist": "🏆 Completionist",
-    }
-    
     def __init__(self) -> None:
         super().__init__(title="Home")
         self.state = StateManager()
@@ -190,6 +180,11 @@ class HomeScreen(ExplorerScreen):
         """Update progress display on mount."""
         self._update_progress()
     
+    def on_screen_resume(self) -> None:
+        """Show progress made on other screens when returning here."""
+        if self.is_mounted and self.state.reload():
+            self._update_progress()
+    
     def _update_progress(self) -> None:
         """Update the progress panel content."""
         progress = self.state.get_overall_progress()
@@ -210,6 +205,17 @@ class HomeScreen(ExplorerScreen):
             lines.append(f"   Next level: {xp_to_next} XP")
         lines.append("")
         
+        # Activity
+        activity = self.state.get_activity_stats()
+        days = activity["streak_days"]
+        lines.append(f"🔥 Streak: {days} day{'s' if days != 1 else ''}")
+        lines.append(f"   This week: {activity['xp_this_week']} XP")
+        lines.append(
+            f"   Sessions: {activity['total_sessions']}"
+            f" ({format_duration(activity['total_time_seconds'])})"
+        )
+        lines.append("")
+        
         # Overall progress
         overall = progress["overall_percent"]
         bar = self._make_bar(overall)
@@ -256,7 +262,7 @@ class HomeScreen(ExplorerScreen):
         
         if achievements["unlocked"]:
             for ach_id in achievements["unlocked"]:
-                name = self.ACHIEVEMENT_NAMES.get(ach_id, ach_id)
+                name = self.state.achievements.name(ach_id)
                 lines.append(f"  {name}")
         else:
             lines.append("  Complete activities to")
@@ -1,7 +1,5 @@
 """Interactive simulator with question-driven workflow adaptation."""
 
-import json
-from pathlib import Path
 from typing import Any
 
 from textual.app import ComposeResult
@@ -10,21 +8,20 @@ from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.widgets import Static, Button
 from textual.message import Message
 
-from aidlc_explainer.screens.base import ExplorerScreen
+from aidlc_explainer import layout
+from aidlc_explainer.content import snapshot
+from aidlc_explainer.content.watch import PackChange
+from aidlc_explainer.screens.base import ExplorerScreen, follow_item
 
 
 def load_questions() -> dict[str, Any]:
-    """Load simulator questions from JSON."""
-    path = Path(__file__).parent.parent / "content" / "simulator" / "questions.json"
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    """Load simulator questions from the content."""
+    return snapshot.load("questions")
 
 
 def load_stages() -> dict[str, Any]:
-    """Load stages data from JSON."""
-    path = Path(__file__).parent.parent / "content" / "simulator" / "stages.json"
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    """Load stages data from the content."""
+    return snapshot.load("stages")
 
 
 class QuestionOption(Static):
@@ -163,6 +160,8 @@ class InteractiveSimulatorScreen(ExplorerScreen):
         Binding("r", "restart", "Restart", show=True),
     ]
     
+    CONTENT_SECTIONS = ("questions", "stages")
+    
     def __init__(self, request_type: str = "greenfield") -> None:
         super().__init__(title="Interactive Simulator")
         self.request_type = request_type
@@ -216,6 +215,30 @@ class InteractiveSimulatorScreen(ExplorerScreen):
         self._refresh_question()
         self._refresh_workflow()
     
+    def reflow(self) -> None:
+        """Redraw both panels for their new width."""
+        self._refresh_question()
+        self._refresh_workflow()
+    
+    def content_changed(self, changes: list[PackChange]) -> None:
+        """Replay the answers so far against the reloaded questions and stages."""
+        questions_data = load_questions()
+        if not questions_data["questions"]:
+            return  # Nothing to ask; keep the last questions
+        old = self.questions
+        self.questions_data, self.stages_data = questions_data, load_stages()
+        self.questions = questions_data["questions"]
+        self.current_index = follow_item(old, self.questions, self.current_index)
+        answers, self.answers = self.answers, {}
+        self.active_stages, self.stage_reasons = set(), {}
+        self._initialize_stages()
+        by_id = {q['id']: q for q in self.questions}
+        for question_id, option_id in answers.items():  # In the order given
+            if question_id in by_id:
+                self._apply_answer(by_id[question_id], option_id)
+        self._refresh_question()
+        self._refresh_workflow()
+    
     def _refresh_question(self) -> None:
         """Refresh the question display."""
         content = self.query_one("#question-content", Static)
@@ -225,28 +248,30 @@ class InteractiveSimulatorScreen(ExplorerScreen):
             return
         
         q = self.questions[self.current_index]
+        width = layout.content_width(content, 74)
         
         lines = []
-        lines.append(f"╭─ Question {self.current_index + 1} of {len(self.questions)} ─────────────────────────────────────╮")
+        lines.append(f"╭{layout.rule(width - 2, f'Question {self.current_index + 1} of {len(self.questions)}')}╮")
         lines.append(f"│")
-        lines.append(f"│  {q['prompt']}")
+        lines.extend(layout.wrap(q['prompt'], width, indent="│  "))
         lines.append(f"│")
         
         labels = ['A', 'B', 'C', 'D']
         for i, opt in enumerate(q['options']):
             marker = "●" if self.answers.get(q['id']) == opt['id'] else "○"
             label = labels[i] if i < len(labels) else str(i+1)
-            lines.append(f"│  [{label}] {marker} {opt['label']}")
+            # Escaped, or the label would be read as markup
+            lines.extend(layout.wrap(f"\\[{label}] {marker} {opt['label']}", width, indent="│  "))
         
         lines.append(f"│")
-        lines.append(f"╰────────────────────────────────────────────────────────────────────────╯")
+        lines.append(f"╰{'─' * (width - 2)}╯")
         
         # Show last impact if any
         if self.last_impact:
             lines.append("")
-            lines.append("┌─ Impact of Your Answer ─────────────────────────────────────────────┐")
+            lines.append(f"┌{layout.rule(width - 2, 'Impact of Your Answer')}┐")
             lines.append(f"│")
-            lines.append(f"│  {self.last_impact.get('explanation', '')}")
+            lines.extend(layout.wrap(self.last_impact.get('explanation', ''), width, indent="│  "))
             lines.append(f"│")
             
             if 'add_stages' in self.last_impact and self.last_impact['add_stages']:
@@ -258,8 +283,9 @@ class InteractiveSimulatorScreen(ExplorerScreen):
                     lines.append(f"│  ➖ Removed: {stage}")
             
             lines.append(f"│")
-            lines.append(f"│  💡 Principle: {self.questions[max(0, self.current_index-1)]['principle']}")
-            lines.append(f"└────────────────────────────────────────────────────────────────────┘")
+            principle = self.questions[max(0, self.current_index-1)]['principle']
+            lines.extend(layout.wrap(f"💡 Principle: {principle}", width, indent="│  "))
+            lines.append(f"└{'─' * (width - 2)}┘")
         
         content.update("\n".join(lines))
         
@@ -274,8 +300,9 @@ class InteractiveSimulatorScreen(ExplorerScreen):
     
     def _show_results(self, content: Static) -> None:
         """Show final results."""
+        width = layout.content_width(content, 74)
         lines = []
-        lines.append("╭─ Simulation Complete ──────────────────────────────────────────────────╮")
+        lines.append(f"╭{layout.rule(width - 2, 'Simulation Complete')}╮")
         lines.append("│")
         lines.append("│  Based on your answers, AI-DLC has configured the optimal workflow:")
         lines.append("│")
@@ -288,20 +315,21 @@ class InteractiveSimulatorScreen(ExplorerScreen):
             if answer:
                 for opt in q['options']:
                     if opt['id'] == answer:
-                        lines.append(f"│    • {q['prompt'][:40]}... → {opt['label'][:25]}")
+                        lines.extend(layout.wrap(f"• {q['prompt']} → {opt['label']}", width, indent="│    "))
                         break
         
         lines.append("│")
         lines.append("│  Press [R] to restart with different answers")
         lines.append("│  Press [Esc] to go back")
         lines.append("│")
-        lines.append("╰────────────────────────────────────────────────────────────────────────╯")
+        lines.append(f"╰{'─' * (width - 2)}╯")
         
         content.update("\n".join(lines))
     
     def _refresh_workflow(self) -> None:
         """Refresh the workflow display."""
         content = self.query_one("#workflow-content", Static)
+        width = layout.content_width(content, 35)
         
         lines = []
         
@@ -325,7 +353,7 @@ class InteractiveSimulatorScreen(ExplorerScreen):
                 continue
             
             lines.append(f"\n{phase_name}")
-            lines.append("─" * 35)
+            lines.append(layout.rule(width))
             
             for stage in phase_stages:
                 stage_id = stage["id"]
@@ -334,7 +362,7 @@ class InteractiveSimulatorScreen(ExplorerScreen):
                 if is_active:
                     marker = "✓"
                     reason = self.stage_reasons.get(stage_id, "")
-                    short_reason = f"({reason[:20]}...)" if len(reason) > 20 else f"({reason})" if reason else ""
+                    short_reason = layout.truncate(f"({reason})", width - 6) if reason else ""
                     lines.append(f"  {marker} {stage['name']}")
                     if short_reason:
                         lines.append(f"      {short_reason}")
@@ -373,27 +401,32 @@ class InteractiveSimulatorScreen(ExplorerScreen):
         if not question:
             return
         
-        # Store answer
-        self.answers[question_id] = option_id
+        self.last_impact = self._apply_answer(question, option_id)
         
-        # Apply effects
+        # Refresh display
+        self._refresh_question()
+        self._refresh_workflow()
+    
+    def _apply_answer(self, question: dict, option_id: str) -> dict:
+        """Store an answer and apply its effects to the workflow.
+        
+        Returns:
+            The answer's effects
+        """
+        self.answers[question['id']] = option_id
         effects = question['effects'].get(option_id, {})
-        self.last_impact = effects
         
         # Add stages
         for stage_id in effects.get('add_stages', []):
             self.active_stages.add(stage_id)
-            self.stage_reasons[stage_id] = effects.get('explanation', 'Added by answer')[:50]
+            self.stage_reasons[stage_id] = effects.get('explanation', 'Added by answer')
         
         # Remove stages
         for stage_id in effects.get('remove_stages', []):
             self.active_stages.discard(stage_id)
             if stage_id in self.stage_reasons:
                 del self.stage_reasons[stage_id]
-        
-        # Refresh display
-        self._refresh_question()
-        self._refresh_workflow()
+        return effects
     
     def action_next_question(self) -> None:
         """Move to next question."""
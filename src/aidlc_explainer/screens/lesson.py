@@ -1,14 +1,100 @@
 """Lesson screen for displaying educational content."""
 
+import threading
+from collections import OrderedDict
+from functools import partial
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, Horizontal, ScrollableContainer
+from textual.content import Content
 from textual.widgets import Static, Button
 
 from aidlc_explainer.screens.base import ExplorerScreen
-from aidlc_explainer.content import load_lesson, Lesson, get_all_lessons
+from aidlc_explainer.content import load_lesson, Lesson, Section, get_all_lessons, packs
 from aidlc_explainer.state import StateManager
 
+SECTION_CACHE_SIZE = 12
+
+
+def prepare_section(section: Section, width: int | None = None) -> Content:
+    """Build the body of a lesson section, wrapped to `width` if given."""
+    title_text = f"╭─ {section.title} {'─' * max(0, 60 - len(section.title))}╮"
+    content_parts = [title_text, "", section.content]
+    if section.diagram:
+        content_parts.extend(["", "─" * min(70, width or 70), "", section.diagram])
+    content = Content.from_markup("\n".join(content_parts))
+    if width:
+        content = Content("\n").join(content.wrap(width))
+    return content
+
+
+class SectionRenderer:
+    """Least-recently-used cache of prepared lesson section bodies.
+    
+    Entries are keyed by ``(lesson_id, section_index, terminal_width)`` and
+    can be filled from a worker thread, so the sections a learner is likely
+    to open next are ready before they do.
+    """
+    
+    def __init__(self, max_size: int = SECTION_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+        
+        Args:
+            max_size: Number of prepared sections kept
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._sections: OrderedDict[tuple[str, int, int], Content] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, lesson: Lesson, index: int, terminal_width: int, width: int) -> Content:
+        """Return a section's body wrapped to `width`, preparing it if needed.
+        
+        Args:
+            lesson: The lesson
+            index: Section index within the lesson
+            terminal_width: Terminal width the body is laid out for
+            width: Width of the body's content area
+        """
+        key = (lesson.id, index, terminal_width)
+        with self._lock:
+            content = self._sections.get(key)
+            if content is not None:
+                self._sections.move_to_end(key)
+                self.hits += 1
+                return content
+            self.misses += 1
+        content = prepare_section(lesson.sections[index], width)
+        with self._lock:
+            self._sections[key] = content
+            while len(self._sections) > self.max_size:
+                self._sections.popitem(last=False)
+        return content
+    
+    def prefetch(self, sections: list[tuple[Lesson, int]], terminal_width: int, width: int) -> None:
+        """Prepare sections that are not cached yet (safe to call from a thread)."""
+        for lesson, index in sections:
+            if (lesson.id, index, terminal_width) not in self:
+                self.get(lesson, index, terminal_width, width)
+    
+    def clear(self) -> None:
+        """Drop every prepared section."""
+        with self._lock:
+            self._sections.clear()
+    
+    def __contains__(self, key: tuple[str, int, int]) -> bool:
+        with self._lock:
+            return key in self._sections
+    
+    def __len__(self) -> int:
+        return len(self._sections)
+
+
+# Shared by all lesson screens, so the next lesson opens on a prepared section
+RENDERER = SectionRenderer()
+
 
 class LessonScreen(ExplorerScreen):
     """Screen for displaying lesson content with sections."""
@@ -20,6 +106,7 @@ class LessonScreen(ExplorerScreen):
     
     LessonScreen #lesson-scroll {
         height: 1fr;
+        scrollbar-gutter: stable;
         margin: 0 2;
         min-height: 20;
         max-height: 100%;
@@ -89,10 +176,11 @@ class LessonScreen(ExplorerScreen):
         Binding("end", "last_section", "Last", show=False),
     ]
     
-    def __init__(self, lesson_id: str) -> None:
+    def __init__(self, lesson_id: str, section: int = 0) -> None:
         self.lesson_id = lesson_id
         self.lesson: Lesson = load_lesson(lesson_id)
         self.current_section = 0
+        self._go_to_section(section)
         self.state = StateManager()
         self.all_lessons = get_all_lessons()
         super().__init__(title=self.lesson.title)
@@ -101,10 +189,33 @@ class LessonScreen(ExplorerScreen):
         """Populate the lesson content after mount and track progress."""
         self.state.mark_lesson_started(self.lesson_id)
         self._refresh_content()
+    
+    def get_view_state(self) -> dict:
+        """Add the current section to the scroll offsets."""
+        return {**super().get_view_state(), "section": self.current_section}
+    
+    def restore_view_state(self, view: dict) -> None:
+        """Reopen the saved section."""
+        super().restore_view_state(view)
+        self._go_to_section(view.get("section", self.current_section))
+    
+    def _go_to_section(self, section: object) -> None:
+        """Set the current section before mount, ignoring invalid indices."""
+        if isinstance(section, int) and 0 <= section < len(self.lesson.sections):
+            self.current_section = section
+    
     def compose_content(self) -> ComposeResult:
+        # The gutter keeps the body's width fixed, so prepared sections fit it
         with ScrollableContainer(id="lesson-scroll"):
-            yield Vertical(id="lesson-content")
-        yield Horizontal(id="lesson-nav-buttons")
+            with Vertical(id="lesson-content"):
+                yield Static("", classes="lesson-body")
+        # All buttons stay mounted and are shown as needed: remounting them
+        # reuses IDs that are still being removed
+        with Horizontal(id="lesson-nav-buttons"):
+            yield Button("← Previous Section", id="prev-section-btn", variant="default")
+            yield Button("Next Section →", id="next-section-btn", variant="primary")
+            yield Button("Next Lesson →", id="next-lesson-btn", variant="success")
+            yield Button("Lessons Home", id="lessons-home-btn", variant="default")
         yield Static("", id="progress")
     
     def _get_next_lesson_id(self) -> str | None:
@@ -117,26 +228,7 @@ class LessonScreen(ExplorerScreen):
     
     def _refresh_content(self) -> None:
         """Refresh all content for current section."""
-        section = self.lesson.sections[self.current_section]
-        content_container = self.query_one("#lesson-content", Vertical)
-        
-        # Build new content as a single string to avoid duplicate ID issues
-        title_text = f"╭─ {section.title} {'─' * max(0, 60 - len(section.title))}╮"
-        
-        content_parts = [title_text, "", section.content]
-        
-        if section.diagram:
-            content_parts.extend(["", "─" * 70, "", section.diagram])
-        
-        full_content = "\n".join(content_parts)
-        
-        # Remove all children and add single Static widget
-        children = list(content_container.children)
-        for child in children:
-            child.remove()
-        
-        # Mount new content widget without ID to avoid conflicts
-        content_container.mount(Static(full_content, classes="lesson-body"))
+        self._show_section()
         
         # Update navigation buttons
         self._update_nav_buttons()
@@ -147,28 +239,58 @@ class LessonScreen(ExplorerScreen):
         # Scroll to top
         scroll = self.query_one("#lesson-scroll", ScrollableContainer)
         scroll.scroll_home(animate=False)
+        self.call_after_refresh(self._prefetch)
+    
+    def _show_section(self) -> None:
+        """Show the current section's body, prepared for the body's width."""
+        body = self.query_one(".lesson-body", Static)
+        width = body.content_size.width
+        if width:
+            body.update(RENDERER.get(self.lesson, self.current_section, self.app.size.width, width))
+        else:  # Not laid out yet: let the widget wrap it
+            body.update(prepare_section(self.lesson.sections[self.current_section]))
+    
+    def _prefetch(self) -> None:
+        """Prepare this section, the next one and the next lesson's first in a thread."""
+        if not self.is_current:
+            return
+        width = self.query_one(".lesson-body", Static).content_size.width
+        if not width:
+            return
+        sections = [
+            (self.lesson, i)
+            for i in (self.current_section, self.current_section + 1)
+            if i < len(self.lesson.sections)
+        ]
+        next_lesson_id = self._get_next_lesson_id()
+        # A content pack's lessons are imported only once one is opened
+        if next_lesson_id and (
+            packs.REGISTRY.find("lessons", next_lesson_id) is None
+            or packs.REGISTRY.is_loaded("lessons", next_lesson_id)
+        ):
+            sections.append((load_lesson(next_lesson_id), 0))
+        self.run_worker(
+            partial(RENDERER.prefetch, sections, self.app.size.width, width),
+            group="prefetch",
+            thread=True,
+            exit_on_error=False,
+        )
+    
+    def reflow(self) -> None:
+        """Re-wrap the section for the body's new width."""
+        self._show_section()
     
     def _update_nav_buttons(self) -> None:
-        """Update navigation buttons based on current state."""
-        try:
-            nav = self.query_one("#lesson-nav-buttons", Horizontal)
-            nav.remove_children()
-            
-            # Previous section button
-            if self.current_section > 0:
-                nav.mount(Button("← Previous Section", id="prev-section-btn", variant="default"))
-            
-            # Next section or completion buttons
-            if self.current_section < len(self.lesson.sections) - 1:
-                nav.mount(Button("Next Section →", id="next-section-btn", variant="primary"))
-            else:
-                # Last section - show completion options
-                next_lesson_id = self._get_next_lesson_id()
-                if next_lesson_id:
-                    nav.mount(Button("Next Lesson →", id="next-lesson-btn", variant="success"))
-                nav.mount(Button("Lessons Home", id="lessons-home-btn", variant="default"))
-        except Exception:
-            pass
+        """Show the navigation buttons that apply to the current section."""
+        last = self.current_section == len(self.lesson.sections) - 1
+        shown = {
+            "#prev-section-btn": self.current_section > 0,
+            "#next-section-btn": not last,
+            "#next-lesson-btn": last and self._get_next_lesson_id() is not None,
+            "#lessons-home-btn": last,
+        }
+        for selector, visible in shown.items():
+            self.query_one(selector, Button).display = visible
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -18,11 +18,20 @@ class LessonItem(ListItem):
         self.completed = completed
     
     def compose(self) -> ComposeResult:
+        yield Static(self._label())
+    
+    def _label(self) -> str:
         num = self.index + 1
         title = self.lesson_data["title"]
         desc = self.lesson_data["description"]
         status = "✓" if self.completed else "○"
-        yield Static(f"  [{num}] {status} {title:<25} {desc}")
+        return f"  [{num}] {status} {title:<25} {desc}"
+    
+    def set_completed(self, completed: bool) -> None:
+        """Update the completion mark."""
+        if completed != self.completed:
+            self.completed = completed
+            self.query_one(Static).update(self._label())
 
 
 class LessonsScreen(ExplorerScreen):
@@ -78,38 +87,37 @@ class LessonsScreen(ExplorerScreen):
         self._refresh_completion_status()
     
     def on_screen_resume(self) -> None:
-        """Refresh when returning to this screen."""
-        self._refresh_completion_status()
-        self._refresh_display()
+        """Refresh completion marks when returning to this screen."""
+        # Lessons may have been completed elsewhere
+        if self.is_mounted and self.state.reload():
+            self._refresh_completion_status()
+            self._refresh_display()
     
     def _refresh_completion_status(self) -> None:
         """Refresh the list of completed lessons from state."""
         self.completed_lessons = self.state.get_lessons_stats()["completed"]
     
     def _refresh_display(self) -> None:
-        """Refresh the entire display."""
-        try:
-            content = self.query_one("#content")
-            content.remove_children()
-            for widget in self.compose_content():
-                content.mount(widget)
-        except Exception:
-            pass
+        """Update the progress line and completion marks in place."""
+        self.query_one("#lessons-intro", Static).update(self._intro())
+        for item in self.query(LessonItem):
+            item.set_completed(item.lesson_data["id"] in self.completed_lessons)
     
-    def compose_content(self) -> ComposeResult:
-        # Refresh completion status before composing
-        self._refresh_completion_status()
-        
+    def _intro(self) -> str:
         completed_count = len(self.completed_lessons)
         total = len(self.lessons)
-        
-        yield Static(
+        return (
             f"╭─ AI-DLC Lessons ─────────────────────────────────────────────────────────╮\n"
             f"│  Select a lesson to begin your learning journey.                        │\n"
             f"│  Progress: {completed_count}/{total} lessons completed                                       │\n"
-            f"╰──────────────────────────────────────────────────────────────────────────╯",
-            id="lessons-intro"
+            f"╰──────────────────────────────────────────────────────────────────────────╯"
         )
+    
+    def compose_content(self) -> ComposeResult:
+        # Refresh completion status before composing
+        self._refresh_completion_status()
+        
+        yield Static(self._intro(), id="lessons-intro")
         
         with ListView(id="lesson-list"):
             for i, lesson in enumerate(self.lessons):
@@ -1,10 +1,11 @@
 """Methodology comparison screen with animated visualization."""
 
+from dataclasses import dataclass
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.widgets import Static, Button, Select
-from textual.timer import Timer
 
 from aidlc_explainer.screens.base import ExplorerScreen
 from aidlc_explainer.content.methodology_comparison import (
@@ -16,94 +17,114 @@ from aidlc_explainer.content.methodology_comparison import (
     Methodology,
     ProjectScenario,
 )
+from aidlc_explainer.widgets.animation import AnimationClock
+
+
+@dataclass(frozen=True)
+class TimelineLayout:
+    """Static geometry of a timeline at one width."""
+    width: int
+    top: str
+    bottom: str
+    metrics: str
+    segments: tuple[tuple[int, int, str], ...]  # (column, width, phase name)
+    span: int  # Columns covered by phases and separators
 
 
 class MethodologyTimeline(Static):
-    """A timeline visualization for a methodology."""
+    """A timeline visualization for a methodology.
+    
+    The phase layout is computed once per width and cached; each animation
+    frame only redraws the progress overlay. Animation is driven by the
+    screen's shared AnimationClock via `set_progress`.
+    """
+    
+    DEFAULT_WIDTH = 60
+    MIN_WIDTH = 30
     
     def __init__(self, methodology: Methodology, **kwargs) -> None:
         super().__init__(**kwargs)
         self.methodology = methodology
         self.animation_progress = 0  # 0-100
-        self._timer: Timer | None = None
-    
-    def on_mount(self) -> None:
-        """Start animation when mounted."""
-        self._timer = self.set_interval(0.1, self._animate)
+        self._layouts: dict[int, TimelineLayout] = {}
+        self._width = self.DEFAULT_WIDTH
+        self._visible = self._visible_columns(self._width)
     
-    def _animate(self) -> None:
-        """Animate the timeline."""
-        if self.animation_progress < 100:
-            self.animation_progress += 2
+    def set_progress(self, progress: float) -> None:
+        """Advance the animation, refreshing only if the overlay changed."""
+        self.animation_progress = progress
+        visible = self._visible_columns(self._width)
+        if visible != self._visible:
+            self._visible = visible
             self.refresh()
-        elif self._timer:
-            self._timer.stop()
     
-    def render(self) -> str:
-        """Render the timeline."""
+    def _visible_columns(self, width: int) -> int:
+        """Number of revealed columns at the current progress."""
+        return int((self.animation_progress / 100) * self.layout_for(width).span)
+    
+    def layout_for(self, width: int) -> TimelineLayout:
+        """Get the cached static layout for a width."""
+        layout = self._layouts.get(width)
+        if layout is None:
+            layout = self._layouts[width] = self._build_layout(width)
+        return layout
+    
+    def _build_layout(self, width: int) -> TimelineLayout:
+        """Compute phase positions and the static frame lines."""
         m = self.methodology
+        phases = [p for p in m.phases if p.duration_units > 0]
         
         # Calculate total units for scaling
-        total_units = sum(p.duration_units for p in m.phases if p.duration_units > 0)
-        if total_units == 0:
-            total_units = 1
+        total_units = sum(p.duration_units for p in phases) or 1
         
-        # Timeline width
-        width = 60
-        
-        lines = []
-        lines.append(f"┌─ {m.name} {'─' * (width - len(m.name) - 4)}┐")
-        
-        # Draw phases
-        current_pos = 0
-        phase_line = "│ "
-        label_line = "│ "
-        
-        for phase in m.phases:
-            if phase.duration_units == 0:
-                continue
-            
-            # Calculate phase width
+        segments = []
+        column = 0
+        for phase in phases:
             phase_width = max(3, int((phase.duration_units / total_units) * (width - 4)))
-            
-            # Calculate how much to show based on animation
-            visible_start = int((self.animation_progress / 100) * (width - 4))
-            
-            if current_pos < visible_start:
-                # Show this phase
-                show_width = min(phase_width, visible_start - current_pos)
-                phase_char = "█"
-                phase_line += phase_char * show_width
-                
-                # Add label if space
-                label = phase.name[:show_width-1] if show_width > 2 else ""
-                label_line += label.center(show_width)
-            else:
-                # Not yet visible
-                phase_line += "░" * phase_width
-                label_line += " " * phase_width
-            
-            # Add separator
-            if phase != m.phases[-1] and phase.duration_units > 0:
-                next_has_duration = any(p.duration_units > 0 for p in m.phases[m.phases.index(phase)+1:])
-                if next_has_duration:
-                    phase_line += "│"
-                    label_line += " "
-            
-            current_pos += phase_width + 1
-        
-        # Pad to width
-        phase_line = phase_line[:width-1].ljust(width-1) + "│"
-        label_line = label_line[:width-1].ljust(width-1) + "│"
+            segments.append((column, phase_width, phase.name))
+            column += phase_width + 1  # Phase plus separator
         
-        lines.append(phase_line)
-        lines.append(label_line)
-        lines.append(f"└{'─' * (width - 2)}┘")
+        return TimelineLayout(
+            width=width,
+            top=f"┌─ {m.name} {'─' * (width - len(m.name) - 5)}┐",
+            bottom=f"└{'─' * (width - 2)}┘",
+            metrics=(
+                f"  Time: {m.cycle_time_factor:.0%} of baseline  │  "
+                f"Cost: {m.cost_factor:.0%}  │  Feedback: {m.feedback_loop_time}"
+            ),
+            segments=tuple(segments),
+            span=max(0, column - 1),
+        )
+    
+    def render_frame(self, width: int) -> str:
+        """Render the timeline at `width` for the current progress."""
+        layout = self.layout_for(width)
+        visible = self._visible_columns(width)
         
-        # Add metrics
-        lines.append(f"  Time: {m.cycle_time_factor:.0%} of baseline  │  Cost: {m.cost_factor:.0%}  │  Feedback: {m.feedback_loop_time}")
+        phase_line = []
+        label_line = []
+        for column, phase_width, name in layout.segments:
+            shown = min(phase_width, max(0, visible - column))
+            label = name[:shown - 1] if shown > 2 else ""
+            phase_line.append("█" * shown + "░" * (phase_width - shown))
+            label_line.append(label.center(shown) + " " * (phase_width - shown))
         
-        return "\n".join(lines)
+        inner = width - 3
+        phases = "│".join(phase_line)[:inner].ljust(inner)
+        labels = " ".join(label_line)[:inner].ljust(inner)
+        return "\n".join([
+            layout.top,
+            f"│ {phases}│",
+            f"│ {labels}│",
+            layout.bottom,
+            layout.metrics,
+        ])
+    
+    def render(self) -> str:
+        """Render the timeline."""
+        self._width = max(self.MIN_WIDTH, self.content_size.width or self.DEFAULT_WIDTH)
+        self._visible = self._visible_columns(self._width)
+        return self.render_frame(self._width)
 
 
 class MethodologyComparisonScreen(ExplorerScreen):
@@ -199,6 +220,7 @@ class MethodologyComparisonScreen(ExplorerScreen):
         self.metrics = get_comparison_metrics()
         self.scenarios = get_project_scenarios()
         self.selected_scenario: ProjectScenario | None = None
+        self._clock = AnimationClock(self)
     
     def compose_content(self) -> ComposeResult:
         yield Static(
@@ -252,6 +274,17 @@ class MethodologyComparisonScreen(ExplorerScreen):
                 
                 yield Static("", id="scenario-results")
     
+    def on_mount(self) -> None:
+        """Start the timeline animations from one shared clock."""
+        self._clock.reduced_motion = getattr(self.app, "reduced_motion", False)
+        for timeline in self.query(MethodologyTimeline):
+            self._clock.add(timeline)
+        self._clock.start()
+    
+    def on_unmount(self) -> None:
+        """Stop the animation clock."""
+        self._clock.stop()
+    
     def action_select_scenario(self, index: int) -> None:
         """Select and simulate a project scenario."""
         if 0 <= index < len(self.scenarios):
@@ -260,13 +293,7 @@ class MethodologyComparisonScreen(ExplorerScreen):
     
     def action_restart_animation(self) -> None:
         """Restart all timeline animations."""
-        for methodology in self.methodologies:
-            try:
-                timeline = self.query_one(f"#timeline-{methodology.id}", MethodologyTimeline)
-                timeline.animation_progress = 0
-                timeline._timer = timeline.set_interval(0.1, timeline._animate)
-            except Exception:
-                pass
+        self._clock.start()
     
     def _show_simulation_results(self) -> None:
         """Show simulation results for selected scenario."""
@@ -3,19 +3,29 @@
 from textual.app import ComposeResult
 from textual.widgets import Static, ListItem, ListView
 
+from aidlc_explainer.content import packs
 from aidlc_explainer.screens.base import ExplorerScreen
 
 
 class PracticeMenuItem(ListItem):
     """A practice menu item."""
     
-    def __init__(self, number: int, title: str, description: str, screen_id: str, stats: str = "") -> None:
+    def __init__(
+        self,
+        number: int,
+        title: str,
+        description: str,
+        screen_id: str,
+        stats: str = "",
+        context: dict | None = None,
+    ) -> None:
         super().__init__()
         self.number = number
         self.title = title
         self.description = description
         self.screen_id = screen_id
         self.stats = stats
+        self.context = context
     
     def compose(self) -> ComposeResult:
         stats_text = f" • {self.stats}" if self.stats else ""
@@ -107,13 +117,22 @@ class PracticeScreen(ExplorerScreen):
         with ListView(id="menu"):
             yield PracticeMenuItem(1, "Quiz", "Multiple-choice questions", "quiz", self.quiz_stats)
             yield PracticeMenuItem(2, "Gatekeeper", "Review AI-generated plans", "gatekeeper", self.gate_stats)
+            # Content packs' quizzes and gates; their content loads when opened
+            number = 2
+            for kind, screen_id, key in (("quizzes", "quiz", "quiz_id"), ("gates", "gatekeeper", "gate_id")):
+                for entry in packs.REGISTRY.listings(kind):
+                    number += 1
+                    yield PracticeMenuItem(
+                        number, entry["title"], entry["description"], screen_id,
+                        context={key: entry["id"]},
+                    )
         
         yield Static("[r] Reset Progress", id="reset-hint")
     
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle menu item selection."""
         if isinstance(event.item, PracticeMenuItem):
-            self.app.navigate_to(event.item.screen_id, event.item.title)
+            self.app.navigate_to(event.item.screen_id, event.item.title, event.item.context)
     
     def action_select_item(self, index: int) -> None:
         """Select menu item by index."""
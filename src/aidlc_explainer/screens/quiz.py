@@ -1,8 +1,6 @@
 """Quiz screen for multiple-choice questions with mouse support and randomization."""
 
-import json
 import random
-from pathlib import Path
 from typing import Any
 
 from textual.app import ComposeResult
@@ -11,7 +9,10 @@ from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.widgets import Static, Button
 from textual.message import Message
 
-from aidlc_explainer.screens.base import ExplorerScreen
+from aidlc_explainer import sources
+from aidlc_explainer.content import packs, snapshot
+from aidlc_explainer.content.watch import PackChange
+from aidlc_explainer.screens.base import ExplorerScreen, follow_item, saved_progress
 
 
 class OptionButton(Button):
@@ -29,11 +30,18 @@ class OptionButton(Button):
         self.label = label
 
 
-def load_quiz() -> dict[str, Any]:
-    """Load quiz data from JSON file."""
-    quiz_path = Path(__file__).parent.parent / "content" / "practice" / "quiz.json"
-    with open(quiz_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def load_quiz(quiz_id: str | None = None) -> dict[str, Any]:
+    """Load quiz data from the content.
+    
+    Args:
+        quiz_id: A content pack's quiz (default: the built-in quiz)
+    
+    Raises:
+        ValueError: If no installed pack has the quiz, or it cannot be loaded
+    """
+    if quiz_id is None:
+        return snapshot.load("quiz")
+    return packs.REGISTRY.load("quizzes", quiz_id)
 
 
 class QuizScreen(ExplorerScreen):
@@ -111,6 +119,12 @@ class QuizScreen(ExplorerScreen):
         height: auto;
     }
     
+    QuizScreen .source-excerpt {
+        border-left: outer $secondary;
+        padding-left: 1;
+        color: $text-muted;
+    }
+    
     QuizScreen #progress-bar {
         text-align: center;
         margin: 1 0;
@@ -160,9 +174,18 @@ class QuizScreen(ExplorerScreen):
         Binding("m", "review_mistakes", "Review", show=False),
     ]
     
-    def __init__(self) -> None:
+    CONTENT_SECTIONS = ("quiz",)
+    
+    def __init__(self, quiz_id: str | None = None) -> None:
+        """Initialize the quiz.
+        
+        Args:
+            quiz_id: A content pack's quiz to take instead of the built-in
+                one; only the built-in quiz counts towards progress
+        """
         super().__init__(title="Quiz")
-        self.quiz_data = load_quiz()
+        self.quiz_id = quiz_id
+        self.quiz_data = load_quiz(quiz_id)
         self.questions = self.quiz_data["questions"]
         self.current_index = 0
         self.score = 0
@@ -186,6 +209,43 @@ class QuizScreen(ExplorerScreen):
         self._shuffle_current_options()
         self._refresh_display()
     
+    def get_view_state(self) -> dict:
+        """Add the answers so far, unless the quiz is finished or in review."""
+        view = super().get_view_state()
+        if not (self.showing_results or self.review_mode):
+            position = self.current_index + (1 if self.answered else 0)
+            if 0 < position < len(self.questions):
+                view.update(position=position, score=self.score, mistakes=list(self.mistakes))
+        return view
+    
+    def restore_view_state(self, view: dict) -> None:
+        """Continue from the saved question."""
+        super().restore_view_state(view)
+        progress = saved_progress(view, len(self.questions))
+        if progress is not None:
+            self.current_index, self.score, self.mistakes = progress
+    
+    def content_changed(self, changes: list[PackChange]) -> None:
+        """Show the reloaded questions, staying on the current one."""
+        quiz_data = load_quiz(self.quiz_id)
+        questions = quiz_data["questions"]
+        if not questions:
+            return  # Nothing to show; keep the last questions
+        old = self.questions
+        self.quiz_data, self.questions = quiz_data, questions
+        if self.showing_results:
+            self._refresh_display()
+            return
+        previous = old[self.current_index] if self.current_index < len(old) else None
+        self.current_index = follow_item(old, questions, self.current_index)
+        if self.review_mode:
+            self.review_indices = [
+                i for i, q in enumerate(questions) if q['id'] in self.mistakes
+            ]
+        if previous is None or previous['options'] != questions[self.current_index]['options']:
+            self._shuffle_current_options()
+        self._refresh_display()
+    
     def _shuffle_current_options(self) -> None:
         """Shuffle options for the current question."""
         if self.current_index >= len(self.questions):
@@ -210,34 +270,28 @@ class QuizScreen(ExplorerScreen):
         """Refresh the screen content."""
         try:
             scroll = self.query_one("#quiz-scroll", ScrollableContainer)
-            scroll.remove_children()
-            
-            if self.showing_results:
-                for widget in self._compose_results():
-                    scroll.mount(widget)
-            else:
-                for widget in self._compose_question():
-                    scroll.mount(widget)
         except Exception:
-            pass
+            return
+        widgets = self._compose_results() if self.showing_results else self._compose_question()
+        
+        async def replace() -> None:
+            # The new widgets reuse IDs, so the old ones must be gone first
+            await scroll.remove_children()
+            await scroll.mount_all(widgets)
+        
+        self.call_next(replace)
     
     def _compose_question(self) -> list:
         """Compose question widgets."""
         widgets = []
         q = self.questions[self.current_index]
         labels = ['A', 'B', 'C', 'D']
+        options = []
         
         # Question box
-        question_box = Vertical(id="question-box")
-        widgets.append(question_box)
-        
-        # We'll mount children after
         title = Static(f"Question {self.current_index + 1} of {len(self.questions)}", id="question-title")
         text = Static(q['prompt'], id="question-text")
         
-        # Options container
-        options_container = Vertical(id="options-container")
-        
         # Create option buttons with shuffled order
         for display_idx, (original_idx, option_text) in enumerate(self.shuffled_options):
             if display_idx >= len(labels):
@@ -262,26 +316,30 @@ class QuizScreen(ExplorerScreen):
                     btn.add_class("option-wrong")
                 btn.disabled = True
             
-            options_container.mount(btn)
+            options.append(btn)
         
-        question_box.mount(title)
-        question_box.mount(text)
-        question_box.mount(options_container)
+        # Containers get their children up front: they are not mounted yet
+        options_container = Vertical(*options, id="options-container")
+        widgets.append(Vertical(title, text, options_container, id="question-box"))
         
         # Feedback box (if answered)
         if self.answered:
-            feedback_box = Vertical(id="feedback-box")
-            widgets.append(feedback_box)
-            
             correct_original = q['correct']
             is_correct = self.selected_option == correct_original
             result = "✓ Correct!" if is_correct else "✗ Incorrect"
             
-            feedback_box.mount(Static(result, classes="feedback-result"))
-            feedback_box.mount(Static(""))
-            feedback_box.mount(Static(q['explanation']))
-            feedback_box.mount(Static(""))
-            feedback_box.mount(Static(f"📚 Source: {q['sources']['local'][0]}"))
+            source = q['sources']['local'][0]
+            feedback = [
+                Static(result, classes="feedback-result"),
+                Static(""),
+                Static(q['explanation']),
+                Static(""),
+                Static(f"📚 Source: {source}"),
+            ]
+            cited = sources.excerpt(source)
+            if cited:
+                feedback.append(Static(cited, classes="source-excerpt", markup=False))
+            widgets.append(Vertical(*feedback, id="feedback-box"))
         
         # Progress bar
         current = self.current_index + 1
@@ -295,14 +353,13 @@ class QuizScreen(ExplorerScreen):
         widgets.append(progress)
         
         # Navigation buttons
-        nav = Horizontal(id="nav-buttons")
-        widgets.append(nav)
-        
+        buttons = []
         if self.answered:
             if self.current_index < len(self.questions) - 1:
-                nav.mount(Button("Next Question →", id="next-btn", variant="primary"))
+                buttons.append(Button("Next Question →", id="next-btn", variant="primary"))
             else:
-                nav.mount(Button("See Results →", id="next-btn", variant="success"))
+                buttons.append(Button("See Results →", id="next-btn", variant="success"))
+        widgets.append(Horizontal(*buttons, id="nav-buttons"))
         
         return widgets
     
@@ -325,33 +382,31 @@ class QuizScreen(ExplorerScreen):
             grade = "💪 Don't give up!"
             grade_msg = "Start with the lessons to build your knowledge."
         
-        score_box = Vertical(id="score-box")
-        widgets.append(score_box)
-        
-        score_box.mount(Static(f"╭─ Quiz Complete {'─' * 40}╮"))
-        score_box.mount(Static(""))
-        score_box.mount(Static(f"Score: {self.score}/{total} ({pct}%)"))
-        score_box.mount(Static(""))
-        score_box.mount(Static(grade))
-        score_box.mount(Static(grade_msg))
-        score_box.mount(Static(""))
-        
         if self.mistakes:
-            score_box.mount(Static(f"Missed {len(self.mistakes)} question(s)"))
+            summary = f"Missed {len(self.mistakes)} question(s)"
         else:
-            score_box.mount(Static("Perfect score! 🌟"))
-        
-        score_box.mount(Static(""))
-        score_box.mount(Static(f"╰{'─' * 55}╯"))
+            summary = "Perfect score! 🌟"
+        
+        widgets.append(Vertical(
+            Static(f"╭─ Quiz Complete {'─' * 40}╮"),
+            Static(""),
+            Static(f"Score: {self.score}/{total} ({pct}%)"),
+            Static(""),
+            Static(grade),
+            Static(grade_msg),
+            Static(""),
+            Static(summary),
+            Static(""),
+            Static(f"╰{'─' * 55}╯"),
+            id="score-box",
+        ))
         
         # Results buttons
-        buttons = Horizontal(id="results-buttons")
-        widgets.append(buttons)
-        
-        buttons.mount(Button("[R] Restart Quiz", id="restart-btn", variant="primary"))
+        buttons = [Button("[R] Restart Quiz", id="restart-btn", variant="primary")]
         if self.mistakes:
-            buttons.mount(Button("[M] Review Mistakes", id="review-btn", variant="warning"))
-        buttons.mount(Button("[Esc] Back to Menu", id="back-btn", variant="default"))
+            buttons.append(Button("[M] Review Mistakes", id="review-btn", variant="warning"))
+        buttons.append(Button("[Esc] Back to Menu", id="back-btn", variant="default"))
+        widgets.append(Horizontal(*buttons, id="results-buttons"))
         
         return widgets
     
@@ -400,6 +455,7 @@ class QuizScreen(ExplorerScreen):
             self.score += 1
         else:
             self.mistakes.append(q['id'])
+        self._record_answer(q['id'], original_index == q['correct'])
         
         self._refresh_display()
     
@@ -453,8 +509,19 @@ class QuizScreen(ExplorerScreen):
             self._shuffle_current_options()
             self._refresh_display()
     
+    def _record_answer(self, question_id: str, correct: bool) -> None:
+        """Record an answer in the learner's event log."""
+        if self.review_mode or self.quiz_id is not None:
+            return
+        # The app's session manager; event log errors are ignored there
+        session = getattr(self.app, "session", None)
+        if session is not None:
+            session.record_quiz_answer(question_id, correct)
+    
     def _save_results(self) -> None:
         """Save quiz results to state."""
+        if self.quiz_id is not None:
+            return
         try:
             from aidlc_explainer.state import StateManager
             state = StateManager()
@@ -7,8 +7,10 @@ from textual.widgets import Input, ListView, ListItem, Static
 from textual.binding import Binding
 
 from aidlc_explainer.screens.base import ExplorerScreen
-from aidlc_explainer.content import get_all_lessons, load_lesson
+from aidlc_explainer.content import get_all_lessons, load_lesson, snapshot
 from aidlc_explainer.content.glossary import get_all_terms
+from aidlc_explainer.content.models import GlossaryTerm
+from aidlc_explainer.content.watch import PackChange
 
 
 @dataclass
@@ -21,6 +23,170 @@ class SearchResult:
     context: dict
 
 
+def _quiz_entry(question: dict) -> SearchResult:
+    return SearchResult(
+        title=f"Quiz > {question.get('prompt', '')}",
+        type="quiz",
+        preview=question.get("explanation", ""),
+        target_screen="quiz",
+        context={},
+    )
+
+
+def _gate_entry(scenario: dict) -> SearchResult:
+    return SearchResult(
+        title=f"Gatekeeper > {scenario.get('phase', '')}: {scenario.get('stage', '')}",
+        type="gate",
+        preview=scenario.get("context", ""),
+        target_screen="gatekeeper",
+        context={},
+    )
+
+
+def _stage_entry(stage: dict) -> SearchResult:
+    return SearchResult(
+        title=f"Simulator > {stage.get('name', '')}",
+        type="stage",
+        preview=stage.get("description", ""),
+        target_screen="simulator",
+        context={},
+    )
+
+
+# Content pack -> (key of its item array, entry for an item)
+PACK_ENTRIES = {
+    "quiz": ("questions", _quiz_entry),
+    "gates": ("scenarios", _gate_entry),
+    "stages": ("stages", _stage_entry),
+}
+
+
+def _lesson_entries(lesson_meta: dict) -> list[SearchResult]:
+    if "pack" in lesson_meta:
+        # Listed from its pack's manifest, so the pack is not imported
+        return [SearchResult(
+            title=lesson_meta["title"],
+            type="lesson",
+            preview=lesson_meta["description"],
+            target_screen="lesson",
+            context={"lesson_id": lesson_meta["id"]},
+        )]
+    lesson = load_lesson(lesson_meta["id"])
+    
+    # Add lesson itself
+    entries = [SearchResult(
+        title=lesson.title,
+        type="lesson",
+        preview=lesson.description,
+        target_screen="lesson",
+        context={"lesson_id": lesson.id},
+    )]
+    
+    # Add each section
+    for i, section in enumerate(lesson.sections):
+        entries.append(SearchResult(
+            title=f"{lesson.title} > {section.title}",
+            type="section",
+            preview=section.content[:200].replace("\n", " "),
+            target_screen="lesson",
+            context={"lesson_id": lesson.id, "section": i},
+        ))
+    return entries
+
+
+def _term_entries(term: GlossaryTerm) -> list[SearchResult]:
+    return [SearchResult(
+        title=term.term,
+        type="glossary",
+        preview=term.definition,
+        target_screen="glossary",
+        context={"term_id": term.id},
+    )]
+
+
+class SearchIndex:
+    """Search entries for all content.
+    
+    Entries are kept per content item (a lesson with its sections, a
+    glossary term, a pack item), so a reloaded pack is patched where it
+    changed, and a locale switch rebuilds only the items it translates,
+    instead of everything being indexed again.
+    """
+    
+    def __init__(self) -> None:
+        # Group -> (item ID, the item's entries), in display order
+        self._groups: dict[str, list[tuple[str, list[SearchResult]]]] = {
+            "lessons": [(meta["id"], _lesson_entries(meta)) for meta in get_all_lessons()],
+            "glossary": [(term.id, _term_entries(term)) for term in get_all_terms()],
+        }
+        for section, (key, entry) in PACK_ENTRIES.items():
+            self._groups[section] = [
+                (item.get("id"), [entry(item)]) for item in snapshot.load(section)[key]
+            ]
+        self._entries: list[SearchResult] | None = None
+    
+    @property
+    def entries(self) -> list[SearchResult]:
+        """Every entry: lessons, sections and glossary terms, then pack items."""
+        if self._entries is None:
+            self._entries = [
+                entry for group in self._groups.values() for _, entries in group for entry in entries
+            ]
+        return self._entries
+    
+    def patch(self, change: PackChange) -> None:
+        """Replace the entries of the items a reload changed."""
+        if change.section not in PACK_ENTRIES or change.error is not None:
+            return
+        key, entry = PACK_ENTRIES[change.section]
+        items = snapshot.load(change.section)[key][change.start:change.start + change.added]
+        end = change.start + change.removed
+        self._groups[change.section][change.start:end] = [
+            (item.get("id"), [entry(item)]) for item in items
+        ]
+        self._entries = None
+    
+    def relocalize(self, item_ids: dict[str, set[str]]) -> int:
+        """Rebuild the entries of items whose text changed with the locale.
+        
+        Args:
+            item_ids: IDs of the translated items, by content section (see
+                `aidlc_explainer.content.locale.changed_items`)
+        
+        Returns:
+            The number of items rebuilt
+        """
+        wanted = dict(item_ids)
+        wanted["lessons"] = wanted.get("lessons", set()) | wanted.pop("lesson-index", set())
+        fresh = {}
+        if wanted["lessons"]:
+            fresh["lessons"] = {
+                meta["id"]: _lesson_entries(meta)
+                for meta in get_all_lessons() if meta["id"] in wanted["lessons"]
+            }
+        if wanted.get("glossary"):
+            fresh["glossary"] = {
+                term.id: _term_entries(term)
+                for term in get_all_terms() if term.id in wanted["glossary"]
+            }
+        for section, (key, entry) in PACK_ENTRIES.items():
+            if wanted.get(section):
+                fresh[section] = {
+                    item.get("id"): [entry(item)]
+                    for item in snapshot.load(section)[key] if item.get("id") in wanted[section]
+                }
+        rebuilt = 0
+        for group, entries in fresh.items():
+            items = self._groups[group]
+            for i, (item_id, _) in enumerate(items):
+                if item_id in entries:
+                    items[i] = (item_id, entries[item_id])
+                    rebuilt += 1
+        if rebuilt:
+            self._entries = None
+        return rebuilt
+
+
 class SearchResultItem(ListItem):
     """A search result list item."""
     
@@ -34,10 +200,13 @@ class SearchResultItem(ListItem):
             "section": "📄",
             "glossary": "📚",
             "artifact": "📁",
+            "quiz": "❓",
+            "gate": "🚦",
+            "stage": "🔬",
         }
         icon = type_icons.get(self.result.type, "•")
         yield Static(f"  {icon} {self.result.title}")
-        yield Static(f"     {self.result.preview[:60]}...", classes="preview")
+        yield Static(f"     {self.result.preview}", classes="preview")
 
 
 class SearchScreen(ExplorerScreen):
@@ -72,6 +241,8 @@ class SearchScreen(ExplorerScreen):
     
     SearchScreen .preview {
         color: $text-muted;
+        text-wrap: nowrap;
+        text-overflow: ellipsis;
     }
     
     SearchScreen .search-title {
@@ -94,52 +265,32 @@ class SearchScreen(ExplorerScreen):
     }
     """
     
-    def __init__(self) -> None:
+    CONTENT_SECTIONS = tuple(PACK_ENTRIES)
+    
+    def __init__(self, search_index: SearchIndex | None = None) -> None:
+        """Initialize the search screen.
+        
+        Args:
+            search_index: Index to search, kept up to date by its owner
+                (default: a new index of the content as it is now)
+        """
         super().__init__(title="Search")
         self.results: list[SearchResult] = []
-        self._build_index()
+        self.search_index = search_index if search_index is not None else SearchIndex()
     
-    def _build_index(self) -> None:
-        """Build search index from all content."""
-        self.index: list[SearchResult] = []
-        
-        # Index lessons and sections
-        for lesson_meta in get_all_lessons():
-            lesson = load_lesson(lesson_meta["id"])
-            
-            # Add lesson itself
-            self.index.append(SearchResult(
-                title=lesson.title,
-                type="lesson",
-                preview=lesson.description,
-                target_screen="lesson",
-                context={"lesson_id": lesson.id},
-            ))
-            
-            # Add each section
-            for i, section in enumerate(lesson.sections):
-                self.index.append(SearchResult(
-                    title=f"{lesson.title} > {section.title}",
-                    type="section",
-                    preview=section.content[:100].replace("\n", " "),
-                    target_screen="lesson",
-                    context={"lesson_id": lesson.id, "section": i},
-                ))
-        
-        # Index glossary terms
-        for term in get_all_terms():
-            self.index.append(SearchResult(
-                title=term.term,
-                type="glossary",
-                preview=term.definition[:100],
-                target_screen="glossary",
-                context={"term_id": term.id},
-            ))
+    @property
+    def index(self) -> list[SearchResult]:
+        """Every search entry."""
+        return self.search_index.entries
+    
+    def content_changed(self, changes: list[PackChange]) -> None:
+        """Search again, in the index the app has patched where packs changed."""
+        self._search(self.query_one("#search-input", Input).value)
     
     def compose_content(self) -> ComposeResult:
         with Vertical(id="search-container"):
             yield Static("🔍 Search AI-DLC Content", classes="search-title")
-            yield Input(placeholder="Type to search lessons, glossary, artifacts...", id="search-input")
+            yield Input(placeholder="Type to search lessons, glossary, practice, stages...", id="search-input")
             yield Static("Type to search", id="results-count")
             with VerticalScroll():
                 yield ListView(id="results-list")
@@ -150,7 +301,11 @@ class SearchScreen(ExplorerScreen):
     
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
-        query = event.value.strip().lower()
+        self._search(event.value)
+    
+    def _search(self, text: str) -> None:
+        """Show the entries matching a query, best first."""
+        query = text.strip().lower()
         
         if not query:
             self.results = []
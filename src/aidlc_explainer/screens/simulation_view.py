@@ -1,22 +1,22 @@
 """Simulation view screen showing stage timeline with questions, gates, and artifacts."""
 
-import json
-from pathlib import Path
 from typing import Any
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
 from textual.widgets import Static, Button, ListView, ListItem, RadioSet, RadioButton, Checkbox
+from textual.markup import escape
 from textual.reactive import reactive
 
-from aidlc_explainer.screens.base import ExplorerScreen
+from aidlc_explainer import layout, sources
+from aidlc_explainer.content import snapshot
+from aidlc_explainer.content.watch import PackChange
+from aidlc_explainer.screens.base import ExplorerScreen, follow_item
 
 
 def load_stages() -> dict[str, Any]:
-    """Load stage definitions from JSON."""
-    content_path = Path(__file__).parent.parent / "content" / "simulator" / "stages.json"
-    with open(content_path, encoding="utf-8") as f:
-        return json.load(f)
+    """Load stage definitions from the content."""
+    return snapshot.load("stages")
 
 
 class StageItem(ListItem):
@@ -204,6 +204,8 @@ class SimulationViewScreen(ExplorerScreen):
         ("s", "show_sources", "Sources"),
     ]
     
+    CONTENT_SECTIONS = ("stages",)
+    
     current_stage_index = reactive(0)
     
     def __init__(self, context: dict) -> None:
@@ -389,14 +391,38 @@ class SimulationViewScreen(ExplorerScreen):
         source = stage.get("source", {})
         local = source.get("local", "Not available")
         upstream = source.get("upstream", "Not available")
+        cited = sources.excerpt(local, max_lines=3) if "local" in source else None
+        quote = f"\n\n{escape(cited)}" if cited else ""
         
         self.notify(
             f"📁 Local: {local}\n"
-            f"🌐 Upstream: {upstream}",
+            f"🌐 Upstream: {upstream}{quote}",
             title=f"Sources: {stage['name']}",
             timeout=10
         )
     
+    def reflow(self) -> None:
+        """Redraw the stage detail for its new width."""
+        self._update_stage_detail()
+    
+    def content_changed(self, changes: list[PackChange]) -> None:
+        """Rebuild the timeline from the reloaded stages, staying on the current stage."""
+        old = self.active_stages
+        self.stage_data = load_stages()
+        self.active_stages = self._calculate_active_stages()
+        if not self.active_stages:
+            self._update_stage_detail()
+            return
+        self.current_stage_index = follow_item(old, self.active_stages, self.current_stage_index)
+        stage_list = self.query_one("#stage-list", ListView)
+        stage_list.clear()
+        stage_list.extend(
+            StageItem(stage, stage["status"], stage.get("phase_icon", ""))
+            for stage in self.active_stages
+        )
+        self.call_after_refresh(self._sync_list_selection)
+        self._update_stage_detail()
+    
     def _sync_list_selection(self) -> None:
         """Sync list view selection with current stage index."""
         try:
@@ -418,31 +444,33 @@ class SimulationViewScreen(ExplorerScreen):
         total = len(self.active_stages)
         
         # Build detail content
+        width = layout.content_width(detail, 62)
         lines = []
         
         # Header
         phase_icon = stage.get("phase_icon", "")
         status = stage.get("status", "conditional")
         status_text = "EXECUTE" if status == "execute" else "SKIP" if status == "skip" else "CONDITIONAL"
-        lines.append(f"╭─ {stage['name']} ({stage_num}/{total}) ──────────────────────────────────")
+        title = f"{stage['name']} ({stage_num}/{total})"
+        lines.append(f"╭{layout.rule(width - 1, title)}")
         lines.append(f"│  Phase: {phase_icon} {stage['phase'].upper()}")
         lines.append(f"│  Status: {status_text}")
-        lines.append(f"│  {stage['description']}")
-        lines.append(f"│  Reason: {stage.get('reason', 'N/A')}")
+        lines.extend(layout.wrap(stage['description'], width, indent="│  "))
+        lines.extend(layout.wrap(f"Reason: {stage.get('reason', 'N/A')}", width, indent="│  "))
         
         # Show phase ritual if available
         phase_data = next((p for p in self.stage_data.get("phases", []) 
                          if p["id"] == stage["phase"]), None)
         if phase_data and "ritual" in phase_data:
-            lines.append(f"│  Ritual: {phase_data['ritual']}")
+            lines.extend(layout.wrap(f"Ritual: {phase_data['ritual']}", width, indent="│  "))
         
-        lines.append("╰" + "─" * 60)
+        lines.append("╰" + "─" * (width - 1))
         lines.append("")
         
         # Questions Section
         questions = stage.get("questions", [])
         if questions:
-            lines.append("── Structured Questions ──────────────────────────────────────")
+            lines.append(layout.rule(width, "Structured Questions"))
             lines.append("")
             for i, q in enumerate(questions):
                 lines.append(f"  Q{i+1}: {q['text']}")
@@ -461,7 +489,7 @@ class SimulationViewScreen(ExplorerScreen):
         # Artifacts Section
         artifacts = stage.get("artifacts", [])
         if artifacts:
-            lines.append("── Artifacts Produced ────────────────────────────────────────")
+            lines.append(layout.rule(width, "Artifacts Produced"))
             lines.append("")
             for artifact in artifacts:
                 path = artifact.get("path", artifact) if isinstance(artifact, dict) else artifact
@@ -478,7 +506,7 @@ class SimulationViewScreen(ExplorerScreen):
             stage_id = stage["id"]
             decision = self.gate_decisions.get(stage_id, None)
             
-            lines.append("── Approval Gate ─────────────────────────────────────────────")
+            lines.append(layout.rule(width, "Approval Gate"))
             lines.append("")
             lines.append(f"  🚧 {gate_name}")
             
@@ -502,15 +530,18 @@ class SimulationViewScreen(ExplorerScreen):
             
             if not decision:
                 lines.append("")
-                lines.append("  ⚠️  Press [A] to Approve or [R] to Reject")
+                lines.append("  ⚠️  Press \\[A] to Approve or \\[R] to Reject")
             lines.append("")
         
         # Source reference
         source = stage.get("source", {})
         if source:
-            lines.append("── Source Reference ──────────────────────────────────────────")
+            lines.append(layout.rule(width, "Source Reference"))
             lines.append("")
             lines.append(f"  📁 Local: {source.get('local', 'N/A')}")
+            cited = sources.excerpt(source["local"]) if "local" in source else None
+            if cited:
+                lines.extend(escape(line) for line in layout.wrap(cited, width, indent="     │ "))
             lines.append(f"  🌐 Upstream: {source.get('upstream', 'N/A')}")
         
         detail.update("\n".join(lines))
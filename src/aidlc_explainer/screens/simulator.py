@@ -1,21 +1,18 @@
 """Simulator screen for request type and configuration selection."""
 
-import json
-from pathlib import Path
 from typing import Any
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Static, ListItem, ListView, Button, RadioSet, RadioButton
 
+from aidlc_explainer.content import snapshot
 from aidlc_explainer.screens.base import ExplorerScreen
 
 
 def load_request_types() -> dict[str, Any]:
-    """Load request types from JSON."""
-    content_path = Path(__file__).parent.parent / "content" / "simulator" / "request-types.json"
-    with open(content_path, encoding="utf-8") as f:
-        return json.load(f)
+    """Load request types from the content."""
+    return snapshot.load("request-types")
 
 
 class RequestTypeItem(ListItem):
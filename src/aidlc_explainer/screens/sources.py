@@ -4,6 +4,7 @@ from textual.app import ComposeResult
 from textual.containers import Vertical, VerticalScroll
 from textual.widgets import Static
 
+from aidlc_explainer import sources
 from aidlc_explainer.screens.base import ExplorerScreen
 
 
@@ -83,6 +84,14 @@ UPSTREAM_SOURCES = [
 ]
 
 
+def _availability(path: str) -> str:
+    """Whether a local source can be quoted from in this checkout."""
+    index = sources.RESOLVER.index(path)
+    if index is None:
+        return "Not in this checkout: cited passages are not shown"
+    return f"{len(index)} lines: cited passages are quoted alongside questions and stages"
+
+
 class SourcesScreen(ExplorerScreen):
     """Screen showing content sources."""
     
@@ -142,6 +151,8 @@ class SourcesScreen(ExplorerScreen):
                 for source in LOCAL_SOURCES:
                     yield Static(f"  • {source['path']}", classes="source-path")
                     yield Static(f"    {source['description']}", classes="source-desc")
+                    if not source['path'].endswith("/"):
+                        yield Static(f"    {_availability(source['path'])}", classes="source-desc")
                     yield Static("")
             
             # Upstream sources section
@@ -0,0 +1,306 @@
+"""Check that the local source references in the content packs still hold.
+
+Every reference to a local document (``sources.local`` in quiz questions
+and gate scenarios, ``source.local`` in stages and request types, and the
+``source_document``/``source_lines`` pair in pack metadata) is extracted
+and checked against the document's current text:
+
+    ok              the anchor is in range and cites the recorded text
+    stale           the anchor is in range, but the text there changed
+    out-of-range    the anchor points past the end of the document
+    invalid         the anchor cannot be parsed
+    unrecorded      the anchor is in range, but no text was recorded for it
+    missing         the document is not in this checkout
+
+The text each anchor cited when the content was last reviewed is kept in
+``content/source-anchors.json`` (written by ``--update``). When an anchor
+goes stale or out of range, that text is looked for in the current
+document, exactly and then fuzzily, to suggest where it moved.
+
+Each document is indexed once, each distinct reference is checked once,
+and a check is a slice of the indexed text, so the cost is dominated by
+reading the packs. Only anchors that need relocating pay for matching.
+"""
+
+import json
+import os
+import tempfile
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any
+
+from aidlc_explainer.sources import LineIndex, SourceRef, SourceResolver
+
+CONTENT_DIR = Path(__file__).parent / "content"
+CONTENT_PACKS = (
+    "practice/quiz.json",
+    "practice/gates.json",
+    "simulator/stages.json",
+    "simulator/request-types.json",
+)
+ANCHORS_FILE = "source-anchors.json"  # In the content directory
+ANCHORS_SCHEMA = "source-anchors-v1"
+MATCH_CUTOFF = 0.6  # Minimum similarity for a suggested relocation
+
+OK = "ok"
+STALE = "stale"
+OUT_OF_RANGE = "out-of-range"
+INVALID = "invalid"
+UNRECORDED = "unrecorded"
+MISSING = "missing"
+PROBLEMS = (STALE, OUT_OF_RANGE, INVALID)  # Statuses that fail the check
+
+
+@dataclass(frozen=True)
+class Citation:
+    """A reference to a local document, and where a content pack makes it."""
+    pack: str
+    location: str  # e.g. questions[3].sources.local[0]
+    ref: str
+
+
+@dataclass(frozen=True)
+class Finding:
+    """The outcome of checking one citation."""
+    citation: Citation
+    status: str
+    suggestion: str | None = None  # Where stale or out-of-range text moved to
+
+    def __str__(self) -> str:
+        citation = self.citation
+        text = f"{citation.pack} {citation.location}: {citation.ref} is {self.status}"
+        if self.suggestion:
+            text += f" (moved to {self.suggestion}?)"
+        return text
+
+
+def _walk(node: Any, location: str) -> Iterator[tuple[str, str]]:
+    """Yield ``(location, reference)`` for every local reference in a document."""
+    if isinstance(node, dict):
+        if isinstance(node.get("source_document"), str):
+            lines = node.get("source_lines")
+            ref = node["source_document"] + (f"#L{lines}" if lines else "")
+            yield f"{location}.source_document", ref
+        for key, value in node.items():
+            path = f"{location}.{key}" if location else key
+            if key in ("source", "sources") and isinstance(value, dict):
+                local = value.get("local")
+                if isinstance(local, str):
+                    yield f"{path}.local", local
+                elif isinstance(local, list):
+                    for i, ref in enumerate(local):
+                        yield f"{path}.local[{i}]", ref
+            else:
+                yield from _walk(value, path)
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            yield from _walk(value, f"{location}[{i}]")
+
+
+def extract_citations(
+    content_dir: Path = CONTENT_DIR,
+    packs: tuple[str, ...] = CONTENT_PACKS,
+) -> list[Citation]:
+    """Every local source reference in the content packs.
+
+    Raises:
+        OSError: If a pack cannot be read
+        ValueError: If a pack is not valid JSON
+    """
+    citations = []
+    for pack in packs:
+        with open(content_dir / pack, "r", encoding="utf-8") as f:
+            document = json.load(f)
+        citations.extend(Citation(pack, location, ref) for location, ref in _walk(document, ""))
+    return citations
+
+
+def _cited_parts(index: LineIndex, ref: SourceRef) -> list[str]:
+    """The text of each range of a reference."""
+    return [index.lines(start, end) for start, end in ref.ranges]
+
+
+def record_anchors(citations: list[Citation], resolver: SourceResolver) -> dict:
+    """The text every resolvable anchor cites now, as an anchors document."""
+    anchors = {}
+    for citation in citations:
+        try:
+            ref = SourceRef.parse(citation.ref)
+            index = resolver.index(ref.path)
+            if index is not None and ref.ranges:
+                anchors[citation.ref] = _cited_parts(index, ref)
+        except (ValueError, IndexError):
+            continue
+    return {"$schema": ANCHORS_SCHEMA, "anchors": dict(sorted(anchors.items()))}
+
+
+def load_anchors(path: Path) -> dict[str, list[str]]:
+    """Recorded anchor text, by reference.
+
+    Returns:
+        The recorded text, or an empty mapping if the file is missing
+
+    Raises:
+        ValueError: If the file is not an anchors file
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if not isinstance(document, dict) or document.get("$schema") != ANCHORS_SCHEMA:
+        raise ValueError(f"Not a {ANCHORS_SCHEMA} file: {path}")
+    return document["anchors"]
+
+
+def save_anchors(path: Path, document: dict) -> None:
+    """Write an anchors document atomically."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".source-anchors-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def relocate(index: LineIndex, text: str, near: int = 1) -> tuple[int, int] | None:
+    """Find where text now is in a document.
+
+    An exact match of whole lines wins. Otherwise every run of as many lines as the text
+    has is scored by similarity, nearest to ``near`` first, so a tie goes
+    to the closest run.
+
+    Args:
+        index: The document
+        text: Lines the anchor used to cite
+        near: Line the anchor used to start at
+
+    Returns:
+        The 1-based, inclusive line range, or None if nothing is similar enough
+    """
+    size = text.count("\n") + 1
+    document = index.text
+    position = document.find(text) if text.strip() else -1
+    while position != -1:
+        end = position + len(text)
+        before, after = document[position - 1:position], document[end:end + 1]
+        if before in ("", "\n") and after in ("", "\n"):  # Whole lines only
+            start = index.line_number(position)
+            return start, start + size - 1
+        position = document.find(text, position + 1)
+    if size > len(index):
+        return None
+
+    matcher = SequenceMatcher(None, autojunk=False)
+    matcher.set_seq2(text)  # The matcher caches what it learns about its second sequence
+    best, found = MATCH_CUTOFF, None
+    starts = sorted(range(1, len(index) - size + 2), key=lambda line: abs(line - near))
+    for start in starts:
+        matcher.set_seq1(index.lines(start, start + size - 1))
+        if matcher.real_quick_ratio() <= best or matcher.quick_ratio() <= best:
+            continue
+        score = matcher.ratio()
+        if score > best:
+            best, found = score, (start, start + size - 1)
+    return found
+
+
+def _suggest(index: LineIndex, ref: SourceRef, recorded: list[str] | None) -> str | None:
+    """Where the recorded text of a reference has moved to, as a reference."""
+    if not recorded or len(recorded) != len(ref.ranges):
+        return None
+    ranges = []
+    for (start, _), text in zip(ref.ranges, recorded, strict=True):
+        found = relocate(index, text, near=start)
+        if found is None:
+            return None
+        ranges.append(found)
+    return str(SourceRef(ref.path, tuple(ranges)))
+
+
+def check_reference(
+    ref_text: str,
+    resolver: SourceResolver,
+    recorded: list[str] | None,
+) -> tuple[str, str | None]:
+    """Check one reference.
+
+    Returns:
+        Its status and, for a stale or out-of-range anchor, a suggested
+        relocation (None if the text could not be found)
+    """
+    try:
+        ref = SourceRef.parse(ref_text)
+    except ValueError:
+        return INVALID, None
+    index = resolver.index(ref.path)
+    if index is None:
+        return MISSING, None
+    if not ref.ranges:
+        return OK, None
+    try:
+        current = _cited_parts(index, ref)
+    except IndexError:
+        return OUT_OF_RANGE, _suggest(index, ref, recorded)
+    if recorded is None:
+        return UNRECORDED, None
+    if current == recorded:
+        return OK, None
+    return STALE, _suggest(index, ref, recorded)
+
+
+def check_citations(
+    citations: list[Citation],
+    anchors: dict[str, list[str]],
+    resolver: SourceResolver | None = None,
+) -> list[Finding]:
+    """Check every citation against the current documents.
+
+    Each document is indexed once and each distinct reference is checked
+    once, however often it is cited.
+
+    Args:
+        citations: From `extract_citations`
+        anchors: Recorded text, from `load_anchors`
+        resolver: Where documents are found (default: the working directory
+            and the repository checkout)
+
+    Returns:
+        One finding per citation, in the order given
+    """
+    resolver = resolver or SourceResolver()
+    checked: dict[str, tuple[str, str | None]] = {}
+    findings = []
+    for citation in citations:
+        ref = citation.ref
+        if ref not in checked:
+            checked[ref] = check_reference(ref, resolver, anchors.get(ref))
+        status, suggestion = checked[ref]
+        findings.append(Finding(citation, status, suggestion))
+    return findings
+
+
+def format_report(findings: list[Finding]) -> str:
+    """Findings as text: problems and warnings first, then a count of each status."""
+    lines = []
+    for finding in findings:
+        if finding.status in PROBLEMS:
+            lines.append(f"❌ {finding}")
+        elif finding.status == UNRECORDED:
+            lines.append(f"⚠️  {finding}")
+    counts = Counter(finding.status for finding in findings)
+    missing = sorted({
+        SourceRef.parse(f.citation.ref).path for f in findings if f.status == MISSING
+    })
+    if missing:
+        lines.append(f"ℹ️  Not in this checkout, so not checked: {', '.join(missing)}")
+    packs = len({finding.citation.pack for finding in findings})
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    lines.append(f"{len(findings)} references in {packs} content packs: {summary or 'none'}")
+    return "\n".join(lines)
@@ -0,0 +1,203 @@
+"""Resolve local source references to the text they cite.
+
+Content packs cite the methodology documents with references such as
+``AI-SDLC_best-practice_method_principles.md#L80-99``: a path, optionally
+followed by an anchor naming one or more 1-based, inclusive line ranges
+(``#L89``, ``#L80-99``, ``#L89,L99``).
+
+Each referenced document is read once into a `LineIndex`, which records
+where every line starts, so an excerpt is a single slice of the text
+whatever its position in the file. Indexes are cached by path and
+revalidated against the file's modification time and size, so an edited
+document is re-read on its next use and an unchanged one never is.
+"""
+
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+# Where cited documents are looked for, relative to each root
+SEARCH_DIRS = ("", "references", "references/aidlc-docs")
+EXCERPT_LINES = 6  # Lines shown inline before an excerpt is cut short
+ELLIPSIS = "…"
+
+_RANGE = re.compile(r"L(\d+)(?:-L?(\d+))?")
+
+
+@dataclass(frozen=True)
+class SourceRef:
+    """A parsed local source reference."""
+    path: str
+    ranges: tuple[tuple[int, int], ...] = ()  # 1-based, inclusive
+
+    @classmethod
+    def parse(cls, ref: str) -> "SourceRef":
+        """Parse ``path#L1-5,L9`` into a path and its line ranges.
+
+        Raises:
+            ValueError: If the anchor is not a list of line ranges
+        """
+        path, _, anchor = ref.strip().partition("#")
+        if not path:
+            raise ValueError(f"Source reference has no path: {ref!r}")
+        ranges = []
+        for part in anchor.split(",") if anchor else ():
+            match = _RANGE.fullmatch(part.strip())
+            if not match:
+                raise ValueError(f"Invalid line anchor in source reference: {ref!r}")
+            start = int(match.group(1))
+            end = int(match.group(2) or start)
+            if not 1 <= start <= end:
+                raise ValueError(f"Invalid line range in source reference: {ref!r}")
+            ranges.append((start, end))
+        return cls(path, tuple(ranges))
+
+    def __str__(self) -> str:
+        if not self.ranges:
+            return self.path
+        anchor = ",".join(f"L{a}" if a == b else f"L{a}-{b}" for a, b in self.ranges)
+        return f"{self.path}#{anchor}"
+
+
+class LineIndex:
+    """A document's text with the offset at which each line starts."""
+
+    def __init__(self, text: str, mtime_ns: int = 0, size: int = 0):
+        self.text = text
+        self.mtime_ns = mtime_ns
+        self.size = size
+        starts = array("L", [0])
+        find = text.find
+        position = find("\n")
+        while position != -1:
+            starts.append(position + 1)
+            position = find("\n", position + 1)
+        if starts[-1] < len(text):
+            starts.append(len(text))  # The last line has no newline
+        self._starts = starts
+
+    @classmethod
+    def read(cls, path: Path) -> "LineIndex":
+        """Index a file.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = path.stat()
+        return cls(path.read_text(encoding="utf-8"), stat.st_mtime_ns, stat.st_size)
+
+    def __len__(self) -> int:
+        """Number of lines."""
+        return len(self._starts) - 1
+
+    def line(self, number: int) -> str:
+        """One line, 1-based, without its line break."""
+        return self.lines(number, number)
+
+    def line_number(self, offset: int) -> int:
+        """The 1-based line a character offset falls on."""
+        return min(bisect_right(self._starts, offset), len(self))
+
+    def lines(self, start: int, end: int) -> str:
+        """Lines ``start`` to ``end`` (1-based, inclusive) as one string.
+
+        Raises:
+            IndexError: If the range is outside the document
+        """
+        if not 1 <= start <= end <= len(self):
+            raise IndexError(f"Lines {start}-{end} are outside a {len(self)}-line document")
+        return self.text[self._starts[start - 1]:self._starts[end]].rstrip("\n")
+
+
+class SourceResolver:
+    """Finds cited documents and returns the text a reference points at."""
+
+    def __init__(self, roots: list[Path] | None = None):
+        """Create a resolver.
+
+        Args:
+            roots: Directories to look for documents in (default: the
+                working directory, then the repository checkout)
+        """
+        self.roots = roots
+        self._indexes: dict[Path, LineIndex] = {}
+        self._lock = threading.Lock()
+
+    def find(self, path: str) -> Path | None:
+        """The file a reference path names, if it exists."""
+        roots = self.roots if self.roots is not None else [Path.cwd(), REPO_ROOT]
+        for root in roots:
+            for directory in SEARCH_DIRS:
+                candidate = root / directory / path
+                if candidate.is_file():
+                    return candidate
+        return None
+
+    def index(self, path: str) -> LineIndex | None:
+        """The line index of a document, re-read only if the file changed.
+
+        Returns:
+            The index, or None if the document cannot be found or read
+        """
+        found = self.find(path)
+        if found is None:
+            return None
+        try:
+            stat = found.stat()
+            with self._lock:
+                cached = self._indexes.get(found)
+                if cached and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+                    return cached
+            index = LineIndex.read(found)
+        except (OSError, UnicodeDecodeError):
+            return None
+        with self._lock:
+            self._indexes[found] = index
+        return index
+
+    def excerpt(self, ref: str | SourceRef, max_lines: int | None = None) -> str | None:
+        """The text a reference cites.
+
+        Separate ranges are joined with an ellipsis line. A reference
+        without an anchor cites nothing in particular and has no excerpt.
+
+        Args:
+            ref: A reference string or parsed reference
+            max_lines: Drop blank lines and cut the excerpt to this many
+                lines, ending it with an ellipsis line
+
+        Returns:
+            The cited text, or None if the reference cannot be resolved
+        """
+        try:
+            if isinstance(ref, str):
+                ref = SourceRef.parse(ref)
+            index = self.index(ref.path)
+            if index is None or not ref.ranges:
+                return None
+            parts = [index.lines(start, end) for start, end in ref.ranges]
+        except (ValueError, IndexError):
+            return None
+        lines = f"\n{ELLIPSIS}\n".join(parts).split("\n")
+        if max_lines is not None:
+            lines = [line for line in lines if line.strip()]
+            if len(lines) > max_lines:
+                lines = lines[:max_lines] + [ELLIPSIS]
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """Forget every index."""
+        with self._lock:
+            self._indexes.clear()
+
+
+RESOLVER = SourceResolver()  # Shared by every screen
+
+
+def excerpt(ref: str, max_lines: int | None = EXCERPT_LINES) -> str | None:
+    """The text a reference cites, from the shared resolver."""
+    return RESOLVER.excerpt(ref, max_lines)
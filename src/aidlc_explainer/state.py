@@ -1,13 +1,39 @@
-"""State management for progress persistence."""
+"""State management for progress persistence.
+
+The state is an immutable document (see `aidlc_explainer.persistent`):
+every change makes a new version that shares its unchanged branches with
+the last one. Holding on to a version is a free snapshot, comparing two
+is proportional to what changed, and getters are computed once per
+version.
+"""
 
 import json
-from datetime import datetime
+import sqlite3
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from functools import cache, wraps
 from pathlib import Path
 from typing import Any
 
+from aidlc_explainer import events
+from aidlc_explainer.achievements import load_achievements
+from aidlc_explainer.events import EventLog, Replay, open_event_log
+from aidlc_explainer.migrations import STATE_SCHEMA, migrate, schema_version
+from aidlc_explainer.persistent import FrozenDict, assoc, diff, dissoc, freeze, get_in, thaw
+from aidlc_explainer.storage import (
+    JSON_FILE,
+    StateBackend,
+    default_learner,
+    open_backend,
+    revision_of,
+)
+
 
+@cache
 def _get_quiz_question_count() -> int:
-    """Get the actual number of quiz questions from the JSON file."""
+    """Get the actual number of quiz questions from the JSON file (read once)."""
     try:
         quiz_path = Path(__file__).parent / "content" / "practice" / "quiz.json"
         with open(quiz_path, "r", encoding="utf-8") as f:
@@ -17,8 +43,8 @@ def _get_quiz_question_count() -> int:
         return 24  # Default fallback
 
 
-DEFAULT_STATE = {
-    "$schema": "state-v1",
+DEFAULT_STATE = freeze({
+    "$schema": STATE_SCHEMA,
     "version": "1.0.0",
     "last_updated": None,
     "first_opened": None,
@@ -63,7 +89,10 @@ DEFAULT_STATE = {
         "streak_days": 0,
         "last_session_date": None,
     },
-}
+})
+
+# Saved versions kept for `StateManager.undo`
+HISTORY_SIZE = 32
 
 # XP rewards for various actions
 XP_REWARDS = {
@@ -91,69 +120,280 @@ LEVEL_THRESHOLDS = [
     (4000, "AI-DLC Champion"),
 ]
 
+# How concurrent changes to a field are combined (see `merge_states`)
+ADDITIVE_FIELDS = {
+    ("gamification", "xp"),
+    ("quiz", "attempts"),
+    ("gatekeeper", "attempts"),
+    ("simulator", "runs"),
+    ("stats", "total_sessions"),
+    ("stats", "total_time_seconds"),
+}
+MAX_FIELDS = {
+    ("quiz", "best_score"),
+    ("quiz", "completed"),
+    ("gatekeeper", "best_score"),
+    ("gatekeeper", "completed"),
+}
+UNION_FIELDS = {
+    ("lessons", "completed"),
+    ("achievements", "unlocked"),
+    ("simulator", "request_types_explored"),
+}
+
+_MISSING = object()
+
+
+def level_for_xp(xp: int) -> tuple[int, str]:
+    """Level number and title for an XP total."""
+    level, title = 1, LEVEL_THRESHOLDS[0][1]
+    for index, (threshold, name) in enumerate(LEVEL_THRESHOLDS):
+        if xp >= threshold:
+            level, title = index + 1, name
+    return level, title
+
+
+def format_duration(seconds: int) -> str:
+    """Format a duration as e.g. "1h 05m" or "12m"."""
+    hours, minutes = divmod(seconds // 60, 60)
+    return f"{hours}h {minutes:02d}m" if hours else f"{minutes}m"
+
+
+def _merge_value(path: tuple[str, ...], base: Any, ours: Any, theirs: Any) -> Any:
+    """Three-way merge of one field; returns _MISSING to drop it."""
+    if path in ADDITIVE_FIELDS:
+        def number(value: Any) -> Any:
+            return 0 if value is _MISSING or value is None else value
+        return number(theirs) + number(ours) - number(base)
+    if path in MAX_FIELDS:
+        present = [v for v in (ours, theirs) if v is not _MISSING and v is not None]
+        return max(present) if present else _MISSING
+    if path in UNION_FIELDS:
+        merged = list(theirs) if isinstance(theirs, list) else []
+        if isinstance(ours, list):
+            merged.extend(item for item in ours if item not in merged)
+        return merged
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        base = base if isinstance(base, dict) else {}
+        merged = {}
+        for key in [*theirs, *(k for k in ours if k not in theirs)]:
+            value = _merge_value(
+                (*path, key),
+                base.get(key, _MISSING),
+                ours.get(key, _MISSING),
+                theirs.get(key, _MISSING),
+            )
+            if value is not _MISSING:
+                merged[key] = value
+        return merged
+    # Anything else: our value if we changed it, otherwise theirs
+    return ours if ours != base else theirs
+
+
+def merge_states(
+    base: dict[str, Any], ours: dict[str, Any], theirs: dict[str, Any]
+) -> dict[str, Any]:
+    """Merge concurrent changes to a state document.
+
+    `ours` and `theirs` were both derived from `base`. Counters such as XP
+    and attempts add both sides' increments, best scores take the maximum,
+    completed lessons and achievements take the union, and any other field
+    keeps whichever side changed it (ours if both did).
+
+    Args:
+        base: The document both sides started from
+        ours: Our updated document
+        theirs: The document another writer stored
+
+    Returns:
+        The merged document
+    """
+    merged = _merge_value((), base, ours, theirs)
+    lessons = merged.get("lessons", {})
+    for lesson_id in lessons.get("completed", []):
+        lessons.get("in_progress", {}).pop(lesson_id, None)
+    if "gamification" in merged:
+        xp = merged["gamification"].get("xp", 0)
+        merged["gamification"]["level"], merged["gamification"]["title"] = level_for_xp(xp)
+    return merged
+
+
+def _derived(getter: Callable[["StateManager"], Any]) -> Callable[["StateManager"], Any]:
+    """Compute a getter's (frozen) result once per version of the state."""
+    @wraps(getter)
+    def cached(self: "StateManager") -> Any:
+        version, value = self._views.get(getter.__name__, (None, None))
+        if version is not self._state:
+            value = freeze(getter(self))
+            self._views[getter.__name__] = (self._state, value)
+        return value
+    return cached
+
 
 class StateManager:
     """Manages persistent state for the application."""
     
     STATE_DIR = ".aidlc-explainer"
-    STATE_FILE = "state.json"
+    STATE_FILE = JSON_FILE
     
-    def __init__(self, base_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        backend: StateBackend | None = None,
+        learner_id: str | None = None,
+        event_log: EventLog | None = None,
+    ) -> None:
         """Initialize state manager.
         
         Args:
             base_path: Base directory for state storage (defaults to cwd)
+            backend: Storage backend (defaults to the one configured by
+                ``AIDLC_STATE_BACKEND``, see `aidlc_explainer.storage`)
+            learner_id: Learner whose state to use (defaults to ``AIDLC_LEARNER``
+                or the login name; the JSON backend stores a single learner)
+            event_log: Where learning events are recorded (defaults to the
+                learner's log under the state directory)
         """
         self.base_path = base_path or Path.cwd()
         self.state_dir = self.base_path / self.STATE_DIR
         self.state_file = self.state_dir / self.STATE_FILE
-        self._state: dict[str, Any] = {}
+        self.backend = backend or open_backend(self.state_dir)
+        self.learner_id = learner_id or default_learner()
+        self.achievements = load_achievements(self.state_dir)
+        self.events = event_log or open_event_log(self.state_dir, self.learner_id)
+        self._session_started: float | None = None
+        # Stored state this app cannot upgrade is never overwritten
+        self.read_only = False
+        self._state: FrozenDict = DEFAULT_STATE
+        self._base: FrozenDict = DEFAULT_STATE  # State as last loaded or saved
+        self._history: deque[FrozenDict] = deque(maxlen=HISTORY_SIZE)  # Earlier saves
+        self._views: dict[str, tuple[FrozenDict, Any]] = {}  # Getter -> (version, result)
         self._load()
     
-    def _ensure_dir(self) -> None:
-        """Ensure state directory exists."""
-        self.state_dir.mkdir(parents=True, exist_ok=True)
-    
     def _load(self) -> None:
-        """Load state from file or create default."""
+        """Load state from the backend, upgrading older schema versions, or create default.
+        
+        State from a newer version of the app, or that a migration fails on,
+        is left as stored: the session starts from defaults and is not saved.
+        """
+        self.read_only = False
+        state = DEFAULT_STATE
+        try:
+            stored = self.backend.load(self.learner_id)
+        except (ValueError, OSError, sqlite3.Error):  # Includes json.JSONDecodeError
+            stored = None
+        if schema_version(stored) is None:
+            # Overwrite, rather than merge with, an unusable document
+            revision = revision_of(stored if isinstance(stored, dict) else None)
+            state = assoc(state, ("revision",), revision)
+        else:
+            try:
+                state = freeze(migrate(stored))
+            except ValueError:
+                self.read_only = True
+        self._state = self._base = state
+    
+    def reload(self) -> bool:
+        """Pick up progress saved by other instances since the last load or save.
+        
+        Returns:
+            Whether the state changed; if it did not, the current version
+            (and everything derived from it) is kept
+        """
+        current = self._state
+        self._load()
+        if revision_of(self._state) == revision_of(current):
+            self._state = self._base = current
+        return self._state is not current
+    
+    def _set(self, path: tuple[str, ...], value: Any) -> None:
+        """Make a new version of the state with the field at `path` replaced."""
+        self._state = assoc(self._state, path, value)
+    
+    @property
+    def snapshot(self) -> FrozenDict:
+        """The state as it is now, which later changes leave untouched."""
+        return self._state
+    
+    def changes_since(self, snapshot: FrozenDict) -> list[str]:
+        """Dotted paths of the fields that changed since a snapshot."""
+        return [".".join(path) for path in diff(snapshot, self._state)]
+    
+    def undo(self) -> bool:
+        """Go back to the state before the last save, and save that.
+        
+        Changes other instances saved since this one last loaded or saved
+        are merged in as usual; the event log is append-only and keeps the
+        events of the undone changes.
+        
+        Returns:
+            False if there is nothing to undo
+        """
+        if not self._history or self.read_only:
+            return False
+        previous = self._history.pop()
+        # Based on the stored revision, so it replaces rather than merges
+        # with the version being undone
+        self._state = assoc(previous, ("revision",), revision_of(self._base))
+        self._save(record=False)
+        return True
+    
+    def _save(self, merge: bool = True, record: bool = True) -> None:
+        """Save current state, merging in changes saved by other instances.
+        
+        Args:
+            merge: If False, overwrite whatever is stored
+            record: If False, do not keep the version being replaced for `undo`
+        """
+        if self.read_only:
+            return
         try:
-            if self.state_file.exists():
-                with open(self.state_file, "r", encoding="utf-8") as f:
-                    self._state = json.load(f)
-                # Validate schema version
-                if self._state.get("$schema") != "state-v1":
-                    self._state = DEFAULT_STATE.copy()
-            else:
-                self._state = DEFAULT_STATE.copy()
-        except (json.JSONDecodeError, IOError):
-            self._state = DEFAULT_STATE.copy()
-    
-    def _save(self) -> None:
-        """Save current state to file."""
+            self._set(("last_updated",), datetime.utcnow().isoformat() + "Z")
+            ours, base = self._state, self._base
+            written = self.backend.save(
+                self.learner_id,
+                ours,
+                # Another instance may have saved an older schema version
+                (lambda theirs: merge_states(thaw(base), thaw(ours), migrate(theirs)))
+                if merge else None,
+            )
+            # Unless merged, only the top level is new; the branches are ours
+            self._state = self._base = freeze(written)
+            if record:
+                self._history.append(base)
+        except (ValueError, OSError, sqlite3.Error):
+            pass  # Fail silently - state is optional; ValueError: theirs is newer
+    
+    def _record(self, kind: int, name: str = "", value: int = 0) -> None:
+        """Append a learning event to the event log."""
         try:
-            self._ensure_dir()
-            self._state["last_updated"] = datetime.utcnow().isoformat() + "Z"
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(self._state, f, indent=2)
-        except IOError:
-            pass  # Fail silently - state is optional
+            self.events.append(kind, name, value)
+        except (OSError, OverflowError):
+            pass  # Fail silently - the event log is optional
+    
+    def close(self) -> None:
+        """Release the storage backend."""
+        self.backend.close()
     
     def reset(self) -> None:
-        """Reset all progress to defaults."""
-        self._state = DEFAULT_STATE.copy()
-        self._save()
+        """Reset all progress to defaults, even over state this app could not read."""
+        self._state = DEFAULT_STATE
+        self.read_only = False
+        self._save(merge=False)
     
     # XP and Level methods
     def add_xp(self, action: str, multiplier: float = 1.0) -> int:
         """Add XP for an action and return the amount added."""
         if "gamification" not in self._state:
-            self._state["gamification"] = DEFAULT_STATE["gamification"].copy()
+            self._set(("gamification",), DEFAULT_STATE["gamification"])
         
         base_xp = XP_REWARDS.get(action, 0)
         xp_gained = int(base_xp * multiplier)
         
-        self._state["gamification"]["xp"] = self._state["gamification"].get("xp", 0) + xp_gained
+        self._set(("gamification", "xp"), self._state["gamification"].get("xp", 0) + xp_gained)
         self._update_level()
+        self._check_achievements(("gamification.xp", "gamification.level"))
+        self._record(events.XP, action, xp_gained)
         self._save()
         
         return xp_gained
@@ -161,18 +401,11 @@ class StateManager:
     def _update_level(self) -> None:
         """Update level based on current XP."""
         xp = self._state["gamification"].get("xp", 0)
-        
-        new_level = 1
-        new_title = "Novice"
-        
-        for threshold, title in LEVEL_THRESHOLDS:
-            if xp >= threshold:
-                new_level = LEVEL_THRESHOLDS.index((threshold, title)) + 1
-                new_title = title
-        
-        self._state["gamification"]["level"] = new_level
-        self._state["gamification"]["title"] = new_title
+        level, title = level_for_xp(xp)
+        self._set(("gamification", "level"), level)
+        self._set(("gamification", "title"), title)
     
+    @_derived
     def get_gamification_stats(self) -> dict[str, Any]:
         """Get gamification statistics."""
         gam = self._state.get("gamification", DEFAULT_STATE["gamification"])
@@ -198,6 +431,7 @@ class StateManager:
         }
     
     # Quiz state methods
+    @_derived
     def get_quiz_stats(self) -> dict[str, Any]:
         """Get quiz statistics."""
         quiz = self._state.get("quiz", DEFAULT_STATE["quiz"])
@@ -227,18 +461,19 @@ class StateManager:
         if score == total:
             self.add_xp("quiz_perfect")
         
-        self._state["quiz"] = {
+        self._set(("quiz",), {
             "completed": True,
             "last_score": score,
             "total_questions": total,
             "attempts": self._state.get("quiz", {}).get("attempts", 0) + 1,
             "mistakes": mistakes,
             "best_score": max(self._state.get("quiz", {}).get("best_score", 0), score),
-        }
-        self._check_achievements()
+        })
+        self._check_achievements(("quiz",))
         self._save()
     
     # Gatekeeper state methods
+    @_derived
     def get_gate_stats(self) -> dict[str, Any]:
         """Get gatekeeper statistics."""
         gate = self._state.get("gatekeeper", DEFAULT_STATE["gatekeeper"])
@@ -259,18 +494,19 @@ class StateManager:
             mistakes: List of scenario IDs evaluated incorrectly
         """
         current_best = self._state.get("gatekeeper", {}).get("best_score", 0)
-        self._state["gatekeeper"] = {
+        self._set(("gatekeeper",), {
             "completed": True,
             "last_score": score,
             "total_scenarios": total,
             "attempts": self._state.get("gatekeeper", {}).get("attempts", 0) + 1,
             "mistakes": mistakes,
             "best_score": max(current_best, score),
-        }
-        self._check_achievements()
+        })
+        self._check_achievements(("gatekeeper",))
         self._save()
     
     # Lesson state methods
+    @_derived
     def get_lessons_stats(self) -> dict[str, Any]:
         """Get lesson statistics."""
         lessons = self._state.get("lessons", DEFAULT_STATE["lessons"])
@@ -284,45 +520,42 @@ class StateManager:
     def mark_lesson_started(self, lesson_id: str) -> None:
         """Mark a lesson as started."""
         if "lessons" not in self._state:
-            self._state["lessons"] = DEFAULT_STATE["lessons"].copy()
+            self._set(("lessons",), DEFAULT_STATE["lessons"])
         if lesson_id not in self._state["lessons"].get("completed", []):
-            self._state["lessons"]["in_progress"][lesson_id] = {
+            self._set(("lessons", "in_progress", lesson_id), {
                 "started_at": datetime.utcnow().isoformat() + "Z",
                 "last_section": 0,
-            }
+            })
         self._save()
     
     def update_lesson_progress(self, lesson_id: str, section_index: int) -> None:
         """Update progress within a lesson."""
         if "lessons" not in self._state:
-            self._state["lessons"] = DEFAULT_STATE["lessons"].copy()
-        if "in_progress" not in self._state["lessons"]:
-            self._state["lessons"]["in_progress"] = {}
-        self._state["lessons"]["in_progress"][lesson_id] = {
-            "started_at": self._state["lessons"]["in_progress"].get(lesson_id, {}).get(
-                "started_at", datetime.utcnow().isoformat() + "Z"
-            ),
+            self._set(("lessons",), DEFAULT_STATE["lessons"])
+        started_at = get_in(self._state, ("lessons", "in_progress", lesson_id, "started_at"))
+        self._set(("lessons", "in_progress", lesson_id), {
+            "started_at": started_at or datetime.utcnow().isoformat() + "Z",
             "last_section": section_index,
-        }
+        })
+        self._record(events.LESSON_SECTION, lesson_id, section_index)
         self._save()
     
     def mark_lesson_completed(self, lesson_id: str) -> None:
         """Mark a lesson as completed."""
         if "lessons" not in self._state:
-            self._state["lessons"] = DEFAULT_STATE["lessons"].copy()
+            self._set(("lessons",), DEFAULT_STATE["lessons"])
         completed = self._state["lessons"].get("completed", [])
         if lesson_id not in completed:
-            completed.append(lesson_id)
-            self._state["lessons"]["completed"] = completed
+            self._set(("lessons", "completed"), [*completed, lesson_id])
             # Award XP for completing a new lesson
             self.add_xp("lesson_completed")
         # Remove from in_progress
-        if lesson_id in self._state["lessons"].get("in_progress", {}):
-            del self._state["lessons"]["in_progress"][lesson_id]
-        self._check_achievements()
+        self._state = dissoc(self._state, ("lessons", "in_progress", lesson_id))
+        self._check_achievements(("lessons.completed",))
         self._save()
     
     # Simulator state methods
+    @_derived
     def get_simulator_stats(self) -> dict[str, Any]:
         """Get simulator statistics."""
         sim = self._state.get("simulator", DEFAULT_STATE["simulator"])
@@ -335,24 +568,97 @@ class StateManager:
     def record_simulation_run(self, request_type: str) -> None:
         """Record a simulation run."""
         if "simulator" not in self._state:
-            self._state["simulator"] = DEFAULT_STATE["simulator"].copy()
-        self._state["simulator"]["runs"] = self._state["simulator"].get("runs", 0) + 1
+            self._set(("simulator",), DEFAULT_STATE["simulator"])
+        self._set(("simulator", "runs"), self._state["simulator"].get("runs", 0) + 1)
         explored = self._state["simulator"].get("request_types_explored", [])
+        is_new_type = request_type not in explored
+        if is_new_type:
+            self._set(("simulator", "request_types_explored"), [*explored, request_type])
+        self._set(("simulator", "last_run"), datetime.utcnow().isoformat() + "Z")
         
-        # Award XP for simulation run
+        # Award XP only once the run is recorded: each award saves, and a
+        # save that merges makes a version without it.
         self.add_xp("simulator_run")
-        
-        if request_type not in explored:
-            explored.append(request_type)
-            self._state["simulator"]["request_types_explored"] = explored
+        if is_new_type:
             # Bonus XP for exploring a new type
             self.add_xp("simulator_new_type")
         
-        self._state["simulator"]["last_run"] = datetime.utcnow().isoformat() + "Z"
-        self._check_achievements()
+        self._check_achievements(("simulator",))
+        self._save()
+    
+    # Answer events (the scores themselves are saved with the results)
+    def record_quiz_answer(self, question_id: str, correct: bool) -> None:
+        """Record a single quiz answer in the event log."""
+        self._record(events.QUIZ_ANSWER, question_id, int(correct))
+    
+    def record_gate_decision(self, scenario_id: str, correct: bool) -> None:
+        """Record a single gatekeeper decision in the event log."""
+        self._record(events.GATE_DECISION, scenario_id, int(correct))
+    
+    # Session and activity methods
+    def start_session(self, today: date | None = None) -> None:
+        """Count a new session and extend or restart the daily streak.
+        
+        Args:
+            today: The local date (defaults to today)
+        """
+        stats = self._state.get("stats", DEFAULT_STATE["stats"])
+        today = today or date.today()
+        last = stats.get("last_session_date")
+        if last != today.isoformat():
+            yesterday = (today - timedelta(days=1)).isoformat()
+            streak = stats.get("streak_days", 0) + 1 if last == yesterday else 1
+            stats = assoc(stats, ("streak_days",), streak)
+            stats = assoc(stats, ("last_session_date",), today.isoformat())
+        self._set(("stats",), assoc(stats, ("total_sessions",), stats.get("total_sessions", 0) + 1))
+        if not self._state.get("first_opened"):
+            self._set(("first_opened",), datetime.utcnow().isoformat() + "Z")
+        self._session_started = time.monotonic()
+        self._record(events.SESSION_START)
+        self._save()
+    
+    def end_session(self) -> int:
+        """Add the time since `start_session` to the total and return it in seconds."""
+        if self._session_started is None:
+            return 0
+        seconds = int(time.monotonic() - self._session_started)
+        self._session_started = None
+        stats = self._state.get("stats", DEFAULT_STATE["stats"])
+        self._set(("stats",), assoc(
+            stats, ("total_time_seconds",), stats.get("total_time_seconds", 0) + seconds
+        ))
+        self._record(events.SESSION_END, value=seconds)
         self._save()
+        return seconds
+    
+    def replay_events(self) -> Replay:
+        """Fold the event log from its latest snapshot."""
+        return self.events.replay()
+    
+    def get_activity_stats(self, today: date | None = None) -> dict[str, Any]:
+        """Get session, streak and recent XP statistics.
+        
+        Args:
+            today: The local date (defaults to today)
+        """
+        stats = self._state.get("stats", DEFAULT_STATE["stats"])
+        today = today or date.today()
+        streak = stats.get("streak_days", 0)
+        last = stats.get("last_session_date")
+        # A streak survives until a whole day passes without a session
+        if last is None or last < (today - timedelta(days=1)).isoformat():
+            streak = 0
+        daily_xp = self.replay_events().daily_xp
+        week = [(today - timedelta(days=n)).isoformat() for n in range(7)]
+        return {
+            "streak_days": streak,
+            "total_sessions": stats.get("total_sessions", 0),
+            "total_time_seconds": stats.get("total_time_seconds", 0),
+            "xp_this_week": sum(daily_xp.get(day, 0) for day in week),
+        }
     
     # Achievement methods
+    @_derived
     def get_achievements(self) -> dict[str, Any]:
         """Get achievement status."""
         ach = self._state.get("achievements", DEFAULT_STATE["achievements"])
@@ -361,81 +667,23 @@ class StateManager:
             "progress": ach.get("progress", {}),
         }
     
-    def _check_achievements(self) -> None:
-        """Check and unlock achievements based on current state."""
+    def _check_achievements(self, changed: tuple[str, ...] | None = None) -> None:
+        """Unlock achievements whose rules are now satisfied.
+        
+        Args:
+            changed: State paths that changed; only rules reading them are
+                evaluated. None evaluates every rule.
+        """
         if "achievements" not in self._state:
-            self._state["achievements"] = DEFAULT_STATE["achievements"].copy()
+            self._set(("achievements",), DEFAULT_STATE["achievements"])
         
         unlocked = self._state["achievements"].get("unlocked", [])
-        
-        # Achievement definitions
-        achievements = [
-            ("first-steps", self._check_first_steps),
-            ("scholar", self._check_scholar),
-            ("quiz-master", self._check_quiz_master),
-            ("perfect-score", self._check_perfect_score),
-            ("gatekeeper", self._check_gatekeeper_ach),
-            ("simulator-explorer", self._check_simulator_explorer),
-            ("completionist", self._check_completionist),
-        ]
-        
-        for ach_id, check_fn in achievements:
-            if ach_id not in unlocked and check_fn():
-                unlocked.append(ach_id)
-        
-        self._state["achievements"]["unlocked"] = unlocked
-    
-    def _check_first_steps(self) -> bool:
-        """Check if user completed first lesson."""
-        return len(self._state.get("lessons", {}).get("completed", [])) >= 1
-    
-    def _check_scholar(self) -> bool:
-        """Check if user completed all lessons."""
-        completed = len(self._state.get("lessons", {}).get("completed", []))
-        return completed >= 6
-    
-    def _check_quiz_master(self) -> bool:
-        """Check if user scored 80%+ on quiz."""
-        quiz = self._state.get("quiz", {})
-        if not quiz.get("completed"):
-            return False
-        best = quiz.get("best_score", quiz.get("last_score", 0))
-        total = quiz.get("total_questions", 12)
-        return best >= total * 0.8
-    
-    def _check_perfect_score(self) -> bool:
-        """Check if user got 100% on quiz."""
-        quiz = self._state.get("quiz", {})
-        if not quiz.get("completed"):
-            return False
-        best = quiz.get("best_score", quiz.get("last_score", 0))
-        total = quiz.get("total_questions", 12)
-        return best >= total
-    
-    def _check_gatekeeper_ach(self) -> bool:
-        """Check if user completed gatekeeper with 80%+."""
-        gate = self._state.get("gatekeeper", {})
-        if not gate.get("completed"):
-            return False
-        best = gate.get("best_score", gate.get("last_score", 0))
-        total = gate.get("total_scenarios", 10)
-        return best >= total * 0.8
-    
-    def _check_simulator_explorer(self) -> bool:
-        """Check if user explored all 4 request types."""
-        explored = self._state.get("simulator", {}).get("request_types_explored", [])
-        return len(explored) >= 4
-    
-    def _check_completionist(self) -> bool:
-        """Check if user completed everything."""
-        return (
-            self._check_scholar() and
-            self._check_quiz_master() and
-            self._check_gatekeeper_ach() and
-            self._check_simulator_explorer()
-        )
+        newly = self.achievements.evaluate(self._state, unlocked, changed)
+        if newly:
+            self._set(("achievements", "unlocked"), [*unlocked, *newly])
     
     # Overall progress
+    @_derived
     def get_overall_progress(self) -> dict[str, Any]:
         """Get overall learning progress."""
         lessons = self.get_lessons_stats()
@@ -479,7 +727,7 @@ class StateManager:
             },
             "achievements": {
                 "unlocked": len(ach["unlocked"]),
-                "total": 7,
+                "total": len(self.achievements),
             },
             "gamification": {
                 "xp": gam["xp"],
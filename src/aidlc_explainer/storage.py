@@ -0,0 +1,316 @@
+"""Storage backends for learner state.
+
+`StateManager` keeps the state document in memory and hands it to a backend
+to persist. The JSON backend stores one document per state directory; the
+SQLite backend stores one row per learner, so a classroom host can keep
+every trainee in a single database without their writes racing.
+
+Every stored document carries a ``revision`` counter. A save states the
+revision it was based on; if another process has saved since, the backend
+passes the stored document to the caller's merge function and writes the
+merged result instead, all while holding the store's write lock.
+
+The backend is chosen with ``AIDLC_STATE_BACKEND`` (``json`` or ``sqlite``)
+and the learner with ``AIDLC_LEARNER`` (default: the login name).
+"""
+
+import getpass
+import json
+import os
+import re
+import sqlite3
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes stay atomic, but are not serialized
+    fcntl = None
+
+BACKEND_ENV = "AIDLC_STATE_BACKEND"
+LEARNER_ENV = "AIDLC_LEARNER"
+BACKENDS = ("json", "sqlite")
+
+JSON_FILE = "state.json"
+SQLITE_FILE = "state.db"
+
+# Called with the stored document when it changed since the caller loaded
+# it; returns the document to write instead.
+Merge = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on `path` (created if needed).
+
+    A no-op where fcntl is unavailable.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def revision_of(state: dict[str, Any] | None) -> int:
+    """Revision counter of a stored document (0 if never saved)."""
+    return state.get("revision", 0) if state else 0
+
+
+def _prepare(
+    state: dict[str, Any],
+    stored: dict[str, Any] | None,
+    stored_revision: int,
+    merge: Merge | None,
+) -> dict[str, Any]:
+    """Resolve a save against the stored document and bump the revision."""
+    if merge is not None and stored is not None and stored_revision != revision_of(state):
+        state = merge(stored)
+    return {**state, "revision": stored_revision + 1}
+
+
+class StateBackend(Protocol):
+    """Loads and saves one state document per learner."""
+
+    def load(self, learner_id: str) -> dict[str, Any] | None:
+        """Return the learner's stored state, or None if there is none.
+
+        Raises:
+            ValueError: If stored state exists but cannot be decoded
+            OSError: If the store cannot be read
+        """
+
+    def save(
+        self, learner_id: str, state: dict[str, Any], merge: Merge | None = None
+    ) -> dict[str, Any]:
+        """Store the learner's state.
+
+        Args:
+            learner_id: Learner to store
+            state: Document to store; its ``revision`` is the one it was based on
+            merge: Called with the stored document if that has a different
+                revision; without it the stored document is overwritten
+
+        Returns:
+            The document actually written, with its new revision
+
+        Raises:
+            OSError: If the store cannot be written
+        """
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class JSONFileBackend:
+    """A single JSON document; the learner ID is ignored.
+
+    Writes go to a temporary file that replaces state.json in one rename, so
+    readers never see a partial document. On POSIX a lock on a sibling
+    ``.lock`` file serializes the read-merge-write cycle across processes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the backend.
+
+        Args:
+            path: The state.json file
+        """
+        self.path = path
+        self.lock_path = path.with_name(path.name + ".lock")
+
+    def load(self, learner_id: str) -> dict[str, Any] | None:
+        """Read the state document."""
+        if not self.path.exists():
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(
+        self, learner_id: str, state: dict[str, Any], merge: Merge | None = None
+    ) -> dict[str, Any]:
+        """Write the state document atomically, merging if it changed on disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.lock_path):
+            try:
+                stored = self.load(learner_id)
+            except ValueError:  # Unreadable; nothing worth merging
+                stored = None
+            written = _prepare(state, stored, revision_of(stored), merge)
+            self._replace(written)
+        return written
+
+    def _replace(self, state: dict[str, Any]) -> None:
+        """Write to a temporary file and rename it over the state file."""
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".state-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class SQLiteBackend:
+    """One row per learner in a SQLite database in WAL mode.
+
+    WAL lets readers proceed while one writer commits, and each save is a
+    single-row transaction, so hundreds of learners can share the database.
+    Statements are fixed strings with bound parameters, which sqlite3
+    prepares once and caches per connection.
+
+    The ``version`` column mirrors the document's revision and makes saves
+    optimistic: the update only applies if the version is still the one that
+    was read, otherwise the save merges against the newer row and retries.
+    No lock is held while documents are merged and serialized.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS learner_state (
+            learner_id TEXT PRIMARY KEY,
+            version    INTEGER NOT NULL,
+            updated    TEXT NOT NULL,
+            state      TEXT NOT NULL
+        )
+    """
+    SELECT = "SELECT version, state FROM learner_state WHERE learner_id = ?"
+    INSERT = """
+        INSERT INTO learner_state (learner_id, version, updated, state)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (learner_id) DO NOTHING
+    """
+    UPDATE = """
+        UPDATE learner_state SET version = ?, updated = ?, state = ?
+        WHERE learner_id = ? AND version = ?
+    """
+
+    def __init__(self, path: Path, timeout: float = 30.0) -> None:
+        """Open (and if needed create) the database.
+
+        Args:
+            path: The database file
+            timeout: Seconds to wait for another writer's lock
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # Durable at checkpoints rather than every commit; safe in WAL mode.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(self.SCHEMA)
+
+    def load(self, learner_id: str) -> dict[str, Any] | None:
+        """Read the learner's row."""
+        row = self._conn.execute(self.SELECT, (learner_id,)).fetchone()
+        return json.loads(row[1]) if row else None
+
+    def save(
+        self, learner_id: str, state: dict[str, Any], merge: Merge | None = None
+    ) -> dict[str, Any]:
+        """Write the learner's row, merging if another writer changed it."""
+        while True:
+            row = self._conn.execute(self.SELECT, (learner_id,)).fetchone()
+            version = row[0] if row else 0
+            try:
+                stored = json.loads(row[1]) if row else None
+            except ValueError:  # Unreadable; nothing worth merging
+                stored = None
+            written = _prepare(state, stored, version, merge)
+            updated = datetime.utcnow().isoformat() + "Z"
+            if row is None:
+                cursor = self._conn.execute(
+                    self.INSERT, (learner_id, written["revision"], updated, json.dumps(written))
+                )
+            else:
+                cursor = self._conn.execute(
+                    self.UPDATE,
+                    (written["revision"], updated, json.dumps(written), learner_id, version),
+                )
+            if cursor.rowcount == 1:
+                return written
+            # Another writer saved first; go again against its row
+
+    def learners(self) -> list[str]:
+        """IDs of every learner with stored state."""
+        rows = self._conn.execute("SELECT learner_id FROM learner_state ORDER BY learner_id")
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class MemoryBackend:
+    """Keeps documents in a dict; for read-only or throwaway state."""
+
+    def __init__(self, documents: dict[str, dict[str, Any]] | None = None) -> None:
+        """Initialize the backend.
+
+        Args:
+            documents: Initial documents by learner ID
+        """
+        self.documents = documents if documents is not None else {}
+
+    def load(self, learner_id: str) -> dict[str, Any] | None:
+        """Return the learner's document."""
+        return self.documents.get(learner_id)
+
+    def save(
+        self, learner_id: str, state: dict[str, Any], merge: Merge | None = None
+    ) -> dict[str, Any]:
+        """Store the learner's document, merging if it changed."""
+        stored = self.documents.get(learner_id)
+        written = _prepare(state, stored, revision_of(stored), merge)
+        self.documents[learner_id] = written
+        return written
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def default_learner() -> str:
+    """Learner ID from ``AIDLC_LEARNER``, falling back to the login name."""
+    learner = os.environ.get(LEARNER_ENV)
+    if learner:
+        return learner
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        return "default"
+
+
+def learner_file_stem(learner_id: str) -> str:
+    """A learner ID made safe to use as a file name."""
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", learner_id) or "default"
+
+
+def open_backend(state_dir: Path, kind: str | None = None) -> StateBackend:
+    """Open the configured backend for a state directory.
+
+    Args:
+        state_dir: The .aidlc-explainer directory
+        kind: "json" or "sqlite" (defaults to ``AIDLC_STATE_BACKEND``, then json)
+
+    Raises:
+        ValueError: If the backend kind is unknown
+    """
+    kind = kind or os.environ.get(BACKEND_ENV) or "json"
+    if kind == "json":
+        return JSONFileBackend(state_dir / JSON_FILE)
+    if kind == "sqlite":
+        return SQLiteBackend(state_dir / SQLITE_FILE)
+    raise ValueError(f"Unknown state backend {kind!r}; expected one of {', '.join(BACKENDS)}")
@@ -0,0 +1,251 @@
+"""Per-screen dwell time, key press and render latency telemetry.
+
+Events go into a `RingBuffer` of preallocated columns, so recording one is a
+few array stores (well under a microsecond) and never allocates. Whenever
+half the buffer is filled the new events are copied out and appended to a
+JSON Lines file by a background thread, keeping file I/O off the event loop.
+
+A visit starts when a screen has rendered after `ScreenTelemetry.navigate`
+and ends at the next navigation. Each visit produces three events:
+
+    render_ms   time from the navigation to the screen's first refresh
+    dwell_s     time the screen was on top
+    keys        key presses while it was on top
+"""
+
+import json
+import time
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+TELEMETRY_SCHEMA = "telemetry-v1"
+CAPACITY = 4096
+
+# Event kinds
+RENDER = 1
+DWELL = 2
+KEYS = 3
+
+KIND_NAMES = {RENDER: "render_ms", DWELL: "dwell_s", KEYS: "keys"}
+PERCENTILES = (50, 90, 99)
+
+
+class RingBuffer:
+    """Fixed-capacity columns of (time, kind, screen, value) events.
+
+    Once full, new events overwrite the oldest; `take` reports how many
+    were lost that way.
+    """
+
+    __slots__ = ("capacity", "written", "_mask", "_time", "_kind", "_screen", "_value")
+
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        """Allocate the columns.
+
+        Args:
+            capacity: Number of events held; must be a power of two
+
+        Raises:
+            ValueError: If capacity is not a power of two
+        """
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError(f"Capacity must be a power of two: {capacity}")
+        self.capacity = capacity
+        self.written = 0  # Events ever recorded
+        self._mask = capacity - 1
+        self._time = array("d", bytes(8 * capacity))
+        self._kind = array("B", bytes(capacity))
+        self._screen = array("H", bytes(2 * capacity))
+        self._value = array("d", bytes(8 * capacity))
+
+    def record(self, kind: int, screen: int, value: float) -> None:
+        """Store an event, stamped with `time.perf_counter`."""
+        i = self.written & self._mask
+        self._time[i] = time.perf_counter()
+        self._kind[i] = kind
+        self._screen[i] = screen
+        self._value[i] = value
+        self.written += 1
+
+    def take(self, start: int) -> tuple[list[array], int, int]:
+        """Copy out the events recorded since event number `start`.
+
+        Returns:
+            The time, kind, screen and value columns, the event number to
+            take from next time, and how many events were overwritten
+            before they could be taken
+        """
+        end = self.written
+        lost = max(0, end - start - self.capacity)
+        start += lost
+        first, last = start & self._mask, end & self._mask
+        columns = []
+        for column in (self._time, self._kind, self._screen, self._value):
+            if start == end:
+                columns.append(column[:0])
+            elif first < last:
+                columns.append(column[first:last])
+            else:  # Wrapped around
+                columns.append(column[first:] + column[:last])
+        return columns, end, lost
+
+
+class ScreenTelemetry:
+    """Records screen visits into a ring buffer and flushes them to a file."""
+
+    def __init__(self, path: Path, capacity: int = CAPACITY) -> None:
+        """Initialize telemetry.
+
+        Args:
+            path: JSON Lines file that events are appended to
+            capacity: Ring buffer size (a power of two)
+        """
+        self.path = path
+        self.buffer = RingBuffer(capacity)
+        self.batch = capacity // 2
+        self.keys = 0  # Key presses in the current visit
+        self.dropped = 0
+        self._screens: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._visit: tuple[int, float] | None = None  # (screen, start)
+        self._pending: tuple[int, float] | None = None  # Navigated, not yet rendered
+        self._flushed = 0
+        self._epoch = time.time() - time.perf_counter()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telemetry")
+        self._last_write: Future | None = None
+
+    def _code(self, screen_id: str) -> int:
+        code = self._codes.get(screen_id)
+        if code is None:
+            code = self._codes[screen_id] = len(self._screens)
+            self._screens.append(screen_id)
+        return code
+
+    def navigate(self, screen_id: str) -> None:
+        """End the current visit; `screen_id` is about to be shown."""
+        now = time.perf_counter()
+        self._end_visit(now)
+        self._pending = (self._code(screen_id), now)
+
+    def rendered(self) -> None:
+        """The screen navigated to has refreshed; start its visit."""
+        if self._pending is None:
+            return
+        now = time.perf_counter()
+        screen, started = self._pending
+        self._pending = None
+        self.buffer.record(RENDER, screen, (now - started) * 1000)
+        self._visit = (screen, now)
+        self.keys = 0
+
+    def key(self) -> None:
+        """Count a key press in the current visit."""
+        self.keys += 1
+
+    def _end_visit(self, now: float) -> None:
+        if self._visit is None:
+            return
+        screen, started = self._visit
+        self._visit = None
+        self.buffer.record(DWELL, screen, now - started)
+        self.buffer.record(KEYS, screen, self.keys)
+        if self.buffer.written - self._flushed >= self.batch:
+            self.flush()
+
+    def flush(self) -> Future:
+        """Hand events recorded since the last flush to the writer thread."""
+        columns, self._flushed, lost = self.buffer.take(self._flushed)
+        self.dropped += lost
+        self._last_write = self._writer.submit(
+            self._write, columns, list(self._screens), self._epoch
+        )
+        return self._last_write
+
+    def _write(self, columns: list[array], screens: list[str], epoch: float) -> None:
+        """Append events to the file (runs on the writer thread)."""
+        lines = [
+            json.dumps({
+                "t": round(epoch + t, 3),
+                "screen": screens[screen],
+                "kind": KIND_NAMES[kind],
+                "value": round(value, 3),
+            })
+            for t, kind, screen, value in zip(*columns, strict=True)
+        ]
+        if not lines:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def close(self) -> None:
+        """End the current visit and write everything recorded."""
+        self._end_visit(time.perf_counter())
+        self.flush()
+        self._writer.shutdown(wait=True)
+        if self._last_write is not None:
+            self._last_write.result()  # Surface write errors
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def summarize(path: Path) -> dict:
+    """Per-screen percentiles of the events in a telemetry file.
+
+    Lines that cannot be parsed are counted and skipped.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    values: dict[str, dict[str, list[float]]] = {}
+    skipped = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+                kinds = values.setdefault(event["screen"], {k: [] for k in KIND_NAMES.values()})
+                kinds[event["kind"]].append(float(event["value"]))
+            except (ValueError, KeyError, TypeError):
+                skipped += 1
+
+    screens = {}
+    for screen_id, kinds in values.items():
+        summary: dict = {"visits": len(kinds["dwell_s"])}
+        for kind, samples in kinds.items():
+            ordered = sorted(samples)
+            summary[kind] = {
+                f"p{pct}": round(percentile(ordered, pct), 3) if ordered else None
+                for pct in PERCENTILES
+            }
+        summary["dwell_s"]["total"] = round(sum(kinds["dwell_s"]), 3)
+        screens[screen_id] = summary
+    return {"$schema": TELEMETRY_SCHEMA, "skipped": skipped, "screens": screens}
+
+
+def format_summary(summary: dict) -> str:
+    """Render a summary from `summarize` as a table, most time spent first."""
+    def cell(value: float | None, digits: int) -> str:
+        return "-" if value is None else f"{value:.{digits}f}"
+
+    lines = [
+        f"{'Screen':<24} {'Visits':>6} {'Dwell p50/p90 (s)':>18} {'Keys p50':>9} "
+        f"{'Render p50/p90/p99 (ms)':>24}",
+        "─" * 85,
+    ]
+    for screen_id, s in sorted(
+        summary["screens"].items(), key=lambda item: item[1]["dwell_s"]["total"], reverse=True
+    ):
+        dwell, keys, render = s["dwell_s"], s["keys"], s["render_ms"]
+        dwell_text = f"{cell(dwell['p50'], 1)}/{cell(dwell['p90'], 1)}"
+        render_text = "/".join(cell(render[f"p{pct}"], 1) for pct in PERCENTILES)
+        lines.append(
+            f"{screen_id:<24} {s['visits']:>6} {dwell_text:>18} "
+            f"{cell(keys['p50'], 0):>9} {render_text:>24}"
+        )
+    if summary["skipped"]:
+        lines.append(f"({summary['skipped']} unreadable lines skipped)")
+    return "\n".join(lines)
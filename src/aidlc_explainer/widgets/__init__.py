@@ -1,6 +1,8 @@
 """Custom widgets for the AI-SDLC Explainer TUI."""
 
+from aidlc_explainer.widgets.animation import AnimationClock
 from aidlc_explainer.widgets.breadcrumb import Breadcrumb
+from aidlc_explainer.widgets.chrome import ExplorerFooter, ExplorerHeader
 from aidlc_explainer.widgets.help_overlay import HelpOverlay
 
-__all__ = ["Breadcrumb", "HelpOverlay"]
+__all__ = ["AnimationClock", "Breadcrumb", "ExplorerFooter", "ExplorerHeader", "HelpOverlay"]
@@ -0,0 +1,88 @@
+"""Shared animation clock for progress-style widget animations."""
+
+from time import monotonic
+from typing import Protocol
+
+from textual.message_pump import MessagePump
+from textual.timer import Timer
+
+
+class Animated(Protocol):
+    """A widget driven by an AnimationClock."""
+
+    def set_progress(self, progress: float) -> None:
+        """Show the animation at `progress` percent (0-100)."""
+
+
+class AnimationClock:
+    """Drives any number of animations from a single timer.
+
+    Progress is derived from elapsed wall-clock time rather than from tick
+    count, so slow or dropped frames (e.g. over SSH) skip ahead instead of
+    stretching the animation. The timer pauses once every animation has
+    reached 100% and resumes on `start()`.
+    """
+
+    def __init__(
+        self,
+        owner: MessagePump,
+        duration: float = 5.0,
+        fps: float = 10.0,
+        reduced_motion: bool = False,
+    ) -> None:
+        """Initialize the clock.
+
+        Args:
+            owner: Widget or screen that owns the timer
+            duration: Seconds from 0% to 100%
+            fps: Maximum frames per second
+            reduced_motion: If True, animations jump straight to their final frame
+        """
+        self.owner = owner
+        self.duration = duration
+        self.fps = fps
+        self.reduced_motion = reduced_motion
+        self._animations: list[Animated] = []
+        self._timer: Timer | None = None
+        self._started_at = 0.0
+
+    def add(self, animation: Animated) -> None:
+        """Register an animation with the clock."""
+        self._animations.append(animation)
+
+    def start(self) -> None:
+        """Start (or restart) every animation from 0%."""
+        if self.reduced_motion:
+            self.finish()
+            return
+        self._started_at = monotonic()
+        self._broadcast(0.0)
+        if self._timer is None:
+            self._timer = self.owner.set_interval(1 / self.fps, self._tick)
+        else:
+            self._timer.resume()
+
+    def finish(self) -> None:
+        """Jump every animation to its final frame and stop ticking."""
+        if self._timer is not None:
+            self._timer.pause()
+        self._broadcast(100.0)
+
+    def stop(self) -> None:
+        """Stop the timer without changing any animation."""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def _tick(self) -> None:
+        """Advance every animation to the current elapsed progress."""
+        progress = min(100.0, (monotonic() - self._started_at) / self.duration * 100)
+        if progress >= 100.0:
+            self.finish()
+        else:
+            self._broadcast(progress)
+
+    def _broadcast(self, progress: float) -> None:
+        """Send progress to every registered animation."""
+        for animation in self._animations:
+            animation.set_progress(progress)
@@ -0,0 +1,50 @@
+"""Header and footer for screens that stay alive across many visits.
+
+Textual drops a watcher of a reactive attribute only when that attribute
+changes. Textual's Header watches the app's title and the Footer's keys
+watch the footer's `compact` setting, neither of which this app changes, so
+without help every removed header and every replaced footer key stays
+referenced for as long as the app or screen lives.
+"""
+
+from collections.abc import Callable
+
+from textual.dom import DOMNode
+from textual.screen import Screen
+from textual.widgets import Footer, Header
+
+
+def _drop_watchers(obj: DOMNode, drop: Callable[[DOMNode], bool]) -> None:
+    """Remove watchers of `obj`'s reactives registered by nodes matching `drop`."""
+    for watchers in getattr(obj, "__watchers", {}).values():
+        watchers[:] = [(node, callback) for node, callback in watchers if not drop(node)]
+
+
+class ExplorerHeader(Header):
+    """Header that stops watching the app's title when it is removed."""
+    
+    def on_unmount(self) -> None:
+        """Release this header from the app's title watchers."""
+        _drop_watchers(self.app, lambda node: node is self)
+
+
+class ExplorerFooter(Footer):
+    """Footer that only rebuilds its keys while its screen is visible.
+    
+    Every screen in the stack has its bindings refreshed on each push or pop,
+    and Textual's Footer recomposes whenever that happens. A hidden screen
+    does not repaint, so the replaced keys would pile up in its list of
+    widgets waiting to be drawn. A hidden screen's bindings are refreshed
+    again when it is shown.
+    """
+    
+    def bindings_changed(self, screen: Screen) -> None:
+        """Rebuild the keys, unless the screen is hidden."""
+        if screen.is_current:
+            super().bindings_changed(screen)
+    
+    async def recompose(self) -> None:
+        """Recompose the keys and drop bindings to the removed ones."""
+        await super().recompose()
+        # Same pruning Textual applies when the reactive changes
+        _drop_watchers(self, lambda node: node._closing)
@@ -27,6 +27,7 @@ HELP_TEXT = """\
 │  GENERAL                                                        │
 │  ───────                                                        │
 │  ?            Toggle this help                                  │
+│  F2           Switch content language                           │
 │  q            Quit application                                  │
 │                                                                 │
 ├─────────────────────────────────────────────────────────────────┤
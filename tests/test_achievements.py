@@ -0,0 +1,94 @@
+"""Tests for the declarative achievement engine."""
+
+import json
+
+import pytest
+
+from aidlc_explainer.achievements import AchievementEngine, load_achievements
+from aidlc_explainer.state import StateManager
+
+
+def rule(ach_id, rule, **extra):
+    return {"id": ach_id, "name": ach_id.title(), "rule": rule, **extra}
+
+
+def test_builtin_achievements_load():
+    """Test loading the built-in achievements."""
+    engine = load_achievements()
+
+    assert len(engine) == 7
+    assert engine.name("scholar") == "📚 Scholar"
+    assert engine.name("unknown") == "unknown"
+    # Completionist is ordered after everything it requires
+    order = [a.id for a in engine.achievements]
+    assert order.index("completionist") > order.index("scholar")
+
+
+def test_only_affected_rules_are_evaluated():
+    """Test that only rules reading a changed field are evaluated."""
+    engine = load_achievements()
+
+    assert {a.id for a in engine.affected(["lessons.completed"])} == {"first-steps", "scholar"}
+    assert {a.id for a in engine.affected(["quiz"])} == {"quiz-master", "perfect-score"}
+    assert {a.id for a in engine.affected(["quiz.best_score"])} == {"quiz-master", "perfect-score"}
+    assert engine.affected(["gamification.xp"]) == []
+
+
+def test_unlock_cascades_to_dependents():
+    """Test that an unlock cascades to achievements depending on it."""
+    engine = AchievementEngine([
+        rule("xp", {"value": "gamification.xp", "min": 100}),
+        rule("lessons", {"count": "lessons.completed", "min": 1}),
+        rule("both", {"unlocked": ["xp", "lessons"]}),
+    ])
+    state = {"gamification": {"xp": 150}, "lessons": {"completed": ["a"]}}
+
+    assert engine.evaluate(state, [], ["gamification.xp"]) == ["xp"]
+    assert engine.evaluate(state, ["xp"], ["lessons.completed"]) == ["lessons", "both"]
+    assert engine.evaluate(state, [], None) == ["xp", "lessons", "both"]
+
+
+def test_invalid_definitions_are_rejected():
+    """Test that invalid achievement definitions are rejected."""
+    with pytest.raises(ValueError, match="cycle"):
+        AchievementEngine([rule("a", {"unlocked": ["b"]}), rule("b", {"unlocked": ["a"]})])
+    with pytest.raises(ValueError, match="unknown"):
+        AchievementEngine([rule("a", {"unlocked": ["missing"]})])
+    with pytest.raises(ValueError, match="Unknown rule"):
+        AchievementEngine([rule("a", {"bogus": 1})])
+
+
+def test_state_manager_unlocks_from_rules(tmp_path):
+    """Test that the state manager unlocks achievements from rules."""
+    state = StateManager(base_path=tmp_path)
+    for i in range(6):
+        state.mark_lesson_completed(f"lesson-{i}")
+    state.save_quiz_result(12, 12, [])
+    state.save_gate_result(10, 10, [])
+    for request_type in ["greenfield", "brownfield", "bugfix", "refactor"]:
+        state.record_simulation_run(request_type)
+
+    assert state.get_achievements()["unlocked"] == [
+        "first-steps", "scholar", "quiz-master", "perfect-score",
+        "gatekeeper", "simulator-explorer", "completionist",
+    ]
+    assert state.get_overall_progress()["achievements"] == {"unlocked": 7, "total": 7}
+
+
+def test_custom_achievements(tmp_path):
+    """Test loading custom achievements from the state directory."""
+    state_dir = tmp_path / ".aidlc-explainer"
+    state_dir.mkdir()
+    (state_dir / "achievements.json").write_text(json.dumps({
+        "$schema": "achievements-v1",
+        "achievements": [
+            rule("xp-500", {"value": "gamification.xp", "min": 500}, name="💰 Big Earner"),
+        ],
+    }), encoding="utf-8")
+
+    state = StateManager(base_path=tmp_path)
+    assert len(state.achievements) == 8
+    state.save_quiz_result(12, 12, [])
+
+    assert "xp-500" in state.get_achievements()["unlocked"]
+    assert state.achievements.name("xp-500") == "💰 Big Earner"
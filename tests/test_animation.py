@@ -0,0 +1,114 @@
+"""Tests for the shared animation clock and cached timeline rendering."""
+
+from aidlc_explainer.content.methodology_comparison import AIDLC, WATERFALL
+from aidlc_explainer.screens.methodology_comparison import MethodologyTimeline
+from aidlc_explainer.widgets.animation import AnimationClock
+
+
+class FakeTimer:
+    """Timer stand-in recording pause/resume calls."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.paused = False
+        self.stopped = False
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeOwner:
+    """Owner stand-in that hands out FakeTimers."""
+
+    def __init__(self):
+        self.timers = []
+
+    def set_interval(self, interval, callback):
+        self.timers.append(FakeTimer(callback))
+        return self.timers[-1]
+
+
+class Recorder:
+    """Animation stand-in recording progress updates."""
+
+    def __init__(self):
+        self.progress = []
+
+    def set_progress(self, progress):
+        self.progress.append(progress)
+
+
+def test_clock_uses_one_timer_for_all_animations():
+    """Test that many animations share a single timer."""
+    owner = FakeOwner()
+    clock = AnimationClock(owner)
+    animations = [Recorder() for _ in range(3)]
+    for animation in animations:
+        clock.add(animation)
+
+    clock.start()
+    clock.start()  # Restart reuses the timer
+    assert len(owner.timers) == 1
+    assert all(a.progress == [0.0, 0.0] for a in animations)
+
+
+def test_clock_finishes_and_pauses(monkeypatch):
+    """Test that the clock pauses once the duration has elapsed."""
+    now = [100.0]
+    monkeypatch.setattr("aidlc_explainer.widgets.animation.monotonic", lambda: now[0])
+    owner = FakeOwner()
+    clock = AnimationClock(owner, duration=2.0)
+    animation = Recorder()
+    clock.add(animation)
+
+    clock.start()
+    now[0] += 1.0
+    owner.timers[0].callback()
+    assert animation.progress[-1] == 50.0
+    now[0] += 5.0  # A late frame jumps to the end
+    owner.timers[0].callback()
+    assert animation.progress[-1] == 100.0
+    assert owner.timers[0].paused
+
+
+def test_reduced_motion_jumps_to_final_frame():
+    """Test that reduced motion never starts a timer."""
+    owner = FakeOwner()
+    clock = AnimationClock(owner, reduced_motion=True)
+    animation = Recorder()
+    clock.add(animation)
+
+    clock.start()
+    assert owner.timers == []
+    assert animation.progress == [100.0]
+
+
+def test_timeline_layout_cached_per_width():
+    """Test that the static layout is built once per width."""
+    timeline = MethodologyTimeline(WATERFALL)
+    assert timeline.layout_for(60) is timeline.layout_for(60)
+    assert timeline.layout_for(80) is not timeline.layout_for(60)
+    assert timeline.layout_for(80).span > timeline.layout_for(60).span
+
+
+def test_timeline_frames():
+    """Test empty, partial and final frames keep a fixed geometry."""
+    timeline = MethodologyTimeline(AIDLC)
+    frames = {}
+    for progress in (0, 50, 100):
+        timeline.set_progress(progress)
+        frames[progress] = timeline.render_frame(60).splitlines()
+
+    for lines in frames.values():
+        assert all(len(line) == 60 for line in lines[:4])
+    assert "█" not in frames[0][1]
+    assert "█" in frames[50][1] and "░" in frames[50][1]
+    assert "░" not in frames[100][1]
+    assert "Construction" in frames[100][2]
+    assert frames[0][0] == frames[100][0]  # Static lines are shared
@@ -0,0 +1,65 @@
+"""Tests for bytes-on-wire instrumentation."""
+
+import json
+
+from aidlc_explainer.__main__ import parse_args
+from aidlc_explainer.bandwidth import WIRE_STATS_SCHEMA, BandwidthMeter
+
+
+def test_wrapped_write_counts_and_forwards():
+    """Test that the wrapped driver write counts bytes and still writes."""
+    written = []
+    meter = BandwidthMeter()
+    write = meter.wrap(written.append)
+
+    write("abc")
+    write("█")  # 3 bytes in UTF-8
+
+    assert written == ["abc", "█"]
+    assert meter.total_bytes == 6
+    assert meter.interactions[0].writes == 2
+
+
+def test_output_is_charged_to_latest_interaction():
+    """Test that output is charged to the interaction that caused it."""
+    meter = BandwidthMeter()
+    meter.record("x" * 100)
+    meter.begin_interaction("home", "down")
+    meter.record("x" * 10)
+    meter.begin_interaction("home", "down")
+    meter.record("x" * 30)
+    meter.begin_interaction("glossary", "enter")
+    meter.record("x" * 500)
+
+    summary = meter.summary()
+    assert summary["total_bytes"] == 640
+    assert summary["interactions"] == 3
+    assert summary["screens"]["startup"]["bytes"] == 100
+    home = summary["screens"]["home"]
+    assert home["interactions"] == 2
+    assert home["mean_bytes"] == 20
+    assert home["max_bytes"] == 30
+
+
+def test_write_report(tmp_path):
+    """Test writing the wire stats report."""
+    meter = BandwidthMeter()
+    meter.record("hello")
+    meter.begin_interaction("home", "q")
+    path = tmp_path / "wire.json"
+
+    meter.write_report(path, low_bandwidth=True)
+
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert report["$schema"] == WIRE_STATS_SCHEMA
+    assert report["low_bandwidth"] is True
+    assert report["total_bytes"] == 5
+    assert report["log"] == [["startup", "", 5, 1], ["home", "q", 0, 0]]
+    assert "home" in meter.format_summary()
+
+
+def test_low_bandwidth_flags():
+    """Test the low-bandwidth command line flags."""
+    args = parse_args(["--low-bandwidth", "--wire-stats", "out.json"])
+    assert args.low_bandwidth is True
+    assert str(args.wire_stats) == "out.json"
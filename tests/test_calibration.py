@@ -0,0 +1,104 @@
+"""Tests for methodology factor calibration."""
+
+import csv
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aidlc_explainer.analysis import calibration  # noqa: E402
+from aidlc_explainer.content.methodology_comparison import (  # noqa: E402
+    METHODOLOGIES,
+    get_all_methodologies,
+)
+
+TRUE_FACTORS = {
+    "waterfall": (1.1, 0.95, 1.6, 1.25),
+    "agile": (0.55, 0.75, 1.0, 1.15),
+    "aidlc": (0.2, 0.35, 0.85, 1.1),
+}
+
+
+def write_history(path, n=3000, noise=0.05, stabilities=("stable", "evolving", "volatile")):
+    """Write synthetic project history generated from TRUE_FACTORS."""
+    rng = np.random.default_rng(42)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(calibration.REQUIRED_COLUMNS)
+        for i in range(n):
+            method_id = list(TRUE_FACTORS)[i % 3]
+            cycle, cost, volatility, complexity_cost = TRUE_FACTORS[method_id]
+            complexity = ("low", "medium", "high")[rng.integers(3)]
+            stability = stabilities[rng.integers(len(stabilities))]
+            base = int(rng.integers(4, 60))
+            weeks = base * cycle * (volatility if stability == "volatile" else 1.0)
+            total = base * 10 * cost * (complexity_cost if complexity == "high" else 1.0)
+            writer.writerow([
+                method_id, complexity, stability, int(rng.integers(2, 20)), base,
+                weeks * np.exp(rng.normal(0, noise)), total * np.exp(rng.normal(0, noise)),
+            ])
+    return path
+
+
+def test_calibrate_recovers_factors(tmp_path):
+    """Test that fitting synthetic data recovers the generating factors."""
+    history, dropped = calibration.read_history(write_history(tmp_path / "history.csv"))
+    result = calibration.calibrate(history, METHODOLOGIES)
+
+    assert dropped == 0
+    assert result.samples == 3000
+    for method_id, expected in TRUE_FACTORS.items():
+        fitted = result.factors[method_id]
+        actual = (
+            fitted.cycle_time_factor,
+            fitted.cost_factor,
+            fitted.volatility_time_factor,
+            fitted.complexity_cost_factor,
+        )
+        assert actual == pytest.approx(expected, rel=0.02)
+
+
+def test_calibrate_keeps_unidentified_multipliers(tmp_path):
+    """Test that multipliers without supporting rows keep current values."""
+    path = write_history(tmp_path / "history.csv", stabilities=("stable",))
+    history, _ = calibration.read_history(path)
+    result = calibration.calibrate(history, METHODOLOGIES)
+
+    assert result.factors["waterfall"].volatility_time_factor == 1.5
+    assert result.factors["aidlc"].volatility_time_factor == 0.9
+
+
+def test_read_history_drops_bad_rows(tmp_path):
+    """Test that blank or non-positive rows are skipped."""
+    path = tmp_path / "history.csv"
+    path.write_text(
+        "methodology,complexity,requirements_stability,team_size,"
+        "baseline_weeks,actual_weeks,actual_cost\n"
+        "aidlc,low,stable,4,10,2,30\n"
+        "aidlc,low,stable,4,,2,30\n"
+        "agile,high,volatile,4,10,0,30\n",
+        encoding="utf-8",
+    )
+    history, dropped = calibration.read_history(path)
+    assert len(history) == 1
+    assert dropped == 2
+
+
+def test_read_history_missing_column(tmp_path):
+    """Test that a CSV without required columns is rejected."""
+    path = tmp_path / "history.csv"
+    path.write_text("methodology,actual_weeks\naidlc,3\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="baseline_weeks"):
+        calibration.read_history(path)
+
+
+def test_written_profile_is_loaded(tmp_path):
+    """Test that get_all_methodologies applies a written profile."""
+    history, _ = calibration.read_history(write_history(tmp_path / "history.csv"))
+    result = calibration.calibrate(history, METHODOLOGIES)
+    profile = tmp_path / "profile.json"
+    result.write_profile(profile)
+
+    methodologies = {m.id: m for m in get_all_methodologies(profile)}
+    assert methodologies["aidlc"].cycle_time_factor == pytest.approx(0.2, rel=0.02)
+    assert methodologies["waterfall"].volatility_time_factor == pytest.approx(1.6, rel=0.02)
@@ -0,0 +1,139 @@
+"""Tests for certificate issuance and the certificate registry."""
+
+import json
+from dataclasses import asdict, replace
+
+import pytest
+
+from aidlc_explainer import certificates
+from aidlc_explainer.__main__ import main
+from aidlc_explainer.certificates import Certificate, CertificateRegistry
+from aidlc_explainer.state import StateManager
+
+PROGRESS = {
+    "lessons": {"completed": 6},
+    "quiz": {"score": 22, "total": 24, "percent": 91.7},
+    "achievements": {"unlocked": 3, "total": 7},
+}
+
+
+def make_cert(name, date_str="2026-10-19"):
+    return Certificate.from_progress(name, date_str, PROGRESS)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return CertificateRegistry(tmp_path / "registry")
+
+
+def test_certificate_id_is_stable():
+    """Test that certificate IDs are stable and normalized."""
+    assert certificates.certificate_id("Ada", "2026-10-19") == make_cert("Ada").id
+    assert len(make_cert("Ada").id) == 12
+    assert certificates.normalize_id(f" {make_cert('Ada').id.lower()} ") == make_cert("Ada").id
+    assert certificates.normalize_id("not-an-id!!") is None
+
+
+def test_issue_and_lookup(registry):
+    """Test issuing a certificate and looking it up by ID."""
+    cert = make_cert("Ada Lovelace")
+
+    assert registry.issue(cert).status == certificates.ISSUED
+    assert registry.lookup(cert.id) == [cert]
+    assert registry.lookup(cert.id.lower()) == [cert]
+    assert registry.lookup(make_cert("Grace Hopper").id) == []
+    assert len(registry) == 1
+
+
+def test_reissue_is_a_duplicate(registry):
+    """Test that reissuing a certificate is reported as a duplicate."""
+    cert = make_cert("Ada Lovelace")
+    registry.issue(cert)
+
+    assert registry.issue(cert).status == certificates.DUPLICATE
+    assert len(registry) == 1
+
+
+def test_collision_is_detected_on_issue_and_verify(registry):
+    """Test that an ID belonging to another learner is a collision."""
+    cert = make_cert("Ada Lovelace")
+    registry.issue(cert)
+    impostor = replace(cert, name="Mallory")
+
+    result = registry.issue(impostor)
+
+    assert result.status == certificates.COLLISION
+    assert "Ada Lovelace" in result.message
+    # A colliding record that reached the log by other means is still reported
+    with open(registry.log_path, "a", encoding="utf-8") as log:
+        log.write(json.dumps(asdict(impostor)) + "\n")
+    assert {c.name for c in registry.lookup(cert.id)} == {"Ada Lovelace", "Mallory"}
+
+
+def test_index_grows_and_rebuilds(registry):
+    """Test that the index grows and is rebuilt when damaged."""
+    certs = [make_cert(f"Learner {i}") for i in range(1500)]
+    results = registry.issue_many(certs)
+
+    assert all(r.status == certificates.ISSUED for r in results)
+    assert len(registry) == 1500
+    assert registry.lookup(certs[1234].id) == [certs[1234]]
+
+    registry.index_path.write_bytes(b"garbage")
+    assert registry.lookup(certs[42].id) == [certs[42]]
+    registry.index_path.unlink()
+    assert registry.lookup(certs[999].id) == [certs[999]]
+    assert len(registry) == 1500
+
+
+def test_index_resyncs_after_an_interrupted_batch(registry, monkeypatch):
+    """Test resyncing the index after an interrupted batch."""
+    registry.issue(make_cert("Ada Lovelace"))
+    batch = [make_cert("Ann"), make_cert("Bob")]
+
+    def interrupted(self, log_bytes):
+        raise KeyboardInterrupt
+
+    # The batch's records and index slots are written, but not the header
+    with monkeypatch.context() as patch:
+        patch.setattr(certificates._HashIndex, "write_header", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            registry.issue_many(batch)
+
+    assert registry.issue(make_cert("Cy")).status == certificates.ISSUED
+    assert registry.lookup(batch[0].id) == [batch[0]]
+    assert registry.issue(batch[1]).status == certificates.DUPLICATE
+    assert len(registry) == 4
+
+
+def test_issue_from_roster(tmp_path, registry):
+    """Test issuing certificates to the eligible learners on a roster."""
+    for name, lessons in [("ada", 6), ("grace", 2)]:
+        state = StateManager(base_path=tmp_path / name)
+        for i in range(lessons):
+            state.mark_lesson_completed(f"lesson-{i}")
+        state.save_quiz_result(22, 24, [])
+    roster_path = tmp_path / "roster.csv"
+    roster_path.write_text(
+        "name,state\nAda Lovelace,ada\nGrace Hopper,grace\nNobody,missing\n", encoding="utf-8"
+    )
+
+    roster = certificates.read_roster(roster_path)
+    results = certificates.issue_from_roster(roster, registry, "2026-10-19", processes=1)
+
+    assert [r.status for r in results] == [
+        certificates.ISSUED, certificates.INELIGIBLE, certificates.FAILED
+    ]
+    assert registry.lookup(certificates.certificate_id("Ada Lovelace", "2026-10-19"))
+
+
+def test_verify_command(registry, capsys):
+    """Test the verify command."""
+    cert = make_cert("Ada Lovelace")
+    registry.issue(cert)
+    args = ["--registry", str(registry.directory)]
+
+    assert main(["verify", cert.id, *args]) == 0
+    assert "Ada Lovelace" in capsys.readouterr().out
+    assert main(["verify", make_cert("Nobody").id, *args]) == 1
+    assert main(["verify", "bogus", *args]) == 1
@@ -0,0 +1,84 @@
+"""Tests for cohort analytics over collected state files."""
+
+import csv
+import io
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aidlc_explainer.__main__ import main  # noqa: E402
+from aidlc_explainer.analysis import cohort  # noqa: E402
+from aidlc_explainer.state import StateManager  # noqa: E402
+
+
+@pytest.fixture
+def collected(tmp_path):
+    """Three learners' state files plus files that should be skipped."""
+    root = tmp_path / "collected"
+    for name, lessons, quiz in [("ada", 6, 24), ("grace", 2, 12), ("linus", 0, 0)]:
+        learner_dir = tmp_path / name
+        state = StateManager(base_path=learner_dir)
+        state.add_xp("lesson_section")
+        for i in range(lessons):
+            state.mark_lesson_completed(f"lesson-{i}")
+        if quiz:
+            state.save_quiz_result(quiz, 24, [])
+        target = root / name / "state.json"
+        target.parent.mkdir(parents=True)
+        target.write_bytes(state.state_file.read_bytes())
+    (root / "broken.json").write_text("{", encoding="utf-8")
+    (root / "other.json").write_text('{"$schema": "sweep-v1"}', encoding="utf-8")
+    (root / "notes.txt").write_text("ignored", encoding="utf-8")
+    return root
+
+
+def test_summarize_files(collected):
+    """Test summarizing a chunk of collected state files."""
+    paths = sorted(cohort.iter_state_files(collected))
+    stats = cohort.summarize_files(paths)
+
+    assert stats.files == 5
+    assert stats.skipped == 2
+    assert stats.learners == 3
+    assert stats.lessons_completed.tolist() == [1, 0, 1, 0, 0, 0, 1]
+    assert stats.quiz_scores[24] == 1 and stats.quiz_scores[12] == 1
+    assert stats.quiz_takers == 2
+    assert stats.achievements["first-steps"] == 2
+    assert stats.achievements["perfect-score"] == 1
+    assert stats.quiz_total == 24
+
+
+def test_chunked_parallel_report_matches_single_pass(collected):
+    """Test that a chunked parallel report matches a single pass."""
+    single = cohort.summarize_files(list(cohort.iter_state_files(collected)))
+    parallel, _ = cohort.build_report(collected, processes=2, chunk_size=2)
+
+    assert parallel.to_summary() == single.to_summary()
+
+
+def test_summary_statistics(collected):
+    """Test the cohort summary statistics."""
+    summary, _ = cohort.build_report(collected, processes=1)
+    s = summary.to_summary()
+
+    assert s["lessons"]["all_completed_rate"] == pytest.approx(1 / 3, abs=1e-4)
+    assert s["quiz"]["median_score"] == 12
+    assert s["quiz"]["pass_rate"] == pytest.approx(1 / 3, abs=1e-4)
+    assert sum(s["xp"]["histogram"]) == 3
+
+
+def test_cli_formats(collected, tmp_path, capsys):
+    """Test the cohort-report output formats."""
+    assert main(["cohort-report", str(collected), "--format", "json", "--processes", "1"]) == 0
+    assert json.loads(capsys.readouterr().out)["learners"] == 3
+
+    output = tmp_path / "cohort.csv"
+    assert main(["cohort-report", str(collected), "--format", "csv", "--output", str(output)]) == 0
+    rows = list(csv.reader(io.StringIO(output.read_text(encoding="utf-8"))))
+    assert rows[0] == ["section", "key", "value"]
+    assert ["", "learners", "3"] in rows
+
+    assert main(["cohort-report", str(collected), "--processes", "1"]) == 0
+    assert "# AI-DLC Cohort Report" in capsys.readouterr().out
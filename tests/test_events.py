@@ -0,0 +1,128 @@
+"""Tests for the learning event log, replay and activity analytics."""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from aidlc_explainer import events, state
+from aidlc_explainer.app import AIDLCExplainerApp
+from aidlc_explainer.events import EventLog
+from aidlc_explainer.state import StateManager
+
+DAY = 86400
+NOON = 20000 * DAY + 12 * 3600  # 2024-10-04 12:00 UTC
+
+
+@pytest.fixture
+def log(tmp_path):
+    return EventLog(tmp_path / "events", "ada lovelace")
+
+
+def test_append_and_replay(log):
+    """Test appending events and replaying them."""
+    log.append(events.XP, "lesson_section", 10)
+    log.append(events.XP, "quiz_completed", 50)
+    log.append(events.LESSON_SECTION, "what-is-aidlc", 3)
+    log.append(events.QUIZ_ANSWER, "q1", 1)
+    log.append(events.QUIZ_ANSWER, "q2", 0)
+    log.append(events.GATE_DECISION, "gate-1", 1)
+
+    replay = log.replay()
+
+    assert len(log) == 6
+    assert log.log_path.stat().st_size == 6 * events.RECORD.size
+    assert log.log_path.name == "ada_lovelace.log"
+    assert replay.xp == 60
+    assert replay.xp_by_action == {"lesson_section": 10, "quiz_completed": 50}
+    assert replay.lesson_sections == {"what-is-aidlc": 3}
+    assert (replay.quiz_answers, replay.quiz_correct) == (2, 1)
+    assert (replay.gate_decisions, replay.gate_correct) == (1, 1)
+
+
+def test_replay_resumes_from_snapshot(log, monkeypatch):
+    """Test that replay resumes from the latest snapshot."""
+    monkeypatch.setattr(events, "SNAPSHOT_INTERVAL", 4)
+    for _ in range(10):
+        log.append(events.XP, "lesson_section", 10)
+
+    assert log.snapshot_path.exists()
+    assert log._load_snapshot().records == 8
+    assert log.replay().xp == 100
+
+    log.snapshot_path.write_text("{", encoding="utf-8")
+    assert log.replay().xp == 100
+
+
+def test_torn_final_record_is_ignored(log):
+    """Test that a torn final record is ignored."""
+    log.append(events.XP, "lesson_section", 10)
+    with open(log.log_path, "ab") as f:
+        f.write(b"\x00" * 5)
+
+    assert len(log) == 1
+    assert log.replay().xp == 10
+
+
+def test_state_manager_records_events_and_sessions(tmp_path):
+    """Test that the state manager records events and sessions."""
+    state = StateManager(base_path=tmp_path)
+    state.start_session(today=date(2026, 10, 18))
+    state.update_lesson_progress("what-is-aidlc", 2)
+    state.record_quiz_answer("q1", True)
+    state.end_session()
+    state.start_session(today=date(2026, 10, 19))
+
+    replay = state.replay_events()
+    assert replay.xp == 0
+    assert replay.lesson_sections == {"what-is-aidlc": 2}
+    assert replay.sessions == 2
+
+    activity = state.get_activity_stats(today=date(2026, 10, 19))
+    assert activity["streak_days"] == 2
+    assert activity["total_sessions"] == 2
+    assert state.get_activity_stats(today=date(2026, 10, 25))["streak_days"] == 0
+
+    state.start_session(today=date(2026, 10, 25))
+    assert state.get_activity_stats(today=date(2026, 10, 25))["streak_days"] == 1
+
+
+def test_answers_are_recorded_through_the_app_session(tmp_path, monkeypatch):
+    """Test that answers are recorded through the app's session manager."""
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+
+    async def answer() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True)
+        async with app.run_test(size=(100, 40)) as pilot:
+            app.navigate_to("practice", "Practice")
+            app.navigate_to("quiz", "Quiz")
+            await pilot.pause()
+            managers = []
+            monkeypatch.setattr(state.StateManager, "_load", lambda self: managers.append(self))
+            await pilot.press("a")
+            await pilot.pause()
+            assert managers == []  # No manager is loaded per answer
+            assert app.session.replay_events().quiz_answers == 1
+
+    asyncio.run(answer())
+
+
+def test_activity_summary(log):
+    """Test the learning activity summary."""
+    activity = pytest.importorskip("aidlc_explainer.analysis.activity")
+    # Active on days -5, -4, -3 and -1, 0 relative to today
+    for day in (-5, -4, -3, -1, 0):
+        log.append(events.XP, "lesson_section", 10, timestamp=NOON + day * DAY)
+    log.append(events.LESSON_SECTION, "what-is-aidlc", 1, timestamp=NOON)
+    log.append(events.QUIZ_ANSWER, "q1", 1, timestamp=NOON)
+    log.append(events.QUIZ_ANSWER, "q2", 0, timestamp=NOON)
+
+    summary = activity.summarize(log, now=NOON, utc_offset=0)
+
+    assert summary["streak_days"] == 2
+    assert summary["longest_streak"] == 3
+    assert summary["active_days"] == 5
+    assert summary["daily_xp"][-6:] == [10, 10, 10, 0, 10, 10]
+    assert summary["xp_per_day"] == round(50 / 7, 2)
+    assert summary["answer_accuracy"] == 0.5
+    assert activity.summarize(log, now=NOON + 3 * DAY, utc_offset=0)["streak_days"] == 0
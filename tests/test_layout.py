@@ -0,0 +1,69 @@
+"""Tests for width-aware text layout."""
+
+import asyncio
+
+from rich.cells import cell_len
+
+from aidlc_explainer import layout
+from aidlc_explainer.app import AIDLCExplainerApp
+
+
+def test_wrap_keeps_words_and_line_breaks():
+    """Test that wrapping keeps words whole and line breaks in place."""
+    lines = layout.wrap("Proof over prose: every gate needs evidence\nSecond paragraph", 20, indent="  ")
+
+    assert lines == (
+        "  Proof over prose:",
+        "  every gate needs",
+        "  evidence",
+        "  Second paragraph",
+    )
+    assert layout.wrap("x" * 25, 10) == ("x" * 10, "x" * 10, "x" * 5)
+    assert all(cell_len(line) <= 12 for line in layout.wrap("🚀 launch " * 5, 12))
+
+
+def test_truncate_only_cuts_long_lines():
+    """Test that only lines wider than the width are truncated."""
+    assert layout.truncate("short", 10) == "short"
+    assert layout.truncate("a longer line", 8) == "a longe…"
+    assert cell_len(layout.truncate("📄 📄 📄 📄", 5)) <= 5
+
+
+def test_box_fits_width():
+    """Test that every row of a box is exactly the width."""
+    rows = layout.box(["Requirements", "a fairly long line that has to wrap"], 24, title="Artifact")
+
+    assert rows[0].startswith("╭── Artifact ")
+    assert {cell_len(row) for row in rows} == {24}
+    assert layout.box(["code line that is too long"], 14, wrap_lines=False)[1] == "│ code line… │"
+
+
+def test_wrap_is_memoized_until_invalidated():
+    """Test that wrapped text is memoized until the cache is invalidated."""
+    layout.invalidate()
+    first = layout.wrap("memoized text", 8)
+
+    assert layout.wrap("memoized text", 8) is first
+    layout.invalidate()
+    assert layout.wrap.cache_info().currsize == 0
+
+
+def test_panels_reflow_on_resize(tmp_path, monkeypatch):
+    """Test that panels reflow when the terminal is resized."""
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+
+    async def resize() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True)
+        async with app.run_test(size=(160, 40)) as pilot:
+            app.navigate_to("interactive-simulator", "Interactive Simulator")
+            await pilot.pause()
+            content = app.screen.query_one("#question-content")
+            wide = str(content.render()).splitlines()[0]
+            assert cell_len(wide) == content.content_size.width
+
+            await pilot.resize_terminal(90, 40)
+            await pilot.pause()
+            narrow = str(content.render()).splitlines()[0]
+            assert cell_len(narrow) == content.content_size.width < cell_len(wide)
+
+    asyncio.run(resize())
@@ -0,0 +1,60 @@
+"""Tests for the lesson screen's section renderer."""
+
+import asyncio
+
+from aidlc_explainer.app import AIDLCExplainerApp
+from aidlc_explainer.content import load_lesson
+from aidlc_explainer.screens import lesson
+from aidlc_explainer.screens.lesson import SectionRenderer, prepare_section
+
+
+def test_prepare_section_wraps_to_width():
+    """Test that a prepared section is wrapped to the width."""
+    section = load_lesson("aidlc-overview").sections[0]
+
+    unwrapped = prepare_section(section)
+    wrapped = prepare_section(section, 40)
+
+    assert unwrapped.plain.startswith(f"╭─ {section.title}")
+    assert max(len(line) for line in wrapped.plain.splitlines()) <= 40
+    assert wrapped.plain.replace("\n", "").replace(" ", "") == unwrapped.plain.replace("\n", "").replace(" ", "")
+
+
+def test_renderer_caches_by_lesson_section_and_width():
+    """Test that rendered sections are cached by lesson, section and width."""
+    renderer = SectionRenderer(max_size=2)
+    overview = load_lesson("aidlc-overview")
+
+    first = renderer.get(overview, 0, 100, 80)
+    assert renderer.get(overview, 0, 100, 80) is first
+    assert renderer.get(overview, 0, 120, 100) is not first
+    assert (renderer.hits, renderer.misses) == (1, 2)
+
+    renderer.prefetch([(overview, 1)], 100, 80)
+    assert ("aidlc-overview", 1, 100) in renderer
+    assert ("aidlc-overview", 0, 100) not in renderer  # Least recently used
+    assert len(renderer) == 2
+
+
+def test_section_flips_use_prefetched_sections(tmp_path, monkeypatch):
+    """Test that flipping sections uses the prefetched renders."""
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+    renderer = SectionRenderer()
+    monkeypatch.setattr(lesson, "RENDERER", renderer)
+
+    async def flip() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True)
+        async with app.run_test(size=(100, 30)) as pilot:
+            app.navigate_to("lesson", "Lesson", {"lesson_id": "aidlc-overview"})
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            assert ("aidlc-overview", 1, 100) in renderer
+            assert ("principles", 0, 100) in renderer  # The next lesson
+
+            hits = renderer.hits
+            await pilot.press("right")
+            await pilot.pause()
+            assert app.screen.current_section == 1
+            assert renderer.hits == hits + 1
+
+    asyncio.run(flip())
@@ -0,0 +1,137 @@
+"""Tests for localized content."""
+
+import asyncio
+import json
+
+import pytest
+
+from aidlc_explainer.__main__ import main
+from aidlc_explainer.app import AIDLCExplainerApp
+from aidlc_explainer.content import get_all_lessons, load_lesson, locale, snapshot
+from aidlc_explainer.content.glossary import get_all_terms
+from aidlc_explainer.content.models import Lesson, Section
+from aidlc_explainer.screens.search import SearchIndex
+
+
+@pytest.fixture
+def english():
+    """Leave the shared localizer in English after the test."""
+    yield
+    locale.LOCALIZER.set_locale(locale.DEFAULT_LOCALE)
+
+
+def test_untranslated_content_is_the_english_content():
+    """Test that untranslated content is the English content itself."""
+    base = {
+        "title": "Quiz",
+        "questions": [
+            {"id": "q1", "prompt": "First?", "options": ["a", "b"], "correct": 1},
+            {"id": "q2", "prompt": "Second?", "options": ["c", "d"], "correct": 0},
+        ],
+    }
+    strings = {"questions": {"q1": {"prompt": "¿Primera?", "options": [None, "be"]}}}
+
+    localized = locale.overlay(base, strings)
+    assert localized["questions"][0] == {
+        "id": "q1", "prompt": "¿Primera?", "options": ["a", "be"], "correct": 1,
+    }
+    assert localized["questions"][1] is base["questions"][1]
+    assert localized["title"] == "Quiz"
+    assert base["questions"][0]["prompt"] == "First?"  # The English content is left alone
+    assert locale.overlay(base, {"questions": {"q9": {"prompt": "?"}}}) is base
+
+    lesson = Lesson("l1", "Lesson", "About", [Section("s1", "One", "Text"), Section("s2", "Two", "Text")])
+    localized = locale.overlay(lesson, {"title": "Lección", "sections": {"s2": {"title": "Dos"}}})
+    assert (localized.title, localized.sections[1].title) == ("Lección", "Dos")
+    assert localized.sections[0] is lesson.sections[0]
+
+
+def test_structure_is_never_translated():
+    """Test that IDs, answers and other structure are never translated."""
+    stage = {"id": "design", "phase": "construction", "name": "Design", "gate": {"name": "Done"}}
+    strings = {"id": "diseño", "phase": "construcción", "name": "Diseño", "gate": {"name": "Listo"}}
+    assert locale.overlay(stage, strings) == {
+        "id": "design", "phase": "construction", "name": "Diseño", "gate": {"name": "Listo"},
+    }
+    question = {"id": "q1", "prompt": "?", "correct": 1}
+    assert locale.overlay(question, {"correct": 0, "prompt": 7}) is question
+
+
+def test_locale_files_are_read_on_first_use(tmp_path):
+    """Test that locale files are read the first time they are used."""
+    directory = tmp_path / "fr"
+    directory.mkdir()
+    (directory / "locale.json").write_text('{"$schema": "locale-v1", "name": "Français"}')
+    (directory / "glossary.json").write_text(json.dumps({
+        "$schema": "locale-v1", "strings": {"intent": {"term": "Intention"}},
+    }))
+    (directory / "quiz.json").write_text("not json")
+    assert locale.available_locales(tmp_path) == {"en": "English", "fr": "Français"}
+
+    localizer = locale.Localizer("fr", tmp_path)
+    assert localizer.catalog._strings == {}
+    terms = get_all_terms()
+    localized = localizer.localize("glossary", terms)
+    assert list(localizer.catalog._strings) == ["glossary"]
+    assert [term.term for term in localized if term.id == "intent"] == ["Intention"]
+    assert sum(new is not old for new, old in zip(localized, terms, strict=True)) == 1
+    assert localizer.localize("glossary", terms) is localized  # Localized once
+
+    quiz = {"questions": []}
+    assert localizer.localize("quiz", quiz) is quiz  # Unusable: English
+
+
+def test_switching_locale_rebuilds_only_translated_search_entries(english):
+    """Test that switching locale rebuilds only translated search entries."""
+    index = SearchIndex()
+    before = list(index.entries)
+    previous = locale.LOCALIZER.set_locale("es")
+    changed = locale.changed_items(previous, locale.LOCALIZER.catalog)
+
+    rebuilt = index.relocalize(changed)
+    assert rebuilt == len(changed["lessons"] | changed["lesson-index"]) + sum(
+        len(changed[section]) for section in ("glossary", "quiz", "gates", "stages")
+    )
+    after = index.entries
+    assert len(after) == len(before)
+    kept = [new for new, old in zip(after, before, strict=True) if new is old]
+    assert len(before) - len(kept) < len(before) // 4
+    titles = {entry.title for entry in after}
+    assert "Introducción a AI-DLC > ¿Qué es AI-DLC?" in titles
+    assert "Quiz > ¿Cuáles son las tres fases de AI-DLC?" in titles
+    assert "Phase: Inception" in titles  # Untranslated
+
+    question = snapshot.load("quiz")["questions"][0]
+    assert (question["id"], question["correct"]) == ("q1", 1)
+    assert get_all_lessons()[0]["title"] == "Introducción a AI-DLC"
+    assert load_lesson("principles").title == "10 Core Principles"
+
+
+def test_app_switches_locale_where_it_is(english, tmp_path, monkeypatch):
+    """Test that the app switches locale without leaving the screen."""
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+
+    async def switch() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True)
+        async with app.run_test(size=(100, 40)) as pilot:
+            app.navigate_to("practice", "Practice")
+            app.navigate_to("quiz", "Quiz")
+            await pilot.pause()
+            await pilot.press("f2")
+            await pilot.pause()
+            assert locale.LOCALIZER.locale == "es"
+            assert [item.screen_id for item in app.nav] == ["home", "practice", "quiz"]
+            prompt = app.screen.query_one("#question-text").render()
+            assert str(prompt) == "¿Cuáles son las tres fases de AI-DLC?"
+            app.switch_locale("en")
+            await pilot.pause()
+            prompt = app.screen.query_one("#question-text").render()
+            assert str(prompt) == "What are the three phases of AI-DLC?"
+
+    asyncio.run(switch())
+
+
+def test_unknown_locale_is_rejected(english, capsys):
+    """Test that an unknown locale is rejected."""
+    assert main(["--locale", "xx", "list-packs"]) == 1
+    assert "❌ Unknown locale: xx (available: en, es)" in capsys.readouterr().out
@@ -0,0 +1,73 @@
+"""Tests for methodology comparison data and calibrated profiles."""
+
+import json
+
+from aidlc_explainer.content.methodology_comparison import (
+    METHODOLOGIES,
+    PROFILE_SCHEMA,
+    get_all_methodologies,
+    get_methodology,
+    get_project_scenarios,
+    simulate_project,
+)
+
+
+def test_simulate_project_baseline_values():
+    """Test simulation results for the hard-coded factors."""
+    startup = get_project_scenarios()[1]  # medium complexity, volatile
+    results = {m.id: simulate_project(startup, m) for m in METHODOLOGIES}
+
+    assert results["waterfall"].total_weeks == 24
+    assert results["agile"].total_weeks == 8
+    assert results["aidlc"].total_weeks == 2
+    assert results["aidlc"].total_cost_units == 48
+
+
+def test_missing_profile_uses_defaults(tmp_path):
+    """Test that methodologies are unchanged without a profile."""
+    assert get_all_methodologies(tmp_path / "missing.json") == METHODOLOGIES
+
+
+def test_profile_overrides_factors(tmp_path):
+    """Test that a profile replaces only the calibrated factors."""
+    profile = tmp_path / "profile.json"
+    profile.write_text(json.dumps({
+        "$schema": PROFILE_SCHEMA,
+        "methodologies": {
+            "aidlc": {"cycle_time_factor": 0.25, "cost_factor": 0.4, "samples": 10},
+            "unknown": {"cycle_time_factor": 2.0},
+        },
+    }), encoding="utf-8")
+
+    aidlc = get_methodology("aidlc", profile)
+    assert aidlc.cycle_time_factor == 0.25
+    assert aidlc.cost_factor == 0.4
+    assert aidlc.volatility_time_factor == 0.9
+    assert get_methodology("agile", profile).cycle_time_factor == 0.5
+
+
+def test_invalid_profile_is_ignored(tmp_path):
+    """Test that profiles with the wrong schema or bad values are ignored."""
+    profile = tmp_path / "profile.json"
+    profile.write_text(json.dumps({
+        "$schema": "other",
+        "methodologies": {"aidlc": {"cycle_time_factor": 0.25}},
+    }), encoding="utf-8")
+    assert get_all_methodologies(profile) == METHODOLOGIES
+
+    profile.write_text(json.dumps({
+        "$schema": PROFILE_SCHEMA,
+        "methodologies": {"aidlc": {"cycle_time_factor": -1, "cost_factor": "x"}},
+    }), encoding="utf-8")
+    assert get_methodology("aidlc", profile).cycle_time_factor == 0.15
+
+
+def test_malformed_profile_is_ignored(tmp_path):
+    """Test that profiles with the wrong shape fall back to the defaults."""
+    profile = tmp_path / "profile.json"
+    for methodologies in ([1, 2], {"aidlc": [1, 2]}, {"aidlc": {"cycle_time_factor": True}}):
+        profile.write_text(json.dumps({
+            "$schema": PROFILE_SCHEMA,
+            "methodologies": methodologies,
+        }), encoding="utf-8")
+        assert get_all_methodologies(profile) == METHODOLOGIES
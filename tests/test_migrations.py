@@ -0,0 +1,127 @@
+"""Tests for state schema migrations."""
+
+import json
+
+import pytest
+
+from aidlc_explainer import migrations
+from aidlc_explainer.__main__ import main
+from aidlc_explainer.state import StateManager
+
+
+def _v1_to_v2(state: dict) -> dict:
+    quiz = state.setdefault("quiz", {})
+    quiz["history"] = [quiz.pop("last_score", 0)]
+    return state
+
+
+def _v2_to_v3(state: dict) -> dict:
+    state["stats"]["longest_streak"] = state["stats"].get("streak_days", 0)
+    return state
+
+
+@pytest.fixture
+def v3(monkeypatch):
+    """Pretend the app is at state-v3, with migrations from v1 and v2."""
+    monkeypatch.setattr(migrations, "STATE_VERSION", 3)
+    monkeypatch.setattr(migrations, "STATE_SCHEMA", "state-v3")
+    monkeypatch.setattr(migrations, "MIGRATIONS", {1: _v1_to_v2, 2: _v2_to_v3})
+
+
+def _state(schema: str = "state-v1", score: int = 7) -> dict:
+    return {
+        "$schema": schema,
+        "revision": 4,
+        "quiz": {"last_score": score, "attempts": 2},
+        "stats": {"streak_days": 3},
+    }
+
+
+def test_migrations_run_in_order_on_a_copy(v3):
+    """Test that migrations run in order on a copy."""
+    document = _state()
+    migrated = migrations.migrate(document)
+
+    assert migrated == {
+        "$schema": "state-v3",
+        "revision": 4,
+        "quiz": {"history": [7], "attempts": 2},
+        "stats": {"streak_days": 3, "longest_streak": 3},
+    }
+    assert document == _state()
+    assert migrations.migrate(migrated) is migrated
+    assert migrations.diff(document, migrated) == [
+        "~ $schema", "- quiz.last_score", "+ quiz.history", "+ stats.longest_streak",
+    ]
+    with pytest.raises(migrations.NewerStateError):
+        migrations.migrate(_state("state-v4"))
+    with pytest.raises(ValueError, match="Not a state document"):
+        migrations.migrate({"$schema": "quiz-v1"})
+
+
+def test_state_manager_upgrades_on_load_and_keeps_newer_state(v3, tmp_path):
+    """Test that state is upgraded on load and newer state is left alone."""
+    state_file = tmp_path / ".aidlc-explainer" / "state.json"
+    state_file.parent.mkdir()
+    state_file.write_text(json.dumps(_state()))
+    manager = StateManager(base_path=tmp_path)
+    manager.start_session()
+
+    saved = json.loads(state_file.read_text())
+    assert saved["$schema"] == "state-v3"
+    assert saved["quiz"]["history"] == [7]
+    assert saved["stats"]["total_sessions"] == 1
+
+    newer = json.dumps(_state("state-v9"))
+    state_file.write_text(newer)
+    manager = StateManager(base_path=tmp_path)
+    manager.start_session()
+    assert manager.read_only
+    assert state_file.read_text() == newer
+
+
+def test_tree_migration(v3, tmp_path):
+    """Test migrating a directory of state files."""
+    for i in range(30):
+        path = tmp_path / f"cohort-{i % 3}" / f"learner-{i}.json"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(_state("state-v2" if i % 10 == 0 else "state-v1", i)))
+    (tmp_path / "current.json").write_text(json.dumps(_state("state-v3")))
+    (tmp_path / "newer.json").write_text(json.dumps(_state("state-v4")))
+    (tmp_path / "notes.json").write_text("not json")
+    before = {path: path.read_text() for path in tmp_path.rglob("*.json")}
+
+    report, _ = migrations.migrate_tree(tmp_path, dry_run=True, processes=1, chunk_size=7)
+    assert (report.files, report.migrated, report.current, report.newer, report.skipped) == (
+        33, 30, 1, 1, 1
+    )
+    assert report.changes["+ stats.longest_streak"] == 30
+    assert report.changes["+ quiz.history"] == 27  # The state-v2 files already have it
+    assert {path: path.read_text() for path in tmp_path.rglob("*.json")} == before
+
+    report, _ = migrations.migrate_tree(tmp_path, processes=1, chunk_size=7)
+    assert report.migrated == 30 and report.failed == 0
+    learner = json.loads((tmp_path / "cohort-2" / "learner-5.json").read_text())
+    assert learner["$schema"] == "state-v3" and learner["quiz"]["history"] == [5]
+    for name in ("newer.json", "notes.json"):
+        assert (tmp_path / name).read_text() == before[tmp_path / name]
+    assert not list(tmp_path.rglob(".state-*"))
+
+    report, _ = migrations.migrate_tree(tmp_path, processes=2, chunk_size=7)
+    assert (report.migrated, report.current) == (0, 31)
+
+
+def test_failed_migration_leaves_the_file(v3, tmp_path, monkeypatch, capsys):
+    """Test that a failed migration leaves the file as it was."""
+    def broken(state: dict) -> dict:
+        raise KeyError("stats")
+
+    monkeypatch.setitem(migrations.MIGRATIONS, 2, broken)
+    path = tmp_path / "learner.json"
+    path.write_text(json.dumps(_state()))
+
+    assert main(["migrate-state", str(tmp_path)]) == 1
+    out = capsys.readouterr().out
+    assert "0 of 1 files migrated to state-v3" in out
+    assert "❌ " in out and "Migration from state-v2 failed" in out
+    assert json.loads(path.read_text()) == _state()
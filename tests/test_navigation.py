@@ -1,6 +1,28 @@
 """Tests for navigation system."""
 
-from aidlc_explainer.navigation import NavigationStack, NavItem
+import asyncio
+import gc
+import os
+import tracemalloc
+
+import pytest
+from textual.screen import Screen
+from textual.widgets import Static
+
+from aidlc_explainer import app as app_module
+from aidlc_explainer.app import AIDLCExplainerApp
+from aidlc_explainer.navigation import (
+    NavigationStack,
+    ScreenCache,
+    load_navigation,
+    navigation_path,
+    save_navigation,
+    screen_key,
+)
+from aidlc_explainer.screens.base import saved_progress
+from aidlc_explainer.screens.home import HomeScreen
+from aidlc_explainer.screens.lessons import LessonsScreen
+from aidlc_explainer.widgets import ExplorerFooter
 
 
 def test_navigation_stack_empty():
@@ -61,3 +83,210 @@ def test_navigation_context():
     
     current = nav.current()
     assert current.context == {"lesson_id": "aidlc-overview"}
+
+
+def test_navigation_index_and_truncate():
+    """Test finding items by screen key and popping back to them."""
+    nav = NavigationStack()
+    nav.push("home", "Home")
+    nav.push("glossary", "Glossary")
+    nav.push("lesson", "Lesson", {"lesson_id": "aidlc-overview"})
+    
+    assert nav.index(screen_key("glossary")) == 1
+    assert nav.index(screen_key("lesson", {"lesson_id": "aidlc-overview"})) == 2
+    assert nav.index(screen_key("lesson", {"lesson_id": "other"})) is None
+    
+    popped = nav.truncate(2)
+    assert [item.screen_id for item in popped] == ["lesson"]
+    assert nav.truncate(0) and len(nav) == 1
+
+
+def test_screen_key_ignores_context_order():
+    """Test that equal contexts give equal keys."""
+    assert screen_key("lesson", {"a": 1, "b": 2}) == screen_key("lesson", {"b": 2, "a": 1})
+    assert screen_key("search") == screen_key("search", {})
+
+
+def test_screen_cache_evicts_least_recently_used():
+    """Test LRU eviction, skipping screens that are still shown."""
+    cache = ScreenCache(max_size=2)
+    for key in ["a", "b", "c"]:
+        cache.put(key, key.upper())
+    cache.get("a")
+    
+    assert cache.evict(lambda screen: False) == ["B"]
+    assert "b" not in cache and len(cache) == 2
+    
+    cache.put("d", "D")
+    assert cache.evict(lambda screen: screen == "C") == ["A"]
+    assert cache.evict(lambda screen: True) == []
+
+
+class _SoakScreen(Screen):
+    def __init__(self, screen_id: str) -> None:
+        super().__init__()
+        self.screen_id = screen_id
+    
+    def compose(self):
+        yield Static(self.screen_id)
+
+
+class _SoakApp(AIDLCExplainerApp):
+    def _build_screen(self, screen_id, context):
+        return _SoakScreen(screen_id)
+
+
+def test_long_session_stays_bounded(tmp_path, monkeypatch):
+    """Test that screens, history and memory stay flat over many navigations.
+    
+    Set AIDLC_SOAK_NAVIGATIONS=10000 for a full soak run.
+    """
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+    navigations = int(os.environ.get("AIDLC_SOAK_NAVIGATIONS", "200"))
+    screen_ids = ["glossary", "search", "quick-reference", "glossary", "sources", "practice", "lesson"]
+    
+    def live_screens() -> int:
+        gc.collect()
+        return sum(isinstance(obj, _SoakScreen) for obj in gc.get_objects())
+    
+    async def soak() -> None:
+        app = _SoakApp(screenshot_mode=True, screen_cache_size=4)
+        async with app.run_test(size=(80, 24)) as pilot:
+            await pilot.pause()
+            tracemalloc.start()
+            baseline = None
+            try:
+                for i in range(navigations):
+                    screen_id = screen_ids[i % len(screen_ids)]
+                    context = {"lesson_id": str(i % 11)} if screen_id == "lesson" else None
+                    app.navigate_to(screen_id, screen_id, context)
+                    if i % 5 == 0:
+                        app.go_back()
+                    if i % 50 == 49:
+                        await pilot.pause()  # Screens finish mounting, so they can be evicted
+                    if i % 50 == 0 and i:
+                        await pilot.pause()  # Evicted screens are removed
+                        assert live_screens() <= 4 + len(app.nav)
+                        assert len(app.nav) <= len(screen_ids)
+                        assert len(app.screen_stack) == len(app.nav) + 1  # Plus the default screen
+                        assert len(app.screen_cache) <= 4 + len(app.nav)
+                    if i == navigations // 4:
+                        gc.collect()
+                        baseline = tracemalloc.get_traced_memory()[0]
+                gc.collect()
+                growth = tracemalloc.get_traced_memory()[0] - baseline
+            finally:
+                tracemalloc.stop()
+            assert growth < 500_000
+    
+    asyncio.run(soak())
+
+
+def test_textual_internals_used_to_release_screens_exist(tmp_path, monkeypatch):
+    """Test that the Textual internals the screen cache relies on are still there.
+    
+    The workarounds degrade silently without them, so a Textual upgrade
+    that renames them must fail here.
+    """
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+    assert callable(app_module.StylesCache.get_inner_outer.cache_clear)
+    
+    async def inspect() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True)
+        async with app.run_test(size=(80, 24)) as pilot:
+            app.navigate_to("glossary", "Glossary")
+            await pilot.pause()
+            assert isinstance(getattr(app, "__watchers", None), dict)  # Header title watchers
+            footer = app.screen.query_one(ExplorerFooter)
+            assert isinstance(getattr(footer, "__watchers", None), dict)
+            assert footer._closing is False
+    
+    asyncio.run(inspect())
+
+
+def test_navigation_document_round_trip():
+    """Test saving a navigation stack to a document and back."""
+    nav = NavigationStack()
+    nav.push("home", "Home")
+    nav.push("lesson", "Lesson", {"lesson_id": "what-is-aidlc"})
+    nav.current().view = {"section": 2, "scroll": [14]}
+    
+    document = nav.to_document()
+    restored = NavigationStack.from_document(document)
+    
+    assert document["items"][0] == ["home", "Home"]  # Empty context and view left out
+    assert [(i.screen_id, i.context, i.view) for i in restored] == [
+        ("home", {}, {}),
+        ("lesson", {"lesson_id": "what-is-aidlc"}, {"section": 2, "scroll": [14]}),
+    ]
+
+
+@pytest.mark.parametrize("document", [
+    [],
+    {"$schema": "other", "items": []},
+    {"$schema": "navigation-v1", "items": [["home"]]},
+    {"$schema": "navigation-v1", "items": [["home", "Home", "not a dict"]]},
+])
+def test_navigation_document_rejects_invalid(document):
+    """Test that invalid navigation documents are rejected."""
+    with pytest.raises(ValueError):
+        NavigationStack.from_document(document)
+
+
+def test_save_and_load_navigation(tmp_path):
+    """Test saving and loading a learner's navigation file."""
+    path = navigation_path(tmp_path, "ada lovelace")
+    nav = NavigationStack()
+    nav.push("home", "Home")
+    nav.push("glossary", "Glossary")
+    
+    assert load_navigation(path) is None
+    save_navigation(path, nav)
+    assert path.name == "ada_lovelace.json"
+    assert [i.screen_id for i in load_navigation(path)] == ["home", "glossary"]
+    
+    path.write_text("{", encoding="utf-8")
+    assert load_navigation(path) is None
+
+
+def test_saved_progress_is_validated():
+    """Test that saved quiz progress is validated."""
+    assert saved_progress({"position": 3, "score": 2, "mistakes": ["q2"]}, 10) == (3, 2, ["q2"])
+    assert saved_progress({}, 10) is None
+    assert saved_progress({"position": 10, "score": 10, "mistakes": []}, 10) is None  # Finished
+    assert saved_progress({"position": 3, "score": 3, "mistakes": ["q2"]}, 10) is None
+
+
+def test_resume_rebuilds_only_the_top_screen(tmp_path, monkeypatch):
+    """Test that resuming rebuilds only the screen on top."""
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+    
+    async def first_session() -> None:
+        app = AIDLCExplainerApp()
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            app.navigate_to("lessons", "Lessons")
+            app.navigate_to("lesson", "Lesson", {"lesson_id": "aidlc-overview"})
+            await pilot.pause()
+            app.screen.current_section = 1
+            app.action_quit()
+    
+    async def second_session() -> None:
+        app = AIDLCExplainerApp()
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            assert app.nav.breadcrumb() == ["Home", "Lessons", "Lesson"]
+            assert [item.screen is not None for item in app.nav] == [False, False, True]
+            assert app.screen.current_section == 1
+            
+            app.go_back()
+            await pilot.pause()
+            assert app.nav.current().screen is app.screen
+            assert isinstance(app.screen, LessonsScreen)
+            app.go_back()
+            await pilot.pause()
+            assert isinstance(app.screen, HomeScreen)
+            assert len(app.screen_stack) == 2
+    
+    asyncio.run(first_session())
+    asyncio.run(second_session())
@@ -0,0 +1,163 @@
+"""Tests for content packs installed as separate distributions."""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from aidlc_explainer.__main__ import main
+from aidlc_explainer.app import AIDLCExplainerApp
+from aidlc_explainer.content import get_all_lessons, load_lesson, packs
+
+MANIFEST = """
+MANIFEST = {
+    "title": "ACME Security",
+    "lessons": [{
+        "id": "threat-modeling",
+        "title": "Threat Modeling",
+        "description": "Find threats before Construction",
+        "source": "acme_pack.lessons:THREAT_MODELING",
+    }],
+    "quizzes": [{
+        "id": "acme-secure-coding",
+        "title": "Secure Coding",
+        "description": "ACME's secure coding rules",
+        "source": "acme_pack:quiz.json",
+    }],
+}
+"""
+
+LESSONS = """
+from aidlc_explainer.content.models import Lesson, Section
+
+THREAT_MODELING = Lesson(
+    id="threat-modeling",
+    title="Threat Modeling",
+    description="Find threats before Construction",
+    sections=[Section(id="intro", title="Why", content="Threats are cheapest to fix early.")],
+)
+"""
+
+QUIZ = {
+    "$schema": "quiz-v1",
+    "questions": [{
+        "id": "acme-q1",
+        "prompt": "Where do secrets belong?",
+        "options": ["In the code", "In the vault", "In the wiki", "In chat"],
+        "correct": 1,
+        "explanation": "Secrets live in the vault.",
+        "sources": {"local": ["README.md"], "upstream": []},
+    }],
+}
+
+
+@pytest.fixture
+def installed_pack(tmp_path, monkeypatch):
+    """Install a pack distribution on sys.path, with a fresh registry."""
+    package = tmp_path / "site" / "acme_pack"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "manifest.py").write_text(MANIFEST, encoding="utf-8")
+    (package / "lessons.py").write_text(LESSONS, encoding="utf-8")
+    (package / "quiz.json").write_text(json.dumps(QUIZ), encoding="utf-8")
+    dist_info = tmp_path / "site" / "acme_pack-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: acme-pack\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        f"[{packs.ENTRY_POINT_GROUP}]\n"
+        "acme = acme_pack.manifest:MANIFEST\n"
+        "broken = acme_pack.missing:MANIFEST\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path / "site"))
+    monkeypatch.setattr(packs, "REGISTRY", packs.PackRegistry())
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+    yield
+    for name in [m for m in sys.modules if m.startswith("acme_pack")]:
+        del sys.modules[name]
+
+
+def test_packs_are_listed_without_importing_their_content(installed_pack):
+    """Test that packs are listed without importing their content."""
+    lessons = get_all_lessons()
+
+    assert lessons[-1] == {
+        "id": "threat-modeling",
+        "title": "Threat Modeling",
+        "description": "Find threats before Construction",
+        "pack": "acme",
+    }
+    assert "acme_pack.manifest" in sys.modules
+    assert "acme_pack.lessons" not in sys.modules
+    assert packs.REGISTRY.errors == [
+        "Pack 'broken' not loaded: No module named 'acme_pack.missing'"
+    ]
+
+    lesson = load_lesson("threat-modeling")
+    assert lesson.sections[0].title == "Why"
+    assert load_lesson("threat-modeling") is lesson
+    assert packs.REGISTRY.load("quizzes", "acme-secure-coding") == QUIZ
+
+
+def test_invalid_manifests_are_rejected():
+    """Test that invalid pack manifests are rejected."""
+    with pytest.raises(ValueError, match="no source"):
+        packs.PackManifest.from_dict("x", {"lessons": [{"id": "a", "title": "A", "description": "d"}]})
+    with pytest.raises(ValueError, match="not a dict"):
+        packs.PackManifest.from_dict("x", ["lessons"])
+    with pytest.raises(ValueError, match="Unknown lesson"):
+        load_lesson("no-such-lesson")
+
+
+def test_pack_quiz_opens_from_practice(installed_pack):
+    """Test opening a pack quiz from Practice."""
+    async def take() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True)
+        async with app.run_test(size=(100, 40)) as pilot:
+            app.navigate_to("practice", "Practice")
+            await pilot.pause()
+            assert "acme_pack.lessons" not in sys.modules
+            await pilot.press("down", "down", "enter")
+            await pilot.pause()
+            assert app.screen.quiz_id == "acme-secure-coding"
+            prompt = app.screen.query_one("#question-text").render()
+            assert str(prompt) == "Where do secrets belong?"
+
+    asyncio.run(take())
+
+
+def test_pack_item_that_cannot_be_loaded_is_reported(installed_pack, tmp_path):
+    """Test that a pack item whose content cannot be loaded is reported."""
+    manifest = tmp_path / "site" / "acme_pack" / "manifest.py"
+    manifest.write_text(MANIFEST.replace('"source": "acme_pack:quiz.json",', """"source": "acme_pack:quiz.json",
+    }, {
+        "id": "acme-missing", "title": "Missing", "description": "d",
+        "source": "nonexistent_pkg:quiz.json",
+    }, {
+        "id": "acme-empty", "title": "Empty", "description": "d",
+        "source": "acme_pack:empty.json",""", 1), encoding="utf-8")
+    (tmp_path / "site" / "acme_pack" / "empty.json").write_text('{"$schema": "quiz-v1"}')
+
+    with pytest.raises(ValueError, match="has no questions list"):
+        packs.REGISTRY.load("quizzes", "acme-empty")
+
+    async def take() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True)
+        async with app.run_test(size=(100, 40)) as pilot:
+            app.navigate_to("practice", "Practice")
+            for quiz_id in ("acme-missing", "acme-empty"):
+                app.navigate_to("quiz", "Quiz", {"quiz_id": quiz_id})
+                await pilot.pause()
+                assert [item.screen_id for item in app.nav] == ["home", "practice"]
+            messages = [n.message for n in app._notifications]
+            assert any("cannot load nonexistent_pkg:quiz.json" in m for m in messages)
+
+    asyncio.run(take())
+
+
+def test_list_packs_command(installed_pack, capsys):
+    """Test the list-packs command."""
+    assert main(["list-packs"]) == 1  # The broken pack is an error
+    out = capsys.readouterr().out
+    assert "📦 acme (acme-pack): ACME Security - 1 lessons, 1 quizzes, 0 gates" in out
+    assert "❌ Pack 'broken' not loaded" in out
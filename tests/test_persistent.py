@@ -0,0 +1,90 @@
+"""Tests for immutable, structurally shared state."""
+
+import json
+from copy import deepcopy
+
+import pytest
+
+from aidlc_explainer.persistent import assoc, diff, dissoc, freeze, thaw
+from aidlc_explainer.state import DEFAULT_STATE, StateManager
+
+
+def test_updates_share_unchanged_branches():
+    """Test that updates share the branches they leave unchanged."""
+    doc = freeze({"quiz": {"attempts": 1, "mistakes": ["q1"]}, "stats": {"sessions": 2}})
+    updated = assoc(doc, ("quiz", "attempts"), 2)
+
+    assert doc["quiz"]["attempts"] == 1
+    assert updated["quiz"]["attempts"] == 2
+    assert updated["stats"] is doc["stats"]
+    assert updated["quiz"]["mistakes"] is doc["quiz"]["mistakes"]
+    assert assoc(updated, ("quiz", "attempts"), 2) is updated
+    assert diff(doc, updated) == [("quiz", "attempts")]
+    assert diff(updated, dissoc(updated, ("stats", "sessions"))) == [("stats", "sessions")]
+    assert assoc(doc, ("new", "key"), 1)["new"] == {"key": 1}
+
+    assert doc == {"quiz": {"attempts": 1, "mistakes": ["q1"]}, "stats": {"sessions": 2}}
+    assert json.loads(json.dumps(updated))["quiz"]["mistakes"] == ["q1"]
+
+
+def test_frozen_documents_cannot_be_changed_in_place():
+    """Test that frozen documents cannot be changed in place."""
+    doc = freeze({"lessons": {"completed": ["intro"]}})
+    with pytest.raises(TypeError):
+        doc["lessons"]["completed"] = []
+    with pytest.raises(TypeError):
+        doc.setdefault("stats", {})
+    with pytest.raises(AttributeError):
+        doc["lessons"]["completed"].append("principles")
+    with pytest.raises(TypeError):
+        DEFAULT_STATE["gamification"]["xp"] = 100
+
+    copy = deepcopy(doc)
+    copy["lessons"]["completed"].append("principles")
+    assert type(copy) is dict and thaw(doc) == {"lessons": {"completed": ["intro"]}}
+    assert doc["lessons"]["completed"] == ["intro"]
+
+
+def test_state_versions_are_snapshots(tmp_path):
+    """Test that state versions are snapshots with cached getters."""
+    state = StateManager(base_path=tmp_path)
+    progress = state.get_overall_progress()
+    assert state.get_overall_progress() is progress  # Computed once per version
+    before = state.snapshot
+
+    state.save_quiz_result(20, 24, ["q3"])
+    assert before["quiz"]["attempts"] == 0
+    assert state.get_overall_progress() is not progress
+    assert state.get_quiz_stats()["mistakes"] == ["q3"]
+    changes = state.changes_since(before)
+    assert "quiz.last_score" in changes and "gamification.xp" in changes
+    assert not any(change.startswith("lessons") for change in changes)
+
+    state.reset()
+    assert state.get_gamification_stats()["xp"] == 0
+    assert DEFAULT_STATE["gamification"]["xp"] == 0  # Reset shares the defaults untouched
+
+
+def test_undo_and_reload(tmp_path):
+    """Test undoing saves and reloading changes saved elsewhere."""
+    state = StateManager(base_path=tmp_path)
+    state.mark_lesson_started("intro")
+    state.mark_lesson_completed("intro")
+    assert state.get_lessons_stats()["completed"] == ["intro"]
+
+    assert state.undo() and state.undo()  # Completing saves twice: the XP, then the lesson
+    assert state.get_lessons_stats()["completed"] == []
+    assert "intro" in state.get_lessons_stats()["in_progress"]
+    assert StateManager(base_path=tmp_path).get_lessons_stats()["completed"] == []
+
+    other = StateManager(base_path=tmp_path)
+    progress = state.get_overall_progress()
+    assert not state.reload()
+    assert state.get_overall_progress() is progress
+    other.save_quiz_result(10, 24, [])
+    assert state.reload()
+    assert state.get_quiz_stats()["last_score"] == 10
+
+    while state.undo():
+        pass
+    assert state.get_quiz_stats()["attempts"] == 0
@@ -0,0 +1,68 @@
+"""Tests for the portfolio discrete-event simulation."""
+
+import pytest
+
+from aidlc_explainer.analysis.portfolio import (
+    DEFAULT_CAPACITY,
+    HUMAN_VALIDATOR,
+    INTENT_OWNER,
+    PortfolioSimulation,
+    build_portfolio,
+)
+from aidlc_explainer.content.transition_mapping import get_role_mappings
+
+
+def test_pools_come_from_role_mappings():
+    """Test that every AI-DLC role from the transition mapping has a pool."""
+    roles = {m.aidlc_role for m in get_role_mappings()}
+    assert set(DEFAULT_CAPACITY) == roles
+
+    result = PortfolioSimulation(build_portfolio(8)).run()
+    assert set(result.pools) == roles
+
+
+def test_all_projects_complete():
+    """Test that every project is deployed and stats are consistent."""
+    result = PortfolioSimulation(build_portfolio(200), seed=3).run()
+
+    assert result.completed == 200
+    assert len(result.cycle_hours) == 200
+    assert all(hours > 0 for hours in result.cycle_hours)
+    assert result.bolts >= 200
+    assert result.handoffs > result.bolts
+    for pool in result.pools.values():
+        assert 0.0 <= pool.utilization(result.horizon_hours) <= 1.0
+        assert pool.mean_queue(result.horizon_hours) >= 0.0
+
+
+def test_simulation_is_deterministic():
+    """Test that the same seed reproduces the same run."""
+    first = PortfolioSimulation(build_portfolio(50), seed=7).run().to_summary()
+    second = PortfolioSimulation(build_portfolio(50), seed=7).run().to_summary()
+    first.pop("elapsed_seconds")
+    second.pop("elapsed_seconds")
+    assert first == second
+
+
+def test_scarce_capacity_creates_queues():
+    """Test that a bottleneck role queues work and raises cycle time."""
+    portfolio = build_portfolio(40)
+    scarce = PortfolioSimulation(
+        portfolio, capacity={HUMAN_VALIDATOR: 1}, arrival_hours=0, seed=1
+    ).run()
+    ample = PortfolioSimulation(
+        portfolio, capacity={HUMAN_VALIDATOR: 40}, arrival_hours=0, seed=1
+    ).run()
+
+    assert scarce.pools[HUMAN_VALIDATOR].max_queue > ample.pools[HUMAN_VALIDATOR].max_queue
+    assert scarce.pools[HUMAN_VALIDATOR].mean_wait() > ample.pools[HUMAN_VALIDATOR].mean_wait()
+    assert scarce.cycle_percentile(50) > ample.cycle_percentile(50)
+    assert scarce.pools[HUMAN_VALIDATOR].utilization(scarce.horizon_hours) > 0.9
+
+
+def test_invalid_capacity_rejected():
+    """Test that unknown roles and empty pools are rejected."""
+    with pytest.raises(ValueError, match="Unknown AI-DLC role"):
+        PortfolioSimulation(build_portfolio(1), capacity={"Scrum Master": 2})
+    with pytest.raises(ValueError, match=INTENT_OWNER):
+        PortfolioSimulation(build_portfolio(1), capacity={INTENT_OWNER: 0})
@@ -0,0 +1,55 @@
+"""Tests for the compiled content snapshot."""
+
+from aidlc_explainer.benchmarks import startup
+from aidlc_explainer.content import load_lesson, snapshot
+from aidlc_explainer.content.snapshot import ContentStore
+
+
+def test_snapshot_matches_source(tmp_path):
+    """Test that every snapshot section matches its source."""
+    path = tmp_path / "content.snapshot"
+    sizes = snapshot.build_snapshot(path)
+    store = ContentStore(path)
+
+    assert set(sizes) == set(snapshot.SECTIONS)
+    for name in snapshot.SECTIONS:
+        assert store.load(name) == snapshot.load_from_source(name), name
+    assert set(store.sources.values()) == {"snapshot"}
+
+
+def test_sections_load_lazily_and_json_is_fresh(tmp_path):
+    """Test that sections load on first use and JSON sections are fresh copies."""
+    path = tmp_path / "content.snapshot"
+    snapshot.build_snapshot(path)
+    store = ContentStore(path)
+
+    assert store.sources == {}
+    assert store.load("glossary") is store.load("glossary")
+    quiz = store.load("quiz")
+    quiz["questions"].clear()
+    assert store.load("quiz")["questions"]
+    assert set(store.sources) == {"glossary", "quiz"}
+
+
+def test_stale_or_broken_snapshot_falls_back_to_source(tmp_path, monkeypatch):
+    """Test that a stale or broken snapshot falls back to the sources."""
+    path = tmp_path / "content.snapshot"
+    snapshot.build_snapshot(path)
+    monkeypatch.setattr(snapshot, "source_digest", lambda: b"\0" * 32)  # Sources edited since
+    stale = ContentStore(path)
+    assert stale.load("lessons")["principles"] == load_lesson("principles")
+    assert stale.sources == {"lessons": "source"}
+
+    broken = tmp_path / "broken.snapshot"
+    broken.write_bytes(b"not a snapshot")
+    assert ContentStore(broken).load("gates")["scenarios"]
+    assert ContentStore(tmp_path / "missing.snapshot").load("artifacts")
+
+
+def test_startup_benchmark_compares_both_paths():
+    """Test that the startup benchmark times both loading paths."""
+    results = startup.run_benchmark(repeats=1)
+
+    assert [r.mode for r in results] == ["snapshot", "source"]
+    assert all(r.summary()["total_ms"] > 0 for r in results)
+    assert "snapshot" in startup.format_report(results)
@@ -0,0 +1,101 @@
+"""Tests for the content packs' source reference checks."""
+
+import json
+import time
+
+from aidlc_explainer import source_check
+from aidlc_explainer.__main__ import main
+from aidlc_explainer.source_check import Citation
+from aidlc_explainer.sources import LineIndex, SourceResolver
+
+DOC = "\n".join(f"Line {n}: {word} practice" for n, word in enumerate(
+    ["intent", "units", "bolts", "gates", "evidence", "rituals", "mobs", "state"], start=1
+)) + "\n"
+
+
+def _check(tmp_path, refs: list[str], edited: str) -> list[source_check.Finding]:
+    """Record anchors against DOC, edit it, then check the references again."""
+    doc = tmp_path / "doc.md"
+    doc.write_text(DOC, encoding="utf-8")
+    citations = [Citation("pack.json", f"refs[{i}]", ref) for i, ref in enumerate(refs)]
+    anchors = source_check.record_anchors(citations, SourceResolver([tmp_path]))["anchors"]
+
+    doc.write_text(edited, encoding="utf-8")
+    return source_check.check_citations(citations, anchors, SourceResolver([tmp_path]))
+
+
+def test_extracts_every_local_reference(tmp_path):
+    """Test that every local reference in a content pack is extracted."""
+    (tmp_path / "pack.json").write_text(json.dumps({
+        "metadata": {"source_document": "doc.md", "source_lines": "1-3"},
+        "questions": [{"sources": {"local": ["doc.md#L2", "doc.md#L4-5"], "upstream": ["x"]}}],
+        "stages": [{"source": {"local": "doc.md#L7", "upstream": "y"}}],
+    }), encoding="utf-8")
+
+    citations = source_check.extract_citations(tmp_path, ("pack.json",))
+
+    assert [(c.location, c.ref) for c in citations] == [
+        ("metadata.source_document", "doc.md#L1-3"),
+        ("questions[0].sources.local[0]", "doc.md#L2"),
+        ("questions[0].sources.local[1]", "doc.md#L4-5"),
+        ("stages[0].source.local", "doc.md#L7"),
+    ]
+
+
+def test_moved_text_is_stale_with_a_suggestion(tmp_path):
+    """Test that an anchor whose text moved is stale, with a suggested range."""
+    edited = "# New heading\n\n" + DOC.replace("bolts practice", "bolts practise")
+    findings = _check(tmp_path, ["doc.md#L2-3", "doc.md#L5", "doc.md#L12", "doc.md"], edited)
+
+    assert [(f.status, f.suggestion) for f in findings] == [
+        (source_check.STALE, "doc.md#L4-5"),  # Moved and reworded
+        (source_check.STALE, "doc.md#L7"),  # Moved
+        (source_check.OUT_OF_RANGE, None),  # Never in range
+        (source_check.OK, None),  # No anchor
+    ]
+
+
+def test_unchanged_and_unrecorded_anchors(tmp_path):
+    """Test unchanged, invalid and missing anchors."""
+    findings = _check(tmp_path, ["doc.md#L1,L8", "doc.md#Lx", "gone.md#L1"], DOC)
+
+    assert [f.status for f in findings] == [
+        source_check.OK, source_check.INVALID, source_check.MISSING
+    ]
+    anchors = {}
+    findings = source_check.check_citations(
+        [Citation("pack.json", "refs[0]", "doc.md#L1")], anchors, SourceResolver([tmp_path])
+    )
+    assert findings[0].status == source_check.UNRECORDED
+
+
+def test_relocate_prefers_nearest_match():
+    """Test that relocating prefers an exact, then the nearest, match."""
+    index = LineIndex("a\nb\nc\nb\nx\n")
+
+    assert source_check.relocate(index, "b\nc") == (2, 3)
+    assert source_check.relocate(index, "b", near=4) == (2, 2)  # Exact match wins
+    assert source_check.relocate(index, "completely different text") is None
+
+
+def test_large_content_set_checks_quickly(tmp_path):
+    """Test that checking a large set of references stays fast."""
+    doc = tmp_path / "doc.md"
+    doc.write_text("".join(f"Principle {n} of the method\n" for n in range(20_000)), encoding="utf-8")
+    citations = [
+        Citation("pack.json", f"refs[{i}]", f"doc.md#L{i % 19_000 + 1}-{i % 19_000 + 20}")
+        for i in range(50_000)
+    ]
+    resolver = SourceResolver([tmp_path])
+    anchors = source_check.record_anchors(citations, resolver)["anchors"]
+
+    start = time.perf_counter()
+    findings = source_check.check_citations(citations, anchors, resolver)
+    assert time.perf_counter() - start < 1.0
+    assert {f.status for f in findings} == {source_check.OK}
+
+
+def test_shipped_content_references_hold(capsys):
+    """Test that the shipped content's references all hold."""
+    assert main(["check-sources"]) == 0
+    assert "references in 4 content packs" in capsys.readouterr().out
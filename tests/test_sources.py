@@ -0,0 +1,82 @@
+"""Tests for resolving local source references."""
+
+import asyncio
+import os
+
+import pytest
+
+from aidlc_explainer import sources
+from aidlc_explainer.app import AIDLCExplainerApp
+from aidlc_explainer.sources import LineIndex, SourceRef, SourceResolver
+
+
+def test_parse_references():
+    """Test parsing and formatting source references."""
+    assert SourceRef.parse("doc.md#L80-99") == SourceRef("doc.md", ((80, 99),))
+    assert SourceRef.parse("doc.md#L89,L99").ranges == ((89, 89), (99, 99))
+    assert SourceRef.parse("dir/doc.md") == SourceRef("dir/doc.md")
+    assert str(SourceRef.parse("doc.md#L1-L3,L7")) == "doc.md#L1-3,L7"
+    for bad in ("doc.md#intro", "doc.md#L9-3", "doc.md#L0", "#L4"):
+        with pytest.raises(ValueError):
+            SourceRef.parse(bad)
+
+
+def test_line_index_slices_lines():
+    """Test slicing lines from a line index."""
+    index = LineIndex("one\ntwo\n\nfour")
+
+    assert len(index) == 4
+    assert index.line(1) == "one"
+    assert index.lines(2, 4) == "two\n\nfour"
+    with pytest.raises(IndexError):
+        index.lines(4, 5)
+    assert len(LineIndex("one\ntwo\n")) == 2
+
+
+def test_excerpts_are_cached_until_the_file_changes(tmp_path):
+    """Test that excerpts are cached until their file changes."""
+    doc = tmp_path / "doc.md"
+    doc.write_text("alpha\nbeta\n\ngamma\ndelta\n", encoding="utf-8")
+    resolver = SourceResolver([tmp_path])
+
+    assert resolver.excerpt("doc.md#L2-4") == "beta\n\ngamma"
+    assert resolver.excerpt("doc.md#L1,L5") == "alpha\n…\ndelta"
+    assert resolver.excerpt("doc.md#L1-5", max_lines=2) == "alpha\nbeta\n…"
+    assert resolver.index("doc.md") is resolver.index("doc.md")
+
+    doc.write_text("changed\n", encoding="utf-8")
+    os.utime(doc, ns=(0, 0))
+    assert resolver.excerpt("doc.md#L1") == "changed"
+    assert resolver.excerpt("doc.md#L2") is None  # Out of range
+    assert resolver.excerpt("doc.md") is None  # No anchor
+    assert resolver.excerpt("missing.md#L1") is None
+
+
+def test_every_principles_reference_resolves():
+    """Test that every reference to the principles document resolves."""
+    resolver = SourceResolver()
+    index = resolver.index("AI-SDLC_best-practice_method_principles.md")
+
+    assert index is not None
+    assert resolver.excerpt("AI-SDLC_best-practice_method_principles.md#L80-99").startswith(
+        index.line(80)
+    )
+
+
+def test_quiz_feedback_quotes_the_source(tmp_path, monkeypatch):
+    """Test that quiz feedback quotes the cited source."""
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+
+    async def answer() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True)
+        async with app.run_test(size=(100, 40)) as pilot:
+            app.navigate_to("quiz", "Quiz")
+            await pilot.pause()
+            await pilot.press("a")
+            await pilot.pause()
+            quoted = app.screen.query(".source-excerpt")
+            question = app.screen.questions[app.screen.current_index]
+            assert len(quoted) == 1
+            assert str(quoted.first().render()) == sources.excerpt(question["sources"]["local"][0])
+
+    asyncio.run(answer())
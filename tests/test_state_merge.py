@@ -0,0 +1,124 @@
+"""Tests for concurrent state saves: atomic writes, revisions and merging."""
+
+import json
+import multiprocessing
+from copy import deepcopy
+
+import pytest
+
+from aidlc_explainer import storage
+from aidlc_explainer.state import DEFAULT_STATE, StateManager, merge_states
+
+PROCESSES = 4
+ROUNDS = 15
+
+
+def test_merge_adds_counters_and_unions_sets():
+    """Test merging counters, best scores and completed sets."""
+    base = deepcopy(DEFAULT_STATE)
+    base["gamification"]["xp"] = 100
+    ours = deepcopy(base)
+    theirs = deepcopy(base)
+
+    ours["gamification"]["xp"] = 130
+    ours["lessons"]["completed"] = ["aidlc-overview"]
+    ours["quiz"].update(best_score=18, last_score=18, attempts=1, completed=True)
+    theirs["gamification"]["xp"] = 210
+    theirs["lessons"]["completed"] = ["core-principles"]
+    theirs["lessons"]["in_progress"]["aidlc-overview"] = {"last_section": 2}
+    theirs["quiz"].update(best_score=20, last_score=20, attempts=1, completed=True)
+    theirs["achievements"]["unlocked"] = ["first-steps"]
+
+    merged = merge_states(base, ours, theirs)
+
+    assert merged["gamification"]["xp"] == 240
+    assert merged["gamification"]["level"] == 2
+    assert merged["lessons"]["completed"] == ["core-principles", "aidlc-overview"]
+    assert merged["lessons"]["in_progress"] == {}  # Completed lessons drop out
+    assert merged["quiz"]["best_score"] == 20
+    assert merged["quiz"]["attempts"] == 2
+    assert merged["quiz"]["last_score"] == 18  # Ours wins when both changed
+    assert merged["achievements"]["unlocked"] == ["first-steps"]
+
+
+def test_stale_instance_merges_instead_of_overwriting(tmp_path):
+    """Test that a stale instance merges instead of overwriting."""
+    first = StateManager(base_path=tmp_path)
+    second = StateManager(base_path=tmp_path)
+
+    first.mark_lesson_completed("aidlc-overview")
+    second.mark_lesson_completed("core-principles")
+    second.save_gate_result(9, 10, [])
+
+    stored = json.loads((tmp_path / ".aidlc-explainer" / "state.json").read_text())
+    assert stored["revision"] == 5  # One per save across both instances
+    assert sorted(stored["lessons"]["completed"]) == ["aidlc-overview", "core-principles"]
+    assert stored["gamification"]["xp"] == 200
+    assert stored["gatekeeper"]["best_score"] == 9
+
+
+def test_sqlite_merges_same_learner_in_two_instances(tmp_path):
+    """Test merging one learner saved from two SQLite instances."""
+    path = tmp_path / "state.db"
+    first = StateManager(tmp_path, backend=storage.SQLiteBackend(path), learner_id="ada")
+    second = StateManager(tmp_path, backend=storage.SQLiteBackend(path), learner_id="ada")
+
+    first.record_simulation_run("greenfield")
+    second.record_simulation_run("brownfield")
+
+    stored = storage.SQLiteBackend(path).load("ada")
+    assert stored["simulator"]["runs"] == 2
+    assert stored["simulator"]["request_types_explored"] == ["greenfield", "brownfield"]
+
+
+def test_reset_overwrites_instead_of_merging(tmp_path):
+    """Test that reset overwrites the stored state."""
+    first = StateManager(base_path=tmp_path)
+    first.add_xp("lesson_completed")
+    second = StateManager(base_path=tmp_path)
+    first.add_xp("lesson_completed")
+
+    second.reset()
+
+    assert StateManager(base_path=tmp_path).get_gamification_stats()["xp"] == 0
+
+
+def test_save_leaves_no_temp_files(tmp_path):
+    """Test that saves leave no temporary files behind."""
+    state = StateManager(base_path=tmp_path)
+    for _ in range(3):
+        state.add_xp("lesson_section")
+
+    names = sorted(p.name for p in (tmp_path / ".aidlc-explainer").iterdir())
+    assert names == ["events", "state.json", "state.json.lock"]
+
+
+def _hammer(base_path, index):
+    state = StateManager(base_path=base_path)
+    for _ in range(ROUNDS):
+        state.add_xp("lesson_section")
+    state.mark_lesson_completed(f"lesson-{index}")
+    state.save_quiz_result(10 + index, 24, [])
+
+
+@pytest.mark.skipif(storage.fcntl is None, reason="needs POSIX file locks")
+def test_processes_hammering_one_state_dir_lose_nothing(tmp_path):
+    """Test that concurrent processes lose no updates."""
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_hammer, args=(tmp_path, i)) for i in range(PROCESSES)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    state = StateManager(base_path=tmp_path)
+    quiz_xp = sum(25 * (10 + i) + 50 for i in range(PROCESSES))
+    expected_xp = PROCESSES * (10 * ROUNDS + 100) + quiz_xp
+    assert state.get_gamification_stats()["xp"] == expected_xp
+    assert sorted(state.get_lessons_stats()["completed"]) == [
+        f"lesson-{i}" for i in range(PROCESSES)
+    ]
+    assert state.get_quiz_stats()["attempts"] == PROCESSES
+    assert state._state["quiz"]["best_score"] == 10 + PROCESSES - 1
+    assert "first-steps" in state.get_achievements()["unlocked"]
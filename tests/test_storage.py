@@ -0,0 +1,118 @@
+"""Tests for state storage backends."""
+
+import sqlite3
+
+import pytest
+
+from aidlc_explainer.benchmarks.state_backends import run_backend
+from aidlc_explainer.state import DEFAULT_STATE, StateManager
+from aidlc_explainer.storage import (
+    BACKEND_ENV,
+    JSONFileBackend,
+    SQLiteBackend,
+    open_backend,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    backend = SQLiteBackend(tmp_path / "state.db")
+    yield backend
+    backend.close()
+
+
+def test_sqlite_uses_wal(db):
+    """Test that the SQLite backend runs in WAL mode."""
+    mode = db._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_sqlite_keeps_one_row_per_learner(db):
+    """Test that each learner has one row, updated in place."""
+    db.save("ada", {"xp": 1})
+    db.save("grace", {"xp": 2})
+    db.save("ada", {"xp": 3})
+
+    assert db.load("ada") == {"xp": 3, "revision": 2}
+    assert db.load("grace") == {"xp": 2, "revision": 1}
+    assert db.load("linus") is None
+    assert db.learners() == ["ada", "grace"]
+    version = db._conn.execute(
+        "SELECT version FROM learner_state WHERE learner_id = 'ada'"
+    ).fetchone()[0]
+    assert version == 2
+
+
+def test_state_manager_with_sqlite_backend(tmp_path):
+    """Test that learners sharing a database keep separate progress."""
+    path = tmp_path / "state.db"
+    ada = StateManager(base_path=tmp_path, backend=SQLiteBackend(path), learner_id="ada")
+    grace = StateManager(base_path=tmp_path, backend=SQLiteBackend(path), learner_id="grace")
+
+    ada.save_quiz_result(24, 24, [])
+    grace.add_xp("lesson_section")
+
+    reloaded = StateManager(base_path=tmp_path, backend=SQLiteBackend(path), learner_id="ada")
+    assert reloaded.get_quiz_stats()["last_score"] == 24
+    assert reloaded.get_gamification_stats()["xp"] == ada.get_gamification_stats()["xp"]
+    grace_again = StateManager(
+        base_path=tmp_path, backend=SQLiteBackend(path), learner_id="grace"
+    )
+    assert grace_again.get_gamification_stats()["xp"] == 10
+    for manager in (ada, grace, reloaded, grace_again):
+        manager.close()
+
+
+def test_open_backend_reads_environment(tmp_path, monkeypatch):
+    """Test choosing the backend from the environment."""
+    assert isinstance(open_backend(tmp_path), JSONFileBackend)
+
+    monkeypatch.setenv(BACKEND_ENV, "sqlite")
+    backend = open_backend(tmp_path)
+    assert isinstance(backend, SQLiteBackend)
+    backend.close()
+
+    with pytest.raises(ValueError):
+        open_backend(tmp_path, "yaml")
+
+
+def test_corrupt_database_falls_back_to_defaults(tmp_path):
+    """Test that an undecodable row loads as default state."""
+    path = tmp_path / "state.db"
+    backend = SQLiteBackend(path)
+    backend._conn.execute(
+        "INSERT INTO learner_state VALUES ('ada', 1, '', 'not json')"
+    )
+    state = StateManager(base_path=tmp_path, backend=backend, learner_id="ada")
+    assert state.get_gamification_stats()["xp"] == 0
+    state.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        backend.load("ada")  # Closed with the manager
+
+
+def test_fresh_managers_do_not_share_default_state(tmp_path):
+    """Test that managers never share the default state."""
+    a = StateManager(base_path=tmp_path / "a")
+    b = StateManager(base_path=tmp_path / "b")
+
+    a.add_xp("lesson_completed")
+
+    assert b.get_gamification_stats()["xp"] == 0
+    assert DEFAULT_STATE["gamification"]["xp"] == 0
+
+
+def test_benchmark_sqlite_keeps_every_learner():
+    """Test that concurrent SQLite writers keep every learner."""
+    result = run_backend("sqlite", learners=6, rounds=3, processes=2)
+
+    assert result.operations == 18
+    assert result.intact == 6
+    assert result.to_summary()["latency_ms"]["max"] >= result.latency_percentile(50)
+
+
+def test_benchmark_json_keeps_at_most_last_writer():
+    """Test that concurrent writers to one JSON file keep only the last."""
+    result = run_backend("json", learners=6, rounds=3, processes=2)
+
+    assert result.operations == 18
+    assert result.intact <= 1
@@ -0,0 +1,107 @@
+"""Tests for the methodology parameter sweep engine."""
+
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aidlc_explainer.analysis import sweep  # noqa: E402
+from aidlc_explainer.content.methodology_comparison import (  # noqa: E402
+    ProjectScenario,
+    get_all_methodologies,
+    get_project_scenarios,
+    simulate_project,
+)
+
+
+@pytest.fixture
+def methodologies():
+    """All built-in methodologies."""
+    return get_all_methodologies()
+
+
+@pytest.fixture
+def scenario():
+    """Base scenario for one-at-a-time analysis."""
+    return get_project_scenarios()[0]
+
+
+def test_evaluate_matches_simulate_project(methodologies):
+    """Test that the vectorized model matches simulate_project exactly."""
+    scenarios = [
+        ProjectScenario("s", "S", "", complexity, stability, 5, weeks)
+        for complexity, stability, weeks in itertools.product(
+            sweep.COMPLEXITY_LEVELS, sweep.STABILITY_LEVELS, range(1, 60)
+        )
+    ]
+    params = {
+        "complexity": np.array([sweep.COMPLEXITY_LEVELS.index(s.complexity) for s in scenarios]),
+        "requirements_stability": np.array(
+            [sweep.STABILITY_LEVELS.index(s.requirements_stability) for s in scenarios]
+        ),
+        "baseline_weeks": np.array([s.baseline_weeks for s in scenarios]),
+    }
+    results = sweep.evaluate(params, methodologies)
+
+    for m in methodologies:
+        weeks, cost = results[m.id]
+        expected = [simulate_project(s, m) for s in scenarios]
+        assert weeks.tolist() == [r.total_weeks for r in expected]
+        assert cost.tolist() == [r.total_cost_units for r in expected]
+
+
+def test_sweep_counts_match_brute_force(methodologies, scenario, monkeypatch):
+    """Test that blocked evaluation agrees with a point-by-point loop."""
+    monkeypatch.setattr(sweep, "BLOCK_SIZE", 64)  # Force many small blocks
+    axes = sweep.default_axes(methodologies, resolution=3)
+    result = sweep.run_sweep(axes, methodologies, scenario, keep_mask=True)
+
+    assert result.points == int(np.prod(result.shape))
+    mask = result.unpacked_win_mask()
+    assert mask.sum() == result.wins
+
+    expected = np.zeros(result.shape, dtype=bool)
+    for index in itertools.islice(np.ndindex(*result.shape), 0, None, 97):
+        params = {axis.name: axis.values[i] for axis, i in zip(axes, index, strict=True)}
+        results = sweep.evaluate(params, methodologies)
+        aidlc_weeks, aidlc_cost = results["aidlc"]
+        expected[index] = all(
+            aidlc_weeks < weeks and aidlc_cost < cost
+            for m_id, (weeks, cost) in results.items() if m_id != "aidlc"
+        )
+        assert mask[index] == expected[index]
+
+    for j, counts in enumerate(result.marginal_wins):
+        other = tuple(k for k in range(len(axes)) if k != j)
+        assert counts.tolist() == mask.sum(axis=other).tolist()
+
+
+def test_break_even_for_aidlc_cycle_time(methodologies, scenario):
+    """Test that AI-DLC stops winning once it is no faster than Agile."""
+    axes = [sweep.SweepAxis("aidlc.cycle_time_factor", np.linspace(0.05, 1.5, 5))]
+    result = sweep.run_sweep(axes, methodologies, scenario)
+
+    stops = [be for be in result.break_evens if be.axis == "aidlc.cycle_time_factor"]
+    assert len(stops) == 1
+    assert stops[0].stops_winning
+    assert int(scenario.baseline_weeks * stops[0].value) >= int(scenario.baseline_weeks * 0.5)
+
+
+def test_sweep_result_roundtrip(methodologies, scenario, tmp_path):
+    """Test saving and loading the compact result archive."""
+    axes = sweep.default_axes(methodologies, resolution=2)
+    result = sweep.run_sweep(axes, methodologies, scenario, keep_mask=True)
+    path = tmp_path / "sweep.npz"
+    result.save(path)
+
+    loaded = sweep.SweepResult.load(path)
+    assert loaded.points == result.points
+    assert loaded.wins == result.wins
+    assert loaded.base_point == result.base_point
+    assert [a.name for a in loaded.axes] == [a.name for a in result.axes]
+    assert loaded.axes[-4].labels == sweep.COMPLEXITY_LEVELS
+    assert loaded.tornado == result.tornado
+    assert loaded.break_evens == result.break_evens
+    assert np.array_equal(loaded.unpacked_win_mask(), result.unpacked_win_mask())
+    assert loaded.to_summary()["win_rate"] == result.to_summary()["win_rate"]
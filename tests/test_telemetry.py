@@ -0,0 +1,91 @@
+"""Tests for screen telemetry."""
+
+import json
+import timeit
+
+import pytest
+
+from aidlc_explainer import telemetry
+from aidlc_explainer.__main__ import main
+from aidlc_explainer.telemetry import RingBuffer, ScreenTelemetry
+
+
+def test_ring_buffer_take_and_wrap():
+    """Test taking events from the ring buffer as it wraps."""
+    buffer = RingBuffer(capacity=8)
+    for i in range(6):
+        buffer.record(telemetry.DWELL, i, i * 1.5)
+
+    columns, next_start, lost = buffer.take(0)
+    assert list(columns[2]) == [0, 1, 2, 3, 4, 5]
+    assert (next_start, lost) == (6, 0)
+
+    for i in range(6, 20):
+        buffer.record(telemetry.KEYS, i, i)
+    columns, next_start, lost = buffer.take(next_start)
+    assert list(columns[2]) == list(range(12, 20))  # Wrapped, oldest first
+    assert (next_start, lost) == (20, 6)
+    assert [len(c) for c in buffer.take(next_start)[0]] == [0, 0, 0, 0]
+
+
+def test_ring_buffer_requires_power_of_two():
+    """Test that the ring buffer capacity must be a power of two."""
+    with pytest.raises(ValueError):
+        RingBuffer(capacity=100)
+
+
+def test_visits_are_flushed_and_summarized(tmp_path):
+    """Test that screen visits are flushed and summarized."""
+    path = tmp_path / "telemetry.jsonl"
+    recorder = ScreenTelemetry(path, capacity=8)
+    for screen_id in ["home", "lessons", "home", "glossary", "home"]:
+        recorder.navigate(screen_id)
+        recorder.rendered()
+        recorder.key()
+        recorder.key()
+    recorder.close()
+
+    events = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(events) == 5 * 3
+    assert {e["kind"] for e in events} == {"render_ms", "dwell_s", "keys"}
+
+    summary = telemetry.summarize(path)
+    assert summary["screens"]["home"]["visits"] == 3
+    assert summary["screens"]["lessons"]["keys"]["p50"] == 2
+    assert summary["screens"]["glossary"]["render_ms"]["p99"] >= 0
+
+
+def test_render_without_navigation_is_ignored(tmp_path):
+    """Test that a render with no navigation before it is ignored."""
+    recorder = ScreenTelemetry(tmp_path / "telemetry.jsonl")
+    recorder.rendered()
+    recorder.close()
+
+    assert recorder.buffer.written == 0
+
+
+def test_record_overhead():
+    """Test that recording an event stays within its time budget."""
+    buffer = RingBuffer()
+    record = buffer.record
+    per_event = min(timeit.repeat(lambda: record(1, 2, 3.0), number=20000, repeat=5)) / 20000
+    # Budget is 1µs; allow slack for slow or loaded test machines
+    assert per_event < 5e-6
+
+
+def test_telemetry_report_command(tmp_path, capsys):
+    """Test the telemetry-report command."""
+    path = tmp_path / "telemetry.jsonl"
+    recorder = ScreenTelemetry(path)
+    recorder.navigate("home")
+    recorder.rendered()
+    recorder.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+
+    assert main(["telemetry-report", str(path)]) == 0
+    out = capsys.readouterr().out
+    assert "home" in out and "1 unreadable lines skipped" in out
+    assert main(["telemetry-report", str(path), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["screens"]["home"]["visits"] == 1
+    assert main(["telemetry-report", str(tmp_path / "missing.jsonl")]) == 1
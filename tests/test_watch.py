@@ -0,0 +1,133 @@
+"""Tests for reloading edited content packs."""
+
+import asyncio
+import json
+import shutil
+import time
+from functools import partial
+
+from aidlc_explainer import app as app_module
+from aidlc_explainer.app import AIDLCExplainerApp
+from aidlc_explainer.content import snapshot
+from aidlc_explainer.content.watch import ContentWatcher, PackDocument
+from aidlc_explainer.screens.search import SearchIndex
+
+
+def _pack(count: int) -> dict:
+    return {
+        "$schema": "quiz-v1",
+        "title": "Quiz",
+        "questions": [
+            {"id": f"q{i}", "prompt": f"Question {i}?", "options": ["a", "b"], "correct": 0}
+            for i in range(count)
+        ],
+    }
+
+
+def _dump(pack: dict) -> str:
+    return json.dumps(pack, indent=2)
+
+
+def test_edits_reparse_only_the_items_they_touch():
+    """Test that an edit reparses only the items it touches."""
+    pack = _pack(5)
+    document = PackDocument("quiz", _dump(pack))
+    before = document.items
+
+    pack["questions"][2]["prompt"] = "Reworded?"
+    change = document.update(_dump(pack))
+    assert (change.start, change.removed, change.added, change.full) == (2, 1, 1, False)
+    assert document.value == pack
+    assert all(document.items[i] is before[i] for i in (0, 1, 3, 4))  # Reused, not re-parsed
+    assert before[2]["prompt"] == "Question 2?"  # The old value is left alone
+
+    pack["questions"].insert(1, {"id": "new", "prompt": "New?", "options": [], "correct": 0})
+    del pack["questions"][4]
+    change = document.update(_dump(pack))
+    assert document.value == pack
+    assert not change.full and change.added - change.removed == 0
+
+    pack["title"] = "Renamed quiz"
+    assert document.update(_dump(pack)).full
+    assert document.value == pack
+
+
+def test_invalid_edits_keep_the_last_valid_pack(tmp_path):
+    """Test that an invalid edit keeps the last valid pack."""
+    path = tmp_path / "practice" / "quiz.json"
+    path.parent.mkdir()
+    path.write_text(_dump(_pack(3)), encoding="utf-8")
+    store = snapshot.ContentStore(None)
+    watcher = ContentWatcher(store, {"quiz": "questions"}, tmp_path)
+
+    path.write_text(_dump(_pack(3))[:-20], encoding="utf-8")
+    (change,) = watcher.poll()
+    assert change.error is not None
+    assert store.load("quiz") == _pack(3)
+
+    path.write_text(_dump(_pack(4)), encoding="utf-8")
+    (change,) = watcher.poll()
+    assert change.error is None and change.added - change.removed == 1
+    assert store.load("quiz") == _pack(4)
+    assert watcher.poll() == []  # Nothing changed since
+
+
+def test_large_bank_edit_is_incremental():
+    """Test that editing a large question bank is incremental."""
+    pack = _pack(10_000)
+    text = _dump(pack)
+    document = PackDocument("quiz", text)
+    start = time.perf_counter()
+    json.loads(text)
+    full = time.perf_counter() - start
+
+    edited = text.replace('"Question 5000?"', '"Question 5000, reworded?"')
+    start = time.perf_counter()
+    change = document.update(edited)
+    assert time.perf_counter() - start < full
+    assert (change.start, change.removed, change.added) == (5000, 1, 1)
+    assert document.items[5000]["prompt"] == "Question 5000, reworded?"
+
+
+def test_search_index_is_patched(monkeypatch):
+    """Test that the search index is patched rather than rebuilt."""
+    store = snapshot.ContentStore(None)
+    monkeypatch.setattr(snapshot, "STORE", store)
+    pack = _pack(3)
+    store.override("quiz", pack)
+    index = SearchIndex()
+    document = PackDocument("quiz", _dump(pack))
+
+    pack = json.loads(_dump(pack))
+    pack["questions"][1]["prompt"] = "What is a bolt?"
+    change = document.update(_dump(pack))
+    store.override("quiz", document.value)
+    index.patch(change)
+
+    titles = [entry.title for entry in index.entries if entry.type == "quiz"]
+    assert titles == ["Quiz > Question 0?", "Quiz > What is a bolt?", "Quiz > Question 2?"]
+
+
+def test_quiz_shows_edits_without_a_restart(tmp_path, monkeypatch):
+    """Test that the quiz shows edits without a restart."""
+    content = tmp_path / "content"
+    for directory in ("practice", "simulator"):
+        shutil.copytree(snapshot.CONTENT_DIR / directory, content / directory)
+    monkeypatch.setattr(snapshot, "STORE", snapshot.ContentStore(None))
+    monkeypatch.setattr(app_module, "ContentWatcher", partial(ContentWatcher, content_dir=content))
+    monkeypatch.chdir(tmp_path)  # The app keeps progress in the working directory
+    quiz = content / "practice" / "quiz.json"
+
+    async def edit() -> None:
+        app = AIDLCExplainerApp(screenshot_mode=True, dev_content=True)
+        async with app.run_test(size=(100, 40)) as pilot:
+            app.navigate_to("quiz", "Quiz")
+            await pilot.pause()
+            pack = json.loads(quiz.read_text(encoding="utf-8"))
+            pack["questions"][0]["prompt"] = "Which phase comes first?"
+            quiz.write_text(json.dumps(pack, indent=2), encoding="utf-8")
+            app.reload_content()
+            await pilot.pause()
+            assert str(app.screen.query_one("#question-text").render()) == "Which phase comes first?"
+
+    asyncio.run(edit())